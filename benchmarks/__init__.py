@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/__init__.py
+# code style: PEP 8
+
+"""
+Offline benchmark suite for DeepSearchAgents.
+
+Recorded Serper/Jina/Exa/xAI/Firecrawl/LLM responses are replayed by a
+local stand-in server with configurable injected latency, so throughput
+and p50/p95/p99 latency of our own code paths can be compared across
+commits without API keys or network access.
+
+Usage:
+    python -m benchmarks list
+    python -m benchmarks run [-s SCENARIO] [-n N] [-c CONCURRENCY]
+    python -m benchmarks compare BASELINE.json CURRENT.json
+"""
+
+from .replay_server import LatencyModel, ReplayServer
+from .runner import measure, run_benchmarks
+from .scenarios import SCENARIOS, Scenario, scenario
+from .stats import compare_results, percentile, summarize
+
+__all__ = [
+    "LatencyModel",
+    "ReplayServer",
+    "measure",
+    "run_benchmarks",
+    "SCENARIOS",
+    "Scenario",
+    "scenario",
+    "compare_results",
+    "percentile",
+    "summarize",
+]
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/__main__.py
+# code style: PEP 8
+
+"""
+Command line entry point: ``python -m benchmarks {list,run,compare}``.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .replay_server import LatencyModel, PROVIDERS
+from .runner import DEFAULT_LATENCY, default_output_path, run_benchmarks
+from .scenarios import SCENARIOS
+from .stats import compare_results
+
+
+def _parse_latency(
+    specs: List[str],
+    disabled: bool
+) -> Dict[str, LatencyModel]:
+    """Build latency models from defaults and ``PROVIDER=BASE[:JITTER]``."""
+    if disabled:
+        merged = {provider: "0" for provider in PROVIDERS}
+    else:
+        merged = dict(DEFAULT_LATENCY)
+    for spec in specs:
+        provider, sep, value = spec.partition("=")
+        if not sep or provider not in PROVIDERS:
+            raise argparse.ArgumentTypeError(
+                f"Invalid --latency '{spec}'; expected PROVIDER=MS[:JITTER] "
+                f"with PROVIDER in {', '.join(PROVIDERS)}"
+            )
+        merged[provider] = value
+    return {p: LatencyModel.parse(v) for p, v in merged.items()}
+
+
+def _cmd_list(args) -> int:
+    for name, scenario in SCENARIOS.items():
+        print(f"{name:<24} {scenario.description}")
+    return 0
+
+
+def _cmd_run(args) -> int:
+    try:
+        latency = _parse_latency(args.latency, args.no_latency)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    document = run_benchmarks(
+        scenario_names=args.scenario,
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        warmup=args.warmup,
+        latency=latency,
+        token_interval_ms=args.token_interval_ms,
+    )
+
+    output = Path(args.output) if args.output else default_output_path(
+        document
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+    for name, result in document["scenarios"].items():
+        if "setup_error" in result:
+            print(f"{name:<24} SETUP FAILED: {result['setup_error']}")
+            continue
+        lat = result["latency_ms"]
+        print(
+            f"{name:<24} {result['throughput_per_s']:>9.2f} ops/s  "
+            f"p50 {lat['p50']:>9.1f}ms  p95 {lat['p95']:>9.1f}ms  "
+            f"p99 {lat['p99']:>9.1f}ms  errors {result['errors']}"
+        )
+    print(f"Results written to {output}")
+
+    failed = any(
+        "setup_error" in r or r.get("errors")
+        for r in document["scenarios"].values()
+    )
+    return 1 if failed else 0
+
+
+def _cmd_compare(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    rows = compare_results(baseline, current, args.threshold)
+
+    def fmt(change: Optional[float]) -> str:
+        return "n/a" if change is None else f"{change:+.1f}%"
+
+    print(
+        f"{'scenario':<24} {'p50':>9} {'p95':>9} {'p99':>9} "
+        f"{'ops/s':>9}"
+    )
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['scenario']:<24} "
+            f"{fmt(row['p50']['change_pct']):>9} "
+            f"{fmt(row['p95']['change_pct']):>9} "
+            f"{fmt(row['p99']['change_pct']):>9} "
+            f"{fmt(row['throughput']['change_pct']):>9}{flag}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Offline DeepSearchAgents benchmarks replaying "
+                    "recorded provider responses."
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable info logging"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List scenarios").set_defaults(
+        func=_cmd_list
+    )
+
+    run = commands.add_parser("run", help="Run scenarios")
+    run.add_argument(
+        "-s", "--scenario", action="append", choices=list(SCENARIOS),
+        help="Scenario to run (repeatable; default: all)"
+    )
+    run.add_argument(
+        "-n", "--iterations", type=int, default=None,
+        help="Measured operations per scenario (default: per scenario)"
+    )
+    run.add_argument(
+        "-c", "--concurrency", type=int, default=1,
+        help="Concurrent operations (agent runs are always sequential)"
+    )
+    run.add_argument(
+        "--warmup", type=int, default=1,
+        help="Unmeasured warm-up operations per scenario"
+    )
+    run.add_argument(
+        "--latency", action="append", default=[],
+        metavar="PROVIDER=MS[:JITTER]",
+        help=f"Override injected latency; providers: {', '.join(PROVIDERS)}"
+    )
+    run.add_argument(
+        "--no-latency", action="store_true",
+        help="Disable injected latency to measure pure overhead"
+    )
+    run.add_argument(
+        "--token-interval-ms", type=float, default=2.0,
+        help="Delay between streamed LLM chunks"
+    )
+    run.add_argument(
+        "-o", "--output",
+        help="Result file (default: benchmarks/results/<commit>.json)"
+    )
+    run.set_defaults(func=_cmd_run)
+
+    compare = commands.add_parser(
+        "compare", help="Compare two result files"
+    )
+    compare.add_argument("baseline", help="Result file of the reference run")
+    compare.add_argument("current", help="Result file of the run under test")
+    compare.add_argument(
+        "--threshold", type=float, default=10.0,
+        help="Percent p95/throughput change flagged as a regression"
+    )
+    compare.set_defaults(func=_cmd_compare)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/replay_clients.py
+# code style: PEP 8
+
+"""
+Replay transports for providers that cannot be pointed at an HTTP URL.
+
+The xAI SDK speaks gRPC, so the benchmark swaps only its transport: the
+recorded raw response (content, citations, usage) is fetched from the
+replay server and then goes through the real ``XAISearchClient`` result
+processing.
+"""
+
+from typing import Any, Dict
+
+import aiohttp
+
+from src.core.search_engines.search_xcom_sdk import XAISearchClient
+
+
+class ReplayXAISearchClient(XAISearchClient):
+    """``XAISearchClient`` whose requests go to the replay server."""
+
+    def __init__(self, replay_url: str, **kwargs):
+        """
+        Initialize the replay client.
+
+        Args:
+            replay_url: URL of the replay server's ``/xai/search`` route
+            **kwargs: Passed to ``XAISearchClient``
+        """
+        super().__init__(**kwargs)
+        self.replay_url = replay_url
+
+    async def search_async(
+        self,
+        query: str,
+        num: int = 10,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Replay a recorded xAI live-search response."""
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                self.replay_url, json={"query": query, "num": num}
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+        return self._process_xai_results(
+            data.get("content", ""),
+            data.get("citations", [])[:num],
+            data.get("usage", {}),
+            query
+        )
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/replay_server.py
+# code style: PEP 8
+
+"""
+Local stand-in HTTP server replaying recorded provider responses.
+
+Each provider is mounted under its own path prefix so clients can be
+pointed at it through their ``base_url`` settings:
+
+- ``/serper/{search_type}``           Serper (Google) search
+- ``/jina-search/``                   Jina search
+- ``/jina-reader/{url}``              Jina Reader
+- ``/exa/search``                     Exa search
+- ``/xai/search``                     xAI search (``replay_clients``)
+- ``/firecrawl/v1|v2/scrape``         Firecrawl scrape
+- ``/llm/v1/chat/completions``        OpenAI-compatible LLM, with SSE
+
+Responses come from JSON fixtures and are delayed by a per-provider
+latency model so benchmarks measure our code paths under realistic,
+repeatable network conditions.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+PROVIDERS = ("serper", "jina", "exa", "xai", "firecrawl", "llm")
+
+
+class LatencyModel:
+    """Injected response latency: a fixed base plus uniform jitter."""
+
+    def __init__(
+        self,
+        base_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the latency model.
+
+        Args:
+            base_ms: Minimum delay in milliseconds
+            jitter_ms: Maximum extra random delay in milliseconds
+            seed: Seed for the jitter generator
+        """
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Parse a ``BASE[:JITTER]`` millisecond spec, e.g. ``"120:40"``.
+
+        Raises:
+            ValueError: If the spec is malformed or negative
+        """
+        base, _, jitter = spec.partition(":")
+        model = cls(float(base), float(jitter or 0.0))
+        if model.base_ms < 0 or model.jitter_ms < 0:
+            raise ValueError(f"Latency must be non-negative: {spec}")
+        return model
+
+    def sample(self) -> float:
+        """Draw one delay in seconds."""
+        jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.base_ms + jitter) / 1000.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Describe the model for result documents."""
+        return {"base_ms": self.base_ms, "jitter_ms": self.jitter_ms}
+
+
+class ReplayServer:
+    """
+    Threaded aiohttp server serving recorded provider fixtures.
+
+    The server runs its own event loop in a daemon thread, so it can serve
+    both async clients and blocking ``requests``-based clients running on
+    the benchmark's loop or in worker threads.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Path = FIXTURES_DIR,
+        latency: Optional[Dict[str, LatencyModel]] = None,
+        token_interval_ms: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Initialize the replay server.
+
+        Args:
+            fixtures_dir: Directory containing the recorded responses
+            latency: Latency model per provider (missing = no delay)
+            token_interval_ms: Delay between streamed LLM chunks
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency or {}
+        self.token_interval_ms = token_interval_ms
+        self.host = host
+        self.port = port
+        self.request_counts: Dict[str, int] = {p: 0 for p in PROVIDERS}
+
+        self._fixtures = {
+            name: self._load(name)
+            for name in (
+                "serper_search", "jina_search", "jina_reader", "exa_search",
+                "xai_search", "firecrawl_scrape", "llm_codact_script"
+            )
+        }
+        # Static payloads are encoded once so serving adds little overhead
+        self._encoded = {
+            name: json.dumps(data).encode("utf-8")
+            for name, data in self._fixtures.items()
+        }
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._startup_error: Optional[BaseException] = None
+
+    def _load(self, name: str) -> Any:
+        path = self.fixtures_dir / f"{name}.json"
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def url(self, prefix: str) -> str:
+        """Get the base URL of a provider mount, e.g. ``url("serper")``."""
+        return f"http://{self.host}:{self.port}/{prefix}"
+
+    def start(self) -> "ReplayServer":
+        """Start serving in a background thread."""
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._serve, args=(ready,), name="replay-server",
+            daemon=True
+        )
+        self._thread.start()
+        if not ready.wait(timeout=10):
+            raise RuntimeError("Replay server did not start in time")
+        if self._startup_error:
+            raise RuntimeError(
+                f"Replay server failed to start: {self._startup_error}"
+            )
+        logger.info(f"Replay server listening on {self.url('')}")
+        return self
+
+    def stop(self):
+        """Stop the server and wait for its thread."""
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _serve(self, ready: threading.Event):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        runner = web.AppRunner(self._build_app(), access_log=None)
+        try:
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, self.host, self.port)
+            loop.run_until_complete(site.start())
+            self.port = runner.addresses[0][1]
+        except BaseException as e:
+            self._startup_error = e
+            ready.set()
+            loop.close()
+            return
+
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
+
+    def _build_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/serper/{search_type}", self._serper)
+        app.router.add_post("/jina-search/", self._jina_search)
+        app.router.add_post("/jina-search", self._jina_search)
+        app.router.add_get("/jina-reader/{target:.*}", self._jina_reader)
+        app.router.add_post("/exa/search", self._exa_search)
+        app.router.add_post("/xai/search", self._xai_search)
+        app.router.add_post(
+            "/firecrawl/{version:v[12]}/scrape", self._firecrawl_scrape
+        )
+        app.router.add_post(
+            "/llm/v1/chat/completions", self._chat_completions
+        )
+        return app
+
+    async def _delay(self, provider: str):
+        self.request_counts[provider] += 1
+        model = self.latency.get(provider)
+        if model is not None:
+            delay = model.sample()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def _json(self, name: str) -> web.Response:
+        return web.Response(
+            body=self._encoded[name], content_type="application/json"
+        )
+
+    async def _serper(self, request: web.Request) -> web.Response:
+        await self._delay("serper")
+        return self._json("serper_search")
+
+    async def _jina_search(self, request: web.Request) -> web.Response:
+        await self._delay("jina")
+        return self._json("jina_search")
+
+    async def _jina_reader(self, request: web.Request) -> web.Response:
+        await self._delay("jina")
+        # raw_path keeps the target URL's own query string
+        target = request.raw_path[len("/jina-reader/"):]
+        payload = dict(self._fixtures["jina_reader"])
+        payload["data"] = {**payload["data"], "url": target}
+        return web.json_response(payload)
+
+    async def _exa_search(self, request: web.Request) -> web.Response:
+        await self._delay("exa")
+        return self._json("exa_search")
+
+    async def _xai_search(self, request: web.Request) -> web.Response:
+        await self._delay("xai")
+        return self._json("xai_search")
+
+    async def _firecrawl_scrape(self, request: web.Request) -> web.Response:
+        await self._delay("firecrawl")
+        return self._json("firecrawl_scrape")
+
+    async def _chat_completions(
+        self,
+        request: web.Request
+    ) -> web.StreamResponse:
+        body = await request.json()
+        await self._delay("llm")
+
+        # Stateless scripting: the reply depends on how many assistant
+        # turns the conversation already has, so concurrent runs are safe
+        script = self._fixtures["llm_codact_script"]
+        turn = sum(
+            1 for message in body.get("messages", [])
+            if message.get("role") == "assistant"
+        )
+        responses = script["responses"]
+        content = responses[min(turn, len(responses) - 1)]
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get("model", script.get("model", "bench"))
+        usage = {
+            "prompt_tokens": len(json.dumps(body.get("messages", []))) // 4,
+            "completion_tokens": max(1, len(content) // 4),
+        }
+        usage["total_tokens"] = (
+            usage["prompt_tokens"] + usage["completion_tokens"]
+        )
+
+        if not body.get("stream"):
+            return web.json_response({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+
+        response = web.StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+        })
+        await response.prepare(request)
+
+        def event(delta: Dict[str, Any], finish: Optional[str] = None,
+                  **extra) -> bytes:
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0, "delta": delta, "finish_reason": finish
+                }],
+                **extra,
+            }
+            return b"data: " + json.dumps(chunk).encode("utf-8") + b"\n\n"
+
+        chunk_size = script.get("stream_chunk_chars", 16)
+        interval = self.token_interval_ms / 1000.0
+        await response.write(event({"role": "assistant", "content": ""}))
+        for start in range(0, len(content), chunk_size):
+            await response.write(
+                event({"content": content[start:start + chunk_size]})
+            )
+            if interval:
+                await asyncio.sleep(interval)
+        await response.write(event({}, finish="stop", usage=usage))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/runner.py
+# code style: PEP 8
+
+"""
+Run benchmark scenarios against the replay server and build result
+documents that can be compared across commits.
+"""
+
+import asyncio
+import logging
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .replay_server import LatencyModel, PROVIDERS, ReplayServer
+from .scenarios import SCENARIOS, Scenario, Operation, isolate_environment
+from .stats import summarize
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Default injected latencies (base:jitter ms), roughly proportioned to the
+# providers' observed response times but scaled down to keep runs short
+DEFAULT_LATENCY = {
+    "serper": "150:50",
+    "jina": "300:100",
+    "exa": "250:100",
+    "xai": "600:200",
+    "firecrawl": "400:150",
+    "llm": "200:100",
+}
+
+
+async def measure(
+    op: Operation,
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """
+    Measure one operation repeatedly.
+
+    Args:
+        op: Coroutine function performing one operation
+        iterations: Number of measured operations
+        concurrency: Operations allowed in flight at once
+        warmup: Unmeasured operations run first
+
+    Returns:
+        Summary from ``stats.summarize`` plus the first error, if any
+    """
+    for _ in range(warmup):
+        await op()
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    samples: List[float] = []
+    errors: List[str] = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await op()
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+            else:
+                samples.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(iterations)))
+    wall = time.perf_counter() - wall_start
+
+    summary = summarize(samples, wall, len(errors), concurrency)
+    if errors:
+        summary["first_error"] = errors[0]
+    return summary
+
+
+async def run_scenario(
+    scenario: Scenario,
+    server: ReplayServer,
+    iterations: Optional[int] = None,
+    concurrency: int = 1,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """Set up one scenario, measure it and tear it down."""
+    if scenario.max_concurrency is not None:
+        concurrency = min(concurrency, scenario.max_concurrency)
+    iterations = iterations or scenario.iterations
+
+    logger.info(
+        f"Running {scenario.name}: {iterations} ops, "
+        f"concurrency {concurrency}"
+    )
+    before = dict(server.request_counts)
+    async with scenario.factory(server) as op:
+        summary = await measure(op, iterations, concurrency, warmup)
+
+    summary["description"] = scenario.description
+    summary["provider_requests"] = {
+        provider: server.request_counts[provider] - before[provider]
+        for provider in PROVIDERS
+        if server.request_counts[provider] != before[provider]
+    }
+    return summary
+
+
+def run_benchmarks(
+    scenario_names: Optional[List[str]] = None,
+    iterations: Optional[int] = None,
+    concurrency: int = 1,
+    warmup: int = 1,
+    latency: Optional[Dict[str, LatencyModel]] = None,
+    token_interval_ms: float = 2.0
+) -> Dict[str, Any]:
+    """
+    Run scenarios and build a result document.
+
+    Args:
+        scenario_names: Scenarios to run (defaults to all)
+        iterations: Operations per scenario (defaults per scenario)
+        concurrency: Concurrent operations per scenario
+        warmup: Unmeasured warm-up operations per scenario
+        latency: Injected latency per provider
+        token_interval_ms: Delay between streamed LLM chunks
+
+    Returns:
+        JSON-serializable result document
+
+    Raises:
+        KeyError: If an unknown scenario is requested
+    """
+    names = scenario_names or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise KeyError(f"Unknown scenarios: {', '.join(unknown)}")
+
+    if latency is None:
+        latency = {
+            provider: LatencyModel.parse(spec)
+            for provider, spec in DEFAULT_LATENCY.items()
+        }
+
+    document: Dict[str, Any] = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git": _git_state(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {
+            "iterations": iterations,
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "token_interval_ms": token_interval_ms,
+            "latency": {p: m.to_dict() for p, m in latency.items()},
+        },
+        "scenarios": {},
+    }
+
+    with ReplayServer(
+        latency=latency, token_interval_ms=token_interval_ms
+    ) as server:
+        isolate_environment(server)
+        for name in names:
+            try:
+                document["scenarios"][name] = asyncio.run(run_scenario(
+                    SCENARIOS[name], server, iterations, concurrency, warmup
+                ))
+            except Exception as e:
+                logger.error(f"Scenario {name} failed to run: {e}")
+                document["scenarios"][name] = {
+                    "description": SCENARIOS[name].description,
+                    "setup_error": f"{type(e).__name__}: {e}",
+                }
+
+    return document
+
+
+def default_output_path(document: Dict[str, Any]) -> Path:
+    """Get ``benchmarks/results/<commit>[-dirty].json`` for a document."""
+    git = document.get("git") or {}
+    stem = git.get("commit") or datetime.now().strftime("%Y%m%d-%H%M%S")
+    if git.get("dirty"):
+        stem += "-dirty"
+    return Path(__file__).parent / "results" / f"{stem}.json"
+
+
+def _git_state() -> Optional[Dict[str, Any]]:
+    """Get the current commit and whether the tree has local changes."""
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {"commit": commit, "dirty": bool(status.strip())}
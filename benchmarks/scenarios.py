@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/scenarios.py
+# code style: PEP 8
+
+"""
+Benchmark scenarios.
+
+Each scenario is an async context manager that builds the subject under
+test against a running ``ReplayServer`` and yields a zero-argument
+coroutine function performing one measured operation. Project imports
+happen inside the scenarios so that ``list`` and ``compare`` work without
+the full dependency set.
+"""
+
+import asyncio
+import itertools
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict
+from typing import Optional
+
+from .replay_server import ReplayServer
+
+BENCH_API_KEY = "bench-key"
+SEARCH_QUERY = "agentic retrieval augmented generation survey"
+AGENT_TASK = (
+    "What is agentic retrieval-augmented generation? Answer in one "
+    "paragraph with a citation."
+)
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class Scenario:
+    """A named benchmark scenario."""
+    name: str
+    description: str
+    factory: Callable[[ReplayServer], AsyncContextManager[Operation]]
+    # Upper bound on concurrent operations (None = as requested)
+    max_concurrency: Optional[int] = None
+    # Default operation count when none is given on the command line
+    iterations: int = 50
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(
+    name: str,
+    description: str,
+    max_concurrency: Optional[int] = None,
+    iterations: int = 50
+):
+    """Register an async-generator function as a benchmark scenario."""
+    def decorator(func):
+        SCENARIOS[name] = Scenario(
+            name=name,
+            description=description,
+            factory=asynccontextmanager(func),
+            max_concurrency=max_concurrency,
+            iterations=iterations,
+        )
+        return func
+    return decorator
+
+
+def isolate_environment(server: ReplayServer):
+    """
+    Point provider settings at the replay server for this process.
+
+    Keys are set to placeholders so no real credentials are sent, and
+    ``load_dotenv()`` calls in the clients cannot pull real keys from a
+    local ``.env`` (it never overrides variables that are already set).
+    """
+    os.environ.update({
+        "SERPER_API_KEY": BENCH_API_KEY,
+        "JINA_API_KEY": BENCH_API_KEY,
+        "FIRECRAWL_API_KEY": BENCH_API_KEY,
+        "FIRECRAWL_API_URL": server.url("firecrawl"),
+        "LITELLM_MASTER_KEY": BENCH_API_KEY,
+        "LITELLM_BASE_URL": server.url("llm/v1"),
+        # Disabled providers: empty values are falsy but block .env
+        "XAI_API_KEY": "",
+        "EXA_API_KEY": "",
+        "WOLFRAM_ALPHA_APP_ID": "",
+    })
+
+
+def _scrape_url(server: ReplayServer, provider: str):
+    """Create a ``ScrapeUrl`` routed to the replay server."""
+    from src.core.scraping.scrape_url import (
+        ScrapeUrl, ScraperConfig, ScraperProvider
+    )
+
+    config = ScraperConfig(
+        default_provider=ScraperProvider(provider),
+        fallback_enabled=False,
+        provider_config={
+            "jina": {"api_base_url": server.url("jina-reader")},
+        },
+    )
+    return ScrapeUrl(config=config, timeout=60, max_retries=1)
+
+
+def _page_urls():
+    """Distinct page URLs so no layer can serve repeats from a cache."""
+    return (
+        f"https://example.org/articles/{i}" for i in itertools.count()
+    )
+
+
+@scenario(
+    "hybrid_search",
+    "HybridSearchEngine.search_async across Serper, xAI, Jina and Exa"
+)
+async def hybrid_search(server: ReplayServer):
+    from src.core.search_engines import (
+        ExaSearchClient,
+        GoogleSerperClient,
+        HybridSearchEngine,
+        JinaSearchClient,
+    )
+    from .replay_clients import ReplayXAISearchClient
+
+    engine = HybridSearchEngine(
+        api_keys={"serper": BENCH_API_KEY}, timeout=30
+    )
+    engine.clients = {
+        "serper": GoogleSerperClient(
+            api_key=BENCH_API_KEY, base_url=server.url("serper")
+        ),
+        "xai": ReplayXAISearchClient(
+            server.url("xai/search"), api_key=BENCH_API_KEY
+        ),
+        "jina": JinaSearchClient(
+            api_key=BENCH_API_KEY, base_url=server.url("jina-search/")
+        ),
+        "exa": ExaSearchClient(
+            api_key=BENCH_API_KEY, base_url=server.url("exa")
+        ),
+    }
+
+    async def op():
+        result = await engine.search_async(SEARCH_QUERY, num=10)
+        if len(result["providers_used"]) != len(engine.clients):
+            raise RuntimeError(
+                f"Providers missing from result: {result['providers_used']}"
+            )
+
+    yield op
+
+
+async def _scrape_scenario(server: ReplayServer, provider: str):
+    scraper = _scrape_url(server, provider)
+    urls = _page_urls()
+
+    async def op():
+        result = await scraper.scrape_async(next(urls))
+        if not result.success:
+            raise RuntimeError(result.error)
+
+    try:
+        yield op
+    finally:
+        for instance in scraper._scrapers.values():
+            close = getattr(instance, "_close_session", None)
+            if close is not None:
+                await close()
+
+
+@scenario("scrape_url.jina", "ScrapeUrl.scrape_async via Jina Reader")
+async def scrape_url_jina(server: ReplayServer):
+    async for op in _scrape_scenario(server, "jina"):
+        yield op
+
+
+@scenario("scrape_url.firecrawl", "ScrapeUrl.scrape_async via Firecrawl")
+async def scrape_url_firecrawl(server: ReplayServer):
+    async for op in _scrape_scenario(server, "firecrawl"):
+        yield op
+
+
+def _build_codact_agent(server: ReplayServer, enable_streaming: bool):
+    """Build a CodeAct agent whose model and tools use the replay server."""
+    from smolagents import LiteLLMModel
+
+    from src.agents.codact_agent import CodeActAgent
+    from src.tools.readurl import ReadURLTool
+    from src.tools.search import SearchLinksTool
+
+    model = LiteLLMModel(
+        model_id="openai/deepsearch-bench",
+        api_base=server.url("llm/v1"),
+        api_key=BENCH_API_KEY,
+        temperature=0.2,
+    )
+
+    search_tool = SearchLinksTool(
+        serper_api_key=BENCH_API_KEY,
+        search_provider="serper",
+        cli_console=None,
+    )
+    search_tool.serp_search_api.base_url = server.url("serper")
+    read_tool = ReadURLTool(default_provider="jina", fallback_enabled=False)
+
+    agent = CodeActAgent(
+        orchestrator_model=model,
+        search_model=model,
+        tools=[search_tool, read_tool],
+        initial_state={"visited_urls": set(), "search_queries": []},
+        max_steps=6,
+        verbosity_level=0,
+        enable_streaming=enable_streaming,
+        planning_interval=None,
+        use_structured_outputs_internally=False,
+        cli_console=None,
+    )
+    agent.stream_outputs = enable_streaming
+
+    def reset_read_tool():
+        # ReadURLTool runs each call on a fresh event loop, so give every
+        # run a fresh scraper rather than one bound to a closed loop
+        read_tool.scraper = _scrape_url(server, "jina")
+
+    return agent, reset_read_tool
+
+
+@scenario(
+    "stream_agent_messages",
+    "Scripted CodeAct run streamed through web_ui.stream_agent_messages",
+    max_concurrency=1,
+    iterations=10
+)
+async def stream_agent_messages_run(server: ReplayServer):
+    from src.api.v2.web_ui import stream_agent_messages
+
+    agent, reset_read_tool = _build_codact_agent(
+        server, enable_streaming=True
+    )
+
+    async def op():
+        reset_read_tool()
+        count = 0
+        async for _ in stream_agent_messages(
+            agent, AGENT_TASK, reset_agent_memory=True
+        ):
+            count += 1
+        if not count:
+            raise RuntimeError("No messages streamed")
+
+    yield op
+
+
+@scenario(
+    "codact_run",
+    "Full scripted CodeAct run (search, read, final answer)",
+    max_concurrency=1,
+    iterations=10
+)
+async def codact_run(server: ReplayServer):
+    agent, reset_read_tool = _build_codact_agent(
+        server, enable_streaming=False
+    )
+
+    async def op():
+        reset_read_tool()
+        answer = await asyncio.to_thread(agent.run, AGENT_TASK)
+        if not answer or "Agentic RAG" not in str(answer):
+            raise RuntimeError(f"Unexpected final answer: {answer!r}")
+
+    yield op
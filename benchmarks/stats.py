@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/stats.py
+# code style: PEP 8
+
+"""
+Latency statistics and result comparison for benchmark runs.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between ranks.
+
+    Args:
+        samples: Sample values (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Interpolated percentile, or 0.0 for no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return ordered[low]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(
+    samples: List[float],
+    wall_seconds: float,
+    errors: int = 0,
+    concurrency: int = 1
+) -> Dict[str, Any]:
+    """
+    Summarize per-operation latencies of one scenario.
+
+    Args:
+        samples: Operation latencies in seconds
+        wall_seconds: Wall-clock duration of the measured phase
+        errors: Number of failed operations
+        concurrency: Concurrent operations used
+
+    Returns:
+        JSON-serializable summary with latencies in milliseconds
+    """
+    ms = [s * 1000.0 for s in samples]
+    operations = len(samples) + errors
+    return {
+        "operations": operations,
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_per_s": (
+            round(len(samples) / wall_seconds, 3) if wall_seconds > 0 else 0.0
+        ),
+        "latency_ms": {
+            "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+            "min": round(min(ms), 3) if ms else 0.0,
+            "p50": round(percentile(ms, 50), 3),
+            "p95": round(percentile(ms, 95), 3),
+            "p99": round(percentile(ms, 99), 3),
+            "max": round(max(ms), 3) if ms else 0.0,
+        },
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold_pct: float = 10.0
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents scenario by scenario.
+
+    A scenario regresses when its p95 latency grows, or its throughput
+    drops, by more than ``threshold_pct`` percent.
+
+    Args:
+        baseline: Result document of the reference run
+        current: Result document of the run under test
+        threshold_pct: Allowed change before flagging a regression
+
+    Returns:
+        One row per scenario present in both documents
+    """
+    rows = []
+    base_scenarios = baseline.get("scenarios", {})
+    for name, cur in current.get("scenarios", {}).items():
+        base = base_scenarios.get(name)
+        # Scenarios that failed to set up have no measurements
+        if base is None or "latency_ms" not in base or "latency_ms" not in cur:
+            continue
+
+        row: Dict[str, Any] = {"scenario": name}
+        for metric in ("p50", "p95", "p99"):
+            row[metric] = _change(
+                base["latency_ms"][metric], cur["latency_ms"][metric]
+            )
+        row["throughput"] = _change(
+            base["throughput_per_s"], cur["throughput_per_s"]
+        )
+
+        p95_change = row["p95"]["change_pct"]
+        throughput_change = row["throughput"]["change_pct"]
+        row["regression"] = bool(
+            (p95_change is not None and p95_change > threshold_pct)
+            or (throughput_change is not None
+                and throughput_change < -threshold_pct)
+        )
+        rows.append(row)
+    return rows
+
+
+def _change(before: float, after: float) -> Dict[str, Optional[float]]:
+    """Describe the relative change between two metric values."""
+    change = None
+    if before:
+        change = round((after - before) / before * 100.0, 2)
+    return {"baseline": before, "current": after, "change_pct": change}
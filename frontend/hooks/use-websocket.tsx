@@ -15,6 +15,10 @@ export function useWebSocket(sessionId: string | null) {
   // Use a Map to track streaming messages by step-type key
   const streamingMessagesRef = useRef<Map<string, DSAgentRunMessage>>(new Map());
   const isConnectingRef = useRef<boolean>(false);
+  // Highest stream sequence number received, used to resume after reconnect
+  const lastSeqRef = useRef<number>(0);
+  // Stream epoch lastSeqRef belongs to; the server checks it on resume
+  const epochRef = useRef<string>('');
   const { state, dispatch } = useAppContext();
   
   // Note: Content-based detection is no longer needed - we use metadata from backend
@@ -40,7 +44,11 @@ export function useWebSocket(sessionId: string | null) {
     isConnectingRef.current = true;
     
     // v2 API WebSocket URL
-    const wsUrl = `${process.env.NEXT_PUBLIC_WS_URL}/api/v2/ws/${sessionId}`;
+    // Resume the stream from the last received message on reconnect
+    const resumeQuery = lastSeqRef.current > 0
+      ? `?last_seq=${lastSeqRef.current}&epoch=${encodeURIComponent(epochRef.current)}`
+      : '';
+    const wsUrl = `${process.env.NEXT_PUBLIC_WS_URL}/api/v2/ws/${sessionId}${resumeQuery}`;
     console.log('Connecting to WebSocket:', wsUrl);
     
     const ws = new WebSocket(wsUrl);
@@ -52,8 +60,11 @@ export function useWebSocket(sessionId: string | null) {
       dispatch({ type: 'SET_CONNECTION_STATUS', payload: true });
       toast.success('Connected to agent');
       
-      // Clear streaming messages on new connection
-      streamingMessagesRef.current.clear();
+      // Clear streaming messages on a fresh connection; keep them when
+      // resuming so replayed deltas update the existing messages
+      if (lastSeqRef.current === 0) {
+        streamingMessagesRef.current.clear();
+      }
       
       // Start heartbeat
       pingIntervalRef.current = setInterval(() => {
@@ -85,7 +96,33 @@ export function useWebSocket(sessionId: string | null) {
           });
         }
         
+        // Track stream position for resumable reconnects
+        if (typeof data.seq === 'number' && data.seq > lastSeqRef.current) {
+          lastSeqRef.current = data.seq;
+        }
+        // Each run's user message carries the epoch of the new run
+        if (typeof data.metadata?.stream_epoch === 'string') {
+          epochRef.current = data.metadata.stream_epoch;
+        }
+        
         // 1. Handle protocol messages first
+        if (data.type === 'resume') {
+          console.log('Stream resumed:', data);
+          if (typeof data.epoch === 'string') {
+            epochRef.current = data.epoch;
+          }
+          if (!data.complete) {
+            // Part of the gap was evicted, or the cursor belongs to an
+            // earlier run or session - reload history instead
+            ws.send(JSON.stringify({ type: 'get_messages', limit: 100 }));
+          }
+          return;
+        }
+        
+        if (data.type === 'history') {
+          return;
+        }
+        
         if (data.type === 'pong') {
           return; // Heartbeat response
         }
@@ -330,9 +367,6 @@ export function useWebSocket(sessionId: string | null) {
       dispatch({ type: 'SET_CONNECTION_STATUS', payload: false });
       wsRef.current = null;
       
-      // Clear streaming messages
-      streamingMessagesRef.current.clear();
-      
       // Clear heartbeat
       if (pingIntervalRef.current) {
         clearInterval(pingIntervalRef.current);
@@ -394,6 +428,12 @@ export function useWebSocket(sessionId: string | null) {
     }
   }, []);
   
+  // Start from the beginning of the stream for a new session
+  useEffect(() => {
+    lastSeqRef.current = 0;
+    epochRef.current = '';
+  }, [sessionId]);
+  
   // Connect on mount
   useEffect(() => {
     connect();
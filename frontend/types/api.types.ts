@@ -16,6 +16,7 @@ export interface DSAgentRunMessage {
   };
   message_id: string;
   timestamp: string;
+  seq?: number;
   session_id?: string;
   step_number?: number;
 }
@@ -43,11 +44,34 @@ export interface SessionState {
 export type WebSocketMessage = 
   | { type: 'query'; query: string }
   | { type: 'ping' }
-  | { type: 'get_messages'; limit?: number }
-  | { type: 'get_state' };
+  | {
+      type: 'get_messages';
+      limit?: number;
+      after_seq?: number;
+      before_seq?: number;
+      step?: number;
+      component?: string;
+    }
+  | { type: 'get_state' }
+  | { type: 'resume'; last_seq: number; epoch?: string };
 
 export type WebSocketResponse =
   | DSAgentRunMessage
   | { type: 'pong' }
   | { type: 'error'; message: string; error_code?: string }
-  | { type: 'state'; state: SessionState };
\ No newline at end of file
+  | { type: 'state'; state: SessionState }
+  | {
+      type: 'history';
+      count: number;
+      first_seq: number | null;
+      last_seq: number | null;
+      has_more: boolean;
+    }
+  | {
+      type: 'resume';
+      last_seq: number;
+      replayed: number;
+      complete: boolean;
+      running: boolean;
+      epoch?: string | null;
+    };
\ No newline at end of file
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/agents/answer_cache.py
+# code style: PEP 8
+
+"""
+Semantic answer cache for completed agent runs.
+
+Final answers are cached under an embedding of the query. A new query
+is matched against previous ones by cosine similarity: close matches
+return the cached answer directly, looser matches only seed a fresh run
+with it. Exact repeats (after normalization) skip the embedding call.
+"""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[List[str]], Awaitable[Sequence[Sequence[float]]]]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SOURCE_LINK_RE = re.compile(r"\]\((https?://[^)\s]+)\)")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for exact matching."""
+    return _WHITESPACE_RE.sub(" ", query).strip().rstrip("?!. ").lower()
+
+
+def extract_sources(answer: str) -> List[str]:
+    """Get the source URLs listed in a final answer's Sources section."""
+    _, marker, sources = answer.partition("## Sources")
+    links = _SOURCE_LINK_RE.findall(sources if marker else answer)
+    return list(dict.fromkeys(links))
+
+
+async def jina_embed(texts: List[str]) -> np.ndarray:
+    """Embed queries with the Jina embeddings API."""
+    from ..core.ranking.jina_embedder import JinaAIEmbedder
+
+    embedder = JinaAIEmbedder(model="jina-embeddings-v3")
+    try:
+        embeddings = await embedder.get_embeddings_async(
+            texts, task="text-matching", normalized=True
+        )
+    finally:
+        await embedder._close_session()
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+@dataclass
+class CachedAnswer:
+    """A completed run's answer held by the cache."""
+    query: str
+    agent_type: str
+    final_answer: str
+    sources: List[str] = field(default_factory=list)
+    execution_time: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+@dataclass
+class CacheMatch:
+    """Result of a cache lookup."""
+    entry: CachedAnswer
+    similarity: float
+    # Whether the cached answer can be returned as-is
+    reusable: bool
+
+
+class _VectorIndex:
+    """Normalized query embeddings of one agent type, as a matrix."""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._matrix: Optional[np.ndarray] = None
+
+    def add(self, key: str, vector: np.ndarray):
+        if key not in self._vectors:
+            self.keys.append(key)
+        self._vectors[key] = vector
+        self._matrix = None
+
+    def remove(self, key: str):
+        if self._vectors.pop(key, None) is not None:
+            self.keys.remove(key)
+            self._matrix = None
+
+    def nearest(self, vector: np.ndarray) -> Optional[Tuple[str, float]]:
+        if not self.keys:
+            return None
+        if self._matrix is None:
+            # Rebuilt lazily: writes are rare next to lookups
+            self._matrix = np.stack([self._vectors[k] for k in self.keys])
+        scores = self._matrix @ vector
+        best = int(np.argmax(scores))
+        return self.keys[best], float(scores[best])
+
+
+class SemanticAnswerCache:
+    """
+    TTL + LRU cache of final answers with nearest-neighbor lookup.
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn = jina_embed,
+        similarity_threshold: float = 0.95,
+        seed_threshold: float = 0.85,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 1000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Coroutine embedding a list of texts
+            similarity_threshold: Cosine similarity at which a cached
+                answer is returned instead of running the agent
+            seed_threshold: Cosine similarity at which a cached answer is
+                passed to a fresh run as prior research
+            ttl_seconds: Time-to-live of an entry
+            max_entries: Maximum cached answers
+        """
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.seed_threshold = min(seed_threshold, similarity_threshold)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = (
+            OrderedDict()
+        )
+        self._indexes: Dict[str, _VectorIndex] = {}
+        # Embeddings of recent lookups, reused when their answer is stored
+        self._recent_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._stats = {"hits": 0, "seeds": 0, "misses": 0, "stores": 0}
+
+    async def lookup(
+        self,
+        query: str,
+        agent_type: str
+    ) -> Optional[CacheMatch]:
+        """
+        Find the best cached answer for a query.
+
+        Returns:
+            The closest fresh entry at or above ``seed_threshold``, or None
+        """
+        key = normalize_query(query)
+        entry = self._fresh(agent_type, key)
+        if entry is not None:
+            return self._record_match(entry, 1.0)
+
+        index = self._indexes.get(agent_type)
+        if index is None or not index.keys:
+            self._stats["misses"] += 1
+            return None
+
+        vector = await self._embed(key, query)
+        nearest = index.nearest(vector) if vector is not None else None
+        if nearest is not None:
+            match_key, similarity = nearest
+            entry = self._fresh(agent_type, match_key)
+            if entry is not None and similarity >= self.seed_threshold:
+                return self._record_match(entry, similarity)
+
+        self._stats["misses"] += 1
+        return None
+
+    async def store(
+        self,
+        query: str,
+        agent_type: str,
+        final_answer: str,
+        execution_time: float = 0.0
+    ) -> CachedAnswer:
+        """
+        Cache a completed run's final answer.
+
+        Args:
+            query: Query the agent answered
+            agent_type: Agent type that produced the answer
+            final_answer: Final answer text
+            execution_time: Run duration in seconds
+
+        Returns:
+            The cached entry
+        """
+        key = normalize_query(query)
+        entry = CachedAnswer(
+            query=query,
+            agent_type=agent_type,
+            final_answer=final_answer,
+            sources=extract_sources(final_answer),
+            execution_time=execution_time,
+        )
+        self._entries[(agent_type, key)] = entry
+        self._entries.move_to_end((agent_type, key))
+        self._stats["stores"] += 1
+
+        vector = self._recent_vectors.pop(key, None)
+        if vector is None:
+            vector = await self._embed(key, query)
+        if vector is not None:
+            self._indexes.setdefault(agent_type, _VectorIndex()).add(
+                key, vector
+            )
+
+        while len(self._entries) > self.max_entries:
+            (old_type, old_key), _ = self._entries.popitem(last=False)
+            self._drop_vector(old_type, old_key)
+        return entry
+
+    def seeded_task(self, query: str, match: CacheMatch) -> str:
+        """Build a task that gives the agent a related cached answer."""
+        sources = "\n".join(f"- {url}" for url in match.entry.sources)
+        return (
+            f"{query}\n\n"
+            f"Prior research on a closely related question "
+            f"(\"{match.entry.query}\") is below. Verify it, reuse what "
+            f"still applies and research only what is missing or "
+            f"outdated.\n\n"
+            f"<prior_answer>\n{match.entry.final_answer}\n</prior_answer>"
+            + (f"\n\nPrior sources:\n{sources}" if sources else "")
+        )
+
+    def invalidate(self, query: str, agent_type: str):
+        """Drop a cached answer."""
+        key = normalize_query(query)
+        self._entries.pop((agent_type, key), None)
+        self._drop_vector(agent_type, key)
+
+    def clear(self):
+        """Drop all cached answers."""
+        self._entries.clear()
+        self._indexes.clear()
+        self._recent_vectors.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters and size."""
+        return {**self._stats, "entries": len(self._entries)}
+
+    def _fresh(self, agent_type: str, key: str) -> Optional[CachedAnswer]:
+        entry = self._entries.get((agent_type, key))
+        if entry is None:
+            return None
+        if time.time() - entry.created_at > self.ttl_seconds:
+            self.invalidate(entry.query, agent_type)
+            return None
+        self._entries.move_to_end((agent_type, key))
+        return entry
+
+    def _record_match(
+        self,
+        entry: CachedAnswer,
+        similarity: float
+    ) -> CacheMatch:
+        reusable = similarity >= self.similarity_threshold
+        if reusable:
+            entry.hits += 1
+            self._stats["hits"] += 1
+        else:
+            self._stats["seeds"] += 1
+        return CacheMatch(
+            entry=entry, similarity=similarity, reusable=reusable
+        )
+
+    def _drop_vector(self, agent_type: str, key: str):
+        index = self._indexes.get(agent_type)
+        if index is not None:
+            index.remove(key)
+
+    async def _embed(self, key: str, query: str) -> Optional[np.ndarray]:
+        cached = self._recent_vectors.get(key)
+        if cached is not None:
+            return cached
+        try:
+            embeddings = await self.embed_fn([query])
+        except Exception as e:
+            # Exact matches keep working without embeddings
+            logger.warning(f"Answer cache embedding failed: {e}")
+            return None
+
+        vector = np.asarray(embeddings, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        vector /= norm
+        self._recent_vectors[key] = vector
+        while len(self._recent_vectors) > 256:
+            self._recent_vectors.popitem(last=False)
+        return vector
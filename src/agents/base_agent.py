@@ -20,6 +20,10 @@ from smolagents.models import ChatMessage, ChatMessageStreamDelta
 
 from .run_result import RunResult
 from .stream_aggregator import StreamAggregator, ModelStreamWrapper
+from ..tools.final_answer import (
+    FinalAnswer, SourceTracker, SourceTrackingIterator, get_source_tracker,
+    track_sources
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -385,25 +389,21 @@ class BaseAgent:
 
             # Return a generator for streaming (no RunResult for streaming)
             # The verbosity reduction should help minimize console output
-            return self.agent.run(user_input, **run_kwargs)
+            return SourceTrackingIterator(
+                self.agent.run(user_input, **run_kwargs),
+                get_source_tracker() or SourceTracker()
+            )
 
         # Default non-streaming mode
         try:
-            result = self.agent.run(user_input)
-
-            # Handle JSON response from final_answer tool
-            if isinstance(result, dict) and "content" in result:
-                # Extract content from JSON response
-                result = result["content"]
-            elif isinstance(result, str) and result.strip().startswith('{'):
-                # Try to parse JSON string
-                try:
-                    import json
-                    answer_dict = json.loads(result)
-                    if isinstance(answer_dict, dict) and "content" in answer_dict:
-                        result = answer_dict["content"]
-                except json.JSONDecodeError:
-                    pass
+            # Sub-agent runs share the tracker of the managing run
+            with track_sources(get_source_tracker()):
+                result = self.agent.run(user_input)
+
+            # Handle the structured response from final_answer tool
+            answer = FinalAnswer.from_output(result)
+            if answer is not None:
+                result = answer.markdown
 
             # If not returning RunResult, just return the string
             if not return_result:
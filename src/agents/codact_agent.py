@@ -24,6 +24,7 @@ from .prompt_templates.codact_prompts import (
 )
 import logging
 from .base_agent import BaseAgent, MultiModelRouter
+from .code_analysis import analyze_code, known_tool_names
 
 logger = logging.getLogger(__name__)
 
@@ -166,33 +167,12 @@ class CodeActAgent(BaseAgent):
         Returns:
             bool: True if code appears safe, False otherwise
         """
-        # Security patterns to check for
-        dangerous_patterns = [
-            r"eval\s*\(",  # eval() calls
-            r"exec\s*\(",  # exec() calls
-            r"compile\s*\(",  # compile() calls
-            r"globals\s*\(",  # globals() access
-            r"locals\s*\(",  # locals() access
-            r"vars\s*\(",  # vars() access
-            r"dir\s*\(",  # dir() introspection
-            r"getattr\s*\(",  # getattr() for dynamic access
-            r"setattr\s*\(",  # setattr() for dynamic modification
-            r"delattr\s*\(",  # delattr() for deletion
-            r"\bos\.",  # os module access
-            r"\bsys\.",  # sys module access
-            r"\bsubprocess\.",  # subprocess module
-            r"\.\.\/",  # Path traversal
-            r"\/etc\/",  # System paths
-            r"\/root\/",  # Root paths
-        ]
-
-        import re
-        for pattern in dangerous_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                logger.warning(f"Potentially dangerous pattern detected: {pattern}")
-                return False
+        # One precompiled scan, memoized and shared with step rendering
+        analysis = analyze_code(code, known_tool_names(self.agent))
+        for pattern in analysis.dangerous_patterns:
+            logger.warning(f"Potentially dangerous pattern detected: {pattern}")
 
-        return True
+        return analysis.safe
 
     def _create_prompt_templates(self):
         """Create extended prompt templates
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/agents/code_analysis.py
+# code style: PEP 8
+
+"""
+Shared analysis of agent action code.
+
+One ``ast`` parse per code action yields the tool calls (with argument
+spans) and imports; one precompiled alternation regex yields the safety
+verdict. Results are memoized per code string and tool set, so the web
+UI, the CLI step callback and the CodeAct safety check analyze each
+step's code once and agree with each other.
+"""
+
+import ast
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (pattern, description) pairs matched case-insensitively against the
+# code text; builtin calls are anchored at a word boundary so tool names
+# such as ``academic_retrieval(`` are not mistaken for ``eval(``
+DANGEROUS_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    (r"\beval\s*\(", "eval() calls"),
+    (r"\bexec\s*\(", "exec() calls"),
+    (r"\bcompile\s*\(", "compile() calls"),
+    (r"\bglobals\s*\(", "globals() access"),
+    (r"\blocals\s*\(", "locals() access"),
+    (r"\bvars\s*\(", "vars() access"),
+    (r"\bdir\s*\(", "dir() introspection"),
+    (r"\bgetattr\s*\(", "getattr() for dynamic access"),
+    (r"\bsetattr\s*\(", "setattr() for dynamic modification"),
+    (r"\bdelattr\s*\(", "delattr() for deletion"),
+    (r"\bos\.", "os module access"),
+    (r"\bsys\.", "sys module access"),
+    (r"\bsubprocess\.", "subprocess module"),
+    (r"\.\./", "Path traversal"),
+    (r"/etc/", "System paths"),
+    (r"/root/", "Root paths"),
+)
+
+_DANGEROUS = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern})"
+        for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
+# Tools smolagents gives agents without a toolbox entry
+_IMPLICIT_TOOLS = frozenset({"python_interpreter", "final_answer"})
+
+_CODE_BLOCK = re.compile(
+    r"```(?:python|py)?\s*\n(.*?)```|<code>\s*(.*?)\s*</code>",
+    re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class CodeToolCall:
+    """A tool call found in action code."""
+    name: str
+    # Character offsets of the whole call and of the text between its
+    # parentheses; ``args_end`` is None when the call is unterminated
+    start: int
+    end: Optional[int]
+    args_start: int
+    args_end: Optional[int]
+
+    def arguments(self, code: str) -> str:
+        """Argument source text of this call in ``code``."""
+        return code[self.args_start:self.args_end].strip()
+
+
+@dataclass(frozen=True)
+class CodeAnalysis:
+    """Tool calls, imports and safety findings of one code action."""
+    tool_calls: Tuple[CodeToolCall, ...]
+    imports: Tuple[str, ...]
+    dangerous_patterns: Tuple[str, ...]
+    parsed: bool
+
+    @property
+    def safe(self) -> bool:
+        """Whether no dangerous pattern was found."""
+        return not self.dangerous_patterns
+
+    @property
+    def tool_names(self) -> List[str]:
+        """Called tool names, unique, in order of first call."""
+        return list(dict.fromkeys(call.name for call in self.tool_calls))
+
+
+def known_tool_names(agent: Any = None) -> FrozenSet[str]:
+    """
+    Tool names to detect in action code.
+
+    Args:
+        agent: Running smolagents agent, or a runtime agent wrapping one;
+            its tools (including MCP and other tools not in the global
+            registry) and managed agent names are added
+
+    Returns:
+        Names of the toolbox registry, the tools smolagents adds to every
+        agent, and the agent's tools and managed agents
+    """
+    # Imported lazily: the tools package imports agent modules
+    from ..tools.toolbox import toolbox
+    names = set(toolbox.tool_registry.keys())
+    names.update(_IMPLICIT_TOOLS)
+    if agent is not None:
+        agent = getattr(agent, "agent", None) or agent
+        for members in (
+            getattr(agent, "tools", None),
+            getattr(agent, "managed_agents", None),
+        ):
+            # smolagents keys both by name; wrappers keep lists
+            if isinstance(members, dict):
+                names.update(members)
+            elif members:
+                names.update(
+                    member.name for member in members
+                    if isinstance(getattr(member, "name", None), str)
+                )
+    return frozenset(names)
+
+
+def extract_code(model_output) -> Optional[str]:
+    """
+    Code of the first markdown or ``<code>`` block in model output.
+
+    Args:
+        model_output: Model output text
+
+    Returns:
+        Code string, or None if there is no code block
+    """
+    if not model_output:
+        return None
+    match = _CODE_BLOCK.search(str(model_output))
+    if not match:
+        return None
+    return (match.group(1) or match.group(2) or "").strip()
+
+
+def analyze_code(
+    code: str,
+    tool_names: Optional[Iterable[str]] = None
+) -> CodeAnalysis:
+    """
+    Analyze action code (memoized).
+
+    Args:
+        code: Python code
+        tool_names: Tool names to detect (default: ``known_tool_names()``;
+            pass ``known_tool_names(agent)`` to include the agent's tools)
+
+    Returns:
+        CodeAnalysis
+    """
+    tools = (
+        known_tool_names() if tool_names is None else frozenset(tool_names)
+    )
+    return _analyze(code or "", tools)
+
+
+@lru_cache(maxsize=256)
+def _analyze(code: str, tools: FrozenSet[str]) -> CodeAnalysis:
+    dangerous = tuple(dict.fromkeys(
+        DANGEROUS_PATTERNS[int(match.lastgroup[1:])][0]
+        for match in _DANGEROUS.finditer(code)
+    ))
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        # Partial (streaming) or invalid code
+        return CodeAnalysis(
+            tool_calls=_scan_tool_calls(code, tools),
+            imports=(),
+            dangerous_patterns=dangerous,
+            parsed=False,
+        )
+
+    offsets = _CharOffsets(code)
+    calls = []
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            func = node.func
+            name = (
+                func.id if isinstance(func, ast.Name)
+                else func.attr if isinstance(func, ast.Attribute)
+                else None
+            )
+            if name in tools:
+                start = offsets.at(node.lineno, node.col_offset)
+                end = offsets.at(node.end_lineno, node.end_col_offset)
+                func_end = offsets.at(func.end_lineno, func.end_col_offset)
+                args_start = code.index("(", func_end) + 1
+                calls.append(
+                    CodeToolCall(name, start, end, args_start, end - 1)
+                )
+        elif isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append("." * node.level + (node.module or ""))
+
+    calls.sort(key=lambda call: call.start)
+    return CodeAnalysis(
+        tool_calls=tuple(calls),
+        imports=tuple(dict.fromkeys(imports)),
+        dangerous_patterns=dangerous,
+        parsed=True,
+    )
+
+
+class _CharOffsets:
+    """Convert ``ast`` (line, UTF-8 byte column) positions to offsets."""
+
+    def __init__(self, code: str):
+        self._lines = code.splitlines(keepends=True)
+        self._starts = [0]
+        for line in self._lines:
+            self._starts.append(self._starts[-1] + len(line))
+
+    def at(self, lineno: int, col: int) -> int:
+        line = self._lines[lineno - 1] if lineno <= len(self._lines) else ""
+        if not line.isascii():
+            col = len(line.encode("utf-8")[:col].decode("utf-8", "ignore"))
+        return self._starts[lineno - 1] + col
+
+
+@lru_cache(maxsize=32)
+def _tool_call_pattern(tools: FrozenSet[str]) -> Optional[re.Pattern]:
+    """One alternation regex matching a call of any of ``tools``."""
+    if not tools:
+        return None
+    names = "|".join(
+        re.escape(name) for name in sorted(tools, key=len, reverse=True)
+    )
+    return re.compile(rf"\b({names})\s*\(")
+
+
+def _scan_tool_calls(
+    code: str,
+    tools: FrozenSet[str]
+) -> Tuple[CodeToolCall, ...]:
+    """Find tool calls in code that does not parse."""
+    pattern = _tool_call_pattern(tools)
+    if pattern is None:
+        return ()
+    calls = []
+    for match in pattern.finditer(code):
+        args_start = match.end()
+        args_end = _closing_paren(code, args_start)
+        calls.append(CodeToolCall(
+            match.group(1),
+            match.start(),
+            None if args_end is None else args_end + 1,
+            args_start,
+            args_end,
+        ))
+    return tuple(calls)
+
+
+def _closing_paren(code: str, pos: int) -> Optional[int]:
+    """Index of the parenthesis closing the one before ``pos``."""
+    depth = 1
+    quote = None
+    i = pos
+    while i < len(code):
+        char = code[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#":
+            newline = code.find("\n", i)
+            if newline < 0:
+                return None
+            i = newline
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return None
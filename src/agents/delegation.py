@@ -0,0 +1,416 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/agents/delegation.py
+# code style: PEP 8
+
+"""
+Parallel delegation of sub-questions to managed agents.
+
+A manager normally calls its managed agents one at a time. The
+``delegate_parallel`` tool lets it dispatch independent sub-questions to
+several managed agents at once: tasks run on a bounded thread pool under
+a token budget shared by all of them, each sub-agent's steps are reported
+as they happen, and results are merged in the order they finish.
+
+An agent instance runs one task at a time. Several tasks for the same
+agent run on clones made by the agent's factory (clones share the
+parent's tools, and with them its HTTP pools and caches); without a
+factory they queue for the single instance.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from smolagents import Tool
+from smolagents.memory import ActionStep, FinalAnswerStep, PlanningStep
+
+from src.tools.final_answer import (
+    FinalAnswer, get_source_tracker, track_sources
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DelegationResult:
+    """Outcome of one delegated task."""
+    index: int
+    agent: str
+    task: str
+    answer: str = ""
+    error: Optional[str] = None
+    steps: int = 0
+    tokens: int = 0
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether the sub-agent produced an answer without error."""
+        return self.error is None
+
+
+class TokenBudget:
+    """Token allowance shared by concurrently running sub-agents."""
+
+    def __init__(self, max_tokens: Optional[int] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            max_tokens: Tokens allowed in total (None or 0: unlimited)
+        """
+        self.max_tokens = max_tokens or None
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used(self) -> int:
+        """Tokens charged so far."""
+        return self._used
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the budget is used up."""
+        return self.max_tokens is not None and self._used >= self.max_tokens
+
+    def charge(self, tokens: int) -> bool:
+        """
+        Charge tokens against the budget.
+
+        Args:
+            tokens: Tokens used by a step
+
+        Returns:
+            bool: Whether the budget still has tokens left
+        """
+        with self._lock:
+            self._used += max(tokens or 0, 0)
+        return not self.exhausted
+
+
+class AgentLanes:
+    """
+    Instances of each managed agent, handed out one task at a time.
+
+    The registered instance is used first; when it is busy, a clone is
+    made with the agent's factory, up to ``max_instances`` per agent.
+    Clones are kept for later tasks.
+    """
+
+    def __init__(
+        self,
+        agents: Dict[str, Any],
+        factories: Optional[Dict[str, Callable[[], Any]]] = None,
+        max_instances: int = 3
+    ):
+        """
+        Initialize the lanes.
+
+        Args:
+            agents: Managed agents by name
+            factories: Callables creating a fresh instance of an agent,
+                by agent name
+            max_instances: Instances per agent, clones included
+        """
+        self.factories = factories or {}
+        self.max_instances = max(max_instances, 1)
+        self._idle = {name: [agent] for name, agent in agents.items()}
+        self._count = {name: 1 for name in agents}
+        self._condition = threading.Condition()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._count
+
+    def acquire(self, name: str) -> Any:
+        """Take an idle instance of an agent, cloning or waiting if none."""
+        with self._condition:
+            while True:
+                if self._idle[name]:
+                    return self._idle[name].pop()
+                factory = self.factories.get(name)
+                if factory and self._count[name] < self.max_instances:
+                    # Reserve the slot; the clone is built outside the lock
+                    self._count[name] += 1
+                    break
+                self._condition.wait()
+        try:
+            clone = factory()
+        except Exception:
+            with self._condition:
+                self._count[name] -= 1
+                self._condition.notify_all()
+            raise
+        logger.info(f"Cloned managed agent {name} for a parallel task")
+        return clone
+
+    def release(self, name: str, agent: Any):
+        """Return an instance after its task finished."""
+        with self._condition:
+            self._idle[name].append(agent)
+            self._condition.notify_all()
+
+
+def _step_tokens(step: Any) -> int:
+    """Total tokens of a memory step, 0 if unknown."""
+    usage = getattr(step, "token_usage", None)
+    return getattr(usage, "total_tokens", 0) or 0
+
+
+def _final_text(output: Any) -> str:
+    """Render a sub-agent's final answer as text."""
+    answer = FinalAnswer.from_output(output)
+    if answer is not None:
+        return answer.markdown
+    return "" if output is None else str(output)
+
+
+class ParallelDelegator:
+    """Run delegated tasks concurrently and yield results as they finish."""
+
+    def __init__(
+        self,
+        agents: List[Any],
+        agent_factories: Optional[Dict[str, Callable[[], Any]]] = None,
+        max_concurrency: int = 3,
+        token_budget: Optional[int] = None,
+        on_step: Optional[Callable[[str, Any], None]] = None,
+        on_result: Optional[Callable[[DelegationResult], None]] = None
+    ):
+        """
+        Initialize the delegator.
+
+        Args:
+            agents: Managed agents, addressed by their ``name``
+            agent_factories: Callables creating a fresh instance of an
+                agent, by agent name, used to run several tasks on the
+                same agent at once
+            max_concurrency: Tasks running at once
+            token_budget: Tokens shared by the tasks of one dispatch
+                (None or 0: unlimited)
+            on_step: Called with (agent name, step) for each step a
+                sub-agent takes
+            on_result: Called with each ``DelegationResult`` as it
+                finishes
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.token_budget = token_budget
+        self.on_step = on_step
+        self.on_result = on_result
+        self.lanes = AgentLanes(
+            {agent.name: agent for agent in agents},
+            factories=agent_factories,
+            max_instances=self.max_concurrency
+        )
+
+    def run(self, tasks: List[Dict[str, str]]) -> Iterator[DelegationResult]:
+        """
+        Dispatch tasks to managed agents concurrently.
+
+        Args:
+            tasks: ``{"agent": name, "task": description}`` dictionaries
+
+        Yields:
+            DelegationResult: One per task, in completion order
+        """
+        budget = TokenBudget(self.token_budget)
+        # Worker threads do not inherit context variables
+        tracker = get_source_tracker()
+        workers = min(self.max_concurrency, len(tasks)) or 1
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="delegate"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._run_task, index, spec, budget, tracker
+                )
+                for index, spec in enumerate(tasks)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                logger.info(
+                    f"Delegated task {result.index + 1} to {result.agent} "
+                    f"finished in {result.duration:.1f}s "
+                    f"({result.steps} steps, {result.tokens} tokens)"
+                    + (f": {result.error}" if result.error else "")
+                )
+                if self.on_result:
+                    self.on_result(result)
+                yield result
+
+    def _run_task(
+        self,
+        index: int,
+        spec: Dict[str, str],
+        budget: TokenBudget,
+        tracker
+    ) -> DelegationResult:
+        """Run one task on an instance of its agent."""
+        name = str(spec.get("agent", "")) if isinstance(spec, dict) else ""
+        task = str(spec.get("task", "")) if isinstance(spec, dict) else ""
+        result = DelegationResult(index=index, agent=name, task=task)
+        if name not in self.lanes:
+            result.error = f"Unknown managed agent '{name}'"
+            return result
+        if not task.strip():
+            result.error = "Empty task"
+            return result
+        if budget.exhausted:
+            result.error = "Skipped: delegation token budget exhausted"
+            return result
+
+        start_time = time.time()
+        agent = self.lanes.acquire(name)
+        try:
+            with track_sources(tracker):
+                self._execute(agent, result, budget)
+        except Exception as e:
+            logger.error(f"Error in managed agent {name}: {str(e)}")
+            result.error = f"Failed to execute sub-agent {name}: {str(e)}"
+        finally:
+            self.lanes.release(name, agent)
+            result.duration = time.time() - start_time
+        return result
+
+    def _execute(self, agent: Any, result: DelegationResult,
+                 budget: TokenBudget):
+        """Run a sub-agent step by step, charging the shared budget."""
+        runner = getattr(agent, "agent", None)
+        if runner is None or not hasattr(runner, "run"):
+            # Plain callables report no steps
+            result.answer = str(agent(result.task))
+            return
+
+        events = runner.run(result.task, stream=True, reset=True)
+        last_observation = ""
+        try:
+            for event in events:
+                if isinstance(event, FinalAnswerStep):
+                    result.answer = _final_text(event.output)
+                    return
+                if not isinstance(event, (ActionStep, PlanningStep)):
+                    continue
+                result.steps += 1
+                tokens = _step_tokens(event)
+                result.tokens += tokens
+                if getattr(event, "observations", None):
+                    last_observation = event.observations
+                if self.on_step:
+                    self.on_step(result.agent, event)
+                if not budget.charge(tokens):
+                    result.error = (
+                        f"Stopped after {result.steps} steps: delegation "
+                        f"token budget exhausted"
+                    )
+                    result.answer = last_observation
+                    return
+        finally:
+            events.close()
+
+
+class ParallelDelegationTool(Tool):
+    """
+    Dispatch independent sub-questions to several managed agents at once.
+    """
+
+    name = "delegate_parallel"
+    description = (
+        "Run independent sub-tasks on managed agents concurrently and get "
+        "all their answers back, merged in the order they finish. Use it "
+        "instead of sequential sub-agent calls when the sub-tasks do not "
+        "depend on each other. The same agent may appear several times."
+    )
+    inputs = {
+        "tasks": {
+            "type": "array",
+            "description": (
+                "List of {'agent': <managed agent name>, 'task': <detailed "
+                "task description>} dictionaries"
+            ),
+        },
+    }
+    output_type = "string"
+
+    def __init__(
+        self,
+        agents: List[Any],
+        agent_factories: Optional[Dict[str, Callable[[], Any]]] = None,
+        max_concurrency: int = 3,
+        token_budget: Optional[int] = None,
+        on_step: Optional[Callable[[str, Any], None]] = None,
+        on_result: Optional[Callable[[DelegationResult], None]] = None,
+        **kwargs
+    ):
+        """
+        Initialize the tool.
+
+        Args:
+            agents: Managed agents, addressed by their ``name``
+            agent_factories: Callables creating a fresh instance of an
+                agent, by agent name
+            max_concurrency: Sub-agents running at once
+            token_budget: Tokens shared by the tasks of one call
+                (None or 0: unlimited)
+            on_step: Called with (agent name, step) for each sub-agent step
+            on_result: Called with each result as it finishes
+            **kwargs: Additional parameters
+        """
+        super().__init__(**kwargs)
+        self.delegator = ParallelDelegator(
+            agents,
+            agent_factories=agent_factories,
+            max_concurrency=max_concurrency,
+            token_budget=token_budget,
+            on_step=on_step or self._log_step,
+            on_result=on_result
+        )
+
+    @staticmethod
+    def _log_step(agent_name: str, step: Any):
+        """Report a sub-agent step in the log."""
+        label = getattr(step, "step_number", None)
+        kind = "planning" if isinstance(step, PlanningStep) else "step"
+        logger.info(
+            f"[{agent_name}] {kind}"
+            + (f" {label}" if label is not None else "")
+            + f" done ({_step_tokens(step)} tokens)"
+        )
+
+    def forward(self, tasks: List[Dict[str, str]]) -> str:
+        """
+        Run the tasks and merge their answers.
+
+        Args:
+            tasks: ``{"agent": name, "task": description}`` dictionaries
+
+        Returns:
+            str: Markdown with one section per task, in completion order
+        """
+        if not isinstance(tasks, list) or not tasks:
+            return "Error: tasks must be a non-empty list"
+
+        sections = []
+        failed = 0
+        for order, result in enumerate(self.delegator.run(tasks), 1):
+            failed += not result.success
+            heading = (
+                f"## {order}. {result.agent or 'unknown agent'} "
+                f"(task {result.index + 1}, {result.duration:.1f}s, "
+                f"{result.tokens} tokens)"
+            )
+            body = [f"**Task:** {result.task}"]
+            if result.error:
+                body.append(f"**Error:** {result.error}")
+            if result.answer:
+                body.append(result.answer)
+            sections.append(heading + "\n" + "\n\n".join(body))
+
+        summary = (
+            f"# Parallel delegation: {len(tasks) - failed} of {len(tasks)} "
+            f"tasks completed"
+        )
+        return "\n\n".join([summary] + sections)
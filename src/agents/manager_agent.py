@@ -8,10 +8,11 @@ Manager Agent implementation for hierarchical agent orchestration
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from smolagents import Tool
 from .base_agent import BaseAgent
 from .codact_agent import CodeActAgent
+from .delegation import ParallelDelegationTool
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,11 @@ class ManagerAgent(CodeActAgent):
         additional_authorized_imports: Optional[List[str]] = None,
         use_structured_outputs_internally: bool = False,
         max_delegation_depth: int = 3,
+        parallel_delegation: bool = True,
+        max_parallel_agents: int = 3,
+        delegation_token_budget: Optional[int] = None,
+        agent_factories: Optional[Dict[str, Callable[[], BaseAgent]]] = None,
+        on_delegation_step: Optional[Callable[[str, Any], None]] = None,
         name: str = None,
         description: str = None,
         cli_console=None,
@@ -63,12 +69,28 @@ class ManagerAgent(CodeActAgent):
             additional_authorized_imports: Additional Python imports allowed
             use_structured_outputs_internally: Use structured outputs
             max_delegation_depth: Maximum depth of agent delegation
+            parallel_delegation: Offer the ``delegate_parallel`` tool to run
+                independent sub-tasks on managed agents concurrently
+            max_parallel_agents: Sub-agents running at once in a parallel
+                delegation
+            delegation_token_budget: Tokens shared by the sub-agents of one
+                parallel delegation (None or 0: unlimited)
+            agent_factories: Callables creating a fresh instance of a
+                managed agent, by agent name, so one agent can take several
+                parallel tasks
+            on_delegation_step: Called with (agent name, step) for each
+                step a sub-agent takes during a parallel delegation
             name: Manager agent name
             description: Manager agent description
             cli_console: CLI console object
             **kwargs: Additional parameters
         """
         self.max_delegation_depth = max_delegation_depth
+        self.parallel_delegation = parallel_delegation
+        self.max_parallel_agents = max_parallel_agents
+        self.delegation_token_budget = delegation_token_budget
+        self.agent_factories = agent_factories or {}
+        self.on_delegation_step = on_delegation_step
         self.agent_type = "manager"  # Set agent type
 
         # Default name and description for manager
@@ -143,6 +165,26 @@ class ManagerAgent(CodeActAgent):
                 f"{agent.description}"
             )
 
+    def _create_delegation_tool(self) -> Optional[ParallelDelegationTool]:
+        """Create the parallel delegation tool over the managed agents
+
+        Returns:
+            ParallelDelegationTool or None if parallel delegation is off
+        """
+        agents = [
+            agent for agent in self.managed_agents
+            if getattr(agent, 'name', None) and agent.name.isidentifier()
+        ]
+        if not self.parallel_delegation or not agents:
+            return None
+        return ParallelDelegationTool(
+            agents,
+            agent_factories=self.agent_factories,
+            max_concurrency=self.max_parallel_agents,
+            token_budget=self.delegation_token_budget,
+            on_step=self.on_delegation_step
+        )
+
     def _create_prompt_templates(self):
         """Create extended prompt templates with manager-specific instructions
 
@@ -156,6 +198,11 @@ class ManagerAgent(CodeActAgent):
         from .prompt_templates.codact_prompts import MANAGED_AGENT_TEMPLATES
         manager_instructions = MANAGED_AGENT_TEMPLATES.get("manager_instructions", "")
 
+        if self.parallel_delegation:
+            manager_instructions += MANAGED_AGENT_TEMPLATES.get(
+                "parallel_instructions", ""
+            )
+
         if manager_instructions:
             # Append to system prompt
             templates["system_prompt"] = (
@@ -174,6 +221,15 @@ class ManagerAgent(CodeActAgent):
         # Prepare managed agents first
         self._prepare_managed_agents()
 
+        # Offer parallel delegation alongside the sequential agent calls
+        delegation_tool = self._create_delegation_tool()
+        self.tools = [
+            tool for tool in self.tools
+            if getattr(tool, 'name', None) != ParallelDelegationTool.name
+        ]
+        if delegation_tool is not None:
+            self.tools.append(delegation_tool)
+
         # Let parent create the base agent
         agent = super().create_agent()
 
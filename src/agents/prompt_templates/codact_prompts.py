@@ -51,7 +51,7 @@ and finally provide the answer using the `final_answer` tool.
 **Available Advanced Tools (Callable as Python functions you can programing use):**
 - 🔍 `search_links`: Deeply search multi-source and parameter-conditioned web pages to query and return a list of URLs and summary content
 - ⚡🔍 `search_fast`: Search the web for URLs list matching a query (faster)
-- 📄 `read_url`: Read the content of a URL
+- 📄 `read_url`: Read the content of a URL; long pages come back in sections, read further with `read_url(url, section=k)` as the note at the end says
 - 🐦 `xcom_deep_qa`: Deep query and analyze X.com content with search, read, and Q&A capabilities
 - 🐙 `github_repo_qa`: Deeply query and analyze an GitHub repository for research tasks
 - ✂️ `chunk_text`: Chunk text into smaller pieces help you to process and analyze the text
@@ -389,6 +389,26 @@ print(analysis)
 3. Pass detailed task descriptions as string arguments
 4. Always check and use the results returned by sub-agents
 5. You can call multiple sub-agents in sequence or based on task requirements
+""",
+    "parallel_instructions": """
+## Delegating Sub-Tasks in Parallel
+
+When sub-tasks do not depend on each other's results, dispatch them together with `delegate_parallel` instead of calling sub-agents one after another. They run concurrently and their answers come back merged, in the order they finish:
+
+```python
+report = delegate_parallel(tasks=[
+    {"agent": "web_search_agent", "task": "Find the 2024 revenue of company A, with sources"},
+    {"agent": "web_search_agent", "task": "Find the 2024 revenue of company B, with sources"},
+    {"agent": "analysis_agent", "task": "Explain how to compare revenue growth across fiscal years"},
+])
+print(report)
+```
+
+**Rules for Parallel Delegation:**
+1. Only batch sub-tasks that are independent; call sub-agents sequentially when one task needs another's answer
+2. Make each task self-contained: sub-agents do not see each other's work
+3. The same agent may appear several times in one call
+4. The sub-agents share a token budget; a task may be stopped or skipped when it runs out, so check each section for errors
 """
 }
 
@@ -41,6 +41,9 @@ tools in a search-read-reason cycle.
     regular web search (Google) and X.com/Twitter content search. For X.com content,
     you can also use the specialized `{12} xcom_deep_qa` tool for advanced search,
     reading specific posts, and asking questions about X.com content.
+*   **Long Pages:** `read_url` returns long pages in sections. If the response
+    ends with a `[read_url: ...]` note, call `read_url` again with the `section`
+    it gives to read further, only when the remaining content is still needed.
 *   **Content Processing (Optional):** If `read_url` returns very long text or if
     you need finer-grained relevance filtering:
     *   Use `{6} chunk_text` to split the content into smaller segments 
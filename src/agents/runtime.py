@@ -7,7 +7,10 @@
 DeepSearchAgent core agent runtime module
 """
 
+import asyncio
 import logging
+import threading
+import time
 from typing import (
     Optional, Dict, Type, Any, List, Union, AsyncGenerator
 )
@@ -17,8 +20,10 @@ from .base_agent import BaseAgent
 from .react_agent import ReactAgent
 from .codact_agent import CodeActAgent
 from .manager_agent import ManagerAgent
+from .answer_cache import SemanticAnswerCache
 from .ui_common.agent_step_callback import AgentStepCallback
 from ..tools import from_toolbox
+from ..tools.final_answer import FinalAnswer
 from inspect import isawaitable
 
 logger = logging.getLogger(__name__)
@@ -116,6 +121,17 @@ class AgentRuntime:
         self.model_args = None
         self.react_agent = None
         self.code_agent = None
+        # Models shared by the research team members and their clones
+        self._shared_models: Dict[str, LiteLLMModel] = {}
+        self._shared_models_lock = threading.Lock()
+        self.answer_cache = None
+        if self.settings.ANSWER_CACHE_ENABLED:
+            self.answer_cache = SemanticAnswerCache(
+                similarity_threshold=self.settings.ANSWER_CACHE_SIMILARITY,
+                seed_threshold=self.settings.ANSWER_CACHE_SEED_SIMILARITY,
+                ttl_seconds=self.settings.ANSWER_CACHE_TTL,
+                max_entries=self.settings.ANSWER_CACHE_MAX_ENTRIES
+            )
 
         # Get API keys and validate them
         self.api_keys = self._get_api_keys()
@@ -207,6 +223,7 @@ class AgentRuntime:
         # Create tool collection using the from_toolbox factory method
         tool_collection = from_toolbox(
             api_keys=self.api_keys,
+            tool_names=settings.TOOLS_ENABLED or None,
             cli_console=None,
             verbose=settings.VERBOSE_TOOL_CALLBACKS,
             tool_specific_kwargs=tool_specific_kwargs
@@ -258,6 +275,26 @@ class AgentRuntime:
 
         return model
 
+    def _get_shared_model(self, model_id: str) -> LiteLLMModel:
+        """Get an LLM model shared by the research team members
+
+        Team members and their parallel clones reuse one model instance
+        per model ID instead of building their own clients.
+
+        Args:
+            model_id: Model ID to use
+
+        Returns:
+            LiteLLMModel: Shared model instance
+        """
+        # Clones are built concurrently from parallel delegation threads
+        with self._shared_models_lock:
+            model = self._shared_models.get(model_id)
+            if model is None:
+                model = self._create_llm_model(model_id=model_id)
+                self._shared_models[model_id] = model
+        return model
+
     def _get_initial_state(self) -> Dict[str, Any]:
         """Get initial state for agents
 
@@ -339,7 +376,8 @@ class AgentRuntime:
         self,
         session_id: Optional[str] = None,
         step_callback=None,
-        debug_mode=True
+        debug_mode=True,
+        shared_models: bool = False
     ):
         """Create a ReAct agent
 
@@ -347,11 +385,16 @@ class AgentRuntime:
             session_id: Optional session ID for step tracking
             step_callback: Optional custom step callback
             debug_mode: Whether to enable debug mode
+            shared_models: Whether to reuse the runtime's shared models
 
         Returns:
             ToolCallingAgent: Initialized ReAct agent
         """
         initial_state = self._get_initial_state()
+        create_model = (
+            self._get_shared_model if shared_models
+            else self._create_llm_model
+        )
 
         # Use provided callback or create a new one
         callbacks = []
@@ -364,10 +407,10 @@ class AgentRuntime:
             ))
 
         agent = ReactAgent(
-            orchestrator_model=self._create_llm_model(
+            orchestrator_model=create_model(
                 model_id=settings.ORCHESTRATOR_MODEL_ID
             ),
-            search_model=self._create_llm_model(
+            search_model=create_model(
                 model_id=settings.SEARCH_MODEL_NAME
             ),
             tools=self._tools,
@@ -399,7 +442,8 @@ class AgentRuntime:
         self,
         session_id: Optional[str] = None,
         step_callback=None,
-        debug_mode=True
+        debug_mode=True,
+        shared_models: bool = False
     ):
         """Create a CodeAct agent
 
@@ -407,11 +451,16 @@ class AgentRuntime:
             session_id: Optional session ID for step tracking
             step_callback: Optional custom step callback
             debug_mode: Whether to enable debug mode
+            shared_models: Whether to reuse the runtime's shared models
 
         Returns:
             CodeAgent: Initialized CodeAct agent
         """
         initial_state = self._get_initial_state()
+        create_model = (
+            self._get_shared_model if shared_models
+            else self._create_llm_model
+        )
 
         # Use provided callback or create a new one
         callbacks = []
@@ -427,10 +476,10 @@ class AgentRuntime:
         final_answer_checks = [self.format_final_answer_for_gradio]
 
         agent = CodeActAgent(
-            orchestrator_model=self._create_llm_model(
+            orchestrator_model=create_model(
                 model_id=self.settings.ORCHESTRATOR_MODEL_ID
             ),
-            search_model=self._create_llm_model(
+            search_model=create_model(
                 model_id=self.settings.SEARCH_MODEL_NAME
             ),
             tools=self._tools,
@@ -470,7 +519,8 @@ class AgentRuntime:
         managed_agents: List[Union[str, BaseAgent]] = None,
         session_id: Optional[str] = None,
         step_callback=None,
-        debug_mode=True
+        debug_mode=True,
+        agent_factories: Optional[Dict[str, Any]] = None
     ):
         """Create a Manager agent for hierarchical orchestration
 
@@ -479,6 +529,8 @@ class AgentRuntime:
             session_id: Optional session ID for step tracking
             step_callback: Optional custom step callback
             debug_mode: Whether to enable debug mode
+            agent_factories: Callables creating a fresh instance of a
+                managed agent, by agent name, for parallel delegation
 
         Returns:
             ManagerAgent: Initialized manager agent
@@ -535,6 +587,17 @@ class AgentRuntime:
             additional_authorized_imports=settings.CODACT_ADDITIONAL_IMPORTS,
             enable_streaming=getattr(settings, 'MANAGER_ENABLE_STREAMING', False),
             use_structured_outputs_internally=settings.CODACT_USE_STRUCTURED_OUTPUTS,
+            parallel_delegation=getattr(
+                settings, 'MANAGER_PARALLEL_DELEGATION', True
+            ),
+            max_parallel_agents=getattr(
+                settings, 'MANAGER_MAX_PARALLEL_AGENTS', 3
+            ),
+            delegation_token_budget=getattr(
+                settings, 'MANAGER_DELEGATION_TOKEN_BUDGET', 0
+            ),
+            agent_factories=agent_factories,
+            on_delegation_step=self._create_delegation_step_hook(callbacks),
             cli_console=None,
             step_callbacks=callbacks,
             final_answer_checks=final_answer_checks
@@ -553,6 +616,33 @@ class AgentRuntime:
 
         return agent
 
+    @staticmethod
+    def _create_delegation_step_hook(callbacks: List[Any]):
+        """Create a hook passing parallel sub-agent steps to step callbacks
+
+        Sub-agents of a parallel delegation run on worker threads, so the
+        callbacks are called one step at a time.
+
+        Args:
+            callbacks: Step callbacks of the manager agent
+
+        Returns:
+            Callable: Hook called with (agent name, step)
+        """
+        lock = threading.Lock()
+
+        def on_delegation_step(agent_name: str, step: Any):
+            with lock:
+                for callback in callbacks:
+                    try:
+                        callback(step)
+                    except Exception as e:
+                        logger.warning(
+                            f"Step callback failed for {agent_name}: {e}"
+                        )
+
+        return on_delegation_step
+
     def get_or_create_agent(
         self,
         agent_type="codact",
@@ -746,21 +836,21 @@ class AgentRuntime:
         elif agent_type.lower() == "manager":
             # Create a new Manager agent with research team
             team_type = getattr(settings, 'MANAGER_TEAM', 'research')
-            if team_type == 'research':
-                managed_agents = self._create_research_team()
-            else:
+            agent_factories = None
+            custom_agents = getattr(settings, 'MANAGER_CUSTOM_AGENTS', None)
+            if team_type != 'research' and custom_agents:
                 # Custom team from settings
-                custom_agents = getattr(settings, 'MANAGER_CUSTOM_AGENTS', None)
-                if custom_agents:
-                    managed_agents = self._create_custom_team(custom_agents)
-                else:
-                    # Default to research team if no custom agents specified
-                    managed_agents = self._create_research_team()
+                managed_agents = self._create_custom_team(custom_agents)
+            else:
+                # Default to research team if no custom agents specified
+                managed_agents = self._create_research_team()
+                agent_factories = self._research_team_factories()
 
             agent = self.create_manager_agent(
                 managed_agents=managed_agents,
                 step_callback=step_callback,
-                debug_mode=debug_mode
+                debug_mode=debug_mode,
+                agent_factories=agent_factories
             )
 
             # Ensure agent object has required properties
@@ -818,43 +908,73 @@ class AgentRuntime:
             # Default to research team
             return self._create_research_team()
 
-    def _create_research_team(self):
-        """Create the research team with specialized agents
+    # Research team members: (agent type, display name, description)
+    RESEARCH_TEAM = {
+        "web_search_agent": (
+            "react",
+            "Research Team: Web Search Agent",
+            "A team member specialized in web search, content retrieval, and "
+            "information gathering using tool-calling approach"
+        ),
+        "analysis_agent": (
+            "codact",
+            "Research Team: Analysis Agent",
+            "A team member specialized in data processing, computation, and "
+            "synthesis using code execution approach"
+        ),
+    }
+
+    def _create_team_member(self, name: str) -> BaseAgent:
+        """Create one research team member
+
+        Members share the runtime's tools and models, so the members and
+        the clones made for parallel delegation reuse the same HTTP
+        pools, caches and model clients.
+
+        Args:
+            name: Member name, a key of ``RESEARCH_TEAM``
 
         Returns:
-            List[BaseAgent]: Research team agents
+            BaseAgent: The team member
         """
-        team = []
-
-        # Create Web Research Specialist (React agent)
-        research_agent = self.create_react_agent(
-            step_callback=None,
-            debug_mode=False
+        agent_type, display_name, description = self.RESEARCH_TEAM[name]
+        create = (
+            self.create_react_agent if agent_type == "react"
+            else self.create_codact_agent
         )
-        # Use valid Python identifier for callable name
-        research_agent.name = "web_search_agent"
-        research_agent.display_name = "Research Team: Web Search Agent"
-        research_agent.description = (
-            "A team member specialized in web search, content retrieval, and "
-            "information gathering using tool-calling approach"
-        )
-        team.append(research_agent)
-
-        # Create Data Analysis Specialist (CodeAct agent)
-        analysis_agent = self.create_codact_agent(
+        agent = create(
             step_callback=None,
-            debug_mode=False
+            debug_mode=False,
+            shared_models=True
         )
         # Use valid Python identifier for callable name
-        analysis_agent.name = "analysis_agent"
-        analysis_agent.display_name = "Research Team: Analysis Agent"
-        analysis_agent.description = (
-            "A team member specialized in data processing, computation, and synthesis "
-            "using code execution approach"
-        )
-        team.append(analysis_agent)
+        agent.name = name
+        agent.display_name = display_name
+        agent.description = description
+        return agent
+
+    def _research_team_factories(self) -> Dict[str, Any]:
+        """Factories cloning research team members for parallel delegation
+
+        Returns:
+            Dict[str, Any]: Member name to a callable creating a new member
+        """
+        return {
+            name: (lambda name=name: self._create_team_member(name))
+            for name in self.RESEARCH_TEAM
+        }
+
+    def _create_research_team(self):
+        """Create the research team with specialized agents
+
+        Returns:
+            List[BaseAgent]: Research team agents
+        """
+        # Web Research Specialist (React agent) and Data Analysis
+        # Specialist (CodeAct agent)
+        team = [self._create_team_member(name) for name in self.RESEARCH_TEAM]
 
-        logger.info("Created research team with 2 specialized agents")
+        logger.info(f"Created research team with {len(team)} specialized agents")
         return team
 
     def _create_custom_team(self, agent_types):
@@ -931,10 +1051,15 @@ class AgentRuntime:
         session_id: Optional[str] = None,
         step_callback=None,
         debug_mode: bool = True,
-        stream: bool = True
+        stream: bool = True,
+        force_refresh: bool = False
     ) -> Union[str, AsyncGenerator[Dict[str, Any], None]]:
         """Run the agent with the given input
 
+        Non-streaming runs go through the semantic answer cache: a close
+        enough earlier question returns its cached answer, a related one
+        seeds the new run with it.
+
         Args:
             user_input: User input/query
             agent_type: Optional agent type (react or codact)
@@ -943,6 +1068,7 @@ class AgentRuntime:
             step_callback: Optional step callback
             debug_mode: Whether to enable debug mode
             stream: Whether to enable streaming output
+            force_refresh: Skip the answer cache lookup and run the agent
 
         Returns:
             Result from the agent (string or generator for streaming)
@@ -958,6 +1084,20 @@ class AgentRuntime:
             logger.info(f"Running {agent_type} agent with query: "
                         f"{user_input[:50] if user_input else ''}...")
 
+            match = None
+            if not stream and self.answer_cache and not force_refresh:
+                match = await self.answer_cache.lookup(
+                    user_input, agent_type.lower()
+                )
+                if match is not None and match.reusable:
+                    logger.info(
+                        f"Answer cache hit (similarity "
+                        f"{match.similarity:.3f}) for: "
+                        f"{match.entry.query[:50]}"
+                    )
+                    self.result = match.entry.final_answer
+                    return match.entry.final_answer
+
             if agent_type.lower() == "react":
                 # Create a new ReAct agent
                 agent = self.create_react_agent(
@@ -983,9 +1123,24 @@ class AgentRuntime:
                 # Return a generator for streaming
                 return agent.run(user_input, stream=True)
             else:
-                # Run in non-streaming mode
-                result = await agent.run(user_input, stream=False)
+                # Run in non-streaming mode, seeded by a related answer
+                task = user_input
+                if match is not None:
+                    task = self.answer_cache.seeded_task(user_input, match)
+                start_time = time.time()
+                result = await asyncio.to_thread(
+                    agent.run, task, stream=False
+                )
+                if isawaitable(result):
+                    result = await result
                 self.result = result
+
+                if (self.answer_cache and isinstance(result, str)
+                        and result and not result.startswith("Error")):
+                    await self.answer_cache.store(
+                        user_input, agent_type.lower(), result,
+                        execution_time=time.time() - start_time
+                    )
                 return result
 
         except Exception as e:
@@ -995,18 +1150,11 @@ class AgentRuntime:
 
     def format_final_answer_for_gradio(self, final_answer, memory=None):
         """Ensure final_answer can be rendered correctly by Gradio UI"""
-        import json
-        # If the answer is a JSON string, try to parse it
-        if (isinstance(final_answer, str) and
-                final_answer.strip().startswith('{')):
-            try:
-                answer_dict = json.loads(final_answer)
-                # Extract content field as Markdown content
-                if (isinstance(answer_dict, dict) and
-                        "content" in answer_dict):
-                    return answer_dict["content"]
-            except json.JSONDecodeError:
-                pass
+        # If the answer is a JSON string, use its Markdown content
+        if isinstance(final_answer, str):
+            answer = FinalAnswer.from_output(final_answer)
+            if answer is not None:
+                return answer.markdown
         return final_answer
 
 
@@ -5,30 +5,170 @@
 
 """
 Stream Aggregator for smolagents v1.19.0
-Handles streaming aggregation outside of Model class
+Handles streaming aggregation outside of Model class, collecting content
+in a shared append-only buffer
 """
 
-from typing import Generator, Dict, Any, Optional
+from typing import Generator, Dict, Any, List, Optional
 from smolagents.models import ChatMessageStreamDelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class StreamBuffer:
+    """Append-only text buffer shared by everything reading one stream
+
+    Chunks are kept as a list, so appending costs O(len(chunk))
+    regardless of how long the stream grows. The full text is joined
+    when requested and cached: reading it again is free until the next
+    append, after which the cached text is extended by the new chunks,
+    which still copies it. Readers that only need new content take a
+    ``StreamCursor`` instead of re-reading the whole text.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer"""
+        self._chunks: List[str] = []
+        self._length = 0
+        self._text = ""
+        self._joined_chunks = 0
+        self._ends_in_space = True
+        self.token_count = 0
+        # Bumped by clear() so cursors know to start over
+        self.generation = 0
+
+    def append(self, chunk: str, count_tokens: bool = True) -> None:
+        """Append a chunk of text
+
+        Args:
+            chunk: Text to append
+            count_tokens: Whether to update the token estimate
+        """
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        if count_tokens:
+            self.token_count += self._count_words(chunk)
+
+    def _count_words(self, chunk: str) -> int:
+        """Count words in a chunk, merging words split across chunks
+
+        Keeps ``token_count`` equal to ``len(text.split())`` without
+        re-splitting the accumulated text.
+        """
+        words = len(chunk.split())
+        if words and not self._ends_in_space and not chunk[0].isspace():
+            words -= 1
+        self._ends_in_space = chunk[-1].isspace()
+        return words
+
+    @property
+    def text(self) -> str:
+        """Full text, extended by chunks appended since the last read"""
+        if self._joined_chunks != len(self._chunks):
+            end = len(self._chunks)
+            self._text = "".join(
+                [self._text, *self._chunks[self._joined_chunks:end]]
+            )
+            self._joined_chunks = end
+        return self._text
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of non-empty chunks appended"""
+        return len(self._chunks)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.text
+
+    def cursor(self, from_start: bool = True) -> "StreamCursor":
+        """Create a reader that returns only content it has not seen
+
+        Args:
+            from_start: Start at the beginning rather than the current end
+        """
+        return StreamCursor(self, 0 if from_start else len(self._chunks))
+
+    def clear(self) -> None:
+        """Drop all content and invalidate existing cursor positions"""
+        self._chunks = []
+        self._length = 0
+        self._text = ""
+        self._joined_chunks = 0
+        self._ends_in_space = True
+        self.token_count = 0
+        self.generation += 1
+
+
+class StreamCursor:
+    """Read position of one subscriber on a ``StreamBuffer``"""
+
+    def __init__(self, buffer: StreamBuffer, position: int = 0):
+        """Initialize the cursor
+
+        Args:
+            buffer: Buffer to read from
+            position: Index of the first unread chunk
+        """
+        self.buffer = buffer
+        self.position = position
+        self._generation = buffer.generation
+
+    def read(self) -> str:
+        """Get the content appended since the previous read"""
+        buffer = self.buffer
+        if self._generation != buffer.generation:
+            self._generation = buffer.generation
+            self.position = 0
+        end = len(buffer._chunks)
+        if self.position == end:
+            return ""
+        new = "".join(buffer._chunks[self.position:end])
+        self.position = end
+        return new
+
+    @property
+    def has_unread(self) -> bool:
+        """Whether content was appended since the previous read"""
+        return (
+            self._generation != self.buffer.generation
+            or self.position < self.buffer.chunk_count
+        )
+
+
 class StreamAggregator:
     """Aggregates streaming responses from models
 
     Following smolagents v1.19.0 pattern where streaming aggregation
-    is handled outside the Model class
+    is handled outside the Model class. Content is collected in a
+    ``StreamBuffer`` that other readers can share.
     """
 
-    def __init__(self):
-        """Initialize the stream aggregator"""
-        self.current_content = ""
-        self.token_count = 0
+    def __init__(self, buffer: Optional[StreamBuffer] = None):
+        """Initialize the stream aggregator
+
+        Args:
+            buffer: Existing buffer to aggregate into (new one if None)
+        """
+        self.buffer = buffer if buffer is not None else StreamBuffer()
         self.metadata = {}
         self.current_role = None
 
+    @property
+    def current_content(self) -> str:
+        """Content aggregated so far"""
+        return self.buffer.text
+
+    @property
+    def token_count(self) -> int:
+        """Estimated token count of the aggregated content"""
+        return self.buffer.token_count
+
     def aggregate_stream(
         self,
         stream_generator: Generator[ChatMessageStreamDelta, None, None],
@@ -45,12 +185,10 @@ class StreamAggregator:
         """
         try:
             for delta in stream_generator:
-                # Aggregate content
+                # Aggregate content (simple word-based token estimation,
+                # actual counting would use tokenizer)
                 if delta.content:
-                    self.current_content += delta.content
-                    if track_tokens:
-                        # Simple token estimation (actual counting would use tokenizer)
-                        self.token_count += len(delta.content.split())
+                    self.buffer.append(delta.content, track_tokens)
 
                 # Yield the delta as-is
                 yield delta
@@ -62,16 +200,15 @@ class StreamAggregator:
 
     def get_aggregated_content(self) -> str:
         """Get the full aggregated content"""
-        return self.current_content
+        return self.buffer.text
 
     def get_token_count(self) -> int:
         """Get estimated token count"""
-        return self.token_count
+        return self.buffer.token_count
 
     def reset(self):
         """Reset the aggregator state"""
-        self.current_content = ""
-        self.token_count = 0
+        self.buffer.clear()
         self.metadata = {}
 
     def add_chunk(self, chunk: str, **kwargs) -> None:
@@ -81,10 +218,7 @@ class StreamAggregator:
             chunk: Text chunk to add
             **kwargs: Additional parameters (for compatibility)
         """
-        self.current_content += chunk
-        if chunk:
-            # Simple token estimation
-            self.token_count += len(chunk.split())
+        self.buffer.append(chunk)
 
         # Store role if provided (for compatibility with tests)
         if 'role' in kwargs:
@@ -102,14 +236,20 @@ class ModelStreamWrapper:
     following smolagents v1.19.0 architecture
     """
 
-    def __init__(self, model):
+    def __init__(self, model, buffer: Optional[StreamBuffer] = None):
         """Initialize with a model instance
 
         Args:
             model: The underlying model (e.g., LiteLLMModel)
+            buffer: Shared buffer to stream into (new one if None)
         """
         self.model = model
-        self.aggregator = StreamAggregator()
+        self.aggregator = StreamAggregator(buffer)
+
+    @property
+    def buffer(self) -> StreamBuffer:
+        """Buffer holding the content of the current stream"""
+        return self.aggregator.buffer
 
     def generate_stream(
         self,
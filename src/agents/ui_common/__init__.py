@@ -20,6 +20,12 @@ from .constants import (
 # Export UI formatter
 from .console_formatter import ConsoleFormatter
 from .streaming_formatter import StreamingConsoleFormatter
+from .incremental_markdown import (
+    IncrementalMarkdownRenderer, MarkdownBlockSplitter
+)
+from .startup_profile import (
+    ImportProfile, print_startup_profile, profile_startup
+)
 
 # Gradio adapter removed - use Web API v2 instead
 
@@ -35,5 +41,11 @@ __all__ = [
     'CODE_EXECUTION_EMOJI',
     # Classes
     'ConsoleFormatter',
-    'StreamingConsoleFormatter'
+    'StreamingConsoleFormatter',
+    'IncrementalMarkdownRenderer',
+    'MarkdownBlockSplitter',
+    'ImportProfile',
+    # Functions
+    'profile_startup',
+    'print_startup_profile'
 ]
@@ -12,8 +12,9 @@ TODO: clean up redundant and invalid token stats code
 
 import logging
 import time
-import re
-from typing import Dict, Any, Optional, List, Callable, Set, DefaultDict
+from typing import (
+    Dict, Any, Optional, List, Callable, Set, DefaultDict, FrozenSet
+)
 from collections import defaultdict
 
 from smolagents.memory import (
@@ -24,6 +25,8 @@ from smolagents.monitoring import AgentLogger, Monitor, LogLevel
 from smolagents import TokenUsage
 from rich.console import Console
 
+from ..code_analysis import analyze_code, extract_code, known_tool_names
+
 
 logger = logging.getLogger(__name__)
 
@@ -72,14 +75,6 @@ class AgentStepCallback:
             "step_tokens": {}
         }
 
-        # Common tool names used in both React and CodeAct modes
-        self.known_tools = [
-            "search_links", "search_fast", "read_url", "chunk_text",
-            "embed_texts", "rerank_texts", "wolfram", "academic_retrieval",
-            "final_answer", "xcom_deep_qa", "github_repo_qa",
-            "python_interpreter"
-        ]
-
         # use smolagents' Monitor to track token
         self.model = model
         self.monitor = None
@@ -95,11 +90,13 @@ class AgentStepCallback:
 
         logger.info("🔧 Created CLI step callback")
 
-    def __call__(self, memory_step: MemoryStep) -> None:
+    def __call__(self, memory_step: MemoryStep, agent=None) -> None:
         """Process memory step callback
 
         Args:
             memory_step: Memory step object from smolagents
+            agent: Agent that ran the step (passed by smolagents); its
+                tools are recognized in CodeAct code
         """
         step_start_time = time.time()
         step_interval = step_start_time - self.last_step_time
@@ -135,7 +132,10 @@ class AgentStepCallback:
                     )
 
             # Extract step data based on step type
-            step_data = self._extract_step_data(memory_step)
+            tool_names = (
+                known_tool_names(agent) if agent is not None else None
+            )
+            step_data = self._extract_step_data(memory_step, tool_names)
 
             # Extract token counting from the step if available
             self._extract_token_stats(memory_step, step_data)
@@ -277,11 +277,16 @@ class AgentStepCallback:
             )
         }
 
-    def _extract_step_data(self, step: MemoryStep) -> Dict[str, Any]:
+    def _extract_step_data(
+        self,
+        step: MemoryStep,
+        tool_names: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Any]:
         """Extract relevant data from memory step based on step type
 
         Args:
             step: Memory step object
+            tool_names: Tool names to detect in code (default: known tools)
 
         Returns:
             Dict with structured step data
@@ -299,7 +304,7 @@ class AgentStepCallback:
         elif isinstance(step, TaskStep):
             return self._process_task_step(step, base_data)
         elif isinstance(step, ActionStep):
-            return self._process_action_step(step, base_data)
+            return self._process_action_step(step, base_data, tool_names)
         elif isinstance(step, PlanningStep):
             return self._process_planning_step(step, base_data)
         elif isinstance(step, FinalAnswerStep):
@@ -353,13 +358,15 @@ class AgentStepCallback:
     def _process_action_step(
         self,
         step: ActionStep,
-        base_data: Dict[str, Any]
+        base_data: Dict[str, Any],
+        tool_names: Optional[FrozenSet[str]] = None
     ) -> Dict[str, Any]:
         """Process action step
 
         Args:
             step: Action step
             base_data: Base step data
+            tool_names: Tool names to detect in code (default: known tools)
 
         Returns:
             Dict with processed step data
@@ -436,7 +443,7 @@ class AgentStepCallback:
                 if tool_name == "python_interpreter":
                     # Extract tools used in Python code
                     code_tools = self._extract_tools_from_code(
-                        step.model_output
+                        step.model_output, tool_names
                     )
                     if code_tools:
                         tool_data["code_tools"] = code_tools
@@ -479,58 +486,29 @@ class AgentStepCallback:
 
         return base_data
 
-    def _extract_tools_from_code(self, model_output) -> List[str]:
+    def _extract_tools_from_code(
+        self,
+        model_output,
+        tool_names: Optional[FrozenSet[str]] = None
+    ) -> List[str]:
         """Extract tools from Python code
 
         Args:
             model_output: model output, may contain Python code
+            tool_names: Tool names to detect (default: known tools)
 
         Returns:
             List[str]: tool names list
         """
-        if not model_output:
-            return []
-
-        # extract Python code
-        model_output_str = str(model_output)
         # Support both markdown and XML formats
-        markdown_blocks = re.findall(
-            r'```python\s*(.*?)\s*```',
-            model_output_str,
-            re.DOTALL
-        )
-        xml_blocks = re.findall(
-            r'<code>\s*(.*?)\s*</code>',
-            model_output_str,
-            re.DOTALL
-        )
-        code_blocks = markdown_blocks + xml_blocks
-
-        if not code_blocks:
+        code = extract_code(model_output)
+        if not code:
             return []
 
-        code = code_blocks[0]
-        tool_calls = []
-
-        # agent tool extraction logic enhancement
-        # 1. check direct function call: tool_name(...)
-        # 2. check variable assignment: var = tool_name(...)
-        # 3. check object method call: obj.tool_name(...)
-        # 4. check object in list: [tool_name(...)]
-        for tool in self.known_tools:
-            # 1. direct function call: tool_name(...)
-            pattern1 = fr'\b{tool}\s*\('
-            # 2. variable assignment: var = tool_name(...)
-            pattern2 = fr'=\s*{tool}\s*\('
-            # 3. object method call: obj.tool_name(...)
-            pattern3 = fr'\.{tool}\s*\('
-            # 4. object in list: [tool_name(...)]
-            pattern4 = fr'\[\s*{tool}\s*\('
-
-            if (re.search(pattern1, code) or re.search(pattern2, code) or
-                    re.search(pattern3, code) or re.search(pattern4, code)):
-                tool_calls.append(tool)
-                logger.debug(f"Found tool in code: {tool}")
+        # Tool names come from the running agent when smolagents passes
+        # it; the analysis is shared with the web UI and the CodeAct
+        # safety check
+        tool_calls = analyze_code(code, tool_names).tool_names
 
         # record scan results
         if tool_calls:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/agents/ui_common/incremental_markdown.py
+# code style: PEP 8
+
+"""
+Incremental Markdown Rendering for CLI Streaming
+Splits streamed markdown into completed blocks, printed once, and a live
+tail block that is redrawn at a capped frame rate
+"""
+
+import re
+import time
+from typing import List, Optional
+
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
+from rich.markdown import Markdown
+from rich.text import Text
+
+from ..stream_aggregator import StreamBuffer
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Opening/closing line of a fenced code block (``` or ~~~)
+_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+# Markdown table row
+_TABLE_ROW_RE = re.compile(r'^\s*\|')
+
+
+class MarkdownBlockSplitter:
+    """Incrementally splits streamed markdown into top-level blocks
+
+    A block is completed by a blank line outside fenced code, by the
+    closing line of a fenced code block, or by a fence opening after
+    other content. Only new text is scanned on each ``feed``.
+    """
+
+    def __init__(self):
+        """Initialize the splitter"""
+        self._block_lines: List[str] = []
+        self._partial_line = ""
+        self._fence: Optional[str] = None
+
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text
+
+        Args:
+            text: Newly streamed text
+
+        Returns:
+            Blocks completed by this text, in order
+        """
+        if not text:
+            return []
+        lines = (self._partial_line + text).split("\n")
+        self._partial_line = lines.pop()
+
+        completed = []
+        for line in lines:
+            block = self._add_line(line)
+            if block is not None:
+                completed.append(block)
+        return completed
+
+    def _add_line(self, line: str) -> Optional[str]:
+        """Add one complete line, returning a block it completes"""
+        fence = _FENCE_RE.match(line)
+
+        if self._fence is not None:
+            self._block_lines.append(line)
+            if (fence and fence.group(1)[0] == self._fence[0]
+                    and len(fence.group(1)) >= len(self._fence)
+                    and not line[fence.end():].strip()):
+                self._fence = None
+                return self._take_block()
+            return None
+
+        if fence:
+            completed = self._take_block()
+            self._fence = fence.group(1)
+            self._block_lines.append(line)
+            return completed
+
+        if not line.strip():
+            return self._take_block()
+
+        self._block_lines.append(line)
+        return None
+
+    def _take_block(self) -> Optional[str]:
+        if not self._block_lines:
+            return None
+        block = "\n".join(self._block_lines)
+        self._block_lines = []
+        return block
+
+    @property
+    def tail(self) -> str:
+        """Text of the block still being streamed"""
+        if self._partial_line:
+            return "\n".join(self._block_lines + [self._partial_line])
+        return "\n".join(self._block_lines)
+
+    @property
+    def tail_line_count(self) -> int:
+        """Number of lines in the tail block"""
+        return len(self._block_lines) + (1 if self._partial_line else 0)
+
+    @property
+    def in_code_block(self) -> bool:
+        """Whether the tail is an unfinished fenced code block"""
+        return self._fence is not None
+
+    def flush(self) -> Optional[str]:
+        """Complete and return the tail block at the end of the stream"""
+        if self._partial_line:
+            self._block_lines.append(self._partial_line)
+            self._partial_line = ""
+        self._fence = None
+        return self._take_block()
+
+
+class IncrementalMarkdownRenderer:
+    """Renders a streamed markdown answer without full redraws
+
+    Completed blocks are rendered once and printed above a ``Live``
+    region, so their cost is paid a single time. Only the tail block is
+    redrawn, at most ``max_fps`` times per second. Long unfinished code
+    blocks and tables are previewed as plain text, cropped to the last
+    ``max_tail_lines`` lines, and highlighted once they complete.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        buffer: StreamBuffer,
+        max_fps: float = 12.0,
+        max_tail_lines: int = 40,
+        code_theme: str = "monokai"
+    ):
+        """Initialize the renderer
+
+        Args:
+            console: Rich console to render to
+            buffer: Buffer the streamed text is appended to
+            max_fps: Maximum redraws of the tail block per second
+            max_tail_lines: Lines of the tail block kept on screen
+            code_theme: Pygments theme for code blocks
+        """
+        self.console = console
+        self.max_tail_lines = max_tail_lines
+        self.code_theme = code_theme
+        self.completed_blocks = 0
+        self._cursor = buffer.cursor()
+        self._splitter = MarkdownBlockSplitter()
+        self._frame_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._last_frame = 0.0
+        self._live: Optional[Live] = None
+
+    def start(self):
+        """Open the live region for the tail block"""
+        self._live = Live(
+            Text(""),
+            console=self.console,
+            auto_refresh=False,
+            transient=True,
+            vertical_overflow="crop",
+        )
+        self._live.start()
+
+    def refresh(self, force: bool = False):
+        """Consume new text from the buffer and update the display
+
+        Args:
+            force: Redraw the tail even if the frame interval has not passed
+        """
+        for block in self._splitter.feed(self._cursor.read()):
+            self._print_block(block)
+
+        now = time.monotonic()
+        if not force and now - self._last_frame < self._frame_interval:
+            return
+        self._last_frame = now
+        if self._live is not None:
+            self._live.update(self._render_tail(), refresh=True)
+
+    def finish(self):
+        """Render the remaining text and close the live region"""
+        for block in self._splitter.feed(self._cursor.read()):
+            self._print_block(block)
+        if self._live is not None:
+            self._live.update(Text(""), refresh=True)
+            self._live.stop()
+            self._live = None
+        block = self._splitter.flush()
+        if block is not None:
+            self._print_block(block)
+
+    def _print_block(self, block: str):
+        self.console.print(Markdown(block, code_theme=self.code_theme))
+        self.completed_blocks += 1
+
+    def _render_tail(self) -> RenderableType:
+        tail = self._splitter.tail
+        if not tail:
+            return Text("")
+
+        line_count = self._splitter.tail_line_count
+        lazy = (
+            self._splitter.in_code_block
+            or _TABLE_ROW_RE.match(tail) is not None
+        )
+        if line_count <= self.max_tail_lines and not (
+            lazy and line_count > self.max_tail_lines // 2
+        ):
+            return Markdown(tail, code_theme=self.code_theme)
+
+        # Plain preview of the newest lines until the block completes
+        shown = tail.split("\n")[-self.max_tail_lines:]
+        hidden = line_count - len(shown)
+        preview = Text("\n".join(shown), style="dim" if lazy else "")
+        if hidden <= 0:
+            return preview
+        return Group(
+            Text(f"… {hidden} more lines", style="dim italic"), preview
+        )
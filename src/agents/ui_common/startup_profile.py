@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/agents/ui_common/startup_profile.py
+# code style: PEP 8
+
+"""
+Import-time profiling of CLI / server startup.
+
+Startup is profiled in a fresh interpreter with ``python -X importtime``,
+since by the time a command line is parsed the current process has
+already imported everything.
+"""
+
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_RE = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$"
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@dataclass
+class ImportRecord:
+    """One module import from ``-X importtime`` output."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    # Nesting level; 0 for imports made directly by the profiled code
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Parsed import profile of a startup run."""
+    records: List[ImportRecord] = field(default_factory=list)
+    wall_time: float = 0.0
+    returncode: int = 0
+    error: str = ""
+
+    @property
+    def total_us(self) -> int:
+        """Total time spent importing."""
+        return sum(record.self_us for record in self.records)
+
+    def slowest(self, limit: int = 20) -> List[ImportRecord]:
+        """Modules with the highest cumulative import time."""
+        return sorted(
+            self.records, key=lambda r: r.cumulative_us, reverse=True
+        )[:limit]
+
+    def by_package(self, limit: int = 20) -> List[Tuple[str, int, int]]:
+        """Import time and module count per top-level package."""
+        totals: Dict[str, List[int]] = {}
+        for record in self.records:
+            package = record.module.split(".")[0]
+            total = totals.setdefault(package, [0, 0])
+            total[0] += record.self_us
+            total[1] += 1
+        ranked = sorted(totals.items(), key=lambda t: t[1][0], reverse=True)
+        return [(name, us, count) for name, (us, count) in ranked[:limit]]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse ``python -X importtime`` output.
+
+    Args:
+        output: Captured stderr; lines that aren't import timings are
+            ignored
+
+    Returns:
+        Import records in the order the imports completed
+    """
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(ImportRecord(
+            module=module,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=max(len(indent) - 1, 0) // 2,
+        ))
+    return records
+
+
+def profile_startup(
+    code: str = "import src.cli",
+    timeout: float = 300.0
+) -> ImportProfile:
+    """
+    Profile the imports made by a snippet of Python in a new interpreter.
+
+    Args:
+        code: Code to run, e.g. ``import src.cli``
+        timeout: Seconds before the profiled process is killed
+
+    Returns:
+        ImportProfile: Parsed import timings and total wall time
+    """
+    start_time = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return ImportProfile(
+            wall_time=time.perf_counter() - start_time,
+            returncode=-1,
+            error=f"Startup did not finish within {timeout:.0f}s",
+        )
+
+    error = ""
+    if completed.returncode != 0:
+        lines = [
+            line for line in completed.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        error = "\n".join(lines[-10:])
+    return ImportProfile(
+        records=parse_importtime(completed.stderr),
+        wall_time=time.perf_counter() - start_time,
+        returncode=completed.returncode,
+        error=error,
+    )
+
+
+def print_startup_profile(
+    profile: ImportProfile,
+    console: Optional[Console] = None,
+    limit: int = 20
+):
+    """
+    Print an import profile as tables.
+
+    Args:
+        profile: Profile from ``profile_startup``
+        console: Console to print to
+        limit: Rows per table
+    """
+    console = console or Console()
+
+    packages = Table(title="Import time by package")
+    packages.add_column("Package", style="cyan")
+    packages.add_column("Modules", justify="right")
+    packages.add_column("Time (ms)", justify="right", style="yellow")
+    packages.add_column("Share", justify="right")
+    total_us = profile.total_us or 1
+    for name, us, count in profile.by_package(limit):
+        packages.add_row(
+            name, str(count), f"{us / 1000:.1f}", f"{us / total_us:.0%}"
+        )
+
+    modules = Table(title="Slowest imports (cumulative)")
+    modules.add_column("Module", style="cyan")
+    modules.add_column("Self (ms)", justify="right")
+    modules.add_column("Cumulative (ms)", justify="right", style="yellow")
+    for record in profile.slowest(limit):
+        modules.add_row(
+            record.module,
+            f"{record.self_us / 1000:.1f}",
+            f"{record.cumulative_us / 1000:.1f}",
+        )
+
+    console.print(packages)
+    console.print(modules)
+    console.print(
+        f"[bold]{len(profile.records)}[/bold] modules imported in "
+        f"[bold]{profile.total_us / 1e6:.2f}s[/bold] "
+        f"(process wall time {profile.wall_time:.2f}s)"
+    )
+    if profile.returncode != 0:
+        console.print(
+            f"[red]Profiled startup exited with code "
+            f"{profile.returncode}[/red]"
+        )
+        if profile.error:
+            console.print(profile.error, markup=False)
@@ -8,6 +8,7 @@ Streaming Console Formatter for CLI
 Handles real-time display of streaming agent responses
 """
 
+import re
 import time
 from typing import Dict, Any, Optional, Union
 from rich.console import Console
@@ -15,7 +16,9 @@ from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.text import Text
 
+from ..stream_aggregator import StreamBuffer
 from .console_formatter import ConsoleFormatter
+from .incremental_markdown import IncrementalMarkdownRenderer
 from .constants import (
     THINKING_COLOR, THINKING_EMOJI, COLORS
 )
@@ -24,6 +27,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 class StreamingConsoleFormatter(ConsoleFormatter):
     """Formatter for handling streaming output in CLI
@@ -33,21 +38,34 @@ class StreamingConsoleFormatter(ConsoleFormatter):
     """
 
     def __init__(self, agent_type: str, console: Console,
-                 debug_mode: bool = False):
+                 debug_mode: bool = False,
+                 incremental_markdown: bool = False,
+                 max_fps: float = 12.0):
         """Initialize streaming formatter
 
         Args:
             agent_type: Type of agent ("react" or "codact")
             console: Rich console instance
             debug_mode: Whether to show debug information
+            incremental_markdown: Render the stream as markdown, redrawing
+                only the block still being streamed
+            max_fps: Maximum redraws per second in markdown mode
         """
         super().__init__(agent_type, console, debug_mode)
+        self.incremental_markdown = incremental_markdown
+        self.max_fps = max_fps
+        self._markdown_renderer = None
         self.streaming_panel = None
-        self.stream_content = ""
+        self.stream_buffer = StreamBuffer()
         self.stream_start_time = None
         self.is_streaming = False
         self._last_displayed_length = 0
 
+    @property
+    def stream_content(self) -> str:
+        """Content displayed during the current stream"""
+        return self.stream_buffer.text
+
     def _clean_chunk(self, chunk_str: str) -> str:
         """Clean console formatting from chunk
 
@@ -57,11 +75,8 @@ class StreamingConsoleFormatter(ConsoleFormatter):
         Returns:
             Cleaned chunk string
         """
-        import re
-
         # Remove ANSI escape codes
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        chunk_str = ansi_escape.sub('', chunk_str)
+        chunk_str = _ANSI_ESCAPE_RE.sub('', chunk_str)
 
         # Remove Rich markup
         rich_markup = re.compile(r'\[/?[a-zA-Z0-9_]+\]')
@@ -77,7 +92,7 @@ class StreamingConsoleFormatter(ConsoleFormatter):
     def on_stream_start(self):
         """Initialize streaming display"""
         self.stream_start_time = time.time()
-        self.stream_content = ""
+        self.stream_buffer.clear()
         self.is_streaming = True
         self._last_displayed_length = 0  # Track what we've already displayed
 
@@ -87,6 +102,12 @@ class StreamingConsoleFormatter(ConsoleFormatter):
             f"[{agent_color}]{THINKING_EMOJI} Streaming Response Starting..."
             f"[/{agent_color}]"
         )
+        if self.incremental_markdown:
+            self._markdown_renderer = IncrementalMarkdownRenderer(
+                self.console, self.stream_buffer, max_fps=self.max_fps
+            )
+            self._markdown_renderer.start()
+
         logger.debug("Streaming display started")
 
     def on_stream_chunk(self, chunk: Union[str, Any]):
@@ -135,6 +156,14 @@ class StreamingConsoleFormatter(ConsoleFormatter):
                 logger.debug(f"Skipping formatted chunk containing '{pattern}': {chunk_str[:50]}")
                 return
 
+        if self._markdown_renderer is not None:
+            # Keep whitespace and brackets: both are significant markdown
+            self.stream_buffer.append(
+                _ANSI_ESCAPE_RE.sub('', chunk_str), count_tokens=False
+            )
+            self._markdown_renderer.refresh()
+            return
+
         # Clean the chunk
         cleaned_chunk = self._clean_chunk(chunk_str)
 
@@ -143,7 +172,7 @@ class StreamingConsoleFormatter(ConsoleFormatter):
             return
 
         # Append cleaned chunk to content
-        self.stream_content += cleaned_chunk
+        self.stream_buffer.append(cleaned_chunk, count_tokens=False)
 
         # Just print the new chunk incrementally without re-rendering everything
         # This avoids the repetitive display issue
@@ -156,6 +185,10 @@ class StreamingConsoleFormatter(ConsoleFormatter):
 
         self.is_streaming = False
 
+        if self._markdown_renderer is not None:
+            self._markdown_renderer.finish()
+            self._markdown_renderer = None
+
         # Calculate elapsed time
         elapsed = 0.0
         if self.stream_start_time:
@@ -173,7 +206,7 @@ class StreamingConsoleFormatter(ConsoleFormatter):
         logger.debug(f"Streaming ended after {elapsed:.1f} seconds")
 
         # Reset state
-        self.stream_content = ""
+        self.stream_buffer.clear()
         self.stream_start_time = None
         self._last_displayed_length = 0
 
@@ -11,6 +11,7 @@ from typing import Optional
 
 from ..core.config.settings import settings
 from .v1.router import api_router
+from .v1.jobs import job_manager
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ async def default_lifespan(app):
     yield
 
     # Shutdown
+    await job_manager.shutdown()
     if V2_API_AVAILABLE:
         from .v2.session import session_manager
         await session_manager.shutdown()
@@ -27,6 +27,9 @@ router = APIRouter()
 class UserInput(BaseModel):
     """User input request model"""
     user_input: str = Field(..., description="User query content")
+    force_refresh: bool = Field(
+        False, description="Run the agent even if a cached answer matches"
+    )
 
 
 class DeepSearchRequest(BaseModel):
@@ -38,6 +41,9 @@ class DeepSearchRequest(BaseModel):
     model_args: Optional[Dict[str, Any]] = Field(
         None, description="Model additional parameters"
     )
+    force_refresh: bool = Field(
+        False, description="Run the agent even if a cached answer matches"
+    )
 
 
 # Basic Agent Endpoints
@@ -63,7 +69,10 @@ async def run_agent_endpoint(input_data: UserInput) -> PlainTextResponse:
     logger.info(
         f"Executing React agent with query: {input_data.user_input[:50]}..."
     )
-    result = await agent_runtime.run(input_data.user_input, "react")
+    result = await agent_runtime.run(
+        input_data.user_input, "react", stream=False,
+        force_refresh=input_data.force_refresh
+    )
 
     if result.startswith("Error:") or result.startswith(
         "Error processing request:"
@@ -97,7 +106,10 @@ async def run_deepsearch_agent(input_data: UserInput) -> PlainTextResponse:
         f"Executing DeepSearch agent with query: "
         f"{input_data.user_input[:50]}..."
     )
-    result = await agent_runtime.run(input_data.user_input)
+    result = await agent_runtime.run(
+        input_data.user_input, stream=False,
+        force_refresh=input_data.force_refresh
+    )
 
     # Handle different result types
     if isinstance(result, dict):
@@ -146,7 +158,9 @@ async def run_selected_agent(
     )
     result = await agent_runtime.run(
         input_data.user_input,
-        input_data.agent_type
+        input_data.agent_type,
+        stream=False,
+        force_refresh=input_data.force_refresh
     )
 
     if result.startswith("Error:") or result.startswith(
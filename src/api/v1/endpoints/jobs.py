@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/api/v1/endpoints/jobs.py
+# code style: PEP 8
+
+"""
+DeepSearchAgents - Background Agent Job Routes
+
+Submit agent runs as jobs, then poll for the result or follow the job's
+status changes over Server-Sent Events.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from ..jobs import (
+    JOB_AGENT_TYPES, PRIORITIES, JobStateError, QueueFullError, job_manager
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Seconds between SSE keep-alive comments while a job is unchanged
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+class JobRequest(BaseModel):
+    """Job submission request model"""
+    user_input: str = Field(..., description="User query content")
+    agent_type: str = Field(
+        "codact", description="Agent type used (codact or react)"
+    )
+    priority: str = Field(
+        "normal", description="Job priority (high, normal or low)"
+    )
+    client_id: Optional[str] = Field(
+        None,
+        description="Client the job is accounted to for fair scheduling "
+                    "(defaults to the X-Client-ID header)"
+    )
+    force_refresh: bool = Field(
+        False, description="Run the agent even if a cached answer matches"
+    )
+
+
+def _job_links(job_id: str) -> Dict[str, str]:
+    base = f"/api/v1/jobs/{job_id}"
+    return {"self": base, "events": f"{base}/events"}
+
+
+def _get_job_or_404(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post(
+    "",
+    status_code=202,
+    operation_id="submit_job",
+    summary="Submit an agent job",
+    description="Queue an agent run and return its job ID immediately; "
+                "fetch the result by polling or over SSE"
+)
+async def submit_job(
+    request: JobRequest,
+    x_client_id: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """Queue an agent job
+
+    Args:
+        request: Query, agent type, priority and client
+        x_client_id: Client ID header, used when the body has none
+
+    Returns:
+        Dict: Job ID, status, queue position and links
+    """
+    if request.agent_type not in JOB_AGENT_TYPES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unsupported agent type: {request.agent_type}"
+        )
+    if request.priority not in PRIORITIES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown priority: {request.priority}"
+        )
+
+    try:
+        job = await job_manager.submit(
+            request.user_input,
+            agent_type=request.agent_type,
+            priority=request.priority,
+            client_id=request.client_id or x_client_id,
+            force_refresh=request.force_refresh,
+        )
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": "30"}
+        )
+
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "queue_position": job_manager.queue_position(job),
+        "links": _job_links(job.job_id),
+    }
+
+
+@router.get(
+    "/metrics",
+    operation_id="job_metrics",
+    summary="Job queue metrics",
+    description="Queue depth, worker usage, queue wait and run times"
+)
+async def get_job_metrics() -> Dict[str, Any]:
+    """Get job queue metrics"""
+    return job_manager.metrics()
+
+
+@router.get(
+    "/{job_id}",
+    operation_id="get_job",
+    summary="Get job status and result"
+)
+async def get_job(job_id: str) -> Dict[str, Any]:
+    """Get a job's status, and its result once finished
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        Dict: Job state
+    """
+    job = _get_job_or_404(job_id)
+    data = job.to_dict()
+    data["queue_position"] = job_manager.queue_position(job)
+    data["links"] = _job_links(job_id)
+    return data
+
+
+@router.get(
+    "/{job_id}/events",
+    operation_id="stream_job_events",
+    summary="Stream job status over SSE",
+    description="Server-Sent Events stream with one event per job state "
+                "change, closed after the final state"
+)
+async def stream_job_events(job_id: str) -> StreamingResponse:
+    """Stream a job's state changes as Server-Sent Events
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` of job states
+    """
+    _get_job_or_404(job_id)
+
+    async def events():
+        last_version = None
+        async for job in job_manager.watch(
+            job_id, timeout=SSE_KEEPALIVE_SECONDS
+        ):
+            if job.version == last_version:
+                yield ": keep-alive\n\n"
+                continue
+            last_version = job.version
+            data = job.to_dict(include_result=job.is_finished)
+            data["queue_position"] = job_manager.queue_position(job)
+            yield (
+                f"id: {job.version}\n"
+                f"event: {job.status.value}\n"
+                f"data: {json.dumps(data)}\n\n"
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete(
+    "/{job_id}",
+    operation_id="cancel_job",
+    summary="Cancel a job"
+)
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """Cancel a queued or running job
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        Dict: Job state after cancellation
+    """
+    try:
+        job = job_manager.cancel(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    except JobStateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return job.to_dict(include_result=False)
@@ -0,0 +1,656 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/api/v1/jobs.py
+# code style: PEP 8
+
+"""
+DeepSearchAgents - Background Agent Jobs
+
+Agent runs submitted through the jobs API are queued and executed by a
+bounded pool of workers instead of holding an HTTP request open for the
+whole run. Queued jobs are served by priority, and round-robin across
+clients within a priority so one client's burst cannot starve others.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any, AsyncGenerator, Awaitable, Callable, Deque, Dict, List, Optional
+)
+
+from ...core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Priority name -> queue level (lower levels are served first)
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+# Agent types a job can run
+JOB_AGENT_TYPES = ("codact", "react")
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINAL_STATES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity"""
+
+
+class JobStateError(Exception):
+    """Raised when a job cannot make the requested transition"""
+
+
+@dataclass
+class Job:
+    """A queued or executed agent run"""
+    job_id: str
+    user_input: str
+    agent_type: str
+    priority: str = "normal"
+    client_id: str = "anonymous"
+    # Skip the answer cache lookup
+    force_refresh: bool = False
+    status: JobStatus = JobStatus.QUEUED
+    result: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # Bumped on every state change so watchers can wait for updates
+    version: int = 0
+    _changed: asyncio.Event = field(
+        default_factory=asyncio.Event, repr=False
+    )
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a final state"""
+        return self.status in FINAL_STATES
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Time spent queued before a worker picked the job up"""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.created_at
+
+    @property
+    def run_seconds(self) -> Optional[float]:
+        """Time spent running"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def touch(self):
+        """Record a state change and wake up watchers"""
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Serialize the job for API responses"""
+        data = {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "agent_type": self.agent_type,
+            "priority": self.priority,
+            "client_id": self.client_id,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "wait_seconds": self.wait_seconds,
+            "run_seconds": self.run_seconds,
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class FairShareQueue:
+    """
+    Priority queue with round-robin fair share across clients.
+
+    Each priority level keeps one FIFO per client, in an ordered ring of
+    clients. ``pop`` serves the highest non-empty priority and rotates
+    through its clients, so each client gets one job per turn.
+    """
+
+    def __init__(self):
+        """Initialize the queue"""
+        self._levels: Dict[int, "OrderedDict[str, Deque[Job]]"] = {
+            level: OrderedDict() for level in sorted(PRIORITIES.values())
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, job: Job):
+        """Add a job at the end of its client's queue"""
+        clients = self._levels[PRIORITIES[job.priority]]
+        clients.setdefault(job.client_id, deque()).append(job)
+        self._size += 1
+
+    def pop(self) -> Optional[Job]:
+        """Take the next job by priority and client turn"""
+        for clients in self._levels.values():
+            if not clients:
+                continue
+            client_id, jobs = next(iter(clients.items()))
+            job = jobs.popleft()
+            if jobs:
+                clients.move_to_end(client_id)
+            else:
+                del clients[client_id]
+            self._size -= 1
+            return job
+        return None
+
+    def remove(self, job: Job) -> bool:
+        """Remove a queued job, returning whether it was found"""
+        clients = self._levels[PRIORITIES[job.priority]]
+        jobs = clients.get(job.client_id)
+        if not jobs:
+            return False
+        try:
+            jobs.remove(job)
+        except ValueError:
+            return False
+        if not jobs:
+            del clients[job.client_id]
+        self._size -= 1
+        return True
+
+    def position(self, job: Job) -> Optional[int]:
+        """
+        Estimate how many jobs will be served before this one.
+
+        Counts every job of higher priority plus the jobs of the same
+        priority served ahead of it in round-robin order.
+        """
+        level = PRIORITIES[job.priority]
+        ahead = 0
+        for other_level, clients in self._levels.items():
+            if other_level < level:
+                ahead += sum(len(jobs) for jobs in clients.values())
+        jobs = self._levels[level].get(job.client_id)
+        if not jobs or job not in jobs:
+            return None
+        index = jobs.index(job)
+        # Clients earlier in the ring get one more turn before ours
+        turns = index + 1
+        for client_id, others in self._levels[level].items():
+            if client_id == job.client_id:
+                ahead += index
+                turns = index
+            else:
+                ahead += min(len(others), turns)
+        return ahead
+
+    def depth(self) -> Dict[str, int]:
+        """Queued jobs per priority name"""
+        return {
+            name: sum(len(jobs) for jobs in self._levels[level].values())
+            for name, level in PRIORITIES.items()
+        }
+
+
+class LatencyWindow:
+    """Rolling window of durations for percentile metrics"""
+
+    def __init__(self, size: int = 1000):
+        """
+        Initialize the window.
+
+        Args:
+            size: Number of most recent samples kept
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float):
+        """Record one duration"""
+        self._samples.append(seconds)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Count, mean, p50, p95 and max of the recorded durations"""
+        if not self._samples:
+            return {
+                "count": 0, "mean": None, "p50": None, "p95": None,
+                "max": None
+            }
+        ordered = sorted(self._samples)
+
+        def pct(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        return {
+            "count": len(ordered),
+            "mean": round(sum(ordered) / len(ordered), 3),
+            "p50": round(pct(0.50), 3),
+            "p95": round(pct(0.95), 3),
+            "max": round(ordered[-1], 3),
+        }
+
+
+JobRunner = Callable[[Job, Dict[str, Any]], Awaitable[str]]
+
+
+async def run_agent_job(job: Job, worker_state: Dict[str, Any]) -> str:
+    """
+    Run a job's agent in a worker thread.
+
+    Each worker keeps its own agent per type and resets its memory between
+    runs, so agents are built once per worker instead of once per request.
+    Like ``AgentRuntime.run``, jobs are answered from the runtime's
+    semantic answer cache when a close enough question was answered
+    before, and seeded with a related answer otherwise.
+
+    Args:
+        job: Job to execute
+        worker_state: Per-worker storage for cached agents
+
+    Returns:
+        Final answer text
+
+    Raises:
+        ValueError: If the agent type is unsupported
+        RuntimeError: If the agent could not be created or failed
+    """
+    from ...agents.runtime import agent_runtime
+
+    cache = agent_runtime.answer_cache
+    match = None
+    if cache is not None and not job.force_refresh:
+        match = await cache.lookup(job.user_input, job.agent_type)
+        if match is not None and match.reusable:
+            return match.entry.final_answer
+
+    agents = worker_state.setdefault("agents", {})
+    agent = agents.get(job.agent_type)
+    if agent is None:
+        if job.agent_type == "react":
+            agent = agent_runtime.create_react_agent(debug_mode=False)
+        elif job.agent_type == "codact":
+            agent = agent_runtime.create_codact_agent(debug_mode=False)
+        else:
+            raise ValueError(f"Unsupported agent type: {job.agent_type}")
+        if agent is None:
+            raise RuntimeError(
+                f"Failed to initialize {job.agent_type} agent, "
+                f"missing required API keys"
+            )
+        agents[job.agent_type] = agent
+
+    task = job.user_input
+    if match is not None:
+        task = cache.seeded_task(job.user_input, match)
+    start_time = time.time()
+    run = asyncio.ensure_future(asyncio.to_thread(
+        agent.run, task, stream=False, reset=True
+    ))
+    try:
+        result = await asyncio.shield(run)
+    except asyncio.CancelledError:
+        await _stop_agent_run(agent, run)
+        raise
+    if isinstance(result, str) and result.startswith("Error:"):
+        raise RuntimeError(result)
+    result = result if isinstance(result, str) else str(result)
+
+    if cache is not None and result:
+        await cache.store(
+            job.user_input, job.agent_type, result,
+            execution_time=time.time() - start_time
+        )
+    return result
+
+
+async def _stop_agent_run(agent: Any, run: asyncio.Future):
+    """
+    Interrupt a cancelled agent run and wait for its thread to return.
+
+    The agent stops after its current step. Until then the worker stays
+    busy, so its cached agent never runs two tasks at once and no agent
+    thread outlives its worker slot.
+
+    Args:
+        agent: Agent whose run was cancelled
+        run: Future of the run's thread
+    """
+    inner = getattr(agent, "agent", None)
+    if hasattr(inner, "interrupt"):
+        inner.interrupt()
+    while not run.done():
+        try:
+            await asyncio.shield(run)
+        except asyncio.CancelledError:
+            # Cancelled again (e.g. on shutdown); the thread still runs
+            continue
+        except Exception:
+            break
+    if not run.cancelled() and run.exception() is not None:
+        logger.debug(f"Cancelled agent run ended with: {run.exception()}")
+
+
+class JobManager:
+    """
+    Bounded worker pool executing queued agent jobs.
+
+    Finished jobs are kept for ``result_ttl`` seconds so clients can poll
+    for results or reconnect to the event stream.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: int = 1000,
+        result_ttl: float = 3600.0,
+        runner: JobRunner = run_agent_job
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_workers: Number of jobs executed concurrently
+            max_queue_size: Maximum queued (not yet running) jobs
+            result_ttl: Seconds finished jobs are kept
+            runner: Coroutine executing one job
+        """
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.result_ttl = result_ttl
+        self.runner = runner
+
+        self._jobs: Dict[str, Job] = {}
+        self._queue = FairShareQueue()
+        self._available: Optional[asyncio.Condition] = None
+        self._workers: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+        self._wait_times = LatencyWindow()
+        self._run_times = LatencyWindow()
+        self._counters = {
+            "submitted": 0, "succeeded": 0, "failed": 0, "cancelled": 0,
+            "rejected": 0,
+        }
+
+    @property
+    def started(self) -> bool:
+        """Whether the workers are running"""
+        return bool(self._workers)
+
+    async def start(self):
+        """Start the workers and the expiry task"""
+        if self.started:
+            return
+        self._available = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}")
+            for i in range(self.max_workers)
+        ]
+        self._cleanup_task = asyncio.create_task(self._expire_jobs())
+        logger.info(f"Started job manager with {self.max_workers} workers")
+
+    async def shutdown(self):
+        """Stop the workers, cancelling running and queued jobs"""
+        tasks = self._workers + list(self._running.values())
+        if self._cleanup_task:
+            tasks.append(self._cleanup_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        while True:
+            job = self._queue.pop()
+            if job is None:
+                break
+            self._finish(job, JobStatus.CANCELLED, error="Server shutdown")
+
+        self._workers = []
+        self._running.clear()
+        self._cleanup_task = None
+        logger.info("Job manager shut down")
+
+    async def submit(
+        self,
+        user_input: str,
+        agent_type: str = "codact",
+        priority: str = "normal",
+        client_id: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> Job:
+        """
+        Queue a new job.
+
+        Args:
+            user_input: Query for the agent
+            agent_type: Agent type (react or codact)
+            priority: Priority name (high, normal or low)
+            client_id: Client the job is accounted to for fair share
+            force_refresh: Run the agent even if a cached answer matches
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If the agent type or priority is unknown
+            QueueFullError: If the queue is at capacity
+        """
+        if agent_type not in JOB_AGENT_TYPES:
+            raise ValueError(
+                f"Unsupported agent type '{agent_type}'; "
+                f"expected one of {', '.join(JOB_AGENT_TYPES)}"
+            )
+        if priority not in PRIORITIES:
+            raise ValueError(
+                f"Unknown priority '{priority}'; "
+                f"expected one of {', '.join(PRIORITIES)}"
+            )
+        if len(self._queue) >= self.max_queue_size:
+            self._counters["rejected"] += 1
+            raise QueueFullError(
+                f"Job queue is full ({self.max_queue_size} jobs)"
+            )
+        await self.start()
+
+        job = Job(
+            job_id=str(uuid.uuid4()),
+            user_input=user_input,
+            agent_type=agent_type,
+            priority=priority,
+            client_id=client_id or "anonymous",
+            force_refresh=force_refresh,
+        )
+        self._jobs[job.job_id] = job
+        self._queue.push(job)
+        self._counters["submitted"] += 1
+        async with self._available:
+            self._available.notify()
+
+        logger.info(
+            f"Queued job {job.job_id} ({agent_type}, {priority}) "
+            f"for client {job.client_id}"
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID"""
+        return self._jobs.get(job_id)
+
+    def queue_position(self, job: Job) -> Optional[int]:
+        """Jobs ahead of a queued job, or None if it is not queued"""
+        if job.status != JobStatus.QUEUED:
+            return None
+        return self._queue.position(job)
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        Cancel a queued or running job.
+
+        A running agent is interrupted after its current step; its worker
+        stays busy until the agent thread returns, and the thread's result
+        is discarded.
+
+        Raises:
+            KeyError: If the job does not exist
+            JobStateError: If the job already finished
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job.is_finished:
+            raise JobStateError(
+                f"Job {job_id} already {job.status.value}"
+            )
+
+        if job.status == JobStatus.QUEUED:
+            self._queue.remove(job)
+        else:
+            task = self._running.get(job_id)
+            if task is not None:
+                task.cancel()
+        self._finish(job, JobStatus.CANCELLED, error="Cancelled by client")
+        return job
+
+    async def watch(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None
+    ) -> AsyncGenerator[Job, None]:
+        """
+        Yield the job now and after every state change until it finishes.
+
+        When ``timeout`` passes without a change the job is yielded again
+        unchanged, letting callers send keep-alives; compare ``version``
+        to tell the two apart.
+
+        Args:
+            job_id: Job to watch
+            timeout: Seconds to wait for each change (None waits forever)
+
+        Raises:
+            KeyError: If the job does not exist
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        while True:
+            changed = job._changed
+            version = job.version
+            yield job
+            if job.is_finished:
+                return
+            if job.version == version:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, worker usage, wait/run times and counters"""
+        depth = self._queue.depth()
+        now = time.time()
+        queued = [
+            job for job in self._jobs.values()
+            if job.status == JobStatus.QUEUED
+        ]
+        return {
+            "workers": self.max_workers,
+            "running": len(self._running),
+            "queue_depth": sum(depth.values()),
+            "queue_depth_by_priority": depth,
+            "queue_capacity": self.max_queue_size,
+            "oldest_queued_seconds": (
+                round(now - min(job.created_at for job in queued), 3)
+                if queued else None
+            ),
+            "wait_seconds": self._wait_times.summary(),
+            "run_seconds": self._run_times.summary(),
+            "jobs": dict(self._counters),
+        }
+
+    async def _worker(self, index: int):
+        worker_state: Dict[str, Any] = {}
+        while True:
+            async with self._available:
+                await self._available.wait_for(lambda: len(self._queue) > 0)
+                job = self._queue.pop()
+
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+            job.touch()
+            self._wait_times.add(job.wait_seconds)
+
+            task = asyncio.create_task(self.runner(job, worker_state))
+            self._running[job.job_id] = task
+            try:
+                result = await task
+            except asyncio.CancelledError:
+                if not job.is_finished:
+                    # The worker itself is being cancelled
+                    self._finish(
+                        job, JobStatus.CANCELLED, error="Server shutdown"
+                    )
+                    raise
+            except Exception as e:
+                logger.error(f"Job {job.job_id} failed: {e}")
+                self._finish(job, JobStatus.FAILED, error=str(e))
+            else:
+                if not job.is_finished:
+                    self._finish(job, JobStatus.SUCCEEDED, result=result)
+            finally:
+                self._running.pop(job.job_id, None)
+
+    def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        if job.run_seconds is not None:
+            self._run_times.add(job.run_seconds)
+        self._counters[status.value] += 1
+        job.touch()
+        logger.info(f"Job {job.job_id} {status.value}")
+
+    async def _expire_jobs(self):
+        interval = min(60.0, max(1.0, self.result_ttl / 4))
+        while True:
+            await asyncio.sleep(interval)
+            cutoff = time.time() - self.result_ttl
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.is_finished and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+            if expired:
+                logger.info(f"Expired {len(expired)} finished jobs")
+
+
+job_manager = JobManager(
+    max_workers=settings.JOB_MAX_WORKERS,
+    max_queue_size=settings.JOB_MAX_QUEUE_SIZE,
+    result_ttl=settings.JOB_RESULT_TTL,
+)
@@ -12,7 +12,7 @@ Only basic endpoints are enabled.
 
 from fastapi import APIRouter
 
-from .endpoints import agent, health
+from .endpoints import agent, health, jobs
 
 # Create API v1 version routes
 api_router = APIRouter(prefix="/api/v1")
@@ -20,3 +20,4 @@ api_router = APIRouter(prefix="/api/v1")
 # Include endpoints routes
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(agent.router, prefix="/agents", tags=["agents"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/api/v2/encoding.py
+# code style: PEP 8
+
+"""
+WebSocket frame encoding for DeepSearchAgents v2 Web API.
+
+The frame format is negotiated with a WebSocket subprotocol at connect:
+
+- ``dsagent.json.v1`` (or no subprotocol): text frames holding the JSON
+  form of each message, as before. Message JSON is cached on the message,
+  so each message is serialized once however many clients receive it.
+- ``dsagent.msgpack.v1`` (needs ``msgpack``): binary frames. A message is
+  a MessagePack array ``[WIRE_SCHEMA_VERSION, *fields]`` in
+  ``WIRE_FIELDS`` order; control messages (pong, error, history, resume,
+  state) are MessagePack maps. Metadata keys and short string values are
+  interned per connection: the first occurrence of a string is sent as-is
+  and takes the next id (0, 1, ...) while the table has room; later
+  occurrences are sent as ``ExtType(INTERN_EXT_TYPE, uint16 id)``.
+  ``MessageDecoder`` is the reference decoder.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel
+
+from .models import DSAgentRunMessage, WIRE_FIELDS, WIRE_SCHEMA_VERSION
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_SUBPROTOCOL = "dsagent.json.v1"
+MSGPACK_SUBPROTOCOL = "dsagent.msgpack.v1"
+
+# MessagePack extension type of an interned string reference
+INTERN_EXT_TYPE = 1
+
+Frame = Union[str, bytes]
+
+
+def dumps_json(payload: Any) -> str:
+    """Serialize a JSON-compatible value to compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def supported_subprotocols() -> List[str]:
+    """Subprotocols this server can speak."""
+    protocols = [JSON_SUBPROTOCOL]
+    if msgpack is not None:
+        protocols.append(MSGPACK_SUBPROTOCOL)
+    return protocols
+
+
+def negotiate_subprotocol(offered: Iterable[str]) -> Optional[str]:
+    """
+    Pick the first subprotocol offered by the client that we support.
+
+    Args:
+        offered: Subprotocols from the client's handshake, by preference
+
+    Returns:
+        Chosen subprotocol, or None to use plain JSON frames
+    """
+    supported = supported_subprotocols()
+    for protocol in offered:
+        if protocol in supported:
+            return protocol
+    return None
+
+
+class MessageEncoder:
+    """
+    Per-connection frame encoder.
+    """
+
+    def __init__(
+        self,
+        subprotocol: Optional[str] = None,
+        max_interned: int = 4096,
+        max_interned_length: int = 64
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            subprotocol: Negotiated subprotocol (None for plain JSON)
+            max_interned: Maximum strings in the intern table
+            max_interned_length: Longest string value that is interned
+        """
+        if subprotocol == MSGPACK_SUBPROTOCOL and msgpack is None:
+            raise ValueError("MessagePack frames need the msgpack package")
+        self.subprotocol = subprotocol
+        self.binary = subprotocol == MSGPACK_SUBPROTOCOL
+        self.max_interned = min(max_interned, 0xFFFF)
+        self.max_interned_length = max_interned_length
+        self._interned: Dict[str, int] = {}
+        self._packer = msgpack.Packer() if self.binary else None
+
+    def encode_message(self, message: DSAgentRunMessage) -> Frame:
+        """
+        Encode an agent message.
+
+        Args:
+            message: Message to send
+
+        Returns:
+            Text frame (JSON) or binary frame (MessagePack)
+        """
+        if not self.binary:
+            return message.to_json()
+
+        fields = message.to_wire()
+        metadata_index = WIRE_FIELDS.index("metadata")
+        frame = [WIRE_SCHEMA_VERSION]
+        frame.extend(fields[:metadata_index])
+        frame.append({
+            self._intern(key): self._intern(value)
+            for key, value in fields[metadata_index].items()
+        })
+        frame.extend(fields[metadata_index + 1:])
+        return self._packer.pack(frame)
+
+    def encode_control(self, payload: Union[BaseModel, Dict]) -> Frame:
+        """
+        Encode a control message (pong, error, history, resume, state).
+
+        Args:
+            payload: Pydantic model or JSON-compatible dict
+
+        Returns:
+            Text frame (JSON) or binary frame (MessagePack)
+        """
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump(mode="json")
+        if not self.binary:
+            return dumps_json(payload)
+        return self._packer.pack(payload)
+
+    def _intern(self, value: Any) -> Any:
+        """Replace a repeated short string with its intern reference."""
+        if not isinstance(value, str) or (
+            len(value) > self.max_interned_length
+        ):
+            return value
+        ref = self._interned.get(value)
+        if ref is not None:
+            return msgpack.ExtType(INTERN_EXT_TYPE, struct.pack(">H", ref))
+        if len(self._interned) < self.max_interned:
+            self._interned[value] = len(self._interned)
+        return value
+
+
+class MessageDecoder:
+    """
+    Reference decoder for binary frames of one connection.
+    """
+
+    def __init__(
+        self,
+        max_interned: int = 4096,
+        max_interned_length: int = 64
+    ):
+        """
+        Initialize the decoder with the encoder's limits.
+
+        Args:
+            max_interned: Maximum strings in the intern table
+            max_interned_length: Longest string value that is interned
+        """
+        if msgpack is None:
+            raise ValueError("MessagePack frames need the msgpack package")
+        self.max_interned = min(max_interned, 0xFFFF)
+        self.max_interned_length = max_interned_length
+        self._strings: List[str] = []
+
+    def decode(self, frame: bytes) -> Dict[str, Any]:
+        """
+        Decode a binary frame.
+
+        Args:
+            frame: Frame bytes
+
+        Returns:
+            Message fields, or the control message, as a dict
+        """
+        data = msgpack.unpackb(frame, strict_map_key=False)
+        if isinstance(data, dict):
+            return data
+        version = data[0]
+        if version != WIRE_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported wire schema version {version}")
+        message = dict(zip(WIRE_FIELDS, data[1:]))
+        metadata = {}
+        for key, value in message["metadata"].items():
+            key = self._resolve(key)
+            metadata[key] = self._resolve(value)
+        message["metadata"] = metadata
+        return message
+
+    def _resolve(self, value: Any) -> Any:
+        """Resolve an intern reference, registering new strings."""
+        if isinstance(value, msgpack.ExtType):
+            if value.code != INTERN_EXT_TYPE:
+                raise ValueError(f"Unknown extension type {value.code}")
+            return self._strings[struct.unpack(">H", value.data)[0]]
+        # Strings arrive as-is only until they are interned
+        if (
+            isinstance(value, str)
+            and len(value) <= self.max_interned_length
+            and len(self._strings) < self.max_interned
+        ):
+            self._strings.append(value)
+        return value
@@ -17,14 +17,16 @@ from datetime import datetime
 
 from fastapi import (
     APIRouter, WebSocket, WebSocketDisconnect,
-    HTTPException, Query, BackgroundTasks
+    HTTPException, Query, BackgroundTasks, Response
 )
 from pydantic import BaseModel, Field
 
 from .session import session_manager, SessionState
+from .encoding import Frame, MessageEncoder, negotiate_subprotocol
 from .models import (
     DSAgentRunMessage, QueryRequest as QueryRequestModel,
-    ErrorMessage, PingMessage, PongMessage
+    ErrorMessage, PingMessage, PongMessage, HistoryPageMessage,
+    ResumeMessage
 )
 
 logger = logging.getLogger(__name__)
@@ -86,7 +88,13 @@ async def create_session(request: CreateSessionRequest):
 async def agent_websocket(
     websocket: WebSocket, 
     session_id: str,
-    agent_type: str = Query("codact", description="Agent type (react/codact)")
+    agent_type: str = Query("codact", description="Agent type (react/codact)"),
+    last_seq: Optional[int] = Query(
+        None, description="Resume the stream after this sequence number"
+    ),
+    epoch: Optional[str] = Query(
+        None, description="Stream epoch last_seq was received in"
+    )
 ):
     """
     WebSocket endpoint for real-time agent interaction.
@@ -96,9 +104,28 @@ async def agent_websocket(
     - Server streams: DSAgentRunMessage objects
     - Client sends: {"type": "ping"} (keepalive)
     - Server sends: {"type": "pong"}
+    - Client sends: {"type": "get_messages", "limit": 100,
+      "after_seq"/"before_seq"/"step"/"component": optional}
+    - Server replays the page, then sends {"type": "history", ...}
+    - Client sends: {"type": "resume", "last_seq": N, "epoch": E} (or
+      connects with ?last_seq=N&epoch=E) after a dropped connection; E is
+      the ``stream_epoch`` of the run's user message or the last resume
+    - Server sends: {"type": "resume", ...}, the missed messages, then
+      live messages if the run is still in progress; a cursor from another
+      epoch replays the current run with complete=false
+
+    Frames are JSON text unless the client offers the
+    ``dsagent.msgpack.v1`` subprotocol (see ``encoding.py``).
     """
-    await websocket.accept()
-    logger.info(f"WebSocket connection accepted for session {session_id}")
+    subprotocol = negotiate_subprotocol(
+        websocket.scope.get("subprotocols", [])
+    )
+    await websocket.accept(subprotocol=subprotocol)
+    encoder = MessageEncoder(subprotocol)
+    logger.info(
+        f"WebSocket connection accepted for session {session_id} "
+        f"({subprotocol or 'json'})"
+    )
     
     # Note: TCP_NODELAY configuration removed due to compatibility issues
     # The asyncio.sleep(0) after each message send is sufficient for streaming
@@ -107,16 +134,19 @@ async def agent_websocket(
     session = session_manager.get_or_create(session_id, agent_type=agent_type)
 
     try:
+        if last_seq is not None:
+            await _resume_stream(
+                websocket, session, last_seq, epoch, encoder
+            )
+
         while True:
             # Receive message from client
             try:
                 data = await websocket.receive_json()
             except json.JSONDecodeError:
-                await websocket.send_json(
-                    ErrorMessage(
-                        message="Invalid JSON"
-                    ).model_dump()
-                )
+                await _send(websocket, encoder.encode_control(
+                    ErrorMessage(message="Invalid JSON")
+                ))
                 continue
 
             msg_type = data.get("type")
@@ -125,87 +155,96 @@ async def agent_websocket(
                 # Process query
                 query = data.get("query")
                 if not query:
-                    await websocket.send_json(
-                        ErrorMessage(
-                            message="Query is required"
-                        ).model_dump()
-                    )
+                    await _send(websocket, encoder.encode_control(
+                        ErrorMessage(message="Query is required")
+                    ))
                     continue
 
                 # Check if session is busy
-                if session.state == SessionState.PROCESSING:
-                    await websocket.send_json(
+                if session.is_running or (
+                    session.state == SessionState.PROCESSING
+                ):
+                    await _send(websocket, encoder.encode_control(
                         ErrorMessage(
                             message="Session is already processing a query"
-                        ).model_dump()
-                    )
+                        )
+                    ))
                     continue
 
-                # Process query and stream messages
+                # Run the query in the background and stream its messages;
+                # the run survives a dropped connection and can be resumed
                 try:
-                    message_count = 0
-                    async for message in session.process_query(query):
-                        message_count += 1
-                        # Log streaming messages with more detail
-                        logger.info(
-                            f"Sending message #{message_count} - "
-                            f"message_id: {message.message_id}, "
-                            f"streaming: {message.metadata.get('streaming', False)}, "
-                            f"is_delta: {message.metadata.get('is_delta', False)}, "
-                            f"is_initial_stream: {message.metadata.get('is_initial_stream', False)}, "
-                            f"stream_id: {message.metadata.get('stream_id')}, "
-                            f"step: {message.step_number}, "
-                            f"content_length: {len(message.content) if message.content else 0}"
-                        )
-                        # Send message as JSON
-                        await websocket.send_json(
-                            message.model_dump(mode='json')
+                    after_seq = session.last_seq
+                    session.start_query(query)
+                    # Subscribing before the task first runs misses nothing
+                    subscription = session.subscribe(after_seq=after_seq)
+                    try:
+                        await _send_subscription(
+                            websocket, subscription, encoder
                         )
-                        
-                        # Force immediate delivery - critical for streaming
-                        # Yield control to allow message to be sent
-                        await asyncio.sleep(0)
+                    finally:
+                        subscription.close()
 
+                except WebSocketDisconnect:
+                    raise
                 except Exception as e:
                     logger.error(
                         f"Error processing query: {e}",
                         exc_info=True
                     )
-                    await websocket.send_json(
-                        ErrorMessage(
-                            message=f"Processing error: {str(e)}"
-                        ).model_dump()
-                    )
+                    await _send(websocket, encoder.encode_control(
+                        ErrorMessage(message=f"Processing error: {str(e)}")
+                    ))
+
+            elif msg_type == "resume":
+                # Replay messages missed since last_seq, then follow live
+                await _resume_stream(
+                    websocket, session, data.get("last_seq", 0),
+                    data.get("epoch"), encoder
+                )
 
             elif msg_type == "ping":
                 # Keepalive
-                await websocket.send_json(PongMessage().model_dump())
+                await _send(websocket, encoder.encode_control(PongMessage()))
 
             elif msg_type == "get_messages":
-                # Get historical messages
+                # Get historical messages (cursor-paginated)
                 limit = data.get("limit", 100)
-                messages = session.get_messages(limit=limit)
+                page = session.get_message_page(
+                    after_seq=data.get("after_seq"),
+                    before_seq=data.get("before_seq"),
+                    limit=limit,
+                    step=data.get("step"),
+                    component=data.get("component")
+                )
+
+                # Replay messages; their serialization is cached
+                for entry in page:
+                    await _send(
+                        websocket, encoder.encode_message(entry.message)
+                    )
 
-                # Send all messages
-                for message in messages:
-                    await websocket.send_json(
-                        message.model_dump(mode='json')
+                await _send(websocket, encoder.encode_control(
+                    HistoryPageMessage(
+                        count=len(page),
+                        first_seq=page[0].seq if page else None,
+                        last_seq=page[-1].seq if page else None,
+                        has_more=len(page) == limit
                     )
+                ))
 
             elif msg_type == "get_state":
                 # Get session state
                 state = session.get_state()
-                await websocket.send_json({
+                await _send(websocket, encoder.encode_control({
                     "type": "state",
                     "state": state.model_dump(mode='json')
-                })
+                }))
 
             else:
-                await websocket.send_json(
-                    ErrorMessage(
-                        message=f"Unknown message type: {msg_type}"
-                    ).model_dump()
-                )
+                await _send(websocket, encoder.encode_control(
+                    ErrorMessage(message=f"Unknown message type: {msg_type}")
+                ))
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session {session_id}")
@@ -220,6 +259,76 @@ async def agent_websocket(
             pass
 
 
+async def _send(websocket: WebSocket, frame: Frame):
+    """Send an encoded frame as a text or binary WebSocket frame."""
+    if isinstance(frame, bytes):
+        await websocket.send_bytes(frame)
+    else:
+        await websocket.send_text(frame)
+
+
+async def _send_subscription(
+    websocket: WebSocket,
+    subscription,
+    encoder: MessageEncoder
+):
+    """Forward every message of a stream subscription to the client."""
+    message_count = 0
+    async for message in subscription:
+        message_count += 1
+        # Log streaming messages with more detail
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Sending message #{message_count} - "
+                f"seq: {message.seq}, "
+                f"message_id: {message.message_id}, "
+                f"streaming: {message.metadata.get('streaming', False)}, "
+                f"is_delta: {message.metadata.get('is_delta', False)}, "
+                f"is_initial_stream: "
+                f"{message.metadata.get('is_initial_stream', False)}, "
+                f"stream_id: {message.metadata.get('stream_id')}, "
+                f"step: {message.step_number}, "
+                f"content_length: "
+                f"{len(message.content) if message.content else 0}"
+            )
+        # Serialized once per message and shared by all connections
+        await _send(websocket, encoder.encode_message(message))
+
+        # Force immediate delivery - critical for streaming
+        # Yield control to allow message to be sent
+        await asyncio.sleep(0)
+
+
+async def _resume_stream(
+    websocket: WebSocket,
+    session,
+    last_seq: int,
+    epoch: Optional[str],
+    encoder: MessageEncoder
+):
+    """Send only the part of the stream the client missed."""
+    # A cursor without an epoch cannot be checked, so it never matches
+    subscription = session.subscribe(after_seq=last_seq, epoch=epoch or "")
+    try:
+        await _send(websocket, encoder.encode_control(
+            ResumeMessage(
+                last_seq=last_seq,
+                replayed=len(subscription.replayed),
+                complete=subscription.complete,
+                running=subscription.live,
+                epoch=subscription.epoch
+            )
+        ))
+        logger.info(
+            f"Resuming session {session.session_id} after seq {last_seq}: "
+            f"{len(subscription.replayed)} messages, "
+            f"complete={subscription.complete}, live={subscription.live}"
+        )
+        await _send_subscription(websocket, subscription, encoder)
+    finally:
+        subscription.close()
+
+
 # REST endpoints for session management
 @router.get("/sessions", response_model=List[Dict[str, Any]])
 async def list_sessions():
@@ -252,19 +361,48 @@ async def delete_session(session_id: str):
 @router.get("/sessions/{session_id}/messages")
 async def get_session_messages(
     session_id: str,
-    limit: int = Query(100, description="Maximum messages to return")
+    limit: int = Query(100, description="Maximum messages to return"),
+    after_seq: Optional[int] = Query(
+        None, description="Return messages after this sequence number"
+    ),
+    before_seq: Optional[int] = Query(
+        None, description="Return messages before this sequence number"
+    ),
+    step: Optional[int] = Query(None, description="Filter by step number"),
+    component: Optional[str] = Query(
+        None, description="Filter by UI component (chat/webide/terminal)"
+    )
 ):
-    """Get messages from a session."""
+    """
+    Get a page of messages from a session.
+
+    Messages are returned in ascending sequence order. Use ``first_seq`` as
+    the next ``before_seq`` to page backwards, or ``last_seq`` as the next
+    ``after_seq`` to page forwards.
+    """
     session = session_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    messages = session.get_messages(limit=limit)
-    return {
-        "session_id": session_id,
-        "messages": [m.model_dump(mode='json') for m in messages],
-        "total": len(messages)
-    }
+    page = session.get_message_page(
+        after_seq=after_seq,
+        before_seq=before_seq,
+        limit=limit,
+        step=step,
+        component=component
+    )
+
+    # Splice cached message JSON instead of re-serializing every message
+    body = (
+        '{"session_id":' + json.dumps(session_id)
+        + ',"messages":[' + ",".join(entry.to_json() for entry in page)
+        + '],"total":' + str(len(page))
+        + ',"first_seq":' + json.dumps(page[0].seq if page else None)
+        + ',"last_seq":' + json.dumps(page[-1].seq if page else None)
+        + ',"has_more":' + json.dumps(len(page) == limit)
+        + "}"
+    )
+    return Response(content=body, media_type="application/json")
 
 
 # Health check endpoint
@@ -11,8 +11,17 @@ Direct pass-through of Gradio ChatMessages with field renaming.
 
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional, Literal, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Version of the positional message layout used by binary frames
+WIRE_SCHEMA_VERSION = 1
+
+# Message fields in binary frame order (schema version 1)
+WIRE_FIELDS = (
+    "seq", "message_id", "role", "content", "timestamp",
+    "session_id", "step_number", "metadata",
+)
 
 
 class DSAgentRunMessage(BaseModel):
@@ -51,6 +60,19 @@ class DSAgentRunMessage(BaseModel):
         default=None,
         description="Agent execution step number"
     )
+    seq: Optional[int] = Field(
+        default=None,
+        description="Session stream sequence number (for resume)"
+    )
+
+    # Serialized forms, keyed by the sequence number they were made with;
+    # every connection and history replay reuses them
+    _json_cache: Optional[Tuple[Optional[int], str]] = PrivateAttr(
+        default=None
+    )
+    _wire_cache: Optional[Tuple[Optional[int], List[Any]]] = PrivateAttr(
+        default=None
+    )
 
     class Config:
         """Pydantic config"""
@@ -58,6 +80,28 @@ class DSAgentRunMessage(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+    def to_json(self) -> str:
+        """
+        JSON text of the message, serialized once.
+
+        Messages must not be modified after they are sent, apart from the
+        sequence number assigned by the session.
+        """
+        cached = self._json_cache
+        if cached is None or cached[0] != self.seq:
+            cached = (self.seq, self.model_dump_json())
+            self._json_cache = cached
+        return cached[1]
+
+    def to_wire(self) -> List[Any]:
+        """JSON-compatible field values in ``WIRE_FIELDS`` order, cached."""
+        cached = self._wire_cache
+        if cached is None or cached[0] != self.seq:
+            data = self.model_dump(mode="json")
+            cached = (self.seq, [data[name] for name in WIRE_FIELDS])
+            self._wire_cache = cached
+        return cached[1]
+
 
 class QueryRequest(BaseModel):
     """WebSocket query request"""
@@ -85,6 +129,50 @@ class ErrorMessage(BaseModel):
     )
 
 
+class HistoryPageMessage(BaseModel):
+    """WebSocket trailer sent after a replayed history page"""
+    type: Literal["history"] = "history"
+    count: int = Field(description="Number of messages replayed")
+    first_seq: Optional[int] = Field(
+        default=None,
+        description="Sequence number of the first replayed message"
+    )
+    last_seq: Optional[int] = Field(
+        default=None,
+        description="Sequence number of the last replayed message"
+    )
+    has_more: bool = Field(
+        default=False,
+        description="Whether more messages may exist beyond this page"
+    )
+
+
+class ResumeMessage(BaseModel):
+    """WebSocket header sent before replaying a resumed stream"""
+    type: Literal["resume"] = "resume"
+    last_seq: int = Field(
+        description="Last sequence number the client reported"
+    )
+    replayed: int = Field(description="Number of messages being replayed")
+    complete: bool = Field(
+        default=True,
+        description=(
+            "False when part of the gap was evicted; the client should "
+            "reload history with get_messages"
+        )
+    )
+    running: bool = Field(
+        default=False,
+        description="Whether live messages follow the replay"
+    )
+    epoch: Optional[str] = Field(
+        default=None,
+        description=(
+            "Current stream epoch; send it back with last_seq when resuming"
+        )
+    )
+
+
 class SessionState(BaseModel):
     """Session state information"""
     session_id: str
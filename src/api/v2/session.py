@@ -12,10 +12,12 @@ Uses direct Gradio message pass-through for maximum reliability.
 import asyncio
 import logging
 import uuid
-from typing import Dict, List, Optional, AsyncGenerator
+from typing import Dict, List, Optional, Set, Tuple, AsyncGenerator
 from enum import Enum
 from datetime import datetime, timezone
-from collections import deque
+from dataclasses import dataclass
+from bisect import bisect_left
+from collections import OrderedDict
 
 from src.agents.runtime import agent_runtime
 from .models import DSAgentRunMessage, SessionState as SessionStateModel
@@ -33,9 +35,34 @@ class SessionState(str, Enum):
     EXPIRED = "expired"
 
 
+@dataclass
+class StoredMessage:
+    """
+    A message held by the store together with its sequence number.
+
+    The JSON form is cached on the message, so the live send and every
+    history replay share one serialization.
+    """
+    seq: int
+    message: DSAgentRunMessage
+
+    def to_json(self) -> str:
+        """Get the cached JSON serialization of the message."""
+        return self.message.to_json()
+
+
 class MessageStore:
     """
-    Simple message store for session history.
+    Ring-buffer message store for session history.
+
+    Messages are keyed by a monotonically increasing sequence number, which
+    the session assigns across its whole stream (deltas included), so
+    history sequence numbers may have gaps. Entries live in a fixed-size
+    ring addressed by insertion position; cursors are resolved to positions
+    with a binary search, so lookup and pagination cost O(log n + page)
+    instead of O(history). Secondary indexes by step number and component
+    keep sorted position lists that are pruned lazily once the ring evicts
+    old entries.
     """
 
     def __init__(self, max_messages: int = 10000):
@@ -45,23 +72,332 @@ class MessageStore:
         Args:
             max_messages: Maximum messages to store (FIFO)
         """
-        self.messages: deque[DSAgentRunMessage] = deque(maxlen=max_messages)
+        if max_messages <= 0:
+            raise ValueError("max_messages must be positive")
+        self.max_messages = max_messages
+        self._ring: List[Optional[StoredMessage]] = [None] * max_messages
+        self._next_pos = 0
+        self._first_pos = 0
+        self._last_seq = 0
+        self._by_step: Dict[int, List[int]] = {}
+        self._by_component: Dict[str, List[int]] = {}
+
+    @property
+    def first_seq(self) -> Optional[int]:
+        """Sequence number of the oldest retained message."""
+        if self._first_pos == self._next_pos:
+            return None
+        return self._entry(self._first_pos).seq
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest message (0 if none yet)."""
+        return self._last_seq
+
+    @property
+    def messages(self) -> List[DSAgentRunMessage]:
+        """All retained messages in insertion order."""
+        return [
+            self._entry(pos).message
+            for pos in range(self._first_pos, self._next_pos)
+        ]
 
-    def add(self, message: DSAgentRunMessage):
-        """Add a message to the store."""
-        self.messages.append(message)
+    def add(
+        self,
+        message: DSAgentRunMessage,
+        seq: Optional[int] = None
+    ) -> int:
+        """
+        Add a message to the store.
+
+        Args:
+            message: Message to store
+            seq: Externally assigned sequence number; must be greater than
+                any stored one. Defaults to the next sequence number.
+
+        Returns:
+            The sequence number of the stored message
+        """
+        if seq is None:
+            seq = self._last_seq + 1
+        elif seq <= self._last_seq:
+            raise ValueError(
+                f"Sequence number {seq} is not greater than {self._last_seq}"
+            )
+        self._last_seq = seq
+
+        pos = self._next_pos
+        self._next_pos += 1
+        if pos - self._first_pos >= self.max_messages:
+            self._first_pos = pos - self.max_messages + 1
+
+        self._ring[pos % self.max_messages] = StoredMessage(seq, message)
+
+        if message.step_number is not None:
+            self._index(self._by_step, message.step_number, pos)
+        component = message.metadata.get("component")
+        if component:
+            self._index(self._by_component, component, pos)
+
+        return seq
+
+    def get(self, seq: int) -> Optional[StoredMessage]:
+        """Get a stored message by sequence number."""
+        pos = self._position(seq)
+        if pos < self._next_pos:
+            entry = self._entry(pos)
+            if entry.seq == seq:
+                return entry
+        return None
 
     def get_recent(self, limit: int = 100) -> List[DSAgentRunMessage]:
         """Get most recent messages."""
-        return list(self.messages)[-limit:]
+        return [entry.message for entry in self.get_page(limit=limit)]
+
+    def get_page(
+        self,
+        after_seq: Optional[int] = None,
+        before_seq: Optional[int] = None,
+        limit: int = 100,
+        step: Optional[int] = None,
+        component: Optional[str] = None
+    ) -> List[StoredMessage]:
+        """
+        Get a page of messages using sequence cursors.
+
+        Without ``after_seq`` the page is anchored at the newest end
+        (``before_seq`` or the head of the store); with ``after_seq`` it
+        starts right after that cursor and walks forward.
+
+        Args:
+            after_seq: Only return messages with a greater sequence number
+            before_seq: Only return messages with a smaller sequence number
+            limit: Maximum messages to return
+            step: Only return messages for this step number
+            component: Only return messages for this UI component
+
+        Returns:
+            Stored messages in ascending sequence order
+        """
+        if limit <= 0:
+            return []
+
+        lo = self._first_pos
+        if after_seq is not None:
+            lo = self._position(after_seq + 1)
+        hi = self._next_pos
+        if before_seq is not None:
+            hi = self._position(before_seq)
+        if lo >= hi:
+            return []
+
+        if step is None and component is None:
+            if after_seq is not None:
+                positions = range(lo, min(hi, lo + limit))
+            else:
+                positions = range(max(lo, hi - limit), hi)
+        else:
+            candidates = self._indexed_positions(step, component, lo, hi)
+            if after_seq is not None:
+                positions = candidates[:limit]
+            else:
+                positions = candidates[-limit:]
+        return [self._entry(pos) for pos in positions]
 
     def get_count(self) -> int:
         """Get total message count."""
-        return len(self.messages)
+        return self._next_pos - self._first_pos
 
     def clear(self):
         """Clear all messages."""
-        self.messages.clear()
+        self._ring = [None] * self.max_messages
+        self._first_pos = self._next_pos
+        self._by_step.clear()
+        self._by_component.clear()
+
+    def _entry(self, pos: int) -> StoredMessage:
+        """Get the ring entry at an insertion position."""
+        return self._ring[pos % self.max_messages]
+
+    def _position(self, seq: int) -> int:
+        """Get the position of the first retained entry with seq >= seq."""
+        return bisect_left(
+            range(self._first_pos, self._next_pos),
+            seq,
+            key=lambda pos: self._entry(pos).seq
+        ) + self._first_pos
+
+    def _index(self, index: Dict, key, pos: int):
+        """Append a position to a secondary index bucket."""
+        bucket = index.setdefault(key, [])
+        bucket.append(pos)
+        # Drop evicted entries once they make up half of the bucket
+        stale = bisect_left(bucket, self._first_pos)
+        if stale and stale * 2 >= len(bucket):
+            del bucket[:stale]
+
+    def _indexed_positions(
+        self,
+        step: Optional[int],
+        component: Optional[str],
+        lo: int,
+        hi: int
+    ) -> List[int]:
+        """Get sorted positions in [lo, hi) matching the filters."""
+        buckets = []
+        if step is not None:
+            buckets.append(self._by_step.get(step, []))
+        if component is not None:
+            buckets.append(self._by_component.get(component, []))
+
+        # Walk the smallest bucket and check the other filter directly
+        buckets.sort(key=len)
+        bucket = buckets[0]
+        positions = bucket[bisect_left(bucket, lo):bisect_left(bucket, hi)]
+        if len(buckets) > 1:
+            other = buckets[1]
+            positions = [
+                pos for pos in positions
+                if _contains_sorted(other, pos)
+            ]
+        return positions
+
+
+def _contains_sorted(values: List[int], value: int) -> bool:
+    """Check membership in a sorted list."""
+    i = bisect_left(values, value)
+    return i < len(values) and values[i] == value
+
+
+class ReplayBuffer:
+    """
+    Bounded buffer of recently streamed messages for resumable streams.
+
+    Holds every outgoing message, deltas included, keyed by sequence
+    number. Because each streaming delta carries the full accumulated
+    content of its stream, a new delta supersedes the previous one with the
+    same ``stream_id``; the older entry is dropped so a long stream costs
+    one slot rather than one per chunk.
+    """
+
+    def __init__(self, max_messages: int = 2000):
+        """
+        Initialize replay buffer.
+
+        Args:
+            max_messages: Maximum messages to retain (FIFO)
+        """
+        self.max_messages = max_messages
+        self._messages: "OrderedDict[int, DSAgentRunMessage]" = OrderedDict()
+        self._latest_delta: Dict[str, int] = {}
+        self._evicted_seq = 0
+
+    def append(self, message: DSAgentRunMessage):
+        """Append a message that already carries its sequence number."""
+        metadata = message.metadata
+        stream_id = metadata.get("stream_id")
+        if stream_id and metadata.get("is_delta", False):
+            previous = self._latest_delta.get(stream_id)
+            if previous is not None:
+                self._messages.pop(previous, None)
+            self._latest_delta[stream_id] = message.seq
+        elif stream_id:
+            self._latest_delta.pop(stream_id, None)
+
+        self._messages[message.seq] = message
+
+        while len(self._messages) > self.max_messages:
+            seq, evicted = self._messages.popitem(last=False)
+            self._evicted_seq = seq
+            evicted_stream = evicted.metadata.get("stream_id")
+            if self._latest_delta.get(evicted_stream) == seq:
+                del self._latest_delta[evicted_stream]
+
+    def since(
+        self,
+        last_seq: int
+    ) -> Tuple[List[DSAgentRunMessage], bool]:
+        """
+        Get messages streamed after ``last_seq``.
+
+        Args:
+            last_seq: Last sequence number the client received
+
+        Returns:
+            Tuple of (messages in order, complete); ``complete`` is False
+            when part of the gap was already evicted and the client must
+            fall back to a full history load.
+        """
+        gap = []
+        for seq in reversed(self._messages):
+            if seq <= last_seq:
+                break
+            gap.append(self._messages[seq])
+        gap.reverse()
+        return gap, last_seq >= self._evicted_seq
+
+    def clear(self):
+        """Clear all messages."""
+        self._messages.clear()
+        self._latest_delta.clear()
+
+
+class StreamSubscription:
+    """
+    A live view on a session's message stream.
+
+    Created synchronously so the replay snapshot and live registration
+    happen atomically on the event loop; iterating yields the replayed gap
+    and then live messages until the current run finishes.
+
+    A sequence cursor is only meaningful within the stream epoch it was
+    received in. A cursor from another epoch (an earlier run, or a session
+    that has since been recreated) replays the current run in full and
+    reports ``complete=False``.
+    """
+
+    def __init__(
+        self,
+        session: "AgentSession",
+        after_seq: int,
+        epoch: Optional[str] = None
+    ):
+        self._session = session
+        self.epoch = session.stream_epoch
+        if epoch is not None and epoch != self.epoch:
+            self.replayed, _ = session.replay_buffer.since(
+                session.run_start_seq
+            )
+            self.complete = False
+        else:
+            self.replayed, self.complete = session.replay_buffer.since(
+                after_seq
+            )
+        self.live = session.is_running
+        self._queue: Optional[asyncio.Queue] = None
+        if self.live:
+            self._queue = asyncio.Queue()
+            session._subscribers.add(self._queue)
+
+    async def __aiter__(self) -> AsyncGenerator[DSAgentRunMessage, None]:
+        try:
+            for message in self.replayed:
+                yield message
+            if self._queue is None:
+                return
+            while True:
+                message = await self._queue.get()
+                if message is None:
+                    break
+                yield message
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop receiving live messages."""
+        if self._queue is not None:
+            self._session._subscribers.discard(self._queue)
+            self._queue = None
 
 
 class AgentSession:
@@ -89,8 +425,18 @@ class AgentSession:
 
         self.state = SessionState.IDLE
         self.message_store = MessageStore()
+        self.replay_buffer = ReplayBuffer()
         self.processor = DSAgentMessageProcessor(session_id)
 
+        # Stream sequencing and live fan-out for resumable streams; the
+        # epoch tells cursors of this session instance and run apart
+        self._epoch = uuid.uuid4().hex[:12]
+        self._run_id = 0
+        self._run_start_seq = 0
+        self._last_seq = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._run_task: Optional[asyncio.Task] = None
+
         self.agent = None
         self.current_task: Optional[str] = None
         self.created_at = datetime.now(timezone.utc)
@@ -147,29 +493,28 @@ class AgentSession:
         self.current_task = query
         self.last_activity = datetime.now(timezone.utc)
 
-        # Ensure agent is initialized
-        await self.initialize_agent()
-
-        # Add user message
+        # Add user message; it tells clients the epoch of the new run
         user_msg = DSAgentRunMessage(
             role="user",
             content=query,
+            metadata={"stream_epoch": self.stream_epoch},
             session_id=self.session_id
         )
-        self.message_store.add(user_msg)
+        self._record(user_msg)
         yield user_msg
 
         try:
+            # Ensure agent is initialized
+            await self.initialize_agent()
+
             # Process through Gradio pass-through
             async for message in self.processor.process_agent_stream(
                 self.agent,
                 query,
                 reset_agent_memory=False
             ):
-                # Store and yield each message
-                # Only store non-delta messages
-                if not message.metadata.get('is_delta', False):
-                    self.message_store.add(message)
+                # Sequence, store and yield each message
+                self._record(message)
                 self.last_activity = datetime.now(timezone.utc)
                 yield message
                 # Ensure message is processed before continuing
@@ -184,12 +529,95 @@ class AgentSession:
                 metadata={"error": True},
                 session_id=self.session_id
             )
-            self.message_store.add(error_msg)
+            self._record(error_msg)
             yield error_msg
             self.state = SessionState.ERROR
         else:
             self.state = SessionState.COMPLETED
 
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently streamed message."""
+        return self._last_seq
+
+    @property
+    def stream_epoch(self) -> str:
+        """Identifier of this session instance and its current run."""
+        return f"{self._epoch}:{self._run_id}"
+
+    @property
+    def run_start_seq(self) -> int:
+        """Sequence number streamed just before the current run began."""
+        return self._run_start_seq
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a background query run is in progress."""
+        return self._run_task is not None and not self._run_task.done()
+
+    def start_query(self, query: str) -> asyncio.Task:
+        """
+        Start processing a query in the background.
+
+        The run is decoupled from any WebSocket connection: messages are
+        recorded in the replay buffer and fanned out to subscribers, so a
+        client that reconnects can resume the stream with ``subscribe``.
+
+        Args:
+            query: User query to process
+
+        Returns:
+            The background task running the query
+        """
+        if self.is_running or self.state == SessionState.PROCESSING:
+            raise RuntimeError("Session is already processing a query")
+
+        self._run_id += 1
+        self._run_start_seq = self._last_seq
+        self._run_task = asyncio.create_task(self._run_query(query))
+        return self._run_task
+
+    def subscribe(
+        self,
+        after_seq: int = 0,
+        epoch: Optional[str] = None
+    ) -> StreamSubscription:
+        """
+        Subscribe to the message stream.
+
+        Args:
+            after_seq: Last sequence number the client has received
+            epoch: Stream epoch ``after_seq`` was received in; None trusts
+                the cursor (subscriptions made on the same connection)
+
+        Returns:
+            Subscription yielding the missed messages, then live messages
+            until the current run finishes
+        """
+        return StreamSubscription(self, after_seq, epoch)
+
+    async def _run_query(self, query: str):
+        """Drain ``process_query`` and signal subscribers at the end."""
+        try:
+            async for _ in self.process_query(query):
+                pass
+        finally:
+            for queue in list(self._subscribers):
+                queue.put_nowait(None)
+
+    def _record(self, message: DSAgentRunMessage):
+        """Assign a sequence number, store and fan out a message."""
+        self._last_seq += 1
+        message.seq = self._last_seq
+
+        self.replay_buffer.append(message)
+        # Only store non-delta messages in history
+        if not message.metadata.get('is_delta', False):
+            self.message_store.add(message, seq=message.seq)
+
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
     def get_messages(
         self,
         limit: Optional[int] = None
@@ -205,7 +633,28 @@ class AgentSession:
         """
         if limit:
             return self.message_store.get_recent(limit)
-        return list(self.message_store.messages)
+        return self.message_store.messages
+
+    def get_message_page(
+        self,
+        after_seq: Optional[int] = None,
+        before_seq: Optional[int] = None,
+        limit: int = 100,
+        step: Optional[int] = None,
+        component: Optional[str] = None
+    ) -> List[StoredMessage]:
+        """
+        Get a cursor-paginated page of stored messages.
+
+        See ``MessageStore.get_page`` for argument semantics.
+        """
+        return self.message_store.get_page(
+            after_seq=after_seq,
+            before_seq=before_seq,
+            limit=limit,
+            step=step,
+            component=component
+        )
 
     def get_state(self) -> SessionStateModel:
         """Get current session state."""
@@ -221,7 +670,14 @@ class AgentSession:
     async def cleanup(self):
         """Clean up session resources."""
         logger.info(f"Cleaning up session {self.session_id}")
+        if self.is_running:
+            self._run_task.cancel()
+            try:
+                await self._run_task
+            except asyncio.CancelledError:
+                pass
         self.message_store.clear()
+        self.replay_buffer.clear()
         self.agent = None
         self.state = SessionState.EXPIRED
 
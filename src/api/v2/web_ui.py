@@ -12,9 +12,10 @@ with proper component routing metadata for the frontend.
 
 import re
 import json
-import ast
 import logging
-from typing import Optional, List, Dict, Any, AsyncGenerator, Generator, Union
+from typing import (
+    Optional, List, Dict, Any, AsyncGenerator, Generator, Union, FrozenSet
+)
 
 # Import agent event types
 try:
@@ -30,6 +31,9 @@ except ImportError as e:
     logging.error(f"Failed to import smolagents types: {e}")
     raise
 
+from src.agents.code_analysis import analyze_code, known_tool_names
+from src.agents.stream_aggregator import StreamBuffer
+from src.tools.final_answer import FinalAnswer
 from .models import DSAgentRunMessage
 
 logger = logging.getLogger(__name__)
@@ -141,12 +145,16 @@ def _extract_code_from_content(content: str) -> Optional[str]:
     return None
 
 
-def _extract_tools_from_code(code: str) -> List[str]:
+def _extract_tools_from_code(
+    code: str,
+    tool_names: Optional[FrozenSet[str]] = None,
+) -> List[str]:
     """
     Extract tool names from Python code.
 
     Args:
         code: Python code to analyze.
+        tool_names: Tool names to detect (default: known tools).
 
     Returns:
         List of tool names found in the code.
@@ -154,32 +162,9 @@ def _extract_tools_from_code(code: str) -> List[str]:
     if not code:
         return []
 
-    # Known tool names from toolbox.py
-    known_tools = [
-        "search_links", "search_fast", "read_url", "github_repo_qa",
-        "xcom_deep_qa", "chunk_text", "embed_texts", "rerank_texts",
-        "wolfram", "academic_retrieval", "final_answer"
-    ]
-
-    tool_calls = []
-
-    # Check for tool calls using various patterns
-    for tool in known_tools:
-        # Pattern 1: Direct function call: tool_name(...)
-        pattern1 = rf'\b{tool}\s*\('
-        # Pattern 2: Variable assignment: var = tool_name(...)
-        pattern2 = rf'=\s*{tool}\s*\('
-        # Pattern 3: Method call: obj.tool_name(...)
-        pattern3 = rf'\.{tool}\s*\('
-        # Pattern 4: In list: [tool_name(...)]
-        pattern4 = rf'\[\s*{tool}\s*\('
-
-        if (re.search(pattern1, code) or re.search(pattern2, code) or
-                re.search(pattern3, code) or re.search(pattern4, code)):
-            if tool not in tool_calls:  # Avoid duplicates
-                tool_calls.append(tool)
-                logger.debug(f"Found tool in code: {tool}")
-
+    tool_calls = analyze_code(code, tool_names).tool_names
+    if tool_calls:
+        logger.debug(f"Found tools in code: {tool_calls}")
     return tool_calls
 
 
@@ -396,6 +381,7 @@ def process_action_step(
     step_log: ActionStep,
     session_id: Optional[str] = None,
     skip_model_outputs: bool = False,
+    tool_names: Optional[FrozenSet[str]] = None,
 ) -> Generator[DSAgentRunMessage, None, None]:
     """
     Process an ActionStep and yield DSAgentRunMessage objects.
@@ -404,6 +390,8 @@ def process_action_step(
         step_log: ActionStep to process.
         session_id: Session ID for the messages.
         skip_model_outputs: Whether to skip model outputs.
+        tool_names: Tool names to detect in CodeAct code (default: known
+            tools).
 
     Yields:
         DSAgentRunMessage objects.
@@ -552,7 +540,9 @@ def process_action_step(
             code_only = content  # code_action is already clean code
 
             # Extract tools from the code and generate additional badges
-            extracted_tools = _extract_tools_from_code(code_only)
+            extracted_tools = _extract_tools_from_code(
+                code_only, tool_names
+            )
             for extracted_tool in extracted_tools:
                 yield DSAgentRunMessage(
                     role=MessageRole.ASSISTANT,
@@ -765,114 +755,38 @@ def process_final_answer_step(
     logger.info(f"=== PROCESSING FINAL ANSWER STEP ===")
     logger.info(f"Final answer type: {type(final_answer)}")
 
-    if isinstance(final_answer, AgentText):
-        content_str = final_answer.to_string()
+    # Parsed once; the final_answer tool already returns a FinalAnswer
+    answer = FinalAnswer.from_output(final_answer)
+    if answer is not None:
+        # Send empty content when we have structured data
+        # Frontend will use metadata fields instead
+        # This prevents raw JSON from being displayed
+        content = ""
+
+        # Add structured data to metadata for direct use
+        metadata_extra = {
+            "answer_title": answer.title,
+            "answer_content": answer.markdown,  # Markdown content
+            "answer_sources": answer.sources,
+            "answer_source_details": answer.source_details(),
+            "has_structured_data": True,
+            "answer_format": "json",  # Indicate JSON format
+        }
 
-        # Debug logging
         logger.info(
-            f"Final answer content: "
-            f"length={len(content_str)}, "
-            f"starts_with_brace={content_str.strip().startswith('{')}, "
-            f"preview={content_str[:200]}..."
+            f"Final answer parsed successfully: "
+            f"title='{answer.title}', "
+            f"content_length={len(answer.content)}, "
+            f"sources_count={len(answer.sources)}"
         )
-        logger.info(f"Content string repr: {repr(content_str[:100])}")
-
-        # Check if content has the **Final answer:** prefix
-        # and extract the JSON part
-        json_content = content_str
-        if content_str.startswith("**Final answer:**"):
-            # Extract content after the prefix
-            json_content = content_str[len("**Final answer:**"):].strip()
-            logger.info(f"Removed Final answer prefix, json_content starts with: {json_content[:50]}")
-        elif content_str.startswith("Final answer:"):
-            # Handle case without asterisks
-            json_content = content_str[len("Final answer:"):].strip()
-            logger.info(f"Removed Final answer prefix (no asterisks), json_content starts with: {json_content[:50]}")
-
-        # Try to parse JSON content from final_answer tool
-        if json_content.strip().startswith("{"):
-            try:
-                # First try direct JSON parsing
-                try:
-                    data = json.loads(json_content)
-                except json.JSONDecodeError:
-                    # If that fails, try to convert Python dict string to JSON
-                    # This handles cases where the tool returns str(dict)
-                    # instead of json.dumps(dict)
-                    # Parse as Python literal
-                    data = ast.literal_eval(json_content)
-                    logger.info(
-                        "Converted Python dict string to proper dict"
-                    )
-
-                # Extract structured data
-                title = data.get("title", "Final Answer")
-                answer_content = data.get("content", "")
-                sources = data.get("sources", [])
-
-                # Send empty content when we have structured data
-                # Frontend will use metadata fields instead
-                # This prevents raw JSON from being displayed
-                content = ""
-
-                # Add structured data to metadata for direct use
-                metadata_extra = {
-                    "answer_title": title,
-                    "answer_content": answer_content,  # Markdown content
-                    "answer_sources": sources,
-                    "has_structured_data": True,
-                    "answer_format": "json",  # Indicate JSON format
-                }
-
-                logger.info(
-                    f"Final answer parsed successfully: "
-                    f"title='{title}', "
-                    f"content_length={len(answer_content)}, "
-                    f"sources_count={len(sources)}"
-                )
-                logger.info(f"Formatted content being sent: {content[:200]}...")
-            except (json.JSONDecodeError, ValueError, SyntaxError) as e:
-                logger.error(f"Failed to parse final answer JSON: {e}")
-                logger.error(f"JSON content that failed: {json_content[:200]}")
-                # Fallback to raw content
-                content = f"**Final answer:**\n{content_str}\n"
-        else:
-            logger.info(f"JSON content doesn't start with '{{', it starts with: {json_content[:50]}")
-            content = f"**Final answer:**\n{content_str}\n"
+    elif isinstance(final_answer, AgentText):
+        content = f"**Final answer:**\n{final_answer.to_string()}\n"
     elif isinstance(final_answer, AgentImage):
         path = final_answer.to_string()
         content = f"**Final answer:**\n![Image]({path})"
     elif isinstance(final_answer, AgentAudio):
         path = final_answer.to_string()
         content = f"**Final answer:**\n[Audio]({path})"
-    elif isinstance(final_answer, dict):
-        # Handle dict type final answers
-        logger.info(f"Processing dict final answer with keys: {list(final_answer.keys())}")
-        try:
-            # Extract structured data from dict
-            title = final_answer.get("title", "Final Answer")
-            answer_content = final_answer.get("content", "")
-            sources = final_answer.get("sources", [])
-
-            # Send empty content when we have structured data
-            content = ""
-
-            # Add structured data to metadata
-            metadata_extra = {
-                "answer_title": title,
-                "answer_content": answer_content,
-                "answer_sources": sources,
-                "has_structured_data": True,
-                "answer_format": "json",
-            }
-
-            logger.info(
-                f"Dict final answer parsed: title='{title}', "
-                f"content_length={len(answer_content)}, sources_count={len(sources)}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to parse dict final answer: {e}")
-            content = f"**Final answer:** {str(final_answer)}"
     else:
         content = f"**Final answer:** {str(final_answer)}"
 
@@ -894,6 +808,44 @@ def process_final_answer_step(
     )
 
 
+def _render_stream_delta(
+    buffer: StreamBuffer,
+    tool_call_deltas: List[ChatMessageStreamDelta],
+    delta: ChatMessageStreamDelta,
+) -> str:
+    """
+    Add a stream delta and render the message streamed so far.
+
+    Same output as ``agglomerate_stream_deltas(deltas).render_as_markdown()``
+    over every delta of the message, without rebuilding it from every
+    previous delta: text is extended from the buffer's cached content and
+    only tool-call deltas are re-agglomerated. Delta messages carry the
+    whole message, which the frontend swaps in, so each call still builds
+    a string as long as the message streamed so far.
+
+    Args:
+        buffer: Text content streamed so far for the current message.
+        tool_call_deltas: Tool-call fragments streamed so far.
+        delta: The new delta.
+
+    Returns:
+        Markdown of the accumulated message.
+    """
+    if delta.content:
+        buffer.append(delta.content, count_tokens=False)
+    if delta.tool_calls:
+        tool_call_deltas.append(
+            ChatMessageStreamDelta(tool_calls=delta.tool_calls)
+        )
+
+    text = buffer.text
+    if tool_call_deltas:
+        text += agglomerate_stream_deltas(
+            tool_call_deltas
+        ).render_as_markdown()
+    return text
+
+
 async def stream_agent_messages(
     agent,
     task: str,
@@ -922,9 +874,13 @@ async def stream_agent_messages(
     """
     # Track state
     current_step = 0
-    accumulated_deltas: List[ChatMessageStreamDelta] = []
+    stream_buffer = StreamBuffer()
+    tool_call_deltas: List[ChatMessageStreamDelta] = []
     skip_model_outputs = getattr(agent, "stream_outputs", False)
     planning_interval = getattr(agent, "planning_interval", None)
+    # Tools of the running agent, so CodeAct badges include MCP tools
+    # and managed agents
+    tool_names = known_tool_names(agent)
 
     # Streaming context tracking
     current_streaming_message_id = None
@@ -977,7 +933,8 @@ async def stream_agent_messages(
                         planning_interval=planning_interval,
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
                     # Don't reset streaming context here - wait for
                     # next non-delta event
                     logger.debug(
@@ -997,10 +954,11 @@ async def stream_agent_messages(
                     # Update current step
                     current_step = event.step_number
                     for message in process_action_step(
-                        event, session_id, skip_model_outputs
+                        event, session_id, skip_model_outputs, tool_names
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
 
                 elif isinstance(event, FinalAnswerStep):
                     # Reset streaming context from previous event
@@ -1012,14 +970,14 @@ async def stream_agent_messages(
                         event, session_id, current_step
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
 
                 elif isinstance(event, ChatMessageStreamDelta):
                     # Accumulate streaming deltas
-                    accumulated_deltas.append(event)
-                    text = agglomerate_stream_deltas(
-                        accumulated_deltas
-                    ).render_as_markdown()
+                    text = _render_stream_delta(
+                        stream_buffer, tool_call_deltas, event
+                    )
 
                     # Determine streaming context if not set
                     if not current_streaming_message_id:
@@ -1123,7 +1081,8 @@ async def stream_agent_messages(
                         planning_interval=planning_interval,
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
                     # Don't reset streaming context here - wait for
                     # next non-delta event
                     logger.debug(
@@ -1142,10 +1101,11 @@ async def stream_agent_messages(
 
                     current_step = event.step_number
                     for message in process_action_step(
-                        event, session_id, skip_model_outputs
+                        event, session_id, skip_model_outputs, tool_names
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
 
                 elif isinstance(event, FinalAnswerStep):
                     # Reset streaming context from previous event
@@ -1157,14 +1117,14 @@ async def stream_agent_messages(
                         event, session_id, current_step
                     ):
                         yield message
-                    accumulated_deltas = []
+                    stream_buffer.clear()
+                    tool_call_deltas = []
 
                 elif isinstance(event, ChatMessageStreamDelta):
                     # Accumulate streaming deltas
-                    accumulated_deltas.append(event)
-                    text = agglomerate_stream_deltas(
-                        accumulated_deltas
-                    ).render_as_markdown()
+                    text = _render_stream_delta(
+                        stream_buffer, tool_call_deltas, event
+                    )
 
                     # Determine streaming context if not set
                     if not current_streaming_message_id:
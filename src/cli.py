@@ -32,7 +32,11 @@ from rich.console import Group
 from src.agents.runtime import agent_runtime
 from src.agents.ui_common.console_formatter import ConsoleFormatter
 from src.agents.ui_common.streaming_formatter import StreamingConsoleFormatter
+from src.agents.stream_aggregator import StreamBuffer
 from src.agents.ui_common.agent_step_callback import AgentStepCallback
+from src.agents.ui_common.startup_profile import (
+    print_startup_profile, profile_startup
+)
 from src.agents.ui_common.constants import (
     COLORS, FINAL_COLOR, FINAL_EMOJI, ERROR_COLOR, ERROR_EMOJI,
     TOOL_ICONS, TOOL_COLORS, THINKING_COLOR, THINKING_EMOJI,
@@ -618,7 +622,9 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
         formatter = StreamingConsoleFormatter(
             agent_type=agent_instance.agent_type,
             console=console,
-            debug_mode=verbose_mode
+            debug_mode=verbose_mode,
+            incremental_markdown=settings.CLI_INCREMENTAL_MARKDOWN,
+            max_fps=settings.CLI_STREAM_MAX_FPS
         )
         logger.debug("Using StreamingConsoleFormatter")
     else:
@@ -684,6 +690,7 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
 
     # use safe error handling logic to execute agent
     final_result = None
+    result_buffer = None
 
     try:
         # display processing status
@@ -717,7 +724,7 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
                 # Check if result is a generator (streaming response)
                 if hasattr(result, '__aiter__'):
                     # Handle async generator
-                    final_result = ""
+                    result_buffer = StreamBuffer()
                     async for chunk in result:
                         # Convert chunk to string if needed
                         if hasattr(chunk, 'content'):
@@ -733,10 +740,11 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
 
                         if hasattr(formatter, 'on_stream_chunk'):
                             formatter.on_stream_chunk(chunk)
-                        final_result += chunk_str
+                        result_buffer.append(chunk_str, count_tokens=False)
+                    final_result = result_buffer.text
                 elif hasattr(result, '__iter__') and not isinstance(result, str):
                     # Handle sync generator
-                    final_result = ""
+                    result_buffer = StreamBuffer()
                     for chunk in result:
                         # Convert chunk to string if needed
                         if hasattr(chunk, 'content'):
@@ -752,7 +760,8 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
 
                         if hasattr(formatter, 'on_stream_chunk'):
                             formatter.on_stream_chunk(chunk)
-                        final_result += chunk_str
+                        result_buffer.append(chunk_str, count_tokens=False)
+                    final_result = result_buffer.text
                 else:
                     # Not a generator, just regular result
                     final_result = result
@@ -791,6 +800,9 @@ async def process_query_async(query, agent_instance, verbose_mode, console):
         console.print(f"[red]Error executing agent: {e}[/red]")
         console.print(traceback.format_exc())
     finally:
+        # keep partial streamed output if the stream failed midway
+        if final_result is None and result_buffer is not None:
+            final_result = result_buffer.text
         # try to render final result whether execution is successful or not
         if final_result:
             try:
@@ -1194,8 +1206,26 @@ def main():
         help="Enable streaming output (not recommended)"
     )
 
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Report per-module import times of CLI startup (with "
+             "--agent-type, including agent creation) and exit"
+    )
+
     args = parser.parse_args()
 
+    if args.profile_startup:
+        code = "import src.cli"
+        if args.agent_type:
+            code += (
+                "\nfrom src.agents.runtime import agent_runtime"
+                f"\nagent_runtime.get_or_create_agent({args.agent_type!r})"
+            )
+        profile_console = Console()
+        profile_console.print("[yellow]Profiling startup imports...[/yellow]")
+        print_startup_profile(profile_startup(code), profile_console)
+        exit(0)
+
     try:
         # Prepare console
         console = Console()
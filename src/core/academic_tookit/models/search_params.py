@@ -205,7 +205,8 @@ class SearchParams(BaseModel):
             'min_citations': self.min_citations,
             'include_preprints': self.include_preprints,
             'require_doi': self.require_doi,
-            'require_pdf': self.require_pdf
+            'require_pdf': self.require_pdf,
+            'use_natural_language': self.use_natural_language
         }
 
         # Remove None values
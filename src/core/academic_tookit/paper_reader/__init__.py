@@ -12,6 +12,8 @@ This module provides enhanced paper parsing capabilities including:
 - Figure and table extraction
 - Reference parsing
 - Unified paper reading interface
+- Streaming, memory-mapped PDF downloads
+- Persistent store of parsed papers
 """
 
 from .paper_parser_pdf import (
@@ -33,6 +35,20 @@ from .reader import (
 
 from .metadata_merger import MetadataMerger
 
+from .pdf_download import (
+    DownloadedPDF,
+    PDFDownloader,
+    PDFDownloadError,
+    PDFTooLargeError,
+    get_shared_downloader
+)
+
+from .paper_store import (
+    ParsedPaperStore,
+    PaperKey,
+    split_paper_version
+)
+
 __all__ = [
     # PDF parser exports
     "PDFParserConfig",
@@ -46,5 +62,15 @@ __all__ = [
     "PaperReader",
     "PaperReaderConfig",
     # Metadata merger
-    "MetadataMerger"
+    "MetadataMerger",
+    # Streaming PDF downloads
+    "DownloadedPDF",
+    "PDFDownloader",
+    "PDFDownloadError",
+    "PDFTooLargeError",
+    "get_shared_downloader",
+    # Parsed-paper store
+    "ParsedPaperStore",
+    "PaperKey",
+    "split_paper_version"
 ]
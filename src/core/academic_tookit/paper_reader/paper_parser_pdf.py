@@ -11,14 +11,16 @@ academic papers, using Mistral OCR API for structured extraction.
 """
 
 import os
+import asyncio
 import logging
 import base64
 import re
 import mimetypes
 import fitz  # PyMuPDF pymupdf library
-import aiohttp
 import io
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
 from pydantic import BaseModel, Field
@@ -31,6 +33,12 @@ from tenacity import (
     retry_if_exception_type
 )
 
+from .pdf_download import (
+    DownloadedPDF,
+    PDFDownloadError,
+    get_shared_downloader
+)
+
 
 @dataclass
 class PDFParserConfig:
@@ -52,6 +60,9 @@ class PDFParserConfig:
     max_pages_with_annotations: int = 8  # Mistral API limit for document annotations
     use_bbox_only_for_large_docs: bool = True  # Use only bbox annotations for docs > 8 pages
     check_page_count_for_urls: bool = True  # Check page count before processing URLs
+    max_concurrent_chunks: int = 4  # Concurrent OCR requests for large PDFs
+    max_download_bytes: int = 100 * 1024 * 1024  # Abort larger PDF downloads
+    download_timeout: int = 60  # Seconds per PDF download
 
 
 # Comprehensive schema definitions for Mistral OCR structured extraction
@@ -223,51 +234,59 @@ class MistralAPIError(Exception):
 
 async def _download_and_check_pdf_page_count(
     pdf_url: str,
-    timeout: int = 30
-) -> Tuple[bytes, int]:
+    timeout: int = 60,
+    max_bytes: Optional[int] = None
+) -> DownloadedPDF:
     """
-    Download PDF and check page count.
-    
+    Stream a PDF to a temporary file and check its page count.
+
+    The download goes through the shared connection pool and is aborted
+    as soon as it exceeds ``max_bytes`` or turns out not to be a PDF.
+
     Args:
         pdf_url: URL of the PDF to download
         timeout: Download timeout in seconds
-        
+        max_bytes: Maximum PDF size in bytes
+
     Returns:
-        Tuple of (pdf_bytes, page_count)
-        
+        DownloadedPDF with ``page_count`` available; the caller must
+        close it
+
     Raises:
         ConnectionError: If download fails
-        PDFParserError: If PDF cannot be parsed
+        PDFParserError: If the download is not a valid PDF or too large
     """
     logger.info(f"Downloading PDF from {pdf_url} to check page count")
-    
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                pdf_url,
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                pdf_bytes = await response.read()
-        
-        # Check page count using PyMuPDF
-        pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        page_count = len(pdf_doc)
-        pdf_doc.close()
-        
-        logger.info(f"PDF from {pdf_url} has {page_count} pages")
-        return pdf_bytes, page_count
-        
-    except aiohttp.ClientError as e:
+        downloaded = await get_shared_downloader().download(
+            pdf_url, max_bytes=max_bytes, timeout=timeout
+        )
+    except PDFDownloadError as e:
+        logger.error(f"Rejected PDF from {pdf_url}: {e}")
+        raise PDFParserError(str(e))
+    except ConnectionError as e:
         logger.error(f"Failed to download PDF from {pdf_url}: {e}")
-        raise ConnectionError(f"Failed to download PDF: {e}")
+        raise
+
+    try:
+        page_count = await asyncio.to_thread(
+            lambda: downloaded.page_count
+        )
     except (fitz.FileDataError, fitz.EmptyFileError) as e:
+        downloaded.close()
         logger.error(f"Failed to parse PDF from {pdf_url}: {e}")
         raise PDFParserError(f"Failed to parse PDF: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error downloading PDF from {pdf_url}: {e}")
+    except BaseException:
+        downloaded.close()
         raise
 
+    logger.info(
+        f"PDF from {pdf_url} has {page_count} pages "
+        f"({downloaded.size} bytes)"
+    )
+    return downloaded
+
 
 @retry(
     wait=wait_exponential(min=4, max=60),
@@ -330,9 +349,7 @@ async def parse_pdf_with_ocr(
         )
 
     pdf_doc: Optional[fitz.Document] = None
-    pdf_bytes_from_url: Optional[bytes] = None
-    page_count_from_url: Optional[int] = None
-    
+
     try:
         # If URL is provided and direct URL is enabled
         if pdf_url and config.use_direct_url:
@@ -343,23 +360,23 @@ async def parse_pdf_with_ocr(
             # Check if we should download to check page count
             if config.check_page_count_for_urls and extract_metadata:
                 try:
-                    pdf_bytes_from_url, page_count_from_url = (
-                        await _download_and_check_pdf_page_count(pdf_url)
-                    )
-                    logger.info(
-                        f"PDF from URL has {page_count_from_url} pages. "
-                        f"Will process with appropriate annotation settings."
-                    )
-                    # Process with known page count
-                    pdf_doc = fitz.open(
-                        stream=pdf_bytes_from_url, filetype="pdf"
-                    )
-                    # Convert bytes to base64 for processing
-                    pdf_base64_from_url = base64.b64encode(
-                        pdf_bytes_from_url
-                    ).decode('utf-8')
+                    with await _download_and_check_pdf_page_count(
+                        pdf_url,
+                        timeout=config.download_timeout,
+                        max_bytes=config.max_download_bytes
+                    ) as downloaded:
+                        logger.info(
+                            f"PDF from URL has {downloaded.page_count} "
+                            f"pages. Will process with appropriate "
+                            f"annotation settings."
+                        )
+                        # Encode from the mapped file, off the event loop
+                        pdf_base64_from_url = await asyncio.to_thread(
+                            downloaded.to_base64
+                        )
+                        page_count_from_url = downloaded.page_count
                     return await _process_single_pdf(
-                        pdf_doc, None, None, pdf_base64_from_url, client, config,
+                        None, None, None, pdf_base64_from_url, client, config,
                         filename_for_logging, extract_metadata,
                         page_count_override=page_count_from_url
                     )
@@ -480,6 +497,10 @@ async def _process_large_pdf_chunks(
     Process large PDF by splitting into chunks with intelligent
     metadata extraction.
 
+    Chunks are OCR'd concurrently (up to ``config.max_concurrent_chunks``
+    requests), each split and encoded on a worker thread once its request
+    slot is free; results are merged in page order as they arrive.
+
     Returns:
         Tuple containing:
             - raw_response: Combined response dict with chunks
@@ -537,105 +558,90 @@ async def _process_large_pdf_chunks(
         # Process middle sections
         middle_start = first_chunk_end + 1
         middle_end = page_count - chunk_size - 1
-        for i in range(middle_start, middle_end, chunk_size):
+        for i in range(middle_start, middle_end + 1, chunk_size):
             chunk_end = min(i + chunk_size - 1, middle_end)
             chunks_to_process.append((i, chunk_end, 'middle'))
 
-    # Process each chunk
-    for chunk_idx, (start_page, end_page, chunk_type) in enumerate(
-        chunks_to_process
-    ):
-        logger.info(
-            f"Processing {chunk_type} chunk {chunk_idx + 1}/"
-            f"{len(chunks_to_process)} for '{filename_for_logging}': "
-            f"pages {start_page + 1}-{end_page + 1}"
-        )
-
-        chunk_doc = fitz.open()
-        chunk_doc.insert_pdf(pdf_doc, from_page=start_page, to_page=end_page)
+    # Merge in page order: first, middle..., last
+    chunks_to_process.sort(key=lambda chunk: chunk[0])
 
-        chunk_base64 = base64.b64encode(chunk_doc.tobytes()).decode('utf-8')
-        chunk_doc.close()
+    # PyMuPDF documents are not thread-safe, so one worker thread does all
+    # splitting/encoding (in page order) while OCR requests run concurrently
+    loop = asyncio.get_running_loop()
+    split_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="pdf-chunk-split"
+    )
+    ocr_semaphore = asyncio.Semaphore(max(1, config.max_concurrent_chunks))
 
+    async def ocr_chunk(
+        chunk_idx: int,
+        start_page: int,
+        end_page: int,
+        chunk_type: str
+    ):
         chunk_filename = (
             f"{filename_for_logging}_chunk_{start_page+1}-"
             f"{end_page+1}_{chunk_type}"
         )
-
-        # Note: parse_pdf_with_ocr can be called recursively
-        # Ensure we handle the response properly
-        result = await parse_pdf_with_ocr(
-            pdf_base64=chunk_base64,
-            client=client,
-            config=config,
-            filename_for_logging=chunk_filename,
-            extract_metadata=True  # Always extract for all chunks
-        )
-
-        if len(result) == 5:
-            raw_res_chunk, md_chunk, images_chunk, tables_chunk, meta_chunk = result
-        else:
-            logger.error(
-                f"Unexpected result format from parse_pdf_with_ocr for "
-                f"{chunk_filename}: {len(result)} elements"
+        # Encode only once a request slot is free, so at most
+        # max_concurrent_chunks encoded chunks are held in memory
+        async with ocr_semaphore:
+            chunk_base64 = await loop.run_in_executor(
+                split_executor, _encode_pdf_chunk,
+                pdf_doc, start_page, end_page
             )
-            continue
-
-        all_raw_responses.append(raw_res_chunk)
-        all_markdown_parts.append(md_chunk)
-
-        # Merge metadata based on chunk type
-        if chunk_type == 'first':
-            # First chunk has title, authors, abstract, introduction
-            combined_metadata['title'] = meta_chunk.get('title', '')
-            combined_metadata['authors'] = meta_chunk.get('authors', [])
-            combined_metadata['abstract'] = meta_chunk.get('abstract', '')
-            combined_metadata['keywords'] = meta_chunk.get('keywords', [])
-            combined_metadata['publication_info'] = meta_chunk.get(
-                'publication_info', {}
-            )
-
-            # Add early sections
-            for section in meta_chunk.get('sections', []):
-                section_title = section.get('title', '').lower()
-                if section_title in [
-                    'introduction', 'background', 'related work'
-                ]:
-                    combined_metadata['sections'].append(section)
-
-        elif chunk_type == 'last':
-            # Last chunk has references and appendices
-            combined_metadata['references'].extend(
-                meta_chunk.get('references', [])
+            logger.info(
+                f"Processing {chunk_type} chunk {chunk_idx + 1}/"
+                f"{len(chunks_to_process)} for '{filename_for_logging}': "
+                f"pages {start_page + 1}-{end_page + 1}"
             )
-
-            # Add concluding sections
-            for section in meta_chunk.get('sections', []):
-                section_title = section.get('title', '').lower()
-                if section_title in [
-                    'conclusion', 'references', 'appendix', 'acknowledgments'
-                ]:
-                    combined_metadata['sections'].append(section)
-
-        else:
-            # Middle chunks have main content sections
-            combined_metadata['sections'].extend(
-                meta_chunk.get('sections', [])
+            # Note: parse_pdf_with_ocr can be called recursively
+            result = await parse_pdf_with_ocr(
+                pdf_base64=chunk_base64,
+                client=client,
+                config=config,
+                filename_for_logging=chunk_filename,
+                extract_metadata=True  # Always extract for all chunks
             )
+        return chunk_idx, chunk_filename, result
 
-        # Always merge figures and tables (adjust page numbers)
-        for fig in meta_chunk.get('figures', []):
-            if 'page_number' in fig:
-                fig['page_number'] += start_page
-            combined_metadata['figures'].append(fig)
+    tasks = [
+        asyncio.create_task(ocr_chunk(idx, *chunk))
+        for idx, chunk in enumerate(chunks_to_process)
+    ]
+    completed: Dict[int, Tuple[str, Tuple]] = {}
+    next_to_merge = 0
 
-        for tbl in meta_chunk.get('tables', []):
-            if 'page_number' in tbl:
-                tbl['page_number'] += start_page
-            combined_metadata['tables'].append(tbl)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            chunk_idx, chunk_filename, result = await next_done
+            completed[chunk_idx] = (chunk_filename, result)
+
+            # Merge every chunk whose predecessors have all arrived
+            while next_to_merge in completed:
+                chunk_filename, result = completed.pop(next_to_merge)
+                start_page, _, chunk_type = chunks_to_process[next_to_merge]
+                next_to_merge += 1
+
+                if len(result) != 5:
+                    logger.error(
+                        f"Unexpected result format from parse_pdf_with_ocr "
+                        f"for {chunk_filename}: {len(result)} elements"
+                    )
+                    continue
 
-        # Merge equations
-        combined_metadata['equations'].extend(meta_chunk.get('equations', []))
+                raw_res_chunk, md_chunk, _, _, meta_chunk = result
+                all_raw_responses.append(raw_res_chunk)
+                all_markdown_parts.append(md_chunk)
+                _merge_chunk_metadata(
+                    combined_metadata, meta_chunk, chunk_type, start_page
+                )
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Wait for an in-flight split: the caller closes pdf_doc next
+        split_executor.shutdown(wait=True, cancel_futures=True)
 
     combined_markdown = "\n\n".join(all_markdown_parts)
     logger.info(
@@ -657,6 +663,98 @@ async def _process_large_pdf_chunks(
     )
 
 
+def _encode_pdf_chunk(
+    pdf_doc: fitz.Document,
+    start_page: int,
+    end_page: int
+) -> str:
+    """
+    Copy a page range into a new PDF and base64 encode it.
+
+    Args:
+        pdf_doc: Source document
+        start_page: First page (0-based, inclusive)
+        end_page: Last page (0-based, inclusive)
+
+    Returns:
+        Base64 encoded chunk PDF
+    """
+    chunk_doc = fitz.open()
+    try:
+        chunk_doc.insert_pdf(pdf_doc, from_page=start_page, to_page=end_page)
+        return base64.b64encode(chunk_doc.tobytes()).decode('utf-8')
+    finally:
+        chunk_doc.close()
+
+
+def _merge_chunk_metadata(
+    combined_metadata: Dict[str, Any],
+    meta_chunk: Dict[str, Any],
+    chunk_type: str,
+    start_page: int
+):
+    """
+    Merge one chunk's metadata into the combined document metadata.
+
+    Args:
+        combined_metadata: Metadata accumulated so far (updated in place)
+        meta_chunk: Metadata extracted from the chunk
+        chunk_type: 'first', 'middle' or 'last'
+        start_page: First page of the chunk (0-based)
+    """
+    if chunk_type == 'first':
+        # First chunk has title, authors, abstract, introduction
+        combined_metadata['title'] = meta_chunk.get('title', '')
+        combined_metadata['authors'] = meta_chunk.get('authors', [])
+        combined_metadata['abstract'] = meta_chunk.get('abstract', '')
+        combined_metadata['keywords'] = meta_chunk.get('keywords', [])
+        combined_metadata['publication_info'] = meta_chunk.get(
+            'publication_info', {}
+        )
+
+        # Add early sections
+        for section in meta_chunk.get('sections', []):
+            section_title = section.get('title', '').lower()
+            if section_title in [
+                'introduction', 'background', 'related work'
+            ]:
+                combined_metadata['sections'].append(section)
+
+    elif chunk_type == 'last':
+        # Last chunk has references and appendices
+        combined_metadata['references'].extend(
+            meta_chunk.get('references', [])
+        )
+
+        # Add concluding sections
+        for section in meta_chunk.get('sections', []):
+            section_title = section.get('title', '').lower()
+            if section_title in [
+                'conclusion', 'references', 'appendix', 'acknowledgments'
+            ]:
+                combined_metadata['sections'].append(section)
+
+    else:
+        # Middle chunks have main content sections
+        combined_metadata['sections'].extend(
+            meta_chunk.get('sections', [])
+        )
+
+    # Always merge figures and tables (adjust page numbers)
+    for fig in meta_chunk.get('figures', []):
+        if 'page_number' in fig:
+            fig['page_number'] += start_page
+        combined_metadata['figures'].append(fig)
+
+    for tbl in meta_chunk.get('tables', []):
+        if 'page_number' in tbl:
+            tbl['page_number'] += start_page
+        combined_metadata['tables'].append(tbl)
+
+    # Merge equations
+    combined_metadata['equations'].extend(meta_chunk.get('equations', []))
+
+
 async def _process_single_pdf(
     pdf_doc: Optional[fitz.Document],
     pdf_path: Optional[str],
@@ -712,8 +810,11 @@ async def _process_single_pdf(
             current_content_type = "application/pdf"
         elif pdf_path and pdf_doc:
             logger.info(f"Processing PDF from path: {pdf_path}")
-            pdf_bytes = pdf_doc.tobytes()
-            current_pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+            # Encode the file itself from a read-only mapping
+            with DownloadedPDF(Path(pdf_path), delete=False) as mapped:
+                current_pdf_base64 = await asyncio.to_thread(
+                    mapped.to_base64
+                )
             current_content_type = (
                 mimetypes.guess_type(pdf_path)[0] or "application/pdf"
             )
@@ -778,7 +879,7 @@ async def _process_single_pdf(
                 response_format_from_pydantic_model(DocumentAnnotation)
             )
 
-    response = client.ocr.process(**request_params)
+    response = await client.ocr.process_async(**request_params)
 
     if not response or not response.pages:
         logger.error(
@@ -1172,8 +1273,6 @@ def save_assets_to_files(
     doc_filename: str
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Save image and table data to files and return file paths."""
-    from pathlib import Path
-
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
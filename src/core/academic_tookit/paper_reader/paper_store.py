@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/academic_tookit/paper_reader/paper_store.py
+# code style: PEP 8
+
+"""
+Persistent store for parsed academic papers.
+
+Parsing a paper (Mistral OCR for PDFs, readerlm-v2 for HTML) is slow and
+billed per request, while popular papers are read over and over. The
+store keeps the standardized result of ``PaperReader`` on disk, keyed by
+``(paper_id, version, parser, config hash)``, so any session or process
+sharing the store directory reuses an earlier parse.
+
+Each result is column-split: every heavy field (``full_text``,
+``sections``, ``references`` ...) is a separate gzip-compressed JSON file
+next to a small manifest, so callers can load just the columns they need.
+
+Layout::
+
+    <root>/<paper_id>/<version>/<parser>-<config_hash>/
+        manifest.json
+        full_text.json.gz
+        sections.json.gz
+        ...
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Result fields stored as separate compressed columns
+COLUMN_FIELDS = (
+    "full_text",
+    "sections",
+    "figures",
+    "tables",
+    "references",
+    "equations",
+    "metadata",
+    "metadata_sources",
+)
+
+# Small fields kept inline in the manifest
+MANIFEST_FIELDS = ("paper_id", "content_format", "processing_info")
+
+# Parser config fields that do not change the parsed output
+_IGNORED_CONFIG_FIELDS = {
+    "api_key",
+    "timeout",
+    "retry_attempts",
+    "max_retries",
+    "max_concurrent_chunks",
+    "use_direct_url",
+    "download_fallback",
+    "check_page_count_for_urls",
+}
+
+_STORE_FORMAT = 1
+_VERSION_PATTERN = re.compile(r"^(?P<base>.+?)v(?P<version>\d+)$")
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def split_paper_version(paper_id: str) -> Tuple[str, str]:
+    """
+    Split a versioned paper ID into base ID and version.
+
+    Args:
+        paper_id: Paper identifier such as ``2301.12345v2``
+
+    Returns:
+        Tuple of (base_id, version). Unversioned IDs get ``"latest"``.
+    """
+    match = _VERSION_PATTERN.match(paper_id.strip())
+    if match:
+        return match.group("base"), f"v{match.group('version')}"
+    return paper_id.strip(), "latest"
+
+
+def config_hash(*configs: Any) -> str:
+    """
+    Hash the parser settings that affect parsed output.
+
+    Credentials, timeouts and transport options are ignored so that
+    rotating an API key does not invalidate stored papers.
+
+    Args:
+        *configs: Dataclass instances or plain dictionaries
+
+    Returns:
+        Short hex digest
+    """
+    parts = []
+    for config in configs:
+        if config is None:
+            continue
+        values = asdict(config) if is_dataclass(config) else dict(config)
+        parts.append({
+            key: value for key, value in values.items()
+            if key not in _IGNORED_CONFIG_FIELDS
+        })
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PaperKey:
+    """Identity of one stored parse."""
+
+    paper_id: str
+    version: str
+    parser: str
+    config_hash: str
+
+    @classmethod
+    def for_paper(
+        cls,
+        paper_id: str,
+        parser: str,
+        config_hash: str
+    ) -> "PaperKey":
+        """Build a key, splitting the version off ``paper_id``."""
+        base_id, version = split_paper_version(paper_id)
+        return cls(base_id, version, parser, config_hash)
+
+    @property
+    def relative_path(self) -> Path:
+        """Directory of this entry relative to the store root."""
+        return (
+            Path(_safe_name(self.paper_id))
+            / _safe_name(self.version)
+            / _safe_name(f"{self.parser}-{self.config_hash}")
+        )
+
+
+@dataclass
+class StoreStats:
+    """Hit and miss counters for a store instance."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    columns_read: Dict[str, int] = field(default_factory=dict)
+
+
+class ParsedPaperStore:
+    """
+    On-disk store of parsed paper results.
+
+    Entries are written to a temporary directory and moved into place in
+    one rename, so concurrent readers never see a partial entry and
+    several processes can share one store directory.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        latest_ttl: Optional[float] = 7 * 24 * 3600
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory (created if missing)
+            latest_ttl: Maximum age in seconds of entries for unversioned
+                paper IDs, whose content changes when a new version is
+                published. ``None`` keeps them forever.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.latest_ttl = latest_ttl
+        self.stats = StoreStats()
+
+    def get(
+        self,
+        key: PaperKey,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored result.
+
+        Args:
+            key: Entry key
+            fields: Column fields to load; ``None`` loads all of them.
+                Manifest fields are always included.
+
+        Returns:
+            Result dictionary, or None if the entry is missing or stale
+        """
+        manifest = self._read_manifest(key)
+        if manifest is None:
+            self.stats.misses += 1
+            return None
+
+        wanted = self._validate_fields(fields)
+        result = {name: manifest.get(name) for name in MANIFEST_FIELDS}
+        entry_dir = self.root / key.relative_path
+        for name in wanted:
+            if name not in manifest["columns"]:
+                continue
+            try:
+                result[name] = self._read_column(entry_dir, name)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Corrupt paper store column {name} for "
+                    f"{key.paper_id}: {e}"
+                )
+                self.invalidate(key)
+                self.stats.misses += 1
+                return None
+            self.stats.columns_read[name] = (
+                self.stats.columns_read.get(name, 0) + 1
+            )
+
+        # The metadata column is stored without the other columns;
+        # restore whichever of them were loaded alongside it
+        if isinstance(result.get("metadata"), dict):
+            for name in manifest.get("metadata_columns", []):
+                if name in result:
+                    result["metadata"][name] = result[name]
+
+        self.stats.hits += 1
+        logger.debug(
+            f"Paper store hit for {key.paper_id} {key.version} "
+            f"({key.parser}), columns: {wanted}"
+        )
+        return result
+
+    def put(self, key: PaperKey, result: Dict[str, Any]) -> Path:
+        """
+        Store a parsed result, replacing any existing entry.
+
+        Args:
+            key: Entry key
+            result: Standardized result from ``PaperReader``
+
+        Returns:
+            Path of the stored entry
+        """
+        entry_dir = self.root / key.relative_path
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(
+            prefix=".tmp-", dir=entry_dir.parent
+        ))
+
+        try:
+            columns = {}
+            metadata_columns = []
+            for name in COLUMN_FIELDS:
+                if name not in result:
+                    continue
+                value = result[name]
+                if name == "metadata" and isinstance(value, dict):
+                    # Avoid storing full text and sections twice
+                    metadata_columns = [
+                        column for column in COLUMN_FIELDS
+                        if column in value and column in result
+                    ]
+                    value = {
+                        k: v for k, v in value.items()
+                        if k not in metadata_columns
+                    }
+                columns[name] = self._write_column(tmp_dir, name, value)
+
+            manifest = {
+                "format": _STORE_FORMAT,
+                "key": asdict(key),
+                "created_at": time.time(),
+                "columns": columns,
+                "metadata_columns": metadata_columns,
+            }
+            for name in MANIFEST_FIELDS:
+                manifest[name] = result.get(name)
+            with open(tmp_dir / "manifest.json", "w",
+                      encoding="utf-8") as f:
+                json.dump(manifest, f, default=str)
+
+            # Swap the finished entry into place
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self.stats.writes += 1
+        logger.info(
+            f"Stored parsed paper {key.paper_id} {key.version} "
+            f"({key.parser}) in {entry_dir}"
+        )
+        return entry_dir
+
+    def contains(self, key: PaperKey) -> bool:
+        """Return True if a fresh entry exists for ``key``."""
+        return self._read_manifest(key) is not None
+
+    def invalidate(self, key: PaperKey) -> bool:
+        """
+        Remove a stored entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        entry_dir = self.root / key.relative_path
+        if not entry_dir.exists():
+            return False
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        return True
+
+    def versions(self, paper_id: str) -> List[str]:
+        """List stored versions of a paper."""
+        base_id, _ = split_paper_version(paper_id)
+        paper_dir = self.root / _safe_name(base_id)
+        if not paper_dir.is_dir():
+            return []
+        return sorted(p.name for p in paper_dir.iterdir() if p.is_dir())
+
+    def _read_manifest(self, key: PaperKey) -> Optional[Dict[str, Any]]:
+        """Read the manifest of a complete, fresh entry."""
+        path = self.root / key.relative_path / "manifest.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable paper store manifest {path}: {e}")
+            return None
+
+        if manifest.get("format") != _STORE_FORMAT:
+            return None
+        if (
+            key.version == "latest"
+            and self.latest_ttl is not None
+            and time.time() - manifest.get("created_at", 0)
+            > self.latest_ttl
+        ):
+            logger.debug(f"Stale paper store entry for {key.paper_id}")
+            return None
+        return manifest
+
+    @staticmethod
+    def _validate_fields(fields: Optional[Iterable[str]]) -> List[str]:
+        """Normalize a requested field list to column names."""
+        if fields is None:
+            return list(COLUMN_FIELDS)
+        wanted = []
+        for name in fields:
+            if name in MANIFEST_FIELDS:
+                continue
+            if name not in COLUMN_FIELDS:
+                raise ValueError(
+                    f"Unknown paper field: {name}. "
+                    f"Available: {', '.join(COLUMN_FIELDS)}"
+                )
+            wanted.append(name)
+        return wanted
+
+    @staticmethod
+    def _write_column(directory: Path, name: str, value: Any) -> int:
+        """Write one compressed column; returns its compressed size."""
+        path = directory / f"{name}.json.gz"
+        data = json.dumps(value, default=str, ensure_ascii=False)
+        with gzip.open(path, "wb", compresslevel=6) as f:
+            f.write(data.encode("utf-8"))
+        return path.stat().st_size
+
+    @staticmethod
+    def _read_column(directory: Path, name: str) -> Any:
+        """Read one compressed column."""
+        with gzip.open(directory / f"{name}.json.gz", "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+
+def _safe_name(value: str) -> str:
+    """Turn an identifier into a single safe path component."""
+    name = _UNSAFE_CHARS.sub("_", value).strip("._")
+    if name != value:
+        # Keep sanitized names distinct, e.g. for DOIs with slashes
+        digest = hashlib.sha1(value.encode("utf-8")).hexdigest()[:8]
+        name = f"{name}_{digest}" if name else digest
+    return name
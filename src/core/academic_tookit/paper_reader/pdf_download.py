@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/academic_tookit/paper_reader/pdf_download.py
+# code style: PEP 8
+
+"""
+Streaming PDF downloads for the paper reader.
+
+PDFs are streamed to a temporary file on disk instead of being buffered
+in memory, with a size limit enforced while downloading and an early
+abort for responses that are not PDFs. The finished file is memory-mapped
+so base64 encoding for the OCR API reads pages from the page cache rather
+than from a private copy on the Python heap. All downloads share one
+connection pool per event loop.
+"""
+
+import asyncio
+import binascii
+import logging
+import mmap
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import aiohttp
+import fitz  # PyMuPDF pymupdf library
+
+logger = logging.getLogger(__name__)
+
+# PDF header must appear within the first 1024 bytes
+_PDF_MAGIC = b"%PDF-"
+_HEADER_WINDOW = 1024
+
+# Base64 works on 3-byte groups, so chunks that are multiples of 3
+# encode independently and concatenate to the full encoding
+_BASE64_CHUNK = 3 * 256 * 1024
+
+
+class PDFDownloadError(Exception):
+    """Raised when a download is not a usable PDF."""
+    pass
+
+
+class PDFTooLargeError(PDFDownloadError):
+    """Raised when a PDF exceeds the configured size limit."""
+    pass
+
+
+class DownloadedPDF:
+    """
+    A PDF spooled to disk and mapped read-only into memory.
+
+    Use as a context manager, or call ``close()``; temporary files are
+    removed on close.
+    """
+
+    def __init__(self, path: Path, delete: bool = True):
+        """
+        Map a downloaded PDF.
+
+        Args:
+            path: File containing the PDF
+            delete: Remove the file on close
+        """
+        self.path = Path(path)
+        self.delete = delete
+        self.size = self.path.stat().st_size
+        self._file = open(self.path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        if self.size:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._page_count: Optional[int] = None
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the PDF."""
+        if self._page_count is None:
+            # MuPDF reads the file lazily; only the xref and page tree
+            # are loaded to count pages
+            with fitz.open(self.path, filetype="pdf") as pdf_doc:
+                self._page_count = len(pdf_doc)
+        return self._page_count
+
+    def iter_base64(self, chunk_size: int = _BASE64_CHUNK) -> Iterator[bytes]:
+        """
+        Yield the base64 encoding of the file piece by piece.
+
+        Args:
+            chunk_size: Input bytes per piece (rounded down to a
+                multiple of 3)
+
+        Yields:
+            ASCII base64 chunks that concatenate to the full encoding
+        """
+        if self._map is None:
+            return
+        chunk_size = max(3, chunk_size - chunk_size % 3)
+        view = memoryview(self._map)
+        try:
+            for start in range(0, self.size, chunk_size):
+                yield binascii.b2a_base64(
+                    view[start:start + chunk_size], newline=False
+                )
+        finally:
+            view.release()
+
+    def to_base64(self) -> str:
+        """
+        Base64 encode the whole file.
+
+        The encoding is written into one preallocated buffer from the
+        mapped file, so peak memory is the encoded size plus the result
+        string instead of the PDF bytes plus both encoded copies.
+
+        Returns:
+            Base64 string
+        """
+        encoded = bytearray(4 * ((self.size + 2) // 3))
+        offset = 0
+        for piece in self.iter_base64():
+            encoded[offset:offset + len(piece)] = piece
+            offset += len(piece)
+        return encoded.decode("ascii")
+
+    def close(self):
+        """Unmap the file and remove it if temporary."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if not self._file.closed:
+            self._file.close()
+        if self.delete:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "DownloadedPDF":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PDFDownloader:
+    """
+    Streams PDFs to disk over a shared connection pool.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = 100 * 1024 * 1024,
+        chunk_size: int = 64 * 1024,
+        timeout: float = 60.0,
+        limit_per_host: int = 8
+    ):
+        """
+        Initialize the downloader.
+
+        Args:
+            max_bytes: Maximum PDF size; larger downloads are aborted.
+                ``None`` disables the limit.
+            chunk_size: Bytes read from the network per write
+            timeout: Default total timeout per download in seconds
+            limit_per_host: Concurrent connections per host
+        """
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.limit_per_host = limit_per_host
+        # One session per event loop, dropped with its loop, so callers on
+        # different loops never replace each other's open session
+        self._sessions: "weakref.WeakKeyDictionary" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get a reusable aiohttp session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """Close the HTTP session of the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+
+    async def download(
+        self,
+        pdf_url: str,
+        dest: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> DownloadedPDF:
+        """
+        Stream a PDF to disk.
+
+        Args:
+            pdf_url: URL of the PDF
+            dest: Final file path; the file is written next to it and
+                renamed into place when complete. Without ``dest`` a
+                temporary file is used and removed when the result is
+                closed.
+            max_bytes: Size limit overriding the downloader default
+            timeout: Total timeout overriding the downloader default
+
+        Returns:
+            DownloadedPDF mapping the file
+
+        Raises:
+            ConnectionError: If the download fails
+            PDFTooLargeError: If the PDF exceeds the size limit
+            PDFDownloadError: If the response is not a PDF
+        """
+        limit = max_bytes if max_bytes is not None else self.max_bytes
+        if dest is not None:
+            dest = Path(dest)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            spool_dir = dest.parent
+        else:
+            spool_dir = None
+
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=".pdf-", suffix=".part", dir=spool_dir
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                size = await self._stream_to_file(
+                    pdf_url, f, limit, timeout or self.timeout
+                )
+            if dest is not None:
+                os.replace(tmp_path, dest)
+                result = DownloadedPDF(dest, delete=False)
+            else:
+                result = DownloadedPDF(tmp_path, delete=True)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Downloaded {size} bytes from {pdf_url}")
+        return result
+
+    async def _stream_to_file(
+        self,
+        pdf_url: str,
+        f,
+        limit: Optional[int],
+        timeout: float
+    ) -> int:
+        """Write the response body to ``f``; returns the byte count."""
+        session = await self._get_session()
+        try:
+            async with session.get(
+                pdf_url,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+
+                if (
+                    limit is not None
+                    and response.content_length is not None
+                    and response.content_length > limit
+                ):
+                    raise PDFTooLargeError(
+                        f"PDF at {pdf_url} is {response.content_length} "
+                        f"bytes, limit is {limit}"
+                    )
+
+                size = 0
+                header = b""
+                async for chunk in response.content.iter_chunked(
+                    self.chunk_size
+                ):
+                    size += len(chunk)
+                    if limit is not None and size > limit:
+                        raise PDFTooLargeError(
+                            f"PDF at {pdf_url} exceeds {limit} bytes"
+                        )
+                    if len(header) < _HEADER_WINDOW:
+                        header += chunk[:_HEADER_WINDOW - len(header)]
+                        if (
+                            len(header) >= _HEADER_WINDOW
+                            and _PDF_MAGIC not in header
+                        ):
+                            raise PDFDownloadError(
+                                f"Response from {pdf_url} is not a PDF"
+                            )
+                    # Disk writes can block; keep them off the event loop
+                    await asyncio.to_thread(f.write, chunk)
+
+                if _PDF_MAGIC not in header:
+                    raise PDFDownloadError(
+                        f"Response from {pdf_url} is not a PDF"
+                    )
+                return size
+
+        except aiohttp.ClientError as e:
+            raise ConnectionError(f"Failed to download PDF: {e}") from e
+        except asyncio.TimeoutError as e:
+            raise ConnectionError(
+                f"Timed out downloading PDF from {pdf_url}"
+            ) from e
+
+
+_shared_downloader: Optional[PDFDownloader] = None
+
+
+def get_shared_downloader() -> PDFDownloader:
+    """Get the process-wide downloader and its connection pool."""
+    global _shared_downloader
+    if _shared_downloader is None:
+        _shared_downloader = PDFDownloader()
+    return _shared_downloader
@@ -11,16 +11,29 @@ various sources (HTML, PDF URL, PDF file) with automatic format detection
 and priority handling.
 """
 
+import asyncio
+import hashlib
 import logging
 import tempfile
-import aiohttp
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from dataclasses import dataclass
 
-from .paper_parser_pdf import PDFParserConfig, parse_pdf_with_ocr
+from .paper_parser_pdf import (
+    PDFParserConfig,
+    PDFParserError,
+    parse_pdf_with_ocr
+)
+from .pdf_download import PDFDownloadError, get_shared_downloader
 from .paper_parser_html import HTMLParserConfig, HTMLPaperParser
 from .metadata_merger import MetadataMerger
+from .paper_store import (
+    COLUMN_FIELDS,
+    MANIFEST_FIELDS,
+    ParsedPaperStore,
+    PaperKey,
+    config_hash
+)
 from ..models import Paper, PaperSource
 
 logger = logging.getLogger(__name__)
@@ -41,6 +54,12 @@ class PaperReaderConfig:
     cache_dir: Optional[Path] = None
     cache_pdfs: bool = True
 
+    # Parsed-paper store (shared across sessions via the same directory)
+    use_paper_store: bool = True
+    paper_store_dir: Optional[Path] = None  # Defaults to cache_dir/parsed
+    # Max age in seconds of stored parses for unversioned paper IDs
+    paper_store_latest_ttl: Optional[float] = 7 * 24 * 3600
+
     # Processing options
     extract_references: bool = True
     extract_figures: bool = True
@@ -85,6 +104,15 @@ class PaperReader:
             self.cache_dir = Path(tempfile.gettempdir()) / "paper_reader_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Setup parsed-paper store
+        self.paper_store: Optional[ParsedPaperStore] = None
+        if self.config.use_paper_store:
+            self.paper_store = ParsedPaperStore(
+                self.config.paper_store_dir or self.cache_dir / "parsed",
+                latest_ttl=self.config.paper_store_latest_ttl
+            )
+        self._parse_locks: Dict[PaperKey, asyncio.Lock] = {}
+
     async def read_paper(
         self,
         paper: Optional[Paper] = None,
@@ -92,11 +120,17 @@ class PaperReader:
         html_url: Optional[str] = None,
         pdf_url: Optional[str] = None,
         pdf_path: Optional[str] = None,
-        force_format: Optional[str] = None
+        force_format: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Read academic paper with automatic format selection.
 
+        Parsed results are kept in the paper store, so a paper that was
+        already parsed with the same parser and settings is loaded from
+        disk instead of being sent to OCR/extraction again.
+
         Args:
             paper: Paper object containing URLs
             paper_id: Paper ID for caching/logging
@@ -104,9 +138,13 @@ class PaperReader:
             pdf_url: Direct PDF URL
             pdf_path: Local PDF file path
             force_format: Force specific format ('html' or 'pdf')
+            fields: Content fields to return, e.g. ``["sections"]``;
+                None returns all of them. Stored papers only load the
+                requested fields from disk.
+            refresh: Re-parse even if a stored result exists
 
         Returns:
-            Dictionary containing:
+            Dictionary containing (limited to ``fields`` if given):
                 - paper_id: Paper identifier
                 - content_format: Format used ('html' or 'pdf')
                 - full_text: Full paper text in markdown
@@ -132,6 +170,66 @@ class PaperReader:
             html_url, pdf_url, pdf_path, force_format
         )
 
+        if fields is not None:
+            fields = list(fields)
+            unknown = set(fields) - set(COLUMN_FIELDS) - set(MANIFEST_FIELDS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown paper fields: {sorted(unknown)}. "
+                    f"Available: {', '.join(COLUMN_FIELDS)}"
+                )
+
+        if self.paper_store is None:
+            result = await self._parse_paper(
+                format_to_use, paper, paper_id, html_url, pdf_url, pdf_path
+            )
+            return self._select_fields(result, fields)
+
+        store_id = paper_id or self._source_id(html_url, pdf_url, pdf_path)
+        keys = [
+            self._store_key(store_id, fmt)
+            for fmt in self._candidate_formats(
+                format_to_use, html_url, pdf_url, pdf_path, force_format
+            )
+        ]
+
+        # Serialize parses of the same paper so concurrent requests wait
+        # for the first parse instead of paying for their own
+        lock = self._parse_locks.setdefault(keys[0], asyncio.Lock())
+        async with lock:
+            if not refresh:
+                for key in keys:
+                    stored = await asyncio.to_thread(
+                        self.paper_store.get, key, fields
+                    )
+                    if stored is not None:
+                        logger.info(
+                            f"Loaded parsed paper {store_id} from store "
+                            f"({key.parser})"
+                        )
+                        return stored
+
+            result = await self._parse_paper(
+                format_to_use, paper, paper_id, html_url, pdf_url, pdf_path
+            )
+            key = self._store_key(store_id, result['content_format'])
+            try:
+                await asyncio.to_thread(self.paper_store.put, key, result)
+            except Exception as e:
+                logger.warning(f"Failed to store parsed paper {store_id}: {e}")
+
+        return self._select_fields(result, fields)
+
+    async def _parse_paper(
+        self,
+        format_to_use: str,
+        paper: Optional[Paper],
+        paper_id: Optional[str],
+        html_url: Optional[str],
+        pdf_url: Optional[str],
+        pdf_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """Parse a paper with the chosen format, falling back if needed."""
         logger.info(
             f"Reading paper {paper_id or 'unknown'} using format: {format_to_use}"
         )
@@ -189,6 +287,67 @@ class PaperReader:
             else:
                 raise
 
+    def _candidate_formats(
+        self,
+        format_to_use: str,
+        html_url: Optional[str],
+        pdf_url: Optional[str],
+        pdf_path: Optional[str],
+        force_format: Optional[str]
+    ) -> List[str]:
+        """Formats whose stored parses can answer a request, best first."""
+        formats = [format_to_use]
+        if not force_format:
+            # A stored fallback parse is what a fresh read would return
+            other = 'pdf' if format_to_use == 'html' else 'html'
+            if (other == 'html' and html_url) or (
+                other == 'pdf' and (pdf_url or pdf_path)
+            ):
+                formats.append(other)
+        return formats
+
+    def _store_key(self, paper_id: str, content_format: str) -> PaperKey:
+        """Build the paper store key for a parse in the given format."""
+        if content_format == 'html':
+            parser, parser_config = 'jina_reader', self.html_config
+        else:
+            parser, parser_config = 'mistral_ocr', self.pdf_config
+        options = {
+            'extract_references': self.config.extract_references,
+            'extract_figures': self.config.extract_figures,
+            'extract_equations': self.config.extract_equations,
+            'extract_tables': self.config.extract_tables,
+        }
+        return PaperKey.for_paper(
+            paper_id, parser, config_hash(parser_config, options)
+        )
+
+    @staticmethod
+    def _source_id(
+        html_url: Optional[str],
+        pdf_url: Optional[str],
+        pdf_path: Optional[str]
+    ) -> str:
+        """Stable store ID for papers read without a paper ID."""
+        if pdf_path:
+            path = Path(pdf_path)
+            stat = path.stat()
+            source = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        else:
+            source = html_url or pdf_url
+        return "url-" + hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _select_fields(
+        result: Dict[str, Any],
+        fields: Optional[Iterable[str]]
+    ) -> Dict[str, Any]:
+        """Limit a freshly parsed result to the requested fields."""
+        if fields is None:
+            return result
+        keep = {*MANIFEST_FIELDS, *fields}
+        return {k: v for k, v in result.items() if k in keep}
+
     async def read_pdf(
         self,
         pdf_path: Optional[str] = None,
@@ -433,17 +592,20 @@ class PaperReader:
             logger.info(f"Using cached PDF: {pdf_path}")
             return str(pdf_path)
 
-        # Download PDF
+        # Stream to disk over the shared connection pool; the file only
+        # appears at pdf_path once complete
         logger.info(f"Downloading PDF from: {pdf_url}")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(pdf_url) as response:
-                response.raise_for_status()
-
-                # Save to file
-                with open(pdf_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
+        try:
+            downloaded = await get_shared_downloader().download(
+                pdf_url,
+                dest=pdf_path,
+                max_bytes=self.pdf_config.max_download_bytes,
+                timeout=self.pdf_config.download_timeout
+            )
+        except PDFDownloadError as e:
+            raise PDFParserError(str(e))
+        downloaded.close()
 
         logger.info(f"PDF downloaded to: {pdf_path}")
         return str(pdf_path)
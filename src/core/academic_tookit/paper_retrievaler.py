@@ -381,7 +381,8 @@ class PaperRetriever:
     async def read_paper(
         self,
         paper: Paper,
-        force_format: Optional[str] = None
+        force_format: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Read full paper content with automatic format selection.
@@ -389,6 +390,8 @@ class PaperRetriever:
         Args:
             paper: Paper object to read
             force_format: Force specific format ('html' or 'pdf')
+            fields: Content fields to return, e.g. ``["references"]``;
+                None returns all of them
 
         Returns:
             Dictionary containing:
@@ -414,7 +417,8 @@ class PaperRetriever:
         try:
             result = await self.paper_reader.read_paper(
                 paper=paper,
-                force_format=force_format
+                force_format=force_format,
+                fields=fields
             )
 
             # Enhance result with paper's original metadata if available
@@ -597,6 +601,17 @@ class PaperRetriever:
 
         return results
 
+    async def close(self):
+        """Close the search clients' HTTP sessions on the running loop."""
+        for source, client in self.sources.items():
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Failed to close {source} client: {e}")
+
     def __repr__(self) -> str:
         """String representation."""
         return (
@@ -8,5 +8,13 @@ ArXiv paper search implementation.
 """
 
 from .client import ArxivClient
+from .async_transport import AsyncArxivTransport, ArxivRateLimiter
+from .search_cache import ArxivSearchCache, get_default_search_cache
 
-__all__ = ["ArxivClient"]
+__all__ = [
+    "ArxivClient",
+    "AsyncArxivTransport",
+    "ArxivRateLimiter",
+    "ArxivSearchCache",
+    "get_default_search_cache",
+]
@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/academic_tookit/paper_search/arxiv/async_transport.py
+# code style: PEP 8
+
+"""
+Async transport for the arXiv query API.
+
+Replaces the thread-pool wrapped sync SDK client with:
+- aiohttp requests gated by one process-wide rate limiter, so concurrent
+  callers share arXiv's one-request-per-3-seconds budget
+- incremental Atom parsing: entries are parsed as response chunks arrive
+- speculative prefetch of the next page while the current one is parsed
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncGenerator, List, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+from .arxiv_sdk import Result, Search, HTTPError, UnexpectedEmptyPageError
+
+logger = logging.getLogger(__name__)
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+
+class ArxivRateLimiter:
+    """
+    Rate limit token shared by every arXiv request in the process.
+
+    Each acquire reserves the next request slot, so concurrent callers are
+    spaced ``delay_seconds`` apart without serializing their parsing. Slots
+    are reserved under a thread lock, so callers on different event loops
+    (worker threads, per-call loops) share the same budget.
+    """
+
+    def __init__(self, delay_seconds: float = 3.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            delay_seconds: Minimum seconds between request starts
+        """
+        self.delay_seconds = delay_seconds
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self, delay_seconds: Optional[float] = None):
+        """
+        Wait until this caller's request slot is reached.
+
+        Args:
+            delay_seconds: Caller's own minimum spacing before the next
+                request; never shorter than the limiter's
+        """
+        spacing = max(self.delay_seconds, delay_seconds or 0.0)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + spacing
+        if slot > now:
+            logger.debug(f"arXiv rate limit: waiting {slot - now:.2f}s")
+            await asyncio.sleep(slot - now)
+
+
+# Process-wide limiter shared by all transports
+_shared_rate_limiter = ArxivRateLimiter()
+
+
+def get_shared_rate_limiter() -> ArxivRateLimiter:
+    """Get the process-wide arXiv rate limiter."""
+    return _shared_rate_limiter
+
+
+@dataclass
+class ArxivPage:
+    """One parsed page of an arXiv query feed."""
+    total_results: int = 0
+    results: List[Result] = field(default_factory=list)
+
+
+class AtomEntryParser:
+    """
+    Incremental parser turning Atom feed bytes into SDK ``Result`` objects.
+
+    Feed it response chunks as they arrive; completed entries are converted
+    immediately and their XML elements released.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("end",))
+        self.total_results: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[Result]:
+        """
+        Feed a chunk of the response body.
+
+        Returns:
+            Results whose ``<entry>`` elements completed in this chunk
+        """
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[Result]:
+        """Finish parsing and return any remaining results."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Result]:
+        results = []
+        for _, element in self._parser.read_events():
+            if element.tag == f"{_OPENSEARCH}totalResults":
+                self.total_results = int(element.text or 0)
+            elif element.tag == f"{_ATOM}entry":
+                try:
+                    result = _entry_to_result(element)
+                except Result.MissingFieldError as e:
+                    logger.warning(f"Skipping partial result: {e!r}")
+                    result = None
+                element.clear()
+                if result is not None:
+                    results.append(result)
+        return results
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    """Parse an Atom timestamp into a timezone-aware datetime."""
+    if not value:
+        return datetime.min
+    return datetime.strptime(
+        value.strip(), "%Y-%m-%dT%H:%M:%SZ"
+    ).replace(tzinfo=timezone.utc)
+
+
+def _text(element: ET.Element, tag: str) -> Optional[str]:
+    """Get the text of a child element, if present."""
+    child = element.find(tag)
+    return child.text if child is not None else None
+
+
+def _entry_to_result(entry: ET.Element) -> Optional[Result]:
+    """Convert an Atom ``<entry>`` element into an SDK ``Result``."""
+    entry_id = _text(entry, f"{_ATOM}id")
+    if not entry_id:
+        raise Result.MissingFieldError("id")
+    if "/api/errors" in entry_id:
+        # arXiv reports query errors as a pseudo-entry
+        logger.warning(f"arXiv API error: {_text(entry, f'{_ATOM}summary')}")
+        return None
+
+    title = _text(entry, f"{_ATOM}title")
+    if title is None:
+        logger.warning(
+            f"Result {entry_id} is missing title attribute; defaulting to '0'"
+        )
+        title = "0"
+
+    primary = entry.find(f"{_ARXIV}primary_category")
+    links = [
+        Result.Link(
+            href=link.get("href"),
+            title=link.get("title"),
+            rel=link.get("rel"),
+            content_type=link.get("type"),
+        )
+        for link in entry.iterfind(f"{_ATOM}link")
+    ]
+
+    return Result(
+        entry_id=entry_id,
+        updated=_parse_timestamp(_text(entry, f"{_ATOM}updated")),
+        published=_parse_timestamp(_text(entry, f"{_ATOM}published")),
+        title=" ".join(title.split()),
+        authors=[
+            Result.Author(_text(author, f"{_ATOM}name") or "")
+            for author in entry.iterfind(f"{_ATOM}author")
+        ],
+        summary=_text(entry, f"{_ATOM}summary") or "",
+        comment=_text(entry, f"{_ARXIV}comment"),
+        journal_ref=_text(entry, f"{_ARXIV}journal_ref"),
+        doi=_text(entry, f"{_ARXIV}doi"),
+        primary_category=(
+            primary.get("term") if primary is not None else ""
+        ),
+        categories=[
+            tag.get("term") for tag in entry.iterfind(f"{_ATOM}category")
+        ],
+        links=links,
+    )
+
+
+class AsyncArxivTransport:
+    """
+    Async arXiv API client with shared rate limiting and page prefetch.
+    """
+
+    query_url_format = "https://export.arxiv.org/api/query?{}"
+
+    def __init__(
+        self,
+        page_size: int = 100,
+        num_retries: int = 3,
+        timeout: float = 30.0,
+        rate_limiter: Optional[ArxivRateLimiter] = None,
+        delay_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            page_size: Number of results per API request (max 2000)
+            num_retries: Retries for failed or unexpectedly empty pages
+            timeout: Request timeout in seconds
+            rate_limiter: Limiter to use (defaults to the shared one)
+            delay_seconds: Minimum spacing after this transport's requests,
+                if longer than the limiter's
+        """
+        self.page_size = min(page_size, 2000)
+        self.num_retries = num_retries
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.delay_seconds = delay_seconds
+        # One session per event loop: callers run on per-thread loops
+        self._sessions: "weakref.WeakKeyDictionary" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get a reusable HTTP session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": "arxiv.py/2.2.0"}
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """Close the HTTP session of the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+
+    async def results(
+        self,
+        search: Search,
+        offset: int = 0
+    ) -> AsyncGenerator[Result, None]:
+        """
+        Yield results of a search, fetching pages as needed.
+
+        While one page is downloaded and parsed, the request for the next
+        page is already queued on the rate limiter; it is cancelled if the
+        current page turns out to be the last one.
+
+        Args:
+            search: SDK search specification
+            offset: Number of leading results to skip
+
+        Yields:
+            SDK ``Result`` objects
+        """
+        limit = search.max_results
+        if limit is not None and offset >= limit:
+            return
+
+        def page_size_at(start: int) -> int:
+            if limit is None:
+                return self.page_size
+            return min(self.page_size, limit - start)
+
+        def start_page(start: int, first_page: bool) -> asyncio.Task:
+            return asyncio.create_task(
+                self._fetch_page(
+                    self._format_url(search, start, page_size_at(start)),
+                    first_page=first_page
+                )
+            )
+
+        current = start_page(offset, first_page=True)
+        prefetch: Optional[asyncio.Task] = None
+        yielded = 0
+        try:
+            while current is not None:
+                size = page_size_at(offset)
+                next_offset = offset + size
+                if prefetch is None and (
+                    limit is None or next_offset < limit
+                ):
+                    prefetch = start_page(next_offset, first_page=False)
+
+                page = await current
+                current = None
+
+                for result in page.results:
+                    yield result
+                    yielded += 1
+
+                offset += len(page.results)
+                done = (
+                    not page.results
+                    or offset >= page.total_results
+                    or (limit is not None and offset >= limit)
+                )
+                if done or offset != next_offset:
+                    # Last page, or a short page shifted the next offset
+                    if prefetch is not None:
+                        prefetch.cancel()
+                        prefetch = None
+                    if not done:
+                        current = start_page(offset, first_page=False)
+                else:
+                    current, prefetch = prefetch, None
+        finally:
+            for task in (current, prefetch):
+                if task is not None and not task.done():
+                    task.cancel()
+            logger.debug(f"arXiv search yielded {yielded} results")
+
+    async def _fetch_page(self, url: str, first_page: bool) -> ArxivPage:
+        """Fetch and parse one page, retrying on failure."""
+        for try_index in range(self.num_retries + 1):
+            try:
+                return await self._try_fetch_page(url, first_page, try_index)
+            except (
+                HTTPError,
+                UnexpectedEmptyPageError,
+                aiohttp.ClientConnectionError,
+                asyncio.TimeoutError,
+            ) as err:
+                if try_index >= self.num_retries:
+                    logger.debug(f"Giving up (try {try_index}): {err}")
+                    raise
+                logger.debug(f"Got error (try {try_index}): {err}")
+
+    async def _try_fetch_page(
+        self,
+        url: str,
+        first_page: bool,
+        try_index: int
+    ) -> ArxivPage:
+        """Fetch one page, parsing entries while the body streams in."""
+        await self.rate_limiter.acquire(self.delay_seconds)
+        logger.info(
+            f"Requesting page (first: {first_page}, try: {try_index}): {url}"
+        )
+
+        session = await self._get_session()
+        parser = AtomEntryParser()
+        page = ArxivPage()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise HTTPError(url, try_index, response.status)
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                page.results.extend(parser.feed(chunk))
+        page.results.extend(parser.close())
+        page.total_results = parser.total_results or 0
+
+        if not page.results and not first_page:
+            raise UnexpectedEmptyPageError(url, try_index, None)
+        return page
+
+    def _format_url(self, search: Search, start: int, page_size: int) -> str:
+        """Build the API URL for one page of a search."""
+        url_args = search._url_args()
+        url_args.update({"start": start, "max_results": page_size})
+        return self.query_url_format.format(urlencode(url_args))
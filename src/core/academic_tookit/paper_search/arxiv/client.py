@@ -6,8 +6,9 @@
 """
 ArXiv client implementation using hybrid approach.
 
-This client combines the reliability of the arxiv SDK with async support
-and advanced features from the demo implementations.
+This client combines the arxiv SDK's query model with an async-native
+transport, a persistent search cache and advanced features from the demo
+implementations.
 """
 
 import asyncio
@@ -18,7 +19,9 @@ from typing import List, Optional, Dict, Any
 
 from ..base import BasePaperSearchClient
 from ...models import Paper, SearchParams, PaperSource
-from .arxiv_sdk import Client, Search, Result, SortCriterion, SortOrder
+from .arxiv_sdk import Search, Result, SortCriterion, SortOrder
+from .async_transport import AsyncArxivTransport
+from .search_cache import ArxivSearchCache, get_default_search_cache
 from .query_parser import ArxivQueryParser
 from .features import ArxivFeatureExtractor
 
@@ -27,37 +30,53 @@ logger = logging.getLogger(__name__)
 
 class ArxivClient(BasePaperSearchClient):
     """
-    ArXiv client using SDK with async wrapper and advanced features.
+    ArXiv client with async transport, result cache and advanced features.
 
     This implementation:
-    - Uses the proven arxiv SDK for core API interactions
-    - Adds async support via ThreadPoolExecutor
+    - Uses the arxiv SDK's search and result models
+    - Fetches pages with an async transport that shares one rate-limit
+      token across all callers and prefetches the next page
+    - Serves repeated searches from a persistent query-result cache
     - Incorporates natural language query parsing
     - Provides advanced features like trend analysis
     """
 
-    def __init__(self, page_size: int = 100, delay_seconds: float = 3.0):
+    def __init__(
+        self,
+        page_size: int = 100,
+        delay_seconds: float = 3.0,
+        use_cache: bool = True,
+        cache: Optional[ArxivSearchCache] = None
+    ):
         """
         Initialize the ArXiv client.
 
         Args:
             page_size: Number of results per API request (max 2000)
             delay_seconds: Delay between API requests (min 3.0)
+            use_cache: Whether to serve repeated searches from cache
+            cache: Cache to use (defaults to the process-wide cache)
         """
         super().__init__()
 
-        # Core SDK client with conservative defaults
-        self._sdk_client = Client(
-            page_size=min(page_size, 2000),  # API limit
-            delay_seconds=max(delay_seconds, 3.0),  # API requirement
-            num_retries=3
+        # Async transport with conservative defaults; the rate limiter is
+        # shared process-wide, so delay_seconds only spaces this client's
+        # own requests further apart
+        self._transport = AsyncArxivTransport(
+            page_size=page_size,
+            num_retries=3,
+            delay_seconds=delay_seconds
         )
 
+        self._cache: Optional[ArxivSearchCache] = None
+        if use_cache:
+            self._cache = cache or get_default_search_cache()
+
         # Enhancement modules
         self._query_parser = ArxivQueryParser()
         self._feature_extractor = ArxivFeatureExtractor()
 
-        # Async support - single thread to maintain rate limiting
+        # Thread pool for CPU-bound feature extraction
         self._executor = ThreadPoolExecutor(max_workers=1)
 
         logger.info(
@@ -78,6 +97,16 @@ class ArxivClient(BasePaperSearchClient):
         Raises:
             Exception: If search fails
         """
+        cache_key = params.get_cache_key()
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"ArXiv search for '{params.query}' served "
+                    f"{len(cached)} papers from cache"
+                )
+                return cached
+
         try:
             # Build ArXiv query
             if params.use_natural_language:
@@ -107,14 +136,9 @@ class ArxivClient(BasePaperSearchClient):
                 )
             )
 
-            # Execute search asynchronously
-            results = await self._run_async(
-                lambda: list(self._sdk_client.results(search))
-            )
-
-            # Convert to Paper models
+            # Convert to Paper models as results stream in
             papers = []
-            for result in results:
+            async for result in self._transport.results(search):
                 paper = self._convert_to_paper(result)
 
                 # Apply filters
@@ -128,6 +152,9 @@ class ArxivClient(BasePaperSearchClient):
             # Update statistics
             self._increment_stats(papers_count=len(papers))
 
+            if self._cache is not None:
+                self._cache.set(cache_key, papers)
+
             logger.info(
                 f"ArXiv search for '{params.query}' returned "
                 f"{len(papers)} papers"
@@ -152,10 +179,8 @@ class ArxivClient(BasePaperSearchClient):
         """
         try:
             # Use SDK id_list search
-            search = Search(id_list=[paper_id])
-            results = await self._run_async(
-                lambda: list(self._sdk_client.results(search))
-            )
+            search = Search(id_list=[paper_id], max_results=1)
+            results = await self._collect(search)
 
             if results:
                 paper = self._convert_to_paper(results[0])
@@ -189,9 +214,7 @@ class ArxivClient(BasePaperSearchClient):
                 max_results=10
             )
 
-            results = await self._run_async(
-                lambda: list(self._sdk_client.results(search))
-            )
+            results = await self._collect(search)
 
             # Find exact DOI match
             for result in results:
@@ -217,9 +240,7 @@ class ArxivClient(BasePaperSearchClient):
         try:
             # Simple test query
             search = Search(query="test", max_results=1)
-            await self._run_async(
-                lambda: list(self._sdk_client.results(search))
-            )
+            await self._collect(search)
 
             return True
 
@@ -386,6 +407,22 @@ class ArxivClient(BasePaperSearchClient):
         # Conservative default
         return False
 
+    async def _collect(self, search: Search) -> List[Result]:
+        """
+        Collect all results of a search from the async transport.
+
+        Args:
+            search: SDK search specification
+
+        Returns:
+            List of SDK results
+        """
+        return [result async for result in self._transport.results(search)]
+
+    async def close(self):
+        """Close the underlying HTTP transport."""
+        await self._transport.close()
+
     async def _run_async(self, func):
         """
         Run synchronous function in thread pool.
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/academic_tookit/paper_search/arxiv/search_cache.py
+# code style: PEP 8
+
+"""
+Persistent query-result cache for arXiv searches.
+
+Results are keyed by ``SearchParams.get_cache_key()`` and kept in an
+in-memory LRU with a TTL, backed by JSON files on disk so that repeated
+queries are served instantly across sessions and process restarts.
+"""
+
+import json
+import logging
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ...models import Paper
+
+logger = logging.getLogger(__name__)
+
+
+class ArxivSearchCache:
+    """
+    TTL + LRU cache of search results backed by a directory of JSON files.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = 6 * 3600,
+        max_entries: int = 512,
+        persist: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted entries
+                (defaults to a temp-dir subfolder)
+            ttl_seconds: Time-to-live of an entry
+            max_entries: Maximum entries kept in memory
+            persist: Whether to read and write entries on disk
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.persist = persist
+        self.cache_dir = Path(
+            cache_dir or Path(tempfile.gettempdir()) / "arxiv_search_cache"
+        )
+        if self.persist:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, Tuple[float, List[Paper]]]" = (
+            OrderedDict()
+        )
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[List[Paper]]:
+        """
+        Get cached papers for a key.
+
+        Returns:
+            Copies of the cached papers, or None on miss/expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.persist:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None or time.time() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                self.invalidate(key)
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return [paper.model_copy(deep=True) for paper in entry[1]]
+
+    def set(self, key: str, papers: List[Paper]):
+        """Store papers for a key."""
+        entry = (time.time(), [paper.model_copy(deep=True) for paper in papers])
+        self._remember(key, entry)
+        if self.persist:
+            self._save(key, entry)
+
+    def invalidate(self, key: str):
+        """Remove a key from memory and disk."""
+        self._entries.pop(key, None)
+        if self.persist:
+            self._path(key).unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        if self.persist:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit/miss statistics."""
+        return {**self._stats, "entries": len(self._entries)}
+
+    def _remember(self, key: str, entry: Tuple[float, List[Paper]]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Tuple[float, List[Paper]]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            papers = [Paper(**item) for item in data["papers"]]
+            return data["created_at"], papers
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _save(self, key: str, entry: Tuple[float, List[Paper]]):
+        created_at, papers = entry
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({
+                    "created_at": created_at,
+                    "papers": [
+                        paper.model_dump(mode="json") for paper in papers
+                    ]
+                }),
+                encoding="utf-8"
+            )
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to persist cache entry {path}: {e}")
+
+
+# Process-wide cache shared by all ArxivClient instances
+_default_cache: Optional[ArxivSearchCache] = None
+
+
+def get_default_search_cache() -> ArxivSearchCache:
+    """Get the process-wide arXiv search cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ArxivSearchCache()
+    return _default_cache
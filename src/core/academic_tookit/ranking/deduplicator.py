@@ -8,20 +8,31 @@ Paper deduplication across multiple sources.
 
 This module handles:
 - DOI-based deduplication
-- Title similarity matching
+- Title similarity matching with normalized-title hashing and
+  MinHash/LSH blocking, so only candidate pairs are compared
 - Author and year matching
 - Source priority ranking
 """
 
+import math
 import re
+import zlib
 import logging
-from typing import List, Dict, Set, Tuple
+from collections import defaultdict
+from typing import List, Dict, Optional, Set, Tuple
 from difflib import SequenceMatcher
 
 from ..models import Paper, PaperSource
 
 logger = logging.getLogger(__name__)
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_ARTICLES_RE = re.compile(r'\b(a|an|the)\b')
+
+# 64-bit multiplicative mixing for shingle hashes
+_MIX = 0x9E3779B97F4A7C15
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
 
 class PaperDeduplicator:
     """
@@ -43,14 +54,84 @@ class PaperDeduplicator:
         PaperSource.GOOGLE_SCHOLAR: 0     # Often incomplete metadata
     }
 
-    def __init__(self, title_similarity_threshold: float = 0.85):
+    # Character shingle length used for MinHash signatures
+    SHINGLE_SIZE = 3
+
+    # Chance that a pair at the threshold becomes an LSH candidate
+    LSH_RECALL = 0.99
+
+    # Largest MinHash signature (bands * rows) worth computing
+    MAX_SIGNATURE = 128
+
+    def __init__(
+        self,
+        title_similarity_threshold: float = 0.85,
+        lsh_bands: Optional[int] = None,
+        lsh_rows: Optional[int] = None,
+        seed: int = 0
+    ):
         """
         Initialize the deduplicator.
 
         Args:
             title_similarity_threshold: Minimum similarity for title matching
+            lsh_bands: Number of LSH bands over the MinHash signature
+                (derived from the threshold if None)
+            lsh_rows: MinHash values per band; more rows make candidate
+                selection stricter, more bands make it more permissive
+                (derived from the threshold if None)
+            seed: Seed mixed into the shingle hashes
         """
         self.title_similarity_threshold = title_similarity_threshold
+        if lsh_bands is None or lsh_rows is None:
+            derived = self._lsh_parameters(title_similarity_threshold)
+            bands, rows = derived if derived else (None, None)
+            lsh_bands = lsh_bands if lsh_bands is not None else bands
+            lsh_rows = lsh_rows if lsh_rows is not None else rows
+        self.lsh_bands = lsh_bands
+        self.lsh_rows = lsh_rows
+        self._hash_seed = seed & 0xFFFFFFFF
+
+    @classmethod
+    def _lsh_parameters(cls, threshold: float) -> Optional[Tuple[int, int]]:
+        """
+        Derive LSH bands and rows from the title similarity threshold.
+
+        A ``SequenceMatcher`` ratio of ``t`` leaves at most a fraction
+        ``1 - t`` of characters unmatched, and each of them breaks at most
+        ``SHINGLE_SIZE`` shingles, so at least ``s = 1 - k * (1 - t)`` of
+        the shingles are shared and the shingle Jaccard similarity is at
+        least ``s / (2 - s)``. Pairs at that Jaccard similarity ``j``
+        become candidates with probability ``1 - (1 - j ** rows) **
+        bands``; this picks the most selective split reaching
+        ``LSH_RECALL`` within ``MAX_SIGNATURE`` values.
+
+        Args:
+            threshold: Minimum title similarity
+
+        Returns:
+            ``(bands, rows)``, or None if no signature is small enough and
+            every pair has to be compared
+        """
+        shared = 1 - cls.SHINGLE_SIZE * (1 - threshold)
+        if shared <= 0:
+            return None
+        jaccard = shared / (2 - shared)
+        if jaccard >= 1.0:
+            return 1, 1
+
+        best = None
+        for rows in range(1, cls.MAX_SIGNATURE + 1):
+            match = jaccard ** rows
+            if match <= 0 or match >= 1:
+                break
+            bands = math.ceil(
+                math.log(1 - cls.LSH_RECALL) / math.log(1 - match)
+            )
+            if bands * rows > cls.MAX_SIGNATURE:
+                break
+            best = bands, rows
+        return best
 
     def deduplicate(self, papers: List[Paper]) -> List[Paper]:
         """
@@ -160,14 +241,55 @@ class PaperDeduplicator:
         """
         Group papers with similar titles from the same year.
 
+        Titles are normalized once per paper. Candidate pairs come from
+        two blocking stages keyed by publication year: identical
+        normalized titles, and MinHash/LSH bands over character shingles.
+        Only candidates are verified with ``SequenceMatcher``, so the cost
+        grows with the number of near-duplicates rather than quadratically.
+        Without LSH parameters (thresholds too low to block on) every
+        pair from the same year is a candidate.
+
         Args:
             papers: Papers to group by title
 
         Returns:
             List of paper groups
         """
+        norms = [self._normalize_title(p.title) for p in papers]
+        years = [
+            p.published_date.year if p.published_date else None
+            for p in papers
+        ]
+
+        # Blocking: (year, key) -> indices in input order
+        buckets: Dict[Tuple, List[int]] = defaultdict(list)
+        undated: List[int] = []
+        for i, norm in enumerate(norms):
+            if years[i] is None:
+                undated.append(i)
+                continue
+            buckets[(years[i], "title", norm)].append(i)
+            if self.lsh_bands is None:
+                buckets[(years[i],)].append(i)
+                continue
+            for band in self._lsh_bands(norm):
+                buckets[(years[i],) + band].append(i)
+
+        candidates: Dict[int, Set[int]] = defaultdict(set)
+        for members in buckets.values():
+            if len(members) > 1:
+                for i in members:
+                    candidates[i].update(members)
+        # Papers without a year may match any paper, as before
+        for i in undated:
+            for j in range(len(papers)):
+                if j != i:
+                    candidates[i].add(j)
+                    candidates[j].add(i)
+
         groups = []
         used = set()
+        matcher = SequenceMatcher(None)
 
         for i, paper1 in enumerate(papers):
             if i in used:
@@ -175,32 +297,79 @@ class PaperDeduplicator:
 
             group = [paper1]
             used.add(i)
+            seq1_ready = False
 
-            for j, paper2 in enumerate(papers[i+1:], i+1):
-                if j in used:
-                    continue
-
-                # Check year match
-                if (paper1.published_date and paper2.published_date and
-                        paper1.published_date.year !=
-                        paper2.published_date.year):
+            for j in sorted(candidates.get(i, ())):
+                if j <= i or j in used:
                     continue
 
-                # Check title similarity
-                similarity = self._calculate_title_similarity(
-                    paper1.title,
-                    paper2.title
-                )
-
-                if similarity >= self.title_similarity_threshold:
-                    group.append(paper2)
-                    used.add(j)
+                if norms[i] != norms[j]:
+                    # Same argument order as _calculate_title_similarity,
+                    # since SequenceMatcher ratios are not symmetric
+                    if not seq1_ready:
+                        matcher.set_seq1(norms[i])
+                        seq1_ready = True
+                    # Cheap upper bounds before the full ratio
+                    matcher.set_seq2(norms[j])
+                    threshold = self.title_similarity_threshold
+                    if (matcher.real_quick_ratio() < threshold
+                            or matcher.quick_ratio() < threshold
+                            or matcher.ratio() < threshold):
+                        continue
+
+                group.append(papers[j])
+                used.add(j)
 
             if len(group) > 1:
                 groups.append(group)
 
         return groups
 
+    def _lsh_bands(self, norm_title: str) -> List[Tuple]:
+        """
+        Compute LSH band keys from a MinHash signature of title shingles.
+
+        Uses one-permutation hashing: each character shingle is hashed
+        once and binned, keeping the minimum per bin, so the signature
+        costs O(len(title)) instead of one pass per permutation. Empty
+        bins borrow the value of the next non-empty bin (densification).
+
+        Args:
+            norm_title: Normalized title
+
+        Returns:
+            One hashable key per band
+        """
+        if not norm_title:
+            return []
+
+        k = self.SHINGLE_SIZE
+        size = self.lsh_bands * self.lsh_rows
+        signature: List = [None] * size
+        encoded = norm_title.encode("utf-8")
+        for i in range(max(len(encoded) - k + 1, 1)):
+            h = (zlib.crc32(encoded[i:i + k]) ^ self._hash_seed) * _MIX
+            h = (h & _MASK_64) >> 16
+            slot, value = h % size, h // size
+            if signature[slot] is None or value < signature[slot]:
+                signature[slot] = value
+
+        for slot in range(size):
+            if signature[slot] is None:
+                offset = 1
+                while signature[(slot + offset) % size] is None:
+                    offset += 1
+                # Tag by offset so borrowed values differ from real ones
+                signature[slot] = (
+                    signature[(slot + offset) % size], offset
+                )
+
+        rows = self.lsh_rows
+        return [
+            ("band", band, tuple(signature[band * rows:(band + 1) * rows]))
+            for band in range(self.lsh_bands)
+        ]
+
     def _calculate_title_similarity(self, title1: str, title2: str) -> float:
         """
         Calculate similarity between two titles.
@@ -233,15 +402,13 @@ class PaperDeduplicator:
         title = title.lower()
 
         # Remove punctuation
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # Remove extra whitespace
-        title = ' '.join(title.split())
+        title = _PUNCTUATION_RE.sub(' ', title)
 
         # Remove common variations
-        title = re.sub(r'\b(a|an|the)\b', '', title)
+        title = _ARTICLES_RE.sub('', title)
 
-        return title.strip()
+        # Remove extra whitespace
+        return ' '.join(title.split())
 
     def _select_best_paper(self, group: List[Paper]) -> Paper:
         """
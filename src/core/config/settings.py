@@ -23,6 +23,11 @@ class Settings(BaseSettings):
     VERSION: str = ""
     DEEPSEARCH_AGENT_MODE: str = "codact"
 
+    # Background job configuration (v1 jobs API)
+    JOB_MAX_WORKERS: int = 4
+    JOB_MAX_QUEUE_SIZE: int = 1000
+    JOB_RESULT_TTL: float = 3600.0
+
     # Debug mode
     DEBUG: bool = False
 
@@ -37,6 +42,28 @@ class Settings(BaseSettings):
         default=True,
         description="Global toggle for CLI streaming display"
     )
+    CLI_INCREMENTAL_MARKDOWN: bool = Field(
+        default=True,
+        description="Render CLI streams as markdown, redrawing only the "
+                    "block still being streamed"
+    )
+    CLI_STREAM_MAX_FPS: float = Field(
+        default=12.0,
+        description="Maximum CLI streaming redraws per second"
+    )
+
+    # Semantic answer cache (non-streaming runs)
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_SIMILARITY: float = Field(
+        default=0.95,
+        description="Query similarity at which a cached answer is returned"
+    )
+    ANSWER_CACHE_SEED_SIMILARITY: float = Field(
+        default=0.85,
+        description="Query similarity at which a cached answer seeds a run"
+    )
+    ANSWER_CACHE_TTL: float = 24 * 3600
+    ANSWER_CACHE_MAX_ENTRIES: int = 1000
 
     # React agent configuration
     REACT_MAX_STEPS: int = 25
@@ -71,6 +98,10 @@ class Settings(BaseSettings):
     MANAGER_DEFAULT_TEAM: str = "research"
     MANAGER_TEAM: Optional[str] = None  # Runtime team selection
     MANAGER_CUSTOM_AGENTS: Optional[List[str]] = None  # Custom agent list
+    # Parallel delegation of independent sub-tasks to managed agents
+    MANAGER_PARALLEL_DELEGATION: bool = True
+    MANAGER_MAX_PARALLEL_AGENTS: int = 3
+    MANAGER_DELEGATION_TOKEN_BUDGET: int = 0  # 0 = unlimited
 
     # Managed agents configuration
     MANAGED_AGENTS_ENABLED: bool = True
@@ -79,7 +110,15 @@ class Settings(BaseSettings):
         default_factory=lambda: ["react", "codact"]
     )
 
+    # Scraper configuration
+    SCRAPER_PROVIDER_PRIORITY: List[str] = Field(
+        default_factory=lambda: ["local", "jina", "firecrawl"]
+    )
+    SCRAPER_LOCAL_CONFIG: Dict[str, Any] = Field(default_factory=dict)
+
     # Tools configuration
+    # Built-in tools to load; empty loads all of them
+    TOOLS_ENABLED: List[str] = Field(default_factory=list)
     TOOLS_HUB_COLLECTIONS: List[str] = Field(default_factory=list)
     TOOLS_TRUST_REMOTE_CODE: bool = False
     TOOLS_MCP_SERVERS: List[Dict[str, Any]] = Field(default_factory=list)
@@ -149,6 +188,18 @@ def load_toml_config(settings_instance: Settings) -> Settings:
                     settings_instance.DEEPSEARCH_AGENT_MODE = (
                         service_config['deepsearch_agent_mode']
                     )
+                if 'job_max_workers' in service_config:
+                    settings_instance.JOB_MAX_WORKERS = (
+                        service_config['job_max_workers']
+                    )
+                if 'job_max_queue_size' in service_config:
+                    settings_instance.JOB_MAX_QUEUE_SIZE = (
+                        service_config['job_max_queue_size']
+                    )
+                if 'job_result_ttl' in service_config:
+                    settings_instance.JOB_RESULT_TTL = (
+                        service_config['job_result_ttl']
+                    )
 
             # Update debug mode
             if 'debug' in toml_config:
@@ -170,9 +221,25 @@ def load_toml_config(settings_instance: Settings) -> Settings:
                         models_config['reranker_type']
                     )
 
+            # Update scraper configuration
+            if 'scrapers' in toml_config:
+                scrapers_config = toml_config['scrapers']
+                if 'provider_priority' in scrapers_config:
+                    settings_instance.SCRAPER_PROVIDER_PRIORITY = (
+                        scrapers_config['provider_priority']
+                    )
+                if 'local' in scrapers_config:
+                    settings_instance.SCRAPER_LOCAL_CONFIG = (
+                        scrapers_config['local']
+                    )
+
             # Update tools configuration
             if 'tools' in toml_config:
                 tools_config = toml_config['tools']
+                if 'enabled' in tools_config:
+                    settings_instance.TOOLS_ENABLED = (
+                        tools_config['enabled']
+                    )
                 if 'hub_collections' in tools_config:
                     settings_instance.TOOLS_HUB_COLLECTIONS = (
                         tools_config['hub_collections']
@@ -208,6 +275,34 @@ def load_toml_config(settings_instance: Settings) -> Settings:
                     settings_instance.CLI_STREAMING_ENABLED = (
                         common_config['cli_streaming_enabled']
                     )
+                if 'cli_incremental_markdown' in common_config:
+                    settings_instance.CLI_INCREMENTAL_MARKDOWN = (
+                        common_config['cli_incremental_markdown']
+                    )
+                if 'cli_stream_max_fps' in common_config:
+                    settings_instance.CLI_STREAM_MAX_FPS = (
+                        common_config['cli_stream_max_fps']
+                    )
+                if 'answer_cache_enabled' in common_config:
+                    settings_instance.ANSWER_CACHE_ENABLED = (
+                        common_config['answer_cache_enabled']
+                    )
+                if 'answer_cache_similarity' in common_config:
+                    settings_instance.ANSWER_CACHE_SIMILARITY = (
+                        common_config['answer_cache_similarity']
+                    )
+                if 'answer_cache_seed_similarity' in common_config:
+                    settings_instance.ANSWER_CACHE_SEED_SIMILARITY = (
+                        common_config['answer_cache_seed_similarity']
+                    )
+                if 'answer_cache_ttl' in common_config:
+                    settings_instance.ANSWER_CACHE_TTL = (
+                        common_config['answer_cache_ttl']
+                    )
+                if 'answer_cache_max_entries' in common_config:
+                    settings_instance.ANSWER_CACHE_MAX_ENTRIES = (
+                        common_config['answer_cache_max_entries']
+                    )
 
             # Update React agent configuration
             if 'agents' in toml_config and 'react' in toml_config['agents']:
@@ -288,6 +383,18 @@ def load_toml_config(settings_instance: Settings) -> Settings:
                     settings_instance.MANAGER_DEFAULT_TEAM = (
                         manager_config['default_team']
                     )
+                if 'parallel_delegation' in manager_config:
+                    settings_instance.MANAGER_PARALLEL_DELEGATION = (
+                        manager_config['parallel_delegation']
+                    )
+                if 'max_parallel_agents' in manager_config:
+                    settings_instance.MANAGER_MAX_PARALLEL_AGENTS = (
+                        manager_config['max_parallel_agents']
+                    )
+                if 'delegation_token_budget' in manager_config:
+                    settings_instance.MANAGER_DELEGATION_TOKEN_BUDGET = (
+                        manager_config['delegation_token_budget']
+                    )
                 # Legacy support for old configuration names
                 if 'enabled' in manager_config:
                     settings_instance.MANAGED_AGENTS_ENABLED = (
@@ -4,7 +4,17 @@
 # code style: PEP 8
 
 from .deepwiki import DeepWikiClient
+from .wiki_cache import (
+    RepoWikiCache,
+    WikiIndex,
+    WikiSection,
+    get_shared_wiki_cache,
+)
 
 __all__ = [
     "DeepWikiClient",
+    "RepoWikiCache",
+    "WikiIndex",
+    "WikiSection",
+    "get_shared_wiki_cache",
 ]
@@ -6,12 +6,17 @@
 """
 [`GitHubRepoQATool(Tool)`] using MCP Client Call DeepWiki Remote MCP Server.
 Provides access to DeepWiki's repository documentation and Q&A capabilities.
+Results are cached per repository (see ``wiki_cache``), and cached wiki
+contents are indexed so single sections can be read without refetching.
 """
 
 import asyncio
 import logging
 from typing import Optional, Dict, Any, List
-from smolagents import MCPClient, Tool
+from smolagents import Tool
+
+from ..mcp_toolkit import MCPConnection, get_mcp_manager
+from .wiki_cache import RepoWikiCache, WikiIndex, get_shared_wiki_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +35,8 @@ class DeepWikiClient:
         transport: str = "streamable-http",
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        cache: Optional[RepoWikiCache] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize DeepWikiClient to connect DeepWiki Remote MCP Server.
@@ -39,18 +46,23 @@ class DeepWikiClient:
             transport: Transport protocol (Default: "streamable-http", or "sse")
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            cache: Wiki cache to use (default: the process-wide cache)
+            use_cache: Whether to cache wiki data and answers
         """
         self.server_url = server_url
         self.transport = transport
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._mcp_client: Optional[MCPClient] = None
+        self._connection: Optional[MCPConnection] = None
         self._tools: Optional[List[Tool]] = None
         self._tools_by_name: Dict[str, Tool] = {}
+        self.cache: Optional[RepoWikiCache] = None
+        if use_cache:
+            self.cache = cache or get_shared_wiki_cache()
 
     def _ensure_connection(self):
-        """Ensure MCP client is connected and tools are loaded."""
-        if self._mcp_client is None:
+        """Ensure the shared MCP connection is open and tools are loaded."""
+        if self._connection is None:
             # Configure server parameters based on transport
             if self.transport == "streamable-http":
                 server_params = {
@@ -61,22 +73,20 @@ class DeepWikiClient:
                 # or "sse"
                 server_params = {"url": self.server_url, "transport": "sse"}
 
-            try:
-                self._mcp_client = MCPClient(server_parameters=server_params)
-                self._tools = self._mcp_client.get_tools()
-
-                # Build MCP tools lookup by name
-                for tool in self._tools:
-                    self._tools_by_name[tool.name] = tool
+            self._connection = get_mcp_manager().get_connection(
+                server_params, name="DeepWiki"
+            )
 
-                logger.info(
-                    f"Connected to DeepWiki MCP server. "
-                    f"Available tools: {list(self._tools_by_name.keys())}"
-                )
+        if not self._tools_by_name:
+            try:
+                self._tools = self._connection.get_tools()
             except Exception as e:
                 logger.error(f"Failed to connect to DeepWiki MCP server: {e}")
                 raise
 
+            # Build MCP tools lookup by name
+            self._tools_by_name = {tool.name: tool for tool in self._tools}
+
     def _get_tool(self, tool_name: str) -> Tool:
         """Get a specific MCP tool by name."""
         self._ensure_connection()
@@ -102,11 +112,18 @@ class DeepWikiClient:
         Returns:
             Dictionary containing documentation structure
         """
+        if self.cache is not None:
+            cached = self.cache.get_structure(repo_name)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("read_wiki_structure")
 
         for attempt in range(self.max_retries):
             try:
                 result = await tool.aforward(repoName=repo_name)
+                if self.cache is not None:
+                    self.cache.put_structure(repo_name, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -130,11 +147,18 @@ class DeepWikiClient:
         Returns:
             Dictionary containing documentation contents
         """
+        if self.cache is not None:
+            cached = self.cache.get_contents(repo_name)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("read_wiki_contents")
 
         for attempt in range(self.max_retries):
             try:
                 result = await tool.aforward(repoName=repo_name)
+                if self.cache is not None:
+                    self.cache.put_contents(repo_name, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -161,6 +185,11 @@ class DeepWikiClient:
         Returns:
             Dictionary containing the AI-powered answer
         """
+        if self.cache is not None:
+            cached = self.cache.get_answer(repo_name, question)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("ask_question")
 
         for attempt in range(self.max_retries):
@@ -168,6 +197,8 @@ class DeepWikiClient:
                 result = await tool.aforward(
                     repoName=repo_name, question=question
                 )
+                if self.cache is not None:
+                    self.cache.put_answer(repo_name, question, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -183,11 +214,18 @@ class DeepWikiClient:
 
     def read_wiki_structure(self, repo_name: str) -> Dict[str, Any]:
         """Synchronous wrapper for read_wiki_structure_async."""
+        if self.cache is not None:
+            cached = self.cache.get_structure(repo_name)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("read_wiki_structure")
 
         for attempt in range(self.max_retries):
             try:
                 result = tool.forward(repoName=repo_name)
+                if self.cache is not None:
+                    self.cache.put_structure(repo_name, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -205,11 +243,18 @@ class DeepWikiClient:
 
     def read_wiki_contents(self, repo_name: str) -> Dict[str, Any]:
         """Synchronous wrapper for read_wiki_contents_async."""
+        if self.cache is not None:
+            cached = self.cache.get_contents(repo_name)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("read_wiki_contents")
 
         for attempt in range(self.max_retries):
             try:
                 result = tool.forward(repoName=repo_name)
+                if self.cache is not None:
+                    self.cache.put_contents(repo_name, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -227,11 +272,18 @@ class DeepWikiClient:
 
     def ask_question(self, repo_name: str, question: str) -> Dict[str, Any]:
         """Synchronous wrapper for ask_question_async."""
+        if self.cache is not None:
+            cached = self.cache.get_answer(repo_name, question)
+            if cached is not None:
+                return {"success": True, "data": cached, "cached": True}
+
         tool = self._get_tool("ask_question")
 
         for attempt in range(self.max_retries):
             try:
                 result = tool.forward(repoName=repo_name, question=question)
+                if self.cache is not None:
+                    self.cache.put_answer(repo_name, question, result)
                 return {"success": True, "data": result}
             except Exception as e:
                 logger.warning(
@@ -247,18 +299,137 @@ class DeepWikiClient:
                         "error": f"Failed after {self.max_retries} attempts: {e}",
                     }
 
+    def _select_sections(
+        self,
+        repo_name: str,
+        result: Dict[str, Any],
+        topic: Optional[str],
+        max_sections: int
+    ) -> Dict[str, Any]:
+        """Narrow a wiki contents result to the sections about a topic."""
+        if not result.get("success") or not topic or self.cache is None:
+            return result
+
+        index = self.cache.get_index(repo_name)
+        if index is None:
+            return result
+
+        hits = index.search(topic, limit=max_sections)
+        if not hits:
+            listing = "\n".join(f"- {title}" for title in index.titles())
+            return {
+                "success": True,
+                "data": (
+                    f"No documentation sections of {repo_name} match "
+                    f"'{topic}'. Available sections:\n{listing}"
+                ),
+                "sections": [],
+            }
+
+        indices = [i for i, _ in hits]
+        return {
+            "success": True,
+            "data": index.render(indices),
+            "sections": [index.sections[i].path for i in sorted(indices)],
+            "cached": result.get("cached", False),
+        }
+
+    def read_wiki_sections(
+        self,
+        repo_name: str,
+        topic: Optional[str] = None,
+        max_sections: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Read the documentation sections relevant to a topic.
+
+        Wiki contents are fetched once per repository and served from the
+        cache's section index afterwards.
+
+        Args:
+            repo_name: GitHub repository in format "owner/repo"
+            topic: Topic or question; without it the full contents are
+                returned
+            max_sections: Maximum sections returned
+
+        Returns:
+            Dictionary containing the matching sections
+        """
+        result = self.read_wiki_contents(repo_name)
+        return self._select_sections(repo_name, result, topic, max_sections)
+
+    async def read_wiki_sections_async(
+        self,
+        repo_name: str,
+        topic: Optional[str] = None,
+        max_sections: int = 5
+    ) -> Dict[str, Any]:
+        """Async version of read_wiki_sections."""
+        result = await self.read_wiki_contents_async(repo_name)
+        return self._select_sections(repo_name, result, topic, max_sections)
+
+    def answer_from_cache(
+        self,
+        repo_name: str,
+        question: str,
+        min_coverage: float = 0.6,
+        max_sections: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer a question from cached data without calling DeepWiki.
+
+        Uses a cached answer to the same question, or cached wiki sections
+        that cover enough of the question's keywords.
+
+        Args:
+            repo_name: GitHub repository in format "owner/repo"
+            question: Question about the repository
+            min_coverage: Fraction of question keywords the sections must
+                contain
+            max_sections: Maximum sections used as context
+
+        Returns:
+            Result dictionary, or None if the cache cannot answer
+        """
+        if self.cache is None:
+            return None
+
+        answer = self.cache.get_answer(repo_name, question)
+        if answer is not None:
+            return {"success": True, "data": answer, "cached": True}
+
+        index: Optional[WikiIndex] = self.cache.get_index(repo_name)
+        if index is None:
+            return None
+
+        indices = [i for i, _ in index.search(question, limit=max_sections)]
+        if not indices or index.coverage(question, indices) < min_coverage:
+            return None
+
+        logger.info(
+            f"Answering question about {repo_name} from cached wiki sections"
+        )
+        return {
+            "success": True,
+            "data": (
+                f"Relevant documentation sections of {repo_name} "
+                f"(from cached DeepWiki contents):\n\n"
+                f"{index.render(indices)}"
+            ),
+            "sections": [index.sections[i].path for i in sorted(indices)],
+            "cached": True,
+        }
+
     def disconnect(self):
-        """Disconnect from the DeepWiki Remote MCP server."""
-        if self._mcp_client:
-            try:
-                self._mcp_client.disconnect()
-                logger.info("Disconnected from DeepWiki MCP server")
-            except Exception as e:
-                logger.error(f"Error disconnecting from MCP server: {e}")
-            finally:
-                self._mcp_client = None
-                self._tools = None
-                self._tools_by_name = {}
+        """
+        Release the DeepWiki MCP server.
+
+        The connection itself is shared through the MCP connection manager
+        and stays open for other clients until the process exits.
+        """
+        self._connection = None
+        self._tools = None
+        self._tools_by_name = {}
 
     def __del__(self):
         """Cleanup on deletion."""
@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/github_toolkit/wiki_cache.py
+# code style: PEP 8
+
+"""
+Per-repository cache of DeepWiki documentation with a section index.
+
+Wiki structure, wiki contents and answers are cached per repository with
+a TTL, so popular repositories are fetched from DeepWiki once and then
+served locally. Cached contents are indexed by section (title to byte
+range in the UTF-8 text, plus an inverted keyword index) so callers can
+read only the sections relevant to a topic or question.
+"""
+
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+_HEADING = re.compile(rb"^(#{1,3})[ \t]+(.+?)[ \t#]*$")
+_FENCE = re.compile(rb"^\s*(```|~~~)")
+_PAGE_PREFIX = re.compile(r"^page:\s*", re.IGNORECASE)
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9_]*")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it of on "
+    "or that the this to was what when where which who why with you your "
+    "use used using about into does did there their its".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case keywords of ``text`` without stopwords."""
+    return [
+        token for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def normalize_repo(repo: str) -> str:
+    """Cache key for an ``owner/repo`` name."""
+    return repo.strip().strip("/").lower()
+
+
+@dataclass(frozen=True)
+class WikiSection:
+    """A section of wiki contents located by byte range."""
+    title: str
+    path: str
+    level: int
+    start: int
+    end: int
+
+
+class WikiIndex:
+    """
+    Section index over one repository's wiki contents.
+
+    Sections start at level 1-3 markdown headings outside code fences and
+    are stored as byte ranges into the UTF-8 encoded contents.
+    """
+
+    def __init__(self, contents: str):
+        """
+        Build the index.
+
+        Args:
+            contents: Wiki contents as returned by DeepWiki
+        """
+        self._data = contents.encode("utf-8")
+        self.sections: List[WikiSection] = self._split()
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._title_terms: List[frozenset] = []
+        for i, section in enumerate(self.sections):
+            counts = Counter(tokenize(self.text(i)))
+            for term, count in counts.items():
+                self._postings.setdefault(term, {})[i] = count
+            self._title_terms.append(frozenset(tokenize(section.path)))
+
+    def _split(self) -> List[WikiSection]:
+        """Locate sections by heading."""
+        headings: List[Tuple[int, int, str]] = []
+        in_fence = False
+        offset = 0
+        for line in self._data.split(b"\n"):
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            elif not in_fence:
+                match = _HEADING.match(line.rstrip(b"\r"))
+                if match:
+                    title = match.group(2).decode("utf-8", "replace")
+                    headings.append(
+                        (offset, len(match.group(1)), title.strip())
+                    )
+            offset += len(line) + 1
+
+        if not headings or headings[0][0] > 0:
+            headings.insert(0, (0, 1, "Overview"))
+
+        sections = []
+        parents: Dict[int, str] = {}
+        for i, (start, level, title) in enumerate(headings):
+            end = (
+                headings[i + 1][0] if i + 1 < len(headings)
+                else len(self._data)
+            )
+            title = _PAGE_PREFIX.sub("", title)
+            parents[level] = title
+            for deeper in [k for k in parents if k > level]:
+                del parents[deeper]
+            path = " > ".join(parents[k] for k in sorted(parents))
+            # Skip sections holding nothing but their heading
+            body = self._data[start:end].split(b"\n", 1)
+            if len(body) > 1 and body[1].strip():
+                sections.append(
+                    WikiSection(title, path, level, start, end)
+                )
+        return sections
+
+    def text(self, index: int) -> str:
+        """Text of the section at ``index``."""
+        section = self.sections[index]
+        return self._data[section.start:section.end].decode(
+            "utf-8", "replace"
+        ).strip()
+
+    def titles(self) -> List[str]:
+        """Section paths in document order."""
+        return [section.path for section in self.sections]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        min_ratio: float = 0.5
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank sections by keyword relevance.
+
+        Args:
+            query: Topic or question
+            limit: Maximum sections returned
+            min_ratio: Drop sections scoring below this fraction of the
+                best score
+
+        Returns:
+            (section index, score) pairs, best first
+        """
+        terms = set(tokenize(query))
+        total = len(self.sections)
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + total / len(postings))
+            for i, count in postings.items():
+                weight = (1 + math.log(count)) * idf
+                if term in self._title_terms[i]:
+                    weight *= 2
+                scores[i] = scores.get(i, 0.0) + weight
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        if ranked:
+            floor = ranked[0][1] * min_ratio
+            ranked = [item for item in ranked if item[1] >= floor]
+        return ranked[:limit]
+
+    def coverage(self, query: str, indices: List[int]) -> float:
+        """
+        Fraction of the query keywords found in the given sections.
+
+        Args:
+            query: Topic or question
+            indices: Section indices
+
+        Returns:
+            Coverage between 0 and 1
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return 0.0
+        found = sum(
+            1 for term in terms
+            if any(i in self._postings.get(term, {}) for i in indices)
+        )
+        return found / len(terms)
+
+    def render(self, indices: List[int]) -> str:
+        """Join sections in document order under their paths."""
+        parts = []
+        for i in sorted(set(indices)):
+            parts.append(
+                f"<!-- section: {self.sections[i].path} -->\n{self.text(i)}"
+            )
+        return "\n\n".join(parts)
+
+
+@dataclass
+class CachedWiki:
+    """Cached DeepWiki data for one repository."""
+    structure: Any = None
+    structure_at: float = 0.0
+    contents: Any = None
+    contents_at: float = 0.0
+    index: Optional[WikiIndex] = None
+    answers: Dict[str, Tuple[Any, float]] = field(default_factory=dict)
+
+
+class RepoWikiCache:
+    """
+    Thread-safe LRU cache of DeepWiki data keyed by repository.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 24 * 3600,
+        max_repos: int = 64,
+        max_answers: int = 256
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds before cached data is refetched
+            max_repos: Repositories kept before the oldest is dropped
+            max_answers: Answers kept per repository
+        """
+        self.ttl = ttl
+        self.max_repos = max_repos
+        self.max_answers = max_answers
+        self._repos: "OrderedDict[str, CachedWiki]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return time.monotonic() - fetched_at < self.ttl
+
+    def _entry(self, repo: str, create: bool = False) -> Optional[CachedWiki]:
+        """Get (or create) the entry for a repository; caller locks."""
+        key = normalize_repo(repo)
+        entry = self._repos.get(key)
+        if entry is None and create:
+            entry = self._repos[key] = CachedWiki()
+            while len(self._repos) > self.max_repos:
+                self._repos.popitem(last=False)
+        if entry is not None:
+            self._repos.move_to_end(key)
+        return entry
+
+    def get_structure(self, repo: str) -> Any:
+        """Cached wiki structure, or None."""
+        with self._lock:
+            entry = self._entry(repo)
+            if entry and entry.structure is not None and self._fresh(
+                entry.structure_at
+            ):
+                return entry.structure
+        return None
+
+    def put_structure(self, repo: str, structure: Any):
+        """Cache a wiki structure."""
+        with self._lock:
+            entry = self._entry(repo, create=True)
+            entry.structure = structure
+            entry.structure_at = time.monotonic()
+
+    def get_contents(self, repo: str) -> Any:
+        """Cached wiki contents, or None."""
+        with self._lock:
+            entry = self._entry(repo)
+            if entry and entry.contents is not None and self._fresh(
+                entry.contents_at
+            ):
+                return entry.contents
+        return None
+
+    def get_index(self, repo: str) -> Optional[WikiIndex]:
+        """Section index of cached textual contents, or None."""
+        with self._lock:
+            entry = self._entry(repo)
+            if entry and entry.index is not None and self._fresh(
+                entry.contents_at
+            ):
+                return entry.index
+        return None
+
+    def put_contents(self, repo: str, contents: Any) -> Optional[WikiIndex]:
+        """
+        Cache wiki contents and index them if they are text.
+
+        Args:
+            repo: Repository name
+            contents: Wiki contents
+
+        Returns:
+            The section index, or None for non-text contents
+        """
+        index = WikiIndex(contents) if isinstance(contents, str) else None
+        with self._lock:
+            entry = self._entry(repo, create=True)
+            entry.contents = contents
+            entry.contents_at = time.monotonic()
+            entry.index = index
+        return index
+
+    def get_answer(self, repo: str, question: str) -> Any:
+        """Cached answer to a question, or None."""
+        key = " ".join(question.lower().split())
+        with self._lock:
+            entry = self._entry(repo)
+            if entry and key in entry.answers:
+                answer, fetched_at = entry.answers[key]
+                if self._fresh(fetched_at):
+                    return answer
+        return None
+
+    def put_answer(self, repo: str, question: str, answer: Any):
+        """Cache an answer to a question."""
+        key = " ".join(question.lower().split())
+        with self._lock:
+            entry = self._entry(repo, create=True)
+            entry.answers.pop(key, None)
+            entry.answers[key] = (answer, time.monotonic())
+            while len(entry.answers) > self.max_answers:
+                entry.answers.pop(next(iter(entry.answers)))
+
+    def invalidate(self, repo: str):
+        """Drop everything cached for a repository."""
+        with self._lock:
+            self._repos.pop(normalize_repo(repo), None)
+
+    def clear(self):
+        """Drop all cached repositories."""
+        with self._lock:
+            self._repos.clear()
+
+
+_shared_cache: Optional[RepoWikiCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_wiki_cache() -> RepoWikiCache:
+    """Get the process-wide wiki cache."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = RepoWikiCache()
+        return _shared_cache
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/mcp_toolkit/__init__.py
+# code style: PEP 8
+
+from .connection_manager import (
+    ManagedMCPTool,
+    MCPConnection,
+    MCPConnectionManager,
+    get_mcp_manager,
+    server_key,
+)
+
+__all__ = [
+    "ManagedMCPTool",
+    "MCPConnection",
+    "MCPConnectionManager",
+    "get_mcp_manager",
+    "server_key",
+]
@@ -0,0 +1,445 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/mcp_toolkit/connection_manager.py
+# code style: PEP 8
+
+"""
+Process-wide MCP connection manager.
+
+Keeps one long-lived ``MCPClient`` per configured MCP server instead of
+spawning stdio servers or opening HTTP sessions for every toolbox, agent
+or client instance. Tool schemas are cached with the connection and can
+be invalidated; tool calls from any thread are multiplexed over the one
+session; broken connections are re-established with exponential backoff.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from smolagents import Tool
+
+logger = logging.getLogger(__name__)
+
+# Exceptions (by class name) raised by the MCP transports when the
+# session or subprocess is gone
+_CONNECTION_ERROR_NAMES = frozenset({
+    "ClosedResourceError",
+    "BrokenResourceError",
+    "EndOfStream",
+})
+
+
+def server_key(server_parameters: Any) -> str:
+    """
+    Stable identity of an MCP server configuration.
+
+    Args:
+        server_parameters: ``StdioServerParameters`` or a dict with a
+            ``url``, ``transport`` and optional ``headers``
+
+    Returns:
+        Key string
+    """
+    if isinstance(server_parameters, dict):
+        spec = {k: v for k, v in server_parameters.items() if k != "headers"}
+        headers = server_parameters.get("headers")
+        if headers:
+            # Different credentials need separate connections; only a
+            # digest of the headers goes into the key
+            spec["headers"] = hashlib.sha256(
+                json.dumps(headers, sort_keys=True, default=str).encode()
+            ).hexdigest()
+    else:
+        # Only environment entries that differ from this process's
+        # environment distinguish two stdio servers
+        env = getattr(server_parameters, "env", None) or {}
+        spec = {
+            "command": getattr(server_parameters, "command", None),
+            "args": list(getattr(server_parameters, "args", None) or []),
+            "env": {
+                k: v for k, v in env.items() if os.environ.get(k) != v
+            },
+        }
+    return json.dumps(spec, sort_keys=True, default=str)
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """Whether an exception means the MCP session is unusable."""
+    if isinstance(error, (ConnectionError, EOFError, BrokenPipeError)):
+        return True
+    return type(error).__name__ in _CONNECTION_ERROR_NAMES
+
+
+def _default_client_factory(server_parameters: Any):
+    """Connect an MCPClient (imported lazily; needs smolagents[mcp])."""
+    from smolagents import MCPClient
+    return MCPClient(server_parameters=server_parameters)
+
+
+class ManagedMCPTool(Tool):
+    """
+    Agent tool that calls an MCP tool through a managed connection.
+
+    Subclasses are created per MCP tool by ``MCPConnection`` and carry the
+    tool's schema, so instances are cheap and survive reconnects.
+    """
+
+    skip_forward_signature_validation = True
+    _connection: "MCPConnection"
+
+    def __init__(self, *args, **kwargs):
+        # Toolbox arguments (cli_console, verbose, ...) are not used
+        super().__init__()
+
+    def forward(self, *args, **kwargs):
+        return self._connection.call(self.name, *args, **kwargs)
+
+    async def aforward(self, *args, **kwargs):
+        return await asyncio.to_thread(
+            self._connection.call, self.name, *args, **kwargs
+        )
+
+
+class MCPConnection:
+    """
+    One long-lived connection to an MCP server.
+
+    The connection is opened on first use. Tool calls do not hold the
+    connection lock, so concurrent calls share the session.
+    """
+
+    def __init__(
+        self,
+        server_parameters: Any,
+        name: Optional[str] = None,
+        client_factory: Optional[Callable[[Any], Any]] = None,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        schema_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize the connection.
+
+        Args:
+            server_parameters: ``StdioServerParameters`` or a dict with a
+                ``url`` and ``transport``
+            name: Display name for logs
+            client_factory: Callable creating a connected client with a
+                ``get_tools()`` and ``disconnect()`` (default: MCPClient)
+            max_retries: Connection attempts before giving up
+            initial_backoff: First retry delay in seconds
+            max_backoff: Maximum retry delay in seconds
+            schema_ttl: Seconds before tool schemas are refetched
+                (None keeps them until invalidated)
+        """
+        self.server_parameters = server_parameters
+        self.name = name or self._display_name(server_parameters)
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.schema_ttl = schema_ttl
+        self._client_factory = client_factory or _default_client_factory
+
+        self._lock = threading.RLock()
+        self._client = None
+        self._raw_tools: Dict[str, Tool] = {}
+        self._tool_classes: Dict[str, Type[ManagedMCPTool]] = {}
+        self._generation = 0
+        self._schemas_at = 0.0
+        self._stale = False
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @staticmethod
+    def _display_name(server_parameters: Any) -> str:
+        if isinstance(server_parameters, dict):
+            return str(server_parameters.get("url", "mcp"))
+        command = getattr(server_parameters, "command", "mcp")
+        args = " ".join(getattr(server_parameters, "args", None) or [])
+        return f"{command} {args}".strip()
+
+    @property
+    def connected(self) -> bool:
+        """Whether a session is currently open."""
+        return self._client is not None
+
+    def _connect_locked(self):
+        """Open the session and load tool schemas; caller holds the lock."""
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise ConnectionError(
+                f"MCP server {self.name} is unavailable, retrying in "
+                f"{self._retry_at - now:.0f}s"
+            )
+
+        delay = self.initial_backoff
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.max_retries):
+            try:
+                params = self.server_parameters
+                if isinstance(params, dict):
+                    # MCPClient mutates dict parameters
+                    params = dict(params)
+                client = self._client_factory(params)
+                tools = client.get_tools()
+                break
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    f"Connecting to MCP server {self.name} failed "
+                    f"(attempt {attempt + 1}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.max_backoff)
+        else:
+            self._failures += 1
+            self._retry_at = time.monotonic() + min(
+                self.initial_backoff * 2 ** self._failures, self.max_backoff
+            )
+            raise ConnectionError(
+                f"Failed to connect to MCP server {self.name}: {last_error}"
+            ) from last_error
+
+        self._client = client
+        self._raw_tools = {tool.name: tool for tool in tools}
+        self._tool_classes = {
+            tool.name: self._proxy_class(tool) for tool in tools
+        }
+        self._generation += 1
+        self._schemas_at = time.monotonic()
+        self._stale = False
+        self._failures = 0
+        self._retry_at = 0.0
+        logger.info(
+            f"Connected to MCP server {self.name}. "
+            f"Available tools: {list(self._raw_tools)}"
+        )
+
+    def _proxy_class(self, tool: Tool) -> Type[ManagedMCPTool]:
+        """Create the managed tool class for one MCP tool."""
+        return type(
+            f"MCPTool_{tool.name}",
+            (ManagedMCPTool,),
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputs": tool.inputs,
+                "output_type": tool.output_type,
+                "_connection": self,
+            },
+        )
+
+    def _disconnect_locked(self):
+        """Close the session quietly; caller holds the lock."""
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.disconnect()
+            except Exception as e:
+                logger.debug(f"Error closing MCP server {self.name}: {e}")
+
+    def _ensure_schemas_locked(self, refresh: bool = False):
+        """Connect, or reconnect if the tool schemas are out of date."""
+        expired = (
+            self.schema_ttl is not None
+            and time.monotonic() - self._schemas_at > self.schema_ttl
+        )
+        if self._client is None or refresh or self._stale or expired:
+            self._disconnect_locked()
+            self._connect_locked()
+
+    def tool_classes(
+        self,
+        refresh: bool = False
+    ) -> Dict[str, Type[ManagedMCPTool]]:
+        """
+        Managed tool classes by name, connecting if needed.
+
+        Args:
+            refresh: Reload tool schemas from the server
+
+        Returns:
+            Dictionary of tool name to tool class
+        """
+        with self._lock:
+            self._ensure_schemas_locked(refresh)
+            return dict(self._tool_classes)
+
+    def get_tools(self, refresh: bool = False) -> List[ManagedMCPTool]:
+        """
+        Managed tool instances, connecting if needed.
+
+        Args:
+            refresh: Reload tool schemas from the server
+
+        Returns:
+            List of tools
+        """
+        return [cls() for cls in self.tool_classes(refresh).values()]
+
+    def invalidate(self):
+        """Mark tool schemas stale so the next lookup reloads them."""
+        with self._lock:
+            self._stale = True
+
+    def _live_tool(self, tool_name: str) -> Tuple[Tool, int]:
+        """The session's tool and the session generation."""
+        with self._lock:
+            if self._client is None:
+                self._connect_locked()
+            tool = self._raw_tools.get(tool_name)
+            if tool is None:
+                raise ValueError(
+                    f"Tool '{tool_name}' not found on MCP server "
+                    f"{self.name}. Available tools: {list(self._raw_tools)}"
+                )
+            return tool, self._generation
+
+    def _reconnect(self, generation: int):
+        """Reconnect unless another caller already did."""
+        with self._lock:
+            if self._generation != generation and self._client is not None:
+                return
+            self._disconnect_locked()
+            self._connect_locked()
+
+    def call(self, tool_name: str, *args, **kwargs) -> Any:
+        """
+        Call an MCP tool, reconnecting once if the session broke.
+
+        Args:
+            tool_name: MCP tool name
+            *args: Positional tool arguments
+            **kwargs: Tool arguments
+
+        Returns:
+            Tool result
+        """
+        tool, generation = self._live_tool(tool_name)
+        try:
+            return tool.forward(*args, **kwargs)
+        except Exception as e:
+            if not _is_connection_error(e):
+                raise
+            logger.warning(
+                f"MCP server {self.name} connection lost ({e}), "
+                f"reconnecting"
+            )
+        self._reconnect(generation)
+        tool, _ = self._live_tool(tool_name)
+        return tool.forward(*args, **kwargs)
+
+    async def acall(self, tool_name: str, *args, **kwargs) -> Any:
+        """Async version of call; runs the call in a worker thread."""
+        return await asyncio.to_thread(
+            self.call, tool_name, *args, **kwargs
+        )
+
+    def close(self):
+        """Close the session."""
+        with self._lock:
+            self._disconnect_locked()
+
+
+class MCPConnectionManager:
+    """
+    Registry of long-lived MCP connections keyed by server configuration.
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[Any], Any]] = None,
+        **connection_kwargs
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            client_factory: Client factory passed to each connection
+            **connection_kwargs: Defaults for ``MCPConnection`` (retries,
+                backoff, schema_ttl)
+        """
+        self._client_factory = client_factory
+        self._connection_kwargs = connection_kwargs
+        self._connections: Dict[str, MCPConnection] = {}
+        self._lock = threading.Lock()
+
+    def get_connection(
+        self,
+        server_parameters: Any,
+        name: Optional[str] = None
+    ) -> MCPConnection:
+        """
+        Get the shared connection for a server, creating it if needed.
+
+        The connection is opened lazily on first use.
+
+        Args:
+            server_parameters: ``StdioServerParameters`` or a dict with a
+                ``url`` and ``transport``
+            name: Display name for logs
+
+        Returns:
+            MCPConnection
+        """
+        key = server_key(server_parameters)
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                connection = MCPConnection(
+                    server_parameters,
+                    name=name,
+                    client_factory=self._client_factory,
+                    **self._connection_kwargs
+                )
+                self._connections[key] = connection
+            return connection
+
+    def invalidate(self, server_parameters: Any = None):
+        """
+        Mark tool schemas stale for one server, or for all servers.
+
+        Args:
+            server_parameters: Server to invalidate (default: all)
+        """
+        with self._lock:
+            if server_parameters is None:
+                connections = list(self._connections.values())
+            else:
+                connection = self._connections.get(
+                    server_key(server_parameters)
+                )
+                connections = [connection] if connection else []
+        for connection in connections:
+            connection.invalidate()
+
+    def close_all(self):
+        """Close every connection."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+
+_manager: Optional[MCPConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_mcp_manager() -> MCPConnectionManager:
+    """Get the process-wide MCP connection manager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = MCPConnectionManager()
+            atexit.register(_manager.close_all)
+        return _manager
@@ -3,12 +3,16 @@
 # src/core/chunk/__init__.py
 # code style: PEP 8
 
+from .backends import ArrayBackend, NumpyBackend, get_backend
 from .base_ranker import BaseRanker
 from .jina_reranker import JinaAIReranker
 from .jina_embedder import JinaAIEmbedder
 from .chunker import Chunker
 
 __all__ = [
+    "ArrayBackend",
+    "NumpyBackend",
+    "get_backend",
     "BaseRanker",
     "JinaAIReranker",
     "JinaAIEmbedder",
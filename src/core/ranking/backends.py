@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/ranking/backends.py
+# code style: PEP 8
+
+"""
+Array backends for embedding similarity scoring.
+
+Rankers only need a matmul, softmax and top-k over small matrices, so the
+default backend is NumPy. Torch is an optional extra
+(``pip install "DeepSearchAgents[torch]"``) and is imported only when the
+``torch`` backend is requested.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Tuple, Union
+
+import numpy as np
+
+
+class ArrayBackend(ABC):
+    """
+    Operations a ranker needs on 2-d score and embedding arrays.
+
+    ``topk`` returns NumPy arrays whatever the backend, since results are
+    turned into Python lists right after.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def asarray(self, data: Any) -> Any:
+        """Convert embeddings to a float32 backend array."""
+
+    @abstractmethod
+    def similarity(self, queries: Any, documents: Any) -> Any:
+        """Dot-product scores of shape (num_queries, num_documents)."""
+
+    @abstractmethod
+    def softmax(self, scores: Any) -> Any:
+        """Softmax over the last axis."""
+
+    @abstractmethod
+    def topk(self, scores: Any, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Highest scores per row, in descending order.
+
+        Returns:
+            Tuple of (values, indices) arrays of shape (num_rows, k)
+        """
+
+
+class NumpyBackend(ArrayBackend):
+    """Pure NumPy backend (default)."""
+
+    name = "numpy"
+
+    def asarray(self, data: Any) -> np.ndarray:
+        if hasattr(data, "detach"):
+            # torch.Tensor from a custom _get_embeddings
+            data = data.detach().cpu().numpy()
+        array = np.ascontiguousarray(data, dtype=np.float32)
+        return array.reshape(1, -1) if array.ndim == 1 else array
+
+    def similarity(
+        self,
+        queries: np.ndarray,
+        documents: np.ndarray
+    ) -> np.ndarray:
+        return queries @ documents.T
+
+    def softmax(self, scores: np.ndarray) -> np.ndarray:
+        shifted = np.exp(scores - scores.max(axis=-1, keepdims=True))
+        return shifted / shifted.sum(axis=-1, keepdims=True)
+
+    def topk(
+        self,
+        scores: np.ndarray,
+        k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        scores = np.atleast_2d(scores)
+        k = min(k, scores.shape[-1])
+        if k <= 0:
+            empty = np.empty((scores.shape[0], 0))
+            return empty, empty.astype(np.intp)
+        if k < scores.shape[-1]:
+            # O(n) selection of the top k, then sort only those
+            candidates = np.argpartition(-scores, k - 1, axis=-1)[:, :k]
+        else:
+            candidates = np.broadcast_to(
+                np.arange(scores.shape[-1]), scores.shape
+            )
+        candidate_scores = np.take_along_axis(scores, candidates, axis=-1)
+        order = np.argsort(-candidate_scores, axis=-1, kind="stable")
+        indices = np.take_along_axis(candidates, order, axis=-1)
+        values = np.take_along_axis(candidate_scores, order, axis=-1)
+        return values, indices
+
+
+class TorchBackend(ArrayBackend):
+    """Torch backend, for rankers whose embeddings live on a GPU."""
+
+    name = "torch"
+
+    def __init__(self):
+        try:
+            import torch
+        except ImportError as e:
+            raise ImportError(
+                "The torch ranking backend requires torch. Install with "
+                "pip install \"DeepSearchAgents[torch]\""
+            ) from e
+        self._torch = torch
+
+    def asarray(self, data: Any):
+        if isinstance(data, np.ndarray):
+            tensor = self._torch.from_numpy(data)
+        else:
+            tensor = self._torch.as_tensor(data)
+        tensor = tensor.float()
+        return tensor.unsqueeze(0) if tensor.dim() == 1 else tensor
+
+    def similarity(self, queries, documents):
+        return queries @ documents.T
+
+    def softmax(self, scores):
+        return self._torch.softmax(scores, dim=-1)
+
+    def topk(self, scores, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        scores = scores.unsqueeze(0) if scores.dim() == 1 else scores
+        top = self._torch.topk(scores, min(k, scores.shape[-1]), dim=-1)
+        return (
+            top.values.detach().cpu().numpy(),
+            top.indices.detach().cpu().numpy(),
+        )
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], ArrayBackend]] = {
+    "numpy": NumpyBackend,
+    "torch": TorchBackend,
+}
+_BACKENDS: Dict[str, ArrayBackend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], ArrayBackend]):
+    """
+    Register an array backend.
+
+    Args:
+        name: Backend name used with ``get_backend``
+        factory: Callable creating the backend, called on first use
+    """
+    _BACKEND_FACTORIES[name] = factory
+    _BACKENDS.pop(name, None)
+
+
+def get_backend(backend: Union[str, ArrayBackend] = "numpy") -> ArrayBackend:
+    """
+    Get an array backend by name.
+
+    Args:
+        backend: Backend name, or a backend instance (returned as-is)
+
+    Returns:
+        ArrayBackend: Shared backend instance
+    """
+    if isinstance(backend, ArrayBackend):
+        return backend
+    if backend not in _BACKENDS:
+        if backend not in _BACKEND_FACTORIES:
+            raise ValueError(f"Unknown array backend: {backend}")
+        _BACKENDS[backend] = _BACKEND_FACTORIES[backend]()
+    return _BACKENDS[backend]
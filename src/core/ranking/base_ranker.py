@@ -4,8 +4,9 @@
 # code style: PEP 8
 
 from abc import ABC, abstractmethod
-import torch
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Union
+
+from .backends import ArrayBackend, get_backend
 
 
 class BaseRanker(ABC):
@@ -17,8 +18,17 @@ class BaseRanker(ABC):
     according to their specific embedding source.
     """
 
+    # Array backend used for scoring: "numpy" (default), "torch" or an
+    # ArrayBackend instance
+    array_backend: Union[str, ArrayBackend] = "numpy"
+
+    @property
+    def backend(self) -> ArrayBackend:
+        """Array backend used for scoring."""
+        return get_backend(self.array_backend)
+
     @abstractmethod
-    def _get_embeddings(self, texts: List[str]) -> torch.Tensor:
+    def _get_embeddings(self, texts: List[str]) -> Any:
         """
         Get embeddings for a list of texts.
 
@@ -26,8 +36,8 @@ class BaseRanker(ABC):
             texts: List of text strings to embed
 
         Returns:
-            torch.Tensor containing the embeddings shape:
-            (num_texts, embedding_dim)
+            Array of shape (num_texts, embedding_dim): a NumPy array,
+            nested lists or a tensor of the ranker's backend
         """
         pass
 
@@ -36,10 +46,13 @@ class BaseRanker(ABC):
         queries: List[str],
         documents: List[str],
         normalize: str = "softmax"  # Options: "softmax", "scale", "none"
-    ) -> torch.Tensor:
+    ) -> Any:
         """
         Calculate similarity scores between queries and documents.
 
+        Queries and documents are embedded in a single request and all
+        queries are scored with one matrix product.
+
         Args:
             queries: List of query strings
             documents: List of document strings
@@ -49,25 +62,32 @@ class BaseRanker(ABC):
                       - "none": No normalization
 
         Returns:
-            torch.Tensor of shape (num_queries, num_documents)
+            Backend array of shape (num_queries, num_documents)
             containing similarity scores
         """
-        # Get embeddings for queries and documents
-        query_embeddings = self._get_embeddings(queries)
-        doc_embeddings = self._get_embeddings(documents)
+        if normalize not in ("softmax", "scale", "none"):
+            raise ValueError(f"Unknown normalization method: {normalize}")
+
+        backend = self.backend
+        embeddings = backend.asarray(
+            self._get_embeddings(list(queries) + list(documents))
+        )
+        if embeddings.shape[0] != len(queries) + len(documents):
+            raise ValueError(
+                f"Expected {len(queries) + len(documents)} embeddings, "
+                f"got {embeddings.shape[0]}"
+            )
+        query_embeddings = embeddings[:len(queries)]
+        doc_embeddings = embeddings[len(queries):]
 
         # Calculate similarity scores
-        scores = query_embeddings @ doc_embeddings.T
+        scores = backend.similarity(query_embeddings, doc_embeddings)
 
         # Apply normalization
         if normalize == "softmax":
-            scores = torch.softmax(scores, dim=-1)
+            scores = backend.softmax(scores)
         elif normalize == "scale":
             scores = scores * 100
-        elif normalize == "none":
-            pass
-        else:
-            raise ValueError(f"Unknown normalization method: {normalize}")
 
         return scores
 
@@ -95,22 +115,17 @@ class BaseRanker(ABC):
         """
         queries = [query] if isinstance(query, str) else query
         scores = self.calculate_scores(queries, documents, normalize=normalize)
+        values, indices = self.backend.topk(scores, top_k)
 
-        results = []
-        for query_scores in scores:
-            top_indices = torch.topk(
-                query_scores,
-                min(top_k, len(documents)),
-                dim=0
-            )
-            query_results = [
-                {
-                    "document": documents[idx.item()],
-                    "score": score.item()
-                }
-                for score, idx in zip(top_indices.values, top_indices.indices)
+        results = [
+            [
+                {"document": documents[idx], "score": score}
+                for score, idx in zip(row_values, row_indices)
             ]
-            results.append(query_results)
+            for row_values, row_indices in zip(
+                values.tolist(), indices.tolist()
+            )
+        ]
 
         return results[0] if isinstance(query, str) else results
 
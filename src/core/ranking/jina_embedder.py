@@ -8,13 +8,32 @@ Jina AI Embeddings API for getting text or image embeddings.
 """
 
 import os
+import base64
 import aiohttp
 import asyncio
 from typing import List, Optional, Dict, Union, Any
-import torch
+import numpy as np
 from dotenv import load_dotenv
 
 
+def _decode_embeddings(
+    embeddings: List[Union[str, List[float]]]
+) -> np.ndarray:
+    """
+    Decode one batch of API embeddings into a float32 matrix.
+
+    Base64 embeddings are little-endian float32 buffers and are read
+    without going through Python floats.
+    """
+    if all(isinstance(e, str) for e in embeddings):
+        buffer = b"".join(base64.b64decode(e) for e in embeddings)
+        matrix = np.frombuffer(buffer, dtype="<f4")
+        return matrix.reshape(len(embeddings), -1).astype(
+            np.float32, copy=False
+        )
+    return np.asarray(embeddings, dtype=np.float32)
+
+
 class JinaAIEmbedder:
     """
     Implementation of Jina AI Embeddings API (/v1/embeddings)
@@ -89,12 +108,13 @@ class JinaAIEmbedder:
         normalized: bool = False,
         truncate: bool = False,
         batch_size: int = 50
-    ) -> torch.Tensor:
+    ) -> np.ndarray:
         """
         Asynchronously get embeddings for a list of inputs.
 
         Supports efficient processing of large input batches,
-        automatically batching requests.
+        automatically batching requests. Float embeddings are fetched
+        base64-encoded and decoded straight into a float32 array.
 
         Args:
             inputs: Input list (text or image dictionaries)
@@ -106,11 +126,16 @@ class JinaAIEmbedder:
             batch_size: Maximum number of inputs per batch
 
         Returns:
-            torch.Tensor: Tensor containing embeddings
+            np.ndarray: C-contiguous float32 array of shape
+                (num_embeddings, dim)
         """
         if not inputs:
             raise ValueError("Input list cannot be empty")
 
+        # Floats travel as base64 float32 buffers: smaller responses and
+        # no JSON float parsing
+        wire_type = "base64" if embedding_type == "float" else embedding_type
+
         # Batch inputs for efficiency
         batches = [
             inputs[i:i + batch_size]
@@ -127,7 +152,7 @@ class JinaAIEmbedder:
                 # Prepare request data
                 data = self._prepare_request_data(
                     batch,
-                    embedding_type,
+                    wire_type,
                     task,
                     dimensions,
                     normalized,
@@ -151,7 +176,7 @@ class JinaAIEmbedder:
                     print(f"Batch {i+1}/{len(batches)} failed: {str(result)}")
                     # Continue processing other batches, not interrupt
                     continue
-                all_embeddings.extend(result)
+                all_embeddings.append(result)
 
         except Exception as e:
             raise RuntimeError(f"Embedding processing failed: {str(e)}")
@@ -161,7 +186,9 @@ class JinaAIEmbedder:
             raise RuntimeError("No valid embeddings obtained after "
                                "processing all batches")
 
-        return torch.tensor(all_embeddings, dtype=torch.float)
+        return np.ascontiguousarray(
+            np.concatenate(all_embeddings), dtype=np.float32
+        )
 
     def _prepare_request_data(
         self,
@@ -194,7 +221,7 @@ class JinaAIEmbedder:
         session: aiohttp.ClientSession,
         data: Dict,
         semaphore: asyncio.Semaphore
-    ) -> List:
+    ) -> np.ndarray:
         """Use semaphore to process a single batch, control concurrency"""
         async with semaphore:
             return await self._process_batch(session, data)
@@ -203,7 +230,7 @@ class JinaAIEmbedder:
         self,
         session: aiohttp.ClientSession,
         data: Dict
-    ) -> List:
+    ) -> np.ndarray:
         """Process a single batch of embedding requests"""
         retry_count = 0
         max_retries = 3
@@ -261,12 +288,12 @@ class JinaAIEmbedder:
                                                "valid embedding data")
 
                         # Ensure data format is correct
-                        if not all(isinstance(e, (list, tuple))
+                        if not all(isinstance(e, (list, tuple, str))
                                    for e in valid_embeddings):
-                            raise RuntimeError("Embedding data format is"
-                                               "incorrect (not list/tuple)")
+                            raise RuntimeError("Embedding data format is "
+                                               "incorrect (not list/base64)")
 
-                        return valid_embeddings
+                        return _decode_embeddings(valid_embeddings)
                     else:
                         raise RuntimeError(
                             f"Jina API response format error: {api_result}"
@@ -290,7 +317,7 @@ class JinaAIEmbedder:
         dimensions: Optional[int] = None,
         normalized: bool = False,
         truncate: bool = False
-    ) -> torch.Tensor:
+    ) -> np.ndarray:
         """
         Get embeddings for input list (synchronous version).
 
@@ -306,7 +333,7 @@ class JinaAIEmbedder:
             truncate: Whether to automatically truncate long inputs
 
         Returns:
-            torch.Tensor: Tensor containing embeddings
+            np.ndarray: float32 array containing embeddings
         """
         # Set event loop to run asynchronous code in synchronous environment
         try:
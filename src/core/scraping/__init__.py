@@ -7,8 +7,13 @@ from .base import BaseScraper, RateLimiter
 from .scraper_jinareader import JinaReaderScraper, JinaReaderException
 from .scraper_firecrawl import FirecrawlScraper, FirecrawlException
 from .scraper_xcom import XcomScraper
+from .scraper_local import LocalScraper, LocalScraperException
 from .scrape_url import ScrapeUrl, ScraperConfig, ScraperProvider
 from .result import ExtractionResult, print_extraction_result
+from .sections import MarkdownSectionizer, SectionedDocument, SectionStore
+from .prefetch import (
+    PrefetchStats, ScrapePrefetcher, active_prefetcher, get_prefetcher
+)
 from .utils import get_wikipedia_content
 
 __all__ = [
@@ -19,10 +24,19 @@ __all__ = [
     "FirecrawlScraper",
     "FirecrawlException",
     "XcomScraper",
+    "LocalScraper",
+    "LocalScraperException",
     "ScrapeUrl",
     "ScraperConfig",
     "ScraperProvider",
     "ExtractionResult",
     "print_extraction_result",
+    "MarkdownSectionizer",
+    "SectionedDocument",
+    "SectionStore",
+    "PrefetchStats",
+    "ScrapePrefetcher",
+    "active_prefetcher",
+    "get_prefetcher",
     "get_wikipedia_content",
 ]
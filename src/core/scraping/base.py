@@ -12,7 +12,9 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable, TypeVar
+from typing import (
+    Dict, Any, Optional, List, Callable, TypeVar, AsyncIterator
+)
 from functools import wraps
 
 from .result import ExtractionResult
@@ -332,6 +334,33 @@ class BaseScraper(ABC):
             "Subclass must implement scrape_async method"
         )
 
+    async def stream_async(
+        self,
+        url: str,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream the content of a URL as text chunks.
+
+        Providers with a streaming API override this; the default yields
+        the whole scraped content as a single chunk.
+
+        Args:
+            url: URL to scrape
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Pieces of content in document order
+
+        Raises:
+            ConnectionError: If scraping fails
+        """
+        result = await self.scrape_async(url, **kwargs)
+        if not result.success:
+            raise ConnectionError(result.error or f"Failed to scrape {url}")
+        if result.content:
+            yield result.content
+
     async def scrape_many_async(
         self,
         urls: List[str],
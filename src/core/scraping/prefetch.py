@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/scraping/prefetch.py
+# code style: PEP 8
+
+"""
+Speculative prefetch of search results.
+
+After a search, the agent usually reads a few of the top results one step
+later, while the LLM spends seconds reasoning in between. The prefetcher
+starts background scrapes of the top results right after the search so
+the following ``read_url`` call finds the page already fetched, or joins
+the fetch still in flight, instead of scraping it from scratch.
+
+Prefetches are bounded (top-k per search, global and per-domain
+concurrency, a TTL'd LRU of results), domain-aware (one URL per domain
+per search, no prefetch of skipped domains such as X.com) and
+cancellable. Hit-rate and wasted-fetch counters are kept for tuning k.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from .result import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Domains not worth prefetching (API-billed or needing special scrapers)
+DEFAULT_SKIP_DOMAINS = ("x.com", "twitter.com")
+
+
+def _domain(url: str) -> str:
+    """Host of a URL without a leading ``www.``."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _cache_key(url: str) -> str:
+    """Key under which a URL's prefetch is stored."""
+    return url.strip().split("#", 1)[0].rstrip("/")
+
+
+def _default_scraper_factory():
+    """Unified scraper with the default provider selection."""
+    from .scrape_url import ScrapeUrl, ScraperConfig
+    return ScrapeUrl(
+        config=ScraperConfig.from_settings(), timeout=60, max_retries=1
+    )
+
+
+@dataclass
+class PrefetchStats:
+    """Prefetch counters."""
+    scheduled: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    # Reads served by a finished prefetch / by joining one in flight
+    hits: int = 0
+    joined: int = 0
+    # Reads of URLs with no usable prefetch
+    misses: int = 0
+    # Successful prefetches dropped without ever being read
+    wasted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads served by a prefetch."""
+        reads = self.hits + self.joined + self.misses
+        return (self.hits + self.joined) / reads if reads else 0.0
+
+    @property
+    def waste_rate(self) -> float:
+        """Fraction of successful prefetches that were never read."""
+        return self.wasted / self.completed if self.completed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counters and rates as a dictionary."""
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 3)
+        data["waste_rate"] = round(self.waste_rate, 3)
+        return data
+
+
+class _Prefetch:
+    """One scheduled prefetch."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.domain = _domain(url)
+        self.created_at = time.monotonic()
+        self.started = False
+        self.future: Optional[concurrent.futures.Future] = None
+
+    def succeeded(self) -> bool:
+        """Whether the fetch finished with usable content."""
+        future = self.future
+        if future is None or not future.done() or future.cancelled():
+            return False
+        if future.exception() is not None:
+            return False
+        result = future.result()
+        return bool(result and result.success and result.content)
+
+
+class ScrapePrefetcher:
+    """
+    Background scraper for the top results of each search.
+
+    Fetches run on a dedicated event loop thread, so they overlap with
+    the agent's LLM calls and survive between tool calls.
+    """
+
+    def __init__(
+        self,
+        scraper_factory: Optional[Callable[[], Any]] = None,
+        top_k: int = 3,
+        max_concurrency: int = 4,
+        per_domain: int = 1,
+        ttl: float = 600.0,
+        max_entries: int = 64,
+        timeout: float = 60.0,
+        skip_domains: Iterable[str] = DEFAULT_SKIP_DOMAINS,
+        cancel_stale: bool = True
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            scraper_factory: Creates the scraper used for prefetches (an
+                object with ``scrape_async(url, **kwargs)``)
+            top_k: URLs prefetched per search by default
+            max_concurrency: Prefetches running at once
+            per_domain: Prefetches per domain per search, and running at
+                once per domain
+            ttl: Seconds a prefetched page stays usable
+            max_entries: Prefetched or pending pages kept
+            timeout: Seconds allowed per prefetch
+            skip_domains: Domains (and their subdomains) never prefetched
+            cancel_stale: Cancel prefetches of earlier searches that have
+                not started yet when a new search is prefetched
+        """
+        self.top_k = top_k
+        self.max_concurrency = max_concurrency
+        self.per_domain = per_domain
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.skip_domains = tuple(d.lower() for d in skip_domains)
+        self.cancel_stale = cancel_stale
+        self._scraper_factory = scraper_factory or _default_scraper_factory
+        self._scraper = None
+
+        self._entries: "OrderedDict[str, _Prefetch]" = OrderedDict()
+        self._stats = PrefetchStats()
+        # Reentrant: cancelling a future runs its done callback at once
+        self._lock = threading.RLock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._domain_users: Dict[str, int] = {}
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop thread that runs prefetches; caller locks."""
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="scrape-prefetch",
+                daemon=True
+            ).start()
+            self._loop = loop
+        return self._loop
+
+    def _eligible(self, url: str) -> bool:
+        """Whether a URL may be prefetched at all."""
+        if not isinstance(url, str) or not url.startswith(
+            ("http://", "https://")
+        ):
+            return False
+        domain = _domain(url)
+        return bool(domain) and not any(
+            domain == skip or domain.endswith("." + skip)
+            for skip in self.skip_domains
+        )
+
+    def prefetch(
+        self,
+        urls: Iterable[str],
+        top_k: Optional[int] = None
+    ) -> List[str]:
+        """
+        Start prefetching the first eligible URLs of a search.
+
+        Args:
+            urls: Result URLs in rank order
+            top_k: URLs to prefetch (default: ``self.top_k``)
+
+        Returns:
+            URLs newly scheduled
+        """
+        limit = self.top_k if top_k is None else top_k
+        if limit <= 0:
+            return []
+
+        scheduled = []
+        with self._lock:
+            self._expire_locked()
+            if self.cancel_stale:
+                for entry in list(self._entries.values()):
+                    if not entry.started:
+                        self._drop_locked(entry)
+
+            per_domain: Dict[str, int] = {}
+            for url in urls:
+                if len(scheduled) >= limit:
+                    break
+                key = _cache_key(url) if isinstance(url, str) else None
+                if not key or not self._eligible(url):
+                    continue
+                domain = _domain(url)
+                if per_domain.get(domain, 0) >= self.per_domain:
+                    continue
+                per_domain[domain] = per_domain.get(domain, 0) + 1
+                if key in self._entries:
+                    continue
+
+                entry = _Prefetch(url)
+                self._entries[key] = entry
+                entry.future = asyncio.run_coroutine_threadsafe(
+                    self._fetch(entry), self._get_loop()
+                )
+                entry.future.add_done_callback(self._record_outcome)
+                self._stats.scheduled += 1
+                scheduled.append(url)
+
+            while len(self._entries) > self.max_entries:
+                self._drop_locked(next(iter(self._entries.values())))
+
+        if scheduled:
+            logger.info(f"Prefetching {len(scheduled)} URLs: {scheduled}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Prefetch stats: {self.stats()}")
+        return scheduled
+
+    async def _fetch(self, entry: _Prefetch) -> ExtractionResult:
+        """Scrape one URL within the concurrency limits."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        domain = entry.domain
+        domain_semaphore = self._domain_semaphores.get(domain)
+        if domain_semaphore is None:
+            domain_semaphore = asyncio.Semaphore(self.per_domain)
+            self._domain_semaphores[domain] = domain_semaphore
+        self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+
+        try:
+            async with self._semaphore, domain_semaphore:
+                entry.started = True
+                if self._scraper is None:
+                    self._scraper = self._scraper_factory()
+                return await asyncio.wait_for(
+                    self._scraper.scrape_async(
+                        entry.url, output_format="markdown"
+                    ),
+                    timeout=self.timeout
+                )
+        finally:
+            # Per-domain semaphores only live while the domain is in use
+            self._domain_users[domain] -= 1
+            if not self._domain_users[domain]:
+                del self._domain_users[domain]
+                del self._domain_semaphores[domain]
+
+    def _record_outcome(self, future: concurrent.futures.Future):
+        """Count a finished prefetch."""
+        with self._lock:
+            if future.cancelled():
+                self._stats.cancelled += 1
+            elif future.exception() is not None or not (
+                future.result() and future.result().success
+            ):
+                self._stats.failed += 1
+            else:
+                self._stats.completed += 1
+
+    def _drop_locked(self, entry: _Prefetch):
+        """Remove an entry unread; caller holds the lock."""
+        self._entries.pop(_cache_key(entry.url), None)
+        if entry.succeeded():
+            self._stats.wasted += 1
+        elif entry.future is not None and not entry.future.done():
+            entry.future.cancel()
+
+    def _expire_locked(self):
+        """Drop entries older than the TTL; caller holds the lock."""
+        now = time.monotonic()
+        for entry in list(self._entries.values()):
+            if now - entry.created_at > self.ttl:
+                self._drop_locked(entry)
+
+    def take(
+        self,
+        url: str
+    ) -> Optional[concurrent.futures.Future]:
+        """
+        Claim the prefetch of a URL for a read.
+
+        Args:
+            url: URL being read
+
+        Returns:
+            Future of the ``ExtractionResult`` (done, or still in flight),
+            or None if the URL has no usable prefetch
+        """
+        with self._lock:
+            self._expire_locked()
+            entry = self._entries.pop(_cache_key(url), None)
+            future = entry.future if entry else None
+            if future is None or (future.done() and not entry.succeeded()):
+                self._stats.misses += 1
+                return None
+            if future.done():
+                self._stats.hits += 1
+            else:
+                self._stats.joined += 1
+            return future
+
+    def cancel(self, url: Optional[str] = None):
+        """
+        Cancel prefetches and drop their results.
+
+        Args:
+            url: URL to cancel (default: all)
+        """
+        with self._lock:
+            if url is None:
+                entries = list(self._entries.values())
+            else:
+                entry = self._entries.get(_cache_key(url))
+                entries = [entry] if entry else []
+            for entry in entries:
+                self._drop_locked(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Prefetch counters, hit rate and waste rate."""
+        with self._lock:
+            self._expire_locked()
+            data = self._stats.as_dict()
+            data["pending"] = sum(
+                1 for entry in self._entries.values()
+                if entry.future is not None and not entry.future.done()
+            )
+            data["ready"] = sum(
+                1 for entry in self._entries.values() if entry.succeeded()
+            )
+        return data
+
+
+_shared_prefetcher: Optional[ScrapePrefetcher] = None
+_shared_lock = threading.Lock()
+
+
+def get_prefetcher(**kwargs) -> ScrapePrefetcher:
+    """
+    Get the process-wide prefetcher, creating it on first use.
+
+    Args:
+        **kwargs: ``ScrapePrefetcher`` arguments used on creation
+
+    Returns:
+        ScrapePrefetcher
+    """
+    global _shared_prefetcher
+    with _shared_lock:
+        if _shared_prefetcher is None:
+            _shared_prefetcher = ScrapePrefetcher(**kwargs)
+        return _shared_prefetcher
+
+
+def active_prefetcher() -> Optional[ScrapePrefetcher]:
+    """The process-wide prefetcher, or None if prefetching is not used."""
+    return _shared_prefetcher
@@ -9,13 +9,18 @@ Unified URL scraper that wraps multiple scraping providers.
 This module provides a unified interface for scraping URLs using different
 backends like JinaReader, Firecrawl, and potentially other scrapers.
 It automatically selects the best scraper based on configuration, URL type,
-and availability.
+and availability. In auto mode pages are first fetched directly by the
+local scraper and escalated to a remote scraper only when the local result
+is too thin or needs JavaScript; escalated domains go straight to remote
+scrapers for a while.
 """
 
 import os
 import logging
+import time
 from enum import Enum
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Union, AsyncIterator
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 from .base import BaseScraper
@@ -23,12 +28,15 @@ from .result import ExtractionResult
 from .scraper_jinareader import JinaReaderScraper
 from .scraper_firecrawl import FirecrawlScraper
 from .scraper_xcom import XcomScraper
+from . import scraper_local
+from .scraper_local import LocalScraper
 
 logger = logging.getLogger(__name__)
 
 
 class ScraperProvider(Enum):
     """Available scraper providers."""
+    LOCAL = "local"
     JINA = "jina"
     FIRECRAWL = "firecrawl"
     XCOM = "xcom"
@@ -44,6 +52,7 @@ class ScraperConfig:
         fallback_enabled: bool = True,
         provider_priority: Optional[List[ScraperProvider]] = None,
         provider_config: Optional[Dict[str, Dict[str, Any]]] = None,
+        escalation_ttl: float = 24 * 3600,
     ):
         """
         Initialize scraper configuration.
@@ -53,16 +62,45 @@ class ScraperConfig:
             fallback_enabled: Whether to fallback to other scrapers on failure
             provider_priority: Priority order for auto selection
             provider_config: Provider-specific configurations
+            escalation_ttl: Seconds a domain that needed a remote scraper
+                skips the local scraper
         """
         self.default_provider = default_provider
         self.fallback_enabled = fallback_enabled
         self.provider_priority = provider_priority or [
+            ScraperProvider.LOCAL,
             ScraperProvider.JINA,
             ScraperProvider.FIRECRAWL,
             # XCOM is excluded from auto selection
             # It will only be used for X.com URLs or when explicitly requested
         ]
         self.provider_config = provider_config or {}
+        self.escalation_ttl = escalation_ttl
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> "ScraperConfig":
+        """
+        Create a configuration from the ``[scrapers]`` settings.
+
+        Args:
+            **kwargs: Arguments overriding the configured values
+
+        Returns:
+            ScraperConfig
+        """
+        from ..config.settings import settings
+
+        priority = []
+        for name in settings.SCRAPER_PROVIDER_PRIORITY:
+            try:
+                priority.append(ScraperProvider(str(name).lower()))
+            except ValueError:
+                logger.warning(f"Unknown scraper provider in priority: {name}")
+        kwargs.setdefault("provider_priority", priority or None)
+        kwargs.setdefault(
+            "provider_config", {"local": dict(settings.SCRAPER_LOCAL_CONFIG)}
+        )
+        return cls(**kwargs)
 
 
 class ScrapeUrl(BaseScraper):
@@ -82,8 +120,15 @@ class ScrapeUrl(BaseScraper):
     3. URL mapping and crawling
     4. Structured data extraction
     5. Multiple output formats
+    6. Local direct fetch with escalation to remote scrapers
     """
 
+    # Options only remote scrapers implement
+    REMOTE_ONLY_OPTIONS = (
+        'javascript', 'actions', 'screenshot', 'wait_for',
+        'remove_selector', 'target_selector', 'formats',
+    )
+
     def __init__(
         self,
         config: Optional[ScraperConfig] = None,
@@ -111,12 +156,28 @@ class ScrapeUrl(BaseScraper):
 
         self.config = config or ScraperConfig()
         self._scrapers: Dict[ScraperProvider, Optional[BaseScraper]] = {}
+        # Domain -> time until which it skips the local scraper
+        self._escalated_domains: Dict[str, float] = {}
         self._initialize_scrapers()
 
     def _initialize_scrapers(self):
         """
         Initialize available scrapers based on API keys and configuration.
         """
+        # Local scraper needs no API key, only the HTML converters
+        if scraper_local.is_available():
+            local_config = self.config.provider_config.get('local', {})
+            self._scrapers[ScraperProvider.LOCAL] = LocalScraper(
+                **local_config
+            )
+            logger.info("Local scraper initialized")
+        else:
+            logger.warning(
+                "Local scraper unavailable: install beautifulsoup4 and "
+                "markdownify"
+            )
+            self._scrapers[ScraperProvider.LOCAL] = None
+
         # Initialize Jina scraper if API key is available
         jina_api_key = os.getenv('JINA_API_KEY')
         if jina_api_key:
@@ -172,10 +233,68 @@ class ScrapeUrl(BaseScraper):
         else:
             self._scrapers[ScraperProvider.XCOM] = None
 
+    @staticmethod
+    def _domain(url: str) -> str:
+        """Domain key used for escalation tracking."""
+        host = (urlparse(url).hostname or '').lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _is_escalated(self, url: str) -> bool:
+        """Return True if the URL's domain currently skips local fetch."""
+        domain = self._domain(url)
+        until = self._escalated_domains.get(domain)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._escalated_domains[domain]
+            return False
+        return True
+
+    def _record_escalation(self, url: str, reason: Optional[str]):
+        """Send the URL's domain to remote scrapers for a while."""
+        domain = self._domain(url)
+        if domain:
+            self._escalated_domains[domain] = (
+                time.monotonic() + self.config.escalation_ttl
+            )
+            logger.info(
+                f"Escalating {domain} to remote scrapers: {reason}"
+            )
+
+    def _can_use_local(self, url: str, **kwargs) -> bool:
+        """Return True if the local scraper may handle this request."""
+        return (
+            LocalScraper.can_scrape(url)
+            and not XcomScraper.is_x_url(url)
+            and not any(kwargs.get(k) for k in self.REMOTE_ONLY_OPTIONS)
+            and not self._is_escalated(url)
+        )
+
+    def _needs_escalation(
+        self,
+        url: str,
+        scraper: BaseScraper,
+        result: ExtractionResult,
+        provider: Optional[ScraperProvider]
+    ) -> bool:
+        """Check a local result and record escalation if it falls short."""
+        if (
+            provider not in (None, ScraperProvider.AUTO)
+            or not isinstance(scraper, LocalScraper)
+            or not (result.metadata or {}).get('needs_escalation')
+        ):
+            return False
+        if result.metadata.get('escalation_scope') == 'domain':
+            self._record_escalation(
+                url, result.metadata.get('escalation_reason')
+            )
+        return True
+
     def _select_scraper(
         self,
         url: str,
         provider: Optional[ScraperProvider] = None,
+        skip_local: bool = False,
         **kwargs
     ) -> Optional[BaseScraper]:
         """
@@ -184,6 +303,7 @@ class ScrapeUrl(BaseScraper):
         Args:
             url: URL to scrape
             provider: Specific provider requested
+            skip_local: Only consider remote scrapers
             **kwargs: Additional parameters that might influence selection
 
         Returns:
@@ -213,6 +333,11 @@ class ScrapeUrl(BaseScraper):
         for provider in self.config.provider_priority:
             scraper = self._scrapers.get(provider)
             if scraper:
+                # Local fetch only for static-looking requests
+                if provider == ScraperProvider.LOCAL:
+                    if skip_local or not self._can_use_local(url, **kwargs):
+                        continue
+                    return scraper
                 # Special check: Don't use XcomScraper for non-X.com URLs
                 if provider == ScraperProvider.XCOM:
                     # Only use XcomScraper if it's an X.com URL
@@ -270,12 +395,26 @@ class ScrapeUrl(BaseScraper):
             )
 
         try:
+            logger.info(f"Scraping {url} with {scraper.__class__.__name__}")
+            result = scraper.scrape(url, **kwargs)
+            if not self._needs_escalation(url, scraper, result, provider):
+                return result
+
+            # Local result fell short: retry with a remote scraper
+            remote = self._select_scraper(
+                url, provider, skip_local=True, **kwargs
+            )
+            if remote is None:
+                return result
+            scraper = remote
             logger.info(f"Scraping {url} with {scraper.__class__.__name__}")
             return scraper.scrape(url, **kwargs)
         except Exception as e:
             logger.error(
                 f"Scraping failed with {scraper.__class__.__name__}: {e}"
             )
+            # Fetch errors (HTTP 4xx, timeouts) only concern this URL:
+            # the fallback below handles it without escalating the domain
 
             # Try fallback scrapers if enabled
             if self.config.fallback_enabled:
@@ -284,6 +423,11 @@ class ScrapeUrl(BaseScraper):
                         continue  # Skip the one that just failed
 
                     fallback_scraper = self._scrapers.get(fallback_provider)
+                    if fallback_scraper is scraper or (
+                        fallback_provider == ScraperProvider.LOCAL
+                        and not self._can_use_local(url, **kwargs)
+                    ):
+                        continue
                     if fallback_scraper:
                         try:
                             logger.info(
@@ -344,12 +488,28 @@ class ScrapeUrl(BaseScraper):
             )
 
         try:
+            logger.info(
+                f"Async scraping {url} with {scraper.__class__.__name__}"
+            )
+            result = await scraper.scrape_async(url, **kwargs)
+            if not self._needs_escalation(url, scraper, result, provider):
+                return result
+
+            # Local result fell short: retry with a remote scraper
+            remote = self._select_scraper(
+                url, provider, skip_local=True, **kwargs
+            )
+            if remote is None:
+                return result
+            scraper = remote
             logger.info(
                 f"Async scraping {url} with {scraper.__class__.__name__}"
             )
             return await scraper.scrape_async(url, **kwargs)
         except Exception as e:
             logger.error(f"Async scraping failed: {e}")
+            # Fetch errors (HTTP 4xx, timeouts) only concern this URL:
+            # the fallback below handles it without escalating the domain
 
             # Try fallback scrapers
             if self.config.fallback_enabled:
@@ -358,6 +518,11 @@ class ScrapeUrl(BaseScraper):
                         continue
 
                     fallback_scraper = self._scrapers.get(fallback_provider)
+                    if fallback_scraper is scraper or (
+                        fallback_provider == ScraperProvider.LOCAL
+                        and not self._can_use_local(url, **kwargs)
+                    ):
+                        continue
                     if fallback_scraper:
                         try:
                             logger.info(
@@ -379,6 +544,66 @@ class ScrapeUrl(BaseScraper):
                 error=f"All scrapers failed. Last error: {str(e)}"
             )
 
+    async def stream_async(
+        self,
+        url: str,
+        provider: Optional[Union[ScraperProvider, str]] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream the content of a URL as text chunks.
+
+        Providers with a streaming API (Jina Reader) are streamed directly;
+        other providers, including local fetch and its escalation, go
+        through ``scrape_async`` and yield their content as one chunk.
+        A streaming failure before the first chunk falls back to
+        ``scrape_async``.
+
+        Args:
+            url: URL to scrape
+            provider: Specific provider to use (optional)
+            **kwargs: Additional parameters
+
+        Yields:
+            Pieces of content in document order
+
+        Raises:
+            ConnectionError: If no scraper can read the URL
+        """
+        if isinstance(provider, str):
+            try:
+                provider = ScraperProvider(provider.lower())
+            except ValueError:
+                provider = None
+
+        if provider is None:
+            provider = self.config.default_provider
+
+        scraper = self._select_scraper(url, provider, **kwargs)
+        if (
+            scraper is not None
+            and type(scraper).stream_async is not BaseScraper.stream_async
+        ):
+            started = False
+            try:
+                logger.info(
+                    f"Streaming {url} with {scraper.__class__.__name__}"
+                )
+                async for chunk in scraper.stream_async(url, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started or not self.config.fallback_enabled:
+                    raise
+                logger.warning(f"Streaming {url} failed: {e}")
+
+        result = await self.scrape_async(url, provider=provider, **kwargs)
+        if not result.success:
+            raise ConnectionError(result.error or f"Failed to scrape {url}")
+        if result.content:
+            yield result.content
+
     def map_website(
         self,
         url: str,
@@ -477,7 +702,12 @@ class ScrapeUrl(BaseScraper):
                 }
 
                 # Add feature information
-                if provider == ScraperProvider.JINA:
+                if provider == ScraperProvider.LOCAL:
+                    provider_info['features'] = [
+                        'markdown', 'html', 'text', 'no_api_key',
+                        'remote_escalation'
+                    ]
+                elif provider == ScraperProvider.JINA:
                     provider_info['features'] = [
                         'markdown', 'html', 'text', 'screenshot',
                         'remove_selectors', 'wait_for_selectors'
@@ -497,7 +727,11 @@ class ScrapeUrl(BaseScraper):
             else:
                 info[provider.value] = {
                     'available': False,
-                    'reason': f'{provider.value.upper()}_API_KEY not found'
+                    'reason': (
+                        'beautifulsoup4/markdownify not installed'
+                        if provider == ScraperProvider.LOCAL
+                        else f'{provider.value.upper()}_API_KEY not found'
+                    )
                 }
 
         return info
@@ -514,7 +748,8 @@ def scrape_url(
 
     Args:
         url: URL to scrape
-        provider: Optional provider name ('jina', 'firecrawl', 'xcom', 'auto')
+        provider: Optional provider name
+            ('local', 'jina', 'firecrawl', 'xcom', 'auto')
         **kwargs: Additional parameters
 
     Returns:
@@ -12,11 +12,12 @@ API Docs: @(https://github.com/jina-ai/meta-prompt/blob/main/v8.txt)
 import os
 import aiohttp
 import asyncio
+import codecs
 import re
 import logging
 import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, AsyncIterator
 from dotenv import load_dotenv
 
 from .base import BaseScraper, RateLimiter
@@ -326,6 +327,50 @@ class JinaReaderScraper(BaseScraper):
 
         return self._is_premium
 
+    async def _raise_for_status(
+        self,
+        response: aiohttp.ClientResponse,
+        url: str
+    ):
+        """
+        Raise a JinaReaderException for a non-200 response.
+
+        Args:
+            response: Response with an error status
+            url: URL that was being scraped
+
+        Raises:
+            JinaReaderException: Always
+        """
+        error_text = await response.text()
+        cleaned_error = self._clean_error_response(
+            error_text, response.status
+        )
+
+        if response.status == 401:
+            raise JinaReaderException(
+                "Invalid API key. Get your free API key at: "
+                "https://jina.ai/?sui=apikey"
+            )
+        elif response.status == 429:
+            raise JinaReaderException(
+                "Rate limit exceeded. Consider upgrading to "
+                "premium for higher limits."
+            )
+        elif response.status == 422:
+            raise JinaReaderException(
+                f"Invalid request parameters: {cleaned_error}"
+            )
+        elif response.status == 524:
+            raise JinaReaderException(
+                f"CloudFlare timeout (524) for URL: {url}. "
+                "The origin server took too long to respond."
+            )
+        else:
+            raise JinaReaderException(
+                f"HTTP {response.status}: {cleaned_error}"
+            )
+
     async def scrape_async(
         self,
         url: str,
@@ -402,35 +447,69 @@ class JinaReaderScraper(BaseScraper):
                                 metadata={"format": "raw_text"}
                             )
                     else:
-                        # Handle error responses
-                        error_text = await response.text()
-                        cleaned_error = self._clean_error_response(
-                            error_text, response.status
-                        )
-
-                        if response.status == 401:
-                            raise JinaReaderException(
-                                "Invalid API key. Get your free API key at: "
-                                "https://jina.ai/?sui=apikey"
-                            )
-                        elif response.status == 429:
-                            raise JinaReaderException(
-                                "Rate limit exceeded. Consider upgrading to "
-                                "premium for higher limits."
-                            )
-                        elif response.status == 422:
-                            raise JinaReaderException(
-                                f"Invalid request parameters: {cleaned_error}"
-                            )
-                        elif response.status == 524:
-                            raise JinaReaderException(
-                                f"CloudFlare timeout (524) for URL: {url}. "
-                                "The origin server took too long to respond."
-                            )
-                        else:
-                            raise JinaReaderException(
-                                f"HTTP {response.status}: {cleaned_error}"
-                            )
+                        await self._raise_for_status(response, url)
+
+            except asyncio.TimeoutError:
+                raise JinaReaderException(
+                    f"Request timeout after {self.timeout} seconds: {url}"
+                )
+            except aiohttp.ClientError as e:
+                raise JinaReaderException(
+                    f"Network error while scraping {url}: {str(e)}"
+                )
+
+    async def stream_async(
+        self,
+        url: str,
+        chunk_size: int = 16 * 1024,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream page content from Jina Reader as it arrives.
+
+        The response is requested as plain text instead of the JSON
+        envelope, so content can be consumed before the body is complete.
+
+        Args:
+            url: The URL to scrape
+            chunk_size: Bytes read from the network per chunk
+            **kwargs: Optional parameters for headers (see _build_headers)
+
+        Yields:
+            Decoded text chunks in document order
+        """
+        self._track_request()
+
+        headers = self._build_headers(**kwargs)
+        headers['Accept'] = 'text/plain'
+
+        session = await self._get_session()
+        semaphore = await self._get_semaphore()
+
+        async with semaphore:
+            full_url = f"{self.api_base_url}/{url}"
+
+            try:
+                async with session.get(
+                    full_url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    if response.status != 200:
+                        await self._raise_for_status(response, url)
+
+                    decoder = codecs.getincrementaldecoder(
+                        response.charset or "utf-8"
+                    )(errors="replace")
+                    async for chunk in response.content.iter_chunked(
+                        chunk_size
+                    ):
+                        text = decoder.decode(chunk)
+                        if text:
+                            yield text
+                    text = decoder.decode(b"", final=True)
+                    if text:
+                        yield text
 
             except asyncio.TimeoutError:
                 raise JinaReaderException(
@@ -0,0 +1,575 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/scraping/scraper_local.py
+# code style: PEP 8
+
+"""
+Local direct-fetch scraper.
+
+Fetches pages directly over a shared aiohttp connection pool, extracts the
+readable part of the HTML and converts it to markdown in a worker process
+pool. Static pages (documentation, Wikipedia, plain articles) are handled
+locally in milliseconds; pages that need JavaScript or yield too little
+content are flagged for escalation to a remote scraper
+(``metadata["needs_escalation"]``).
+
+The server fetches whatever URL an agent hands it, so only public
+addresses are fetched: the URL of every request and redirect hop is
+checked, and host names are resolved through ``PublicAddressResolver``,
+which refuses loopback, private, link-local and other non-global
+addresses at connect time.
+"""
+
+import asyncio
+import importlib.util
+import ipaddress
+import logging
+import os
+import re
+import socket
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+from .base import BaseScraper
+from .result import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (compatible; DeepSearchAgents/1.0; "
+    "+https://github.com/lwyBZss8924d/DeepSearchAgents)"
+)
+
+# Content types the local scraper can convert
+_HTML_TYPES = ("text/html", "application/xhtml+xml")
+_TEXT_TYPES = ("text/plain", "text/markdown")
+
+# Elements that never hold readable content
+_STRIP_TAGS = (
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "form", "button", "input", "select", "nav", "header", "footer",
+    "aside",
+)
+
+# Containers tried, in order, for the main content
+_CONTENT_SELECTORS = (
+    "article", "main", "[role=main]", "#content", "#main-content",
+    ".mw-parser-output", ".markdown-body", ".document", ".post-content",
+)
+
+# Markers of client-side rendered pages
+_JS_REQUIRED_PATTERNS = re.compile(
+    r"(enable|requires?)\s+javascript|javascript\s+(is\s+)?(required|disabled)"
+    r"|please\s+turn\s+on\s+javascript",
+    re.IGNORECASE,
+)
+_SPA_ROOT_IDS = ("root", "app", "__next", "__nuxt", "svelte")
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class LocalScraperException(Exception):
+    """Exception raised when a direct fetch fails."""
+    pass
+
+
+def is_public_address(host: str) -> bool:
+    """
+    Return True if an IP address is globally routable.
+
+    Args:
+        host: IPv4 or IPv6 address
+
+    Returns:
+        False for loopback, private, link-local, multicast and other
+        special-purpose addresses, and for anything that is not an IP
+    """
+    try:
+        address = ipaddress.ip_address(host.split("%")[0])
+    except ValueError:
+        return False
+    if getattr(address, "ipv4_mapped", None):
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+class PublicAddressResolver(AbstractResolver):
+    """Resolver refusing host names that resolve to non-public addresses."""
+
+    def __init__(self):
+        self._resolver = DefaultResolver()
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,
+        family: socket.AddressFamily = socket.AF_INET
+    ):
+        hosts = await self._resolver.resolve(host, port, family)
+        for entry in hosts:
+            if not is_public_address(entry["host"]):
+                # aiohttp reports resolver OSErrors as connection errors
+                raise OSError(
+                    f"{host} resolves to non-public address {entry['host']}"
+                )
+        return hosts
+
+    async def close(self):
+        await self._resolver.close()
+
+
+def is_available() -> bool:
+    """Return True if the HTML conversion dependencies are installed."""
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("bs4", "markdownify")
+    )
+
+
+def html_to_markdown(
+    html: str,
+    url: str = "",
+    output_format: str = "markdown"
+) -> Dict[str, Any]:
+    """
+    Extract readable content from HTML and convert it to markdown.
+
+    Runs in a worker process, so it only takes and returns picklable
+    values.
+
+    Args:
+        html: Page HTML
+        url: Page URL, used to make relative links absolute
+        output_format: 'markdown', 'text' or 'html'
+
+    Returns:
+        Dictionary with ``content``, ``title``, ``text_length``,
+        ``html_length`` and ``js_required``
+    """
+    from bs4 import BeautifulSoup
+    from markdownify import MarkdownConverter
+
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text(strip=True) if soup.title else ""
+
+    # Detect client-side rendering before scripts are stripped
+    noscript_text = " ".join(
+        tag.get_text(" ", strip=True) for tag in soup.find_all("noscript")
+    )
+    spa_root = any(
+        (root := soup.find(id=root_id)) is not None
+        and not root.get_text(strip=True)
+        for root_id in _SPA_ROOT_IDS
+    )
+
+    for tag in soup(list(_STRIP_TAGS)):
+        tag.decompose()
+
+    container = None
+    for selector in _CONTENT_SELECTORS:
+        candidate = soup.select_one(selector)
+        if candidate and len(candidate.get_text(strip=True)) > 200:
+            container = candidate
+            break
+    if container is None:
+        container = soup.body or soup
+
+    if url:
+        for link in container.find_all("a", href=True):
+            link["href"] = urljoin(url, link["href"])
+
+    text = container.get_text(" ", strip=True)
+    js_required = bool(
+        len(text) < 500
+        and (spa_root or _JS_REQUIRED_PATTERNS.search(noscript_text + text))
+    )
+
+    if output_format == "html":
+        content = str(container)
+    elif output_format == "text":
+        content = container.get_text("\n", strip=True)
+    else:
+        content = MarkdownConverter(
+            heading_style="ATX", bullets="-"
+        ).convert_soup(container)
+        # Collapse runs of blank lines left by removed elements
+        content = re.sub(r"\n{3,}", "\n\n", content).strip()
+        if title and not content.lstrip().startswith("#"):
+            content = f"# {title}\n\n{content}"
+
+    return {
+        "content": content,
+        "title": title,
+        "text_length": len(text),
+        "html_length": len(html),
+        "js_required": js_required,
+    }
+
+
+_shared_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_conversion_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the process-wide HTML conversion pool."""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _shared_pool
+
+
+def _reset_conversion_pool():
+    """Drop a broken conversion pool so the next call recreates it."""
+    global _shared_pool
+    if _shared_pool is not None:
+        _shared_pool.shutdown(wait=False, cancel_futures=True)
+    _shared_pool = None
+
+
+class LocalScraper(BaseScraper):
+    """
+    Scraper that fetches pages directly without a remote service.
+
+    Results whose content is too thin, or that look client-side rendered,
+    are returned with ``metadata["needs_escalation"] = True`` and a
+    ``metadata["escalation_reason"]`` so callers can retry with a remote
+    scraper. ``metadata["escalation_scope"]`` is ``"domain"`` when the
+    site itself needs a remote scraper and ``"url"`` when only this
+    document does (e.g. a PDF).
+    """
+
+    def __init__(
+        self,
+        timeout: int = 20,
+        max_retries: int = 1,
+        max_bytes: int = 5 * 1024 * 1024,
+        min_content_length: int = 500,
+        min_text_ratio: float = 0.02,
+        process_workers: Optional[int] = None,
+        inline_threshold: int = 20 * 1024,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_redirects: int = 10,
+        allow_private_networks: bool = False,
+        **kwargs
+    ):
+        """
+        Initialize the local scraper.
+
+        Args:
+            timeout: Fetch timeout in seconds
+            max_retries: Maximum retry attempts
+            max_bytes: Largest page body to fetch
+            min_content_length: Minimum readable characters before a
+                page is considered good enough
+            min_text_ratio: Minimum ratio of readable text to HTML size
+            process_workers: Size of the conversion process pool
+                (defaults to min(4, CPU count))
+            inline_threshold: Pages smaller than this many bytes are
+                converted on a thread instead of a worker process
+            user_agent: User-Agent header sent with requests
+            max_redirects: Redirects followed per fetch
+            allow_private_networks: Also fetch loopback and private
+                addresses (local development only)
+            **kwargs: Ignored provider options (e.g. output_format)
+        """
+        super().__init__(
+            api_key=None,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limiter=None
+        )
+        self.max_bytes = max_bytes
+        self.min_content_length = min_content_length
+        self.min_text_ratio = min_text_ratio
+        self.process_workers = process_workers or min(4, os.cpu_count() or 1)
+        self.inline_threshold = inline_threshold
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self.allow_private_networks = allow_private_networks
+        # One session per event loop; sessions die with their loop
+        self._sessions: "weakref.WeakKeyDictionary" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def can_scrape(url: str) -> bool:
+        """Return True for URLs the local scraper may try."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return False
+        # Binary documents are left to remote readers
+        return not parsed.path.lower().endswith(
+            (".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx")
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get a reusable aiohttp session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                resolver=(
+                    None if self.allow_private_networks
+                    else PublicAddressResolver()
+                ),
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept": "text/html,application/xhtml+xml,"
+                              "text/plain;q=0.9,*/*;q=0.5",
+                },
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """Close the session of the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+
+    def _check_target(self, url: str):
+        """
+        Refuse URLs the server must not fetch.
+
+        Host names are checked when they are resolved, by
+        ``PublicAddressResolver``; IP literals never reach the resolver,
+        so they are checked here.
+
+        Raises:
+            LocalScraperException: For non-http(s) URLs and non-public
+                IP addresses
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise LocalScraperException(f"Refusing to fetch {url}")
+        if self.allow_private_networks:
+            return
+        host = parsed.hostname
+        try:
+            ipaddress.ip_address(host.split("%")[0])
+        except ValueError:
+            return
+        if not is_public_address(host):
+            raise LocalScraperException(
+                f"Refusing to fetch non-public address {host}: {url}"
+            )
+
+    async def _fetch(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch a page body, following redirects to public addresses only.
+
+        Returns:
+            Dictionary with ``body``, ``content_type``, ``final_url``;
+            ``body`` is None for content the scraper cannot convert
+        """
+        session = await self._get_session()
+        target = url
+        try:
+            for _ in range(self.max_redirects + 1):
+                self._check_target(target)
+                async with session.get(
+                    target, allow_redirects=False
+                ) as response:
+                    location = response.headers.get("Location")
+                    if response.status in _REDIRECT_STATUSES and location:
+                        target = urljoin(str(response.url), location)
+                        continue
+                    return await self._read_response(url, response)
+            raise LocalScraperException(f"Too many redirects fetching {url}")
+        except asyncio.TimeoutError:
+            raise LocalScraperException(
+                f"Request timeout after {self.timeout} seconds: {url}"
+            )
+        except aiohttp.ClientError as e:
+            raise LocalScraperException(
+                f"Network error while fetching {url}: {str(e)}"
+            )
+
+    async def _read_response(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse
+    ) -> Dict[str, Any]:
+        """Read a final (non-redirect) response into a fetch result."""
+        if response.status >= 400:
+            raise LocalScraperException(
+                f"HTTP {response.status} fetching {url}"
+            )
+        content_type = response.headers.get(
+            "Content-Type", ""
+        ).split(";")[0].strip().lower()
+        result = {
+            "content_type": content_type,
+            "final_url": str(response.url),
+            "body": None,
+        }
+        if content_type not in _HTML_TYPES + _TEXT_TYPES:
+            return result
+        if (
+            response.content_length is not None
+            and response.content_length > self.max_bytes
+        ):
+            return result
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(65536):
+            size += len(chunk)
+            if size > self.max_bytes:
+                return result
+            chunks.append(chunk)
+        encoding = response.get_encoding()
+        result["body"] = b"".join(chunks).decode(encoding, errors="replace")
+        return result
+
+    async def _convert(
+        self,
+        html: str,
+        url: str,
+        output_format: str
+    ) -> Dict[str, Any]:
+        """Convert HTML on a worker process (or thread for small pages)."""
+        loop = asyncio.get_running_loop()
+        if len(html) < self.inline_threshold:
+            return await asyncio.to_thread(
+                html_to_markdown, html, url, output_format
+            )
+        try:
+            return await loop.run_in_executor(
+                _get_conversion_pool(self.process_workers),
+                html_to_markdown, html, url, output_format
+            )
+        except BrokenProcessPool:
+            logger.warning("HTML conversion pool broken, recreating")
+            _reset_conversion_pool()
+            return await asyncio.to_thread(
+                html_to_markdown, html, url, output_format
+            )
+
+    async def scrape_async(
+        self,
+        url: str,
+        **kwargs
+    ) -> ExtractionResult:
+        """
+        Fetch and convert a single URL locally.
+
+        Args:
+            url: The URL to scrape
+            **kwargs: ``output_format`` ('markdown', 'text' or 'html');
+                other options are ignored
+
+        Returns:
+            ExtractionResult; check ``metadata["needs_escalation"]``
+        """
+        output_format = kwargs.get("output_format") or "markdown"
+        fetched = await self._fetch(url)
+        metadata: Dict[str, Any] = {
+            "url": fetched["final_url"],
+            "content_type": fetched["content_type"],
+            "provider": "local",
+            "needs_escalation": False,
+        }
+
+        body = fetched["body"]
+        if body is None:
+            # Only this URL needs a remote reader, not the whole domain
+            metadata.update(
+                needs_escalation=True,
+                escalation_scope="url",
+                escalation_reason=(
+                    f"unsupported or oversized content "
+                    f"({fetched['content_type'] or 'unknown type'})"
+                ),
+            )
+            return self.standardize_result(
+                url=url, success=False, metadata=metadata,
+                error="Content not supported by local scraper"
+            )
+
+        if fetched["content_type"] in _TEXT_TYPES:
+            return self.standardize_result(
+                url=url, content=body, success=True, metadata=metadata
+            )
+
+        converted = await self._convert(
+            body, fetched["final_url"], output_format
+        )
+        metadata["title"] = converted["title"]
+        metadata["text_length"] = converted["text_length"]
+
+        reason = self._escalation_reason(converted)
+        if reason:
+            metadata.update(
+                needs_escalation=True,
+                escalation_scope="domain",
+                escalation_reason=reason
+            )
+            logger.info(f"Local scrape of {url} needs escalation: {reason}")
+
+        return self.standardize_result(
+            url=url,
+            content=converted["content"],
+            success=True,
+            metadata=metadata
+        )
+
+    def _escalation_reason(self, converted: Dict[str, Any]) -> Optional[str]:
+        """Explain why a converted page is not good enough, if it isn't."""
+        if converted["js_required"]:
+            return "page requires JavaScript"
+        if converted["text_length"] < self.min_content_length:
+            return (
+                f"too little content ({converted['text_length']} chars)"
+            )
+        ratio = converted["text_length"] / max(converted["html_length"], 1)
+        if ratio < self.min_text_ratio:
+            return f"low text-to-markup ratio ({ratio:.3f})"
+        return None
+
+    def scrape(
+        self,
+        url: str,
+        **kwargs
+    ) -> ExtractionResult:
+        """
+        Synchronous scraping method.
+
+        Args:
+            url: The URL to scrape
+            **kwargs: See scrape_async
+
+        Returns:
+            ExtractionResult
+        """
+        async def run():
+            try:
+                return await self.async_retry_with_backoff(
+                    self.scrape_async, url,
+                    exceptions=(LocalScraperException,), **kwargs
+                )
+            finally:
+                await self.close()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+
+        # Called from async context: run on a separate thread
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, run()).result()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/core/scraping/sections.py
+# code style: PEP 8
+
+"""
+Incremental markdown sectioning for streamed page reads.
+
+Scraped pages are consumed as a stream of text chunks and cut into
+markdown-aware sections as they arrive, so the first sections can be
+handed to the agent while the rest of the page is still downloading and
+no single multi-megabyte string is built.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token for section sizing
+CHARS_PER_TOKEN = 4
+
+_HEADING = re.compile(r"^(#{1,3})\s+\S")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of ``text``."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class MarkdownSectionizer:
+    """
+    Cut a stream of markdown into sections.
+
+    A new section starts at each level 1-3 heading outside code fences.
+    Sections longer than ``max_section_tokens`` are split at the last
+    blank line (or, failing that, line) before the limit.
+    """
+
+    def __init__(self, max_section_tokens: int = 1500):
+        """
+        Initialize the sectionizer.
+
+        Args:
+            max_section_tokens: Approximate maximum tokens per section
+        """
+        self.max_chars = max_section_tokens * CHARS_PER_TOKEN
+        self._partial_line = ""
+        self._lines: List[str] = []
+        self._chars = 0
+        self._in_fence = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Add streamed text.
+
+        Args:
+            chunk: Next piece of the document
+
+        Returns:
+            Sections completed by this chunk
+        """
+        text = self._partial_line + chunk
+        lines = text.split("\n")
+        self._partial_line = lines.pop()
+
+        sections = []
+        for line in lines:
+            sections.extend(self._add_line(line + "\n"))
+        return sections
+
+    def close(self) -> List[str]:
+        """
+        Finish the stream.
+
+        Returns:
+            The remaining sections
+        """
+        sections = []
+        if self._partial_line:
+            sections.extend(self._add_line(self._partial_line))
+            self._partial_line = ""
+        if self._lines:
+            sections.append(self._take(len(self._lines)))
+        return [s for s in sections if s.strip()]
+
+    def _add_line(self, line: str) -> List[str]:
+        """Append one line, returning any sections it completes."""
+        sections = []
+        if _FENCE.match(line):
+            self._in_fence = not self._in_fence
+        elif (
+            not self._in_fence
+            and _HEADING.match(line)
+            and self._has_content()
+        ):
+            sections.append(self._take(len(self._lines)))
+
+        self._lines.append(line)
+        self._chars += len(line)
+
+        while self._chars > self.max_chars and len(self._lines) > 1:
+            sections.append(self._take(self._split_point()))
+        return [s for s in sections if s.strip()]
+
+    def _has_content(self) -> bool:
+        """Return True if the buffer holds more than blank lines."""
+        return any(line.strip() for line in self._lines)
+
+    def _split_point(self) -> int:
+        """Number of buffered lines to emit when a section is too long."""
+        size = 0
+        last_fit = 1
+        last_blank = 0
+        for i, line in enumerate(self._lines, start=1):
+            size += len(line)
+            if size > self.max_chars:
+                break
+            last_fit = i
+            if not line.strip():
+                last_blank = i
+        return last_blank or last_fit
+
+    def _take(self, count: int) -> str:
+        """Remove and join the first ``count`` buffered lines."""
+        taken = self._lines[:count]
+        self._lines = self._lines[count:]
+        section = "".join(taken)
+        self._chars -= len(section)
+        return section.strip("\n")
+
+
+class SectionedDocument:
+    """
+    Sections of one page, filled while the page streams in.
+
+    All methods must be called on the event loop that fills the
+    document.
+    """
+
+    def __init__(self, url: str, output_format: str = "markdown"):
+        """
+        Initialize an empty document.
+
+        Args:
+            url: Page URL
+            output_format: Format the page is read in
+        """
+        self.url = url
+        self.output_format = output_format
+        self.created_at = time.monotonic()
+        self.sections: List[str] = []
+        self.complete = False
+        self.error: Optional[str] = None
+        self._changed = asyncio.Event()
+
+    def add(self, sections: List[str]):
+        """Append completed sections."""
+        if sections:
+            self.sections.extend(sections)
+            self._notify()
+
+    def finish(self, error: Optional[str] = None):
+        """Mark the stream as done, optionally with an error."""
+        self.complete = True
+        self.error = error
+        self._notify()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait_for_tokens(
+        self,
+        tokens: int,
+        start: int = 0,
+        timeout: Optional[float] = None
+    ) -> int:
+        """
+        Wait until the sections from ``start`` hold ``tokens`` tokens.
+
+        Args:
+            tokens: Token budget to fill
+            start: Index of the first section
+            timeout: Maximum wait in seconds
+
+        Returns:
+            End index of the sections from ``start`` that fit the budget;
+            at least one section is included if it exists
+        """
+        async def wait():
+            while True:
+                end = self._end_within(tokens, start)
+                if self.complete or end < len(self.sections):
+                    return end
+                await self._changed.wait()
+        return await asyncio.wait_for(wait(), timeout)
+
+    def _end_within(self, tokens: int, start: int) -> int:
+        """End index of the sections from ``start`` fitting ``tokens``."""
+        used = 0
+        for i in range(start, len(self.sections)):
+            used += estimate_tokens(self.sections[i])
+            if used > tokens:
+                return max(i, start + 1)
+        return len(self.sections)
+
+    def total_label(self) -> str:
+        """Section count, marked as a lower bound while streaming."""
+        if self.complete:
+            return str(len(self.sections))
+        return f"{len(self.sections)}+"
+
+
+class SectionStore:
+    """
+    Least-recently-used store of sectioned documents keyed by URL and
+    output format, whose documents expire after a TTL.
+    """
+
+    def __init__(self, max_documents: int = 32, ttl: float = 600.0):
+        """
+        Initialize the store.
+
+        Args:
+            max_documents: Documents kept before the oldest is dropped
+            ttl: Seconds a document is served before the page is read
+                again
+        """
+        self.max_documents = max_documents
+        self.ttl = ttl
+        self._documents: (
+            "OrderedDict[Tuple[str, str], SectionedDocument]"
+        ) = OrderedDict()
+
+    def get(
+        self,
+        url: str,
+        output_format: str = "markdown"
+    ) -> Optional[SectionedDocument]:
+        """Return the document for ``url`` in ``output_format``, if fresh."""
+        key = (url, output_format)
+        document = self._documents.get(key)
+        if document is None:
+            return None
+        if time.monotonic() - document.created_at > self.ttl:
+            del self._documents[key]
+            return None
+        self._documents.move_to_end(key)
+        return document
+
+    def put(self, document: SectionedDocument):
+        """Store a document, evicting the least recently used."""
+        key = (document.url, document.output_format)
+        self._documents[key] = document
+        self._documents.move_to_end(key)
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+
+    def discard(self, url: str, output_format: str = "markdown"):
+        """Forget the document for ``url`` in ``output_format``."""
+        self._documents.pop((url, output_format), None)
@@ -7,7 +7,7 @@
 Search Engines API for web search tools.
 """
 
-from .base import BaseSearchClient, RateLimiter
+from .base import AnswerChunk, BaseSearchClient, RateLimiter
 
 from .search_serper import (
     SerperAPIException,
@@ -39,6 +39,7 @@ from .search_hybrid import (
 
 __all__ = [
     # Base classes
+    "AnswerChunk",
     "BaseSearchClient",
     "RateLimiter",
     # Serper/Google
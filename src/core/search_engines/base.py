@@ -11,6 +11,7 @@ import asyncio
 import logging
 import time
 from abc import ABC
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Callable, TypeVar
 from functools import wraps
@@ -20,6 +21,25 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+@dataclass
+class AnswerChunk:
+    """
+    Partial output of a streaming search or answer call.
+
+    Chunks carry newly generated text and the citations first seen in
+    them; the last chunk of a stream also carries the complete result in
+    the same format as the non-streaming call.
+    """
+    content: str = ""
+    citations: List[str] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+
+    @property
+    def final(self) -> bool:
+        """Whether this is the last chunk of the stream."""
+        return self.result is not None
+
+
 class RateLimiter:
     """Rate limiter implementation for API calls."""
 
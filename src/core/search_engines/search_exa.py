@@ -12,21 +12,22 @@ Get your Exa AI API key for free: https://exa.ai
 import os
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List, Union
+from typing import AsyncIterator, Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-from .base import BaseSearchClient, RateLimiter
+from .base import AnswerChunk, BaseSearchClient, RateLimiter
 from .utils.search_token_counter import count_search_tokens
 from datetime import timedelta
 
 try:
-    from exa_py import Exa
+    from exa_py import AsyncExa, Exa
 
     HAS_EXA_PY = True
 except ImportError:
     HAS_EXA_PY = False
     Exa = None
+    AsyncExa = None
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -147,6 +148,10 @@ class ExaSearchClient(BaseSearchClient):
         except Exception as e:
             raise ExaSearchException(f"Failed to initialize Exa client: {str(e)}")
 
+        # Async client, bound to the event loop it was created on
+        self._async_client = None
+        self._async_client_loop = None
+
         logger.info(f"Exa Search Client initialized with base URL: {self.base_url}")
 
     def search(
@@ -593,38 +598,211 @@ class ExaSearchClient(BaseSearchClient):
             results.append(content)
         return results
 
+    async def _get_async_client(self) -> "AsyncExa":
+        """
+        Get the async Exa client for the running event loop.
+
+        The client's HTTP pool is bound to the loop that created it, so the
+        previous loop's pool is closed when the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            previous = self._async_client
+            self._async_client = AsyncExa(
+                api_key=self.api_key,
+                api_base=self.base_url
+            )
+            self._async_client_loop = loop
+            http_client = getattr(previous, "_client", None)
+            if http_client is not None:
+                try:
+                    await http_client.aclose()
+                except Exception as e:
+                    logger.debug(f"Failed to close Exa HTTP client: {str(e)}")
+        return self._async_client
+
     async def search_async(
         self,
         query: str,
         num: int = 10,
+        search_type: str = "neural",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        start_crawl_date: Optional[str] = None,
+        end_crawl_date: Optional[str] = None,
+        use_autoprompt: bool = False,
+        category: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Async version of search method.
+        Async version of search method, using Exa's async client.
+
+        Args:
+            query: Search query string
+            num: Number of results to return (default: 10)
+            search_type: Type of search - "neural" or "keyword"
+            include_domains: List of domains to include in search
+            exclude_domains: List of domains to exclude from search
+            start_published_date: Filter by publication date (YYYY-MM-DD)
+            end_published_date: Filter by publication date (YYYY-MM-DD)
+            start_crawl_date: Filter by crawl date (YYYY-MM-DD)
+            end_crawl_date: Filter by crawl date (YYYY-MM-DD)
+            use_autoprompt: Convert query to optimized Exa query
+            category: Category to focus on (e.g., "company")
 
-        Note: This is a wrapper that runs the sync Exa client in an executor
-        since the exa_py library doesn't provide native async support.
+        Returns:
+            Dictionary containing search results and metadata
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.search(query, num, **kwargs)
-        )
+        if not query or not query.strip():
+            raise ExaSearchException("Search query cannot be empty")
+
+        if num < 1 or num > 100:
+            raise ExaSearchException("Number of results must be between 1 and 100")
+
+        try:
+            search_response = await self.async_retry_with_backoff(
+                (await self._get_async_client()).search,
+                query,
+                num_results=num,
+                type=search_type,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                start_published_date=start_published_date,
+                end_published_date=end_published_date,
+                start_crawl_date=start_crawl_date,
+                end_crawl_date=end_crawl_date,
+                use_autoprompt=use_autoprompt,
+                category=category,
+                exceptions=(Exception,)
+            )
+
+            return self._process_search_results(search_response, query)
+
+        except Exception as e:
+            logger.error(f"Async search error: {str(e)}")
+            raise ExaSearchException(f"Search failed: {str(e)}")
 
     async def find_similar_async(
         self,
         url: str,
         num: int = 10,
-        **kwargs
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        start_published_date: Optional[str] = None,
+        end_published_date: Optional[str] = None,
+        exclude_source_domain: bool = True,
+        category: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        Async version of find_similar method.
+        Async version of find_similar method, using Exa's async client.
+
+        Args:
+            url: URL to find similar documents for
+            num: Number of results to return
+            include_domains: List of domains to include
+            exclude_domains: List of domains to exclude
+            start_published_date: Filter by publication date (YYYY-MM-DD)
+            end_published_date: Filter by publication date (YYYY-MM-DD)
+            exclude_source_domain: Exclude results from the source domain
+            category: Category to focus on (e.g., "company")
+
+        Returns:
+            Dictionary containing similar documents
+        """
+        if not url or not url.strip():
+            raise ExaSearchException("URL cannot be empty")
+
+        try:
+            response = await self.async_retry_with_backoff(
+                (await self._get_async_client()).find_similar,
+                url,
+                num_results=num,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                start_published_date=start_published_date,
+                end_published_date=end_published_date,
+                exclude_source_domain=exclude_source_domain,
+                category=category,
+                exceptions=(Exception,)
+            )
+
+            return self._process_search_results(response, f"Similar to: {url}")
+
+        except Exception as e:
+            logger.error(f"Async find similar error: {str(e)}")
+            raise ExaSearchException(f"Find similar failed: {str(e)}")
+
+    async def stream_answer_async(
+        self,
+        query: str,
+        text: bool = False
+    ) -> AsyncIterator[AnswerChunk]:
+        """
+        Stream an answer to a question with its citations.
+
+        Args:
+            query: Question to answer
+            text: Include source text in the citations
+
+        Yields:
+            AnswerChunk objects with partial answer text and newly seen
+            citation URLs; the last one carries the complete result
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.find_similar(url, num, **kwargs)
+        if not query or not query.strip():
+            raise ExaSearchException("Question cannot be empty")
+
+        parts: List[str] = []
+        citations: List[str] = []
+        sources: List[Dict[str, Any]] = []
+        try:
+            client = await self._get_async_client()
+            stream = await client.stream_answer(query, text=text)
+        except Exception as e:
+            logger.error(f"Stream answer error: {str(e)}")
+            raise ExaSearchException(f"Stream answer failed: {str(e)}")
+
+        try:
+            async for chunk in stream:
+                new_citations = []
+                for citation in chunk.citations or []:
+                    if citation.url and citation.url not in citations:
+                        citations.append(citation.url)
+                        new_citations.append(citation.url)
+                        sources.append({
+                            "title": citation.title,
+                            "url": citation.url,
+                            "published_date": citation.published_date,
+                            "author": citation.author,
+                            "text": citation.text,
+                        })
+                if chunk.content:
+                    parts.append(chunk.content)
+                if chunk.content or new_citations:
+                    yield AnswerChunk(
+                        content=chunk.content or "",
+                        citations=new_citations
+                    )
+        except Exception as e:
+            logger.error(f"Stream answer error: {str(e)}")
+            raise ExaSearchException(f"Stream answer failed: {str(e)}")
+        finally:
+            # Release the connection when the consumer stops early
+            raw_response = getattr(stream, "_raw_response", None)
+            if raw_response is not None:
+                await raw_response.aclose()
+
+        result: Dict[str, Any] = {
+            "query": query,
+            "answer": "".join(parts),
+            "citations": citations,
+            "sources": sources,
+        }
+        result["usage"] = count_search_tokens(
+            query=query, response=result, provider="exa"
         )
+        yield AnswerChunk(result=result)
 
 
 # Convenience functions for backward compatibility
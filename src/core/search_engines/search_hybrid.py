@@ -16,17 +16,22 @@ parallel execution, and standardized result formatting.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Literal, Set
+from typing import (
+    AsyncIterator, Dict, Any, Optional, List, Literal, Set, TYPE_CHECKING
+)
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 from concurrent.futures import ThreadPoolExecutor
 
-from .base import BaseSearchClient
+from .base import AnswerChunk, BaseSearchClient
 from .search_serper import GoogleSerperClient
-from .search_xcom import XAISearchClient
+from .search_xcom import XAISearchClient, detect_x_query
 from .search_jina import JinaSearchClient
 from .search_exa import ExaSearchClient
 from .utils.search_token_counter import SearchUsage
 
+if TYPE_CHECKING:
+    from src.core.scraping.prefetch import ScrapePrefetcher
+
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +68,8 @@ class HybridSearchEngine(BaseSearchClient):
         max_retries: int = 2,
         parallel: bool = True,
         deduplicate: bool = True,
+        prefetcher: Optional["ScrapePrefetcher"] = None,
+        prefetch_top_k: Optional[int] = None,
     ):
         """
         Initialize HybridSearchEngine.
@@ -74,6 +81,10 @@ class HybridSearchEngine(BaseSearchClient):
             max_retries: Maximum retry attempts per provider
             parallel: Execute searches in parallel
             deduplicate: Enable URL deduplication
+            prefetcher: Optional prefetcher that starts scraping the top
+                results in the background after each search
+            prefetch_top_k: Results prefetched per search (default: the
+                prefetcher's top_k)
         """
         super().__init__(
             api_key=None,  # We manage multiple keys
@@ -84,6 +95,8 @@ class HybridSearchEngine(BaseSearchClient):
         self.api_keys = api_keys or {}
         self.parallel = parallel
         self.deduplicate = deduplicate
+        self.prefetcher = prefetcher
+        self.prefetch_top_k = prefetch_top_k
 
         # Initialize provider clients
         self.clients = {}
@@ -235,6 +248,9 @@ class HybridSearchEngine(BaseSearchClient):
         # Calculate total usage
         total_usage = self._aggregate_usage(results_by_provider)
 
+        # Start reading the top results while the caller reasons
+        self._prefetch(paginated_results)
+
         return {
             "results": paginated_results,
             "query": query,
@@ -251,6 +267,18 @@ class HybridSearchEngine(BaseSearchClient):
             "aggregation_strategy": aggregation_strategy,
         }
 
+    def _prefetch(self, results: List[Dict[str, Any]]):
+        """Schedule speculative scrapes of the top result URLs."""
+        if self.prefetcher is None or not results:
+            return
+        try:
+            self.prefetcher.prefetch(
+                [result.get("url") for result in results],
+                top_k=self.prefetch_top_k
+            )
+        except Exception as e:
+            logger.warning(f"Failed to schedule result prefetch: {e}")
+
     def _get_active_providers(
         self,
         providers: Optional[List[str]] = None
@@ -873,6 +901,9 @@ class HybridSearchEngine(BaseSearchClient):
         # Calculate total usage
         total_usage = self._aggregate_usage(results_by_provider)
 
+        # Start reading the top results while the caller reasons
+        self._prefetch(paginated_results)
+
         return {
             "results": paginated_results,
             "query": query,
@@ -890,6 +921,58 @@ class HybridSearchEngine(BaseSearchClient):
         }
 
 
+    async def stream_answer(
+        self,
+        query: str,
+        provider: Optional[str] = None,
+        num: int = 10,
+        **kwargs
+    ) -> AsyncIterator[AnswerChunk]:
+        """
+        Stream a cited answer from an answer-capable provider.
+
+        X.com queries go to xAI Live Search and other queries to Exa,
+        falling back to whichever of the two is available.
+
+        Args:
+            query: Question or search query
+            provider: Provider to use ("xai" or "exa"; default: auto)
+            num: Maximum number of sources (xAI only)
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            AnswerChunk objects with partial content and newly seen
+            citations; the last one carries the provider's result with a
+            "provider" field added
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+
+        if provider is None:
+            preferred = (
+                ["xai", "exa"] if detect_x_query(query) else ["exa", "xai"]
+            )
+            provider = next(
+                (p for p in preferred if p in self.clients), None
+            )
+        client = self.clients.get(provider) if provider else None
+        if client is None or not hasattr(client, "stream_answer_async"):
+            raise ValueError(
+                f"No streaming answer provider available: {provider}"
+            )
+
+        logger.info(f"Streaming answer with {provider}: '{query}'")
+        if provider == "xai":
+            stream = client.stream_answer_async(query, num=num, **kwargs)
+        else:
+            stream = client.stream_answer_async(query, **kwargs)
+
+        async for chunk in stream:
+            if chunk.final:
+                chunk.result["provider"] = provider
+            yield chunk
+
+
 # Convenience function
 def hybrid_search(
     query: str,
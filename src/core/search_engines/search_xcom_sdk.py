@@ -11,13 +11,13 @@ API Base URL: (api.x.ai)
 
 import os
 import asyncio
-from typing import Dict, Any, Optional, List, Union
+from typing import AsyncIterator, Dict, Any, Optional, List, Union
 from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
 try:
-    from xai_sdk import Client
+    from xai_sdk import AsyncClient, Client
     from xai_sdk.chat import user
     from xai_sdk.search import (
         SearchParameters,
@@ -29,7 +29,7 @@ try:
 except ImportError:
     raise ImportError("xai-sdk is required. Install with: pip install xai-sdk")
 
-from .base import BaseSearchClient
+from .base import AnswerChunk, BaseSearchClient
 from .utils.search_token_counter import count_search_tokens
 
 logger = logging.getLogger(__name__)
@@ -80,6 +80,41 @@ class XAISearchClient(BaseSearchClient):
         self.model = model
         # Initialize xAI SDK client
         self.client = Client(api_key=self.api_key)
+        # Async client, bound to the event loop it was created on
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def _get_async_client(self) -> AsyncClient:
+        """
+        Get the async xAI SDK client for the running event loop.
+
+        A client's gRPC channels are bound to the loop that created them,
+        so the previous loop's client is closed when the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            previous = self._async_client
+            self._async_client = AsyncClient(
+                api_key=self.api_key, timeout=self.timeout
+            )
+            self._async_client_loop = loop
+            if previous is not None:
+                await self._close_async_client(previous)
+        return self._async_client
+
+    @staticmethod
+    async def _close_async_client(client: AsyncClient):
+        """Close the gRPC channels of a replaced async client."""
+        for channel in (
+            getattr(client, "_api_channel", None),
+            getattr(client, "_management_channel", None),
+        ):
+            if channel is None:
+                continue
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.debug(f"Failed to close xAI channel: {str(e)}")
 
     def _extract_token_usage(self, usage_data: Dict[str, Any]) -> Dict[str, int]:
         """
@@ -244,24 +279,19 @@ class XAISearchClient(BaseSearchClient):
 
         return search_sources
 
-    def search(self, query: str, num: int = 10, **kwargs) -> Dict[str, Any]:
+    def _build_search_parameters(
+        self, query: str, num: int, **kwargs
+    ) -> SearchParameters:
         """
-        Perform a search using xAI's Live Search API.
+        Build Live Search parameters for a query.
 
         Args:
             query: Search query
             num: Maximum number of results to return
-            **kwargs: Additional parameters including:
-                - sources: List of source types ("x", "web", "news", "rss")
-                - mode: Search mode ("auto", "on", "off")
-                - from_date, to_date: Date range
-                - x_handles, included_x_handles, excluded_x_handles
-                - post_favorite_count, post_view_count
-                - country, excluded_websites, allowed_websites
-                - safe_search, rss_links
+            **kwargs: Search options (see ``search``)
 
         Returns:
-            Dictionary containing search results with metadata
+            SearchParameters object
         """
         if not query:
             raise ValueError("Search query cannot be empty")
@@ -303,10 +333,73 @@ class XAISearchClient(BaseSearchClient):
         # Build sources
         search_params["sources"] = self._build_search_sources(sources, **kwargs)
 
+        return SearchParameters(**search_params)
+
+    def _process_response(self, response: Any, query: str) -> Dict[str, Any]:
+        """
+        Process a complete chat response into search results.
+
+        Args:
+            response: Sampled or fully streamed xAI chat response
+            query: Original search query
+
+        Returns:
+            Dictionary containing search results with metadata
+        """
+        # Extract content and citations
+        content = response.content if hasattr(response, "content") else ""
+        citations = response.citations if hasattr(response, "citations") else []
+
+        # Extract usage if available
+        usage_data = {}
+        if hasattr(response, "usage") and response.usage:
+            usage_data = {
+                "total_tokens": getattr(response.usage, "total_tokens", 0),
+                "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
+                "completion_tokens": getattr(
+                    response.usage, "completion_tokens", 0
+                ),
+            }
+            # Check for detailed usage
+            if hasattr(response.usage, "prompt_tokens_details"):
+                usage_data["prompt_tokens_details"] = (
+                    response.usage.prompt_tokens_details
+                )
+            if hasattr(response.usage, "completion_tokens_details"):
+                usage_data["completion_tokens_details"] = (
+                    response.usage.completion_tokens_details
+                )
+
+        # Process results into standard format
+        return self._process_xai_results(
+            content, list(citations), usage_data, query
+        )
+
+    def search(self, query: str, num: int = 10, **kwargs) -> Dict[str, Any]:
+        """
+        Perform a search using xAI's Live Search API.
+
+        Args:
+            query: Search query
+            num: Maximum number of results to return
+            **kwargs: Additional parameters including:
+                - sources: List of source types ("x", "web", "news", "rss")
+                - mode: Search mode ("auto", "on", "off")
+                - from_date, to_date: Date range
+                - x_handles, included_x_handles, excluded_x_handles
+                - post_favorite_count, post_view_count
+                - country, excluded_websites, allowed_websites
+                - safe_search, rss_links
+
+        Returns:
+            Dictionary containing search results with metadata
+        """
+        search_parameters = self._build_search_parameters(query, num, **kwargs)
+
         try:
             # Create chat with search parameters
             chat = self.client.chat.create(
-                model=self.model, search_parameters=SearchParameters(**search_params)
+                model=self.model, search_parameters=search_parameters
             )
 
             # Add user query
@@ -315,35 +408,7 @@ class XAISearchClient(BaseSearchClient):
             # Get response
             response = chat.sample()
 
-            # Extract content and citations
-            content = response.content if hasattr(response, "content") else ""
-            citations = response.citations if hasattr(response, "citations") else []
-
-            # Extract usage if available
-            usage_data = {}
-            if hasattr(response, "usage") and response.usage:
-                usage_data = {
-                    "total_tokens": getattr(response.usage, "total_tokens", 0),
-                    "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
-                    "completion_tokens": getattr(
-                        response.usage, "completion_tokens", 0
-                    ),
-                }
-                # Check for detailed usage
-                if hasattr(response.usage, "prompt_tokens_details"):
-                    usage_data["prompt_tokens_details"] = (
-                        response.usage.prompt_tokens_details
-                    )
-                if hasattr(response.usage, "completion_tokens_details"):
-                    usage_data["completion_tokens_details"] = (
-                        response.usage.completion_tokens_details
-                    )
-
-            # Process results into standard format
-            results = self._process_xai_results(
-                content, list(citations), usage_data, query
-            )
-            return results
+            return self._process_response(response, query)
 
         except Exception as e:
             logger.error(f"xAI search error: {str(e)}")
@@ -385,23 +450,71 @@ class XAISearchClient(BaseSearchClient):
 
     async def search_async(self, query: str, num: int = 10, **kwargs) -> Dict[str, Any]:
         """
-        Async version of search method.
-
-        Note: The xai-sdk doesn't have native async support yet,
-        so we run the sync version in an executor.
+        Async version of search method, using the SDK's async client.
 
         Args:
             query: Search query
             num: Maximum number of results to return
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (see ``search``)
 
         Returns:
             Dictionary containing search results with metadata
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, lambda: self.search(query, num, **kwargs)
-        )
+        search_parameters = self._build_search_parameters(query, num, **kwargs)
+
+        try:
+            chat = (await self._get_async_client()).chat.create(
+                model=self.model, search_parameters=search_parameters
+            )
+            chat.append(user(query))
+            response = await chat.sample()
+
+            return self._process_response(response, query)
+
+        except Exception as e:
+            logger.error(f"xAI async search error: {str(e)}")
+            raise ValueError(f"Error in xAI search: {str(e)}")
+
+    async def stream_answer_async(
+        self, query: str, num: int = 10, **kwargs
+    ) -> AsyncIterator[AnswerChunk]:
+        """
+        Stream a Live Search answer as it is generated.
+
+        Args:
+            query: Search query
+            num: Maximum number of results to return
+            **kwargs: Additional parameters (see ``search``)
+
+        Yields:
+            AnswerChunk objects with partial content and newly seen
+            citation URLs; the last one carries the same result as
+            ``search``
+        """
+        search_parameters = self._build_search_parameters(query, num, **kwargs)
+
+        try:
+            chat = (await self._get_async_client()).chat.create(
+                model=self.model, search_parameters=search_parameters
+            )
+            chat.append(user(query))
+
+            response = None
+            async for response, chunk in chat.stream():
+                if chunk.content or chunk.citations:
+                    yield AnswerChunk(
+                        content=chunk.content,
+                        citations=list(chunk.citations)
+                    )
+
+        except Exception as e:
+            logger.error(f"xAI stream error: {str(e)}")
+            raise ValueError(f"Error in xAI search: {str(e)}")
+
+        if response is None:
+            yield AnswerChunk(result=self._process_xai_results("", [], {}, query))
+        else:
+            yield AnswerChunk(result=self._process_response(response, query))
 
     async def search_x_content_async(
         self,
@@ -6,17 +6,29 @@
 """
 XAI Live Search Client for X.com Deep Q&A Tool.
 Uses xAI SDK's Live Search API to provide advanced X.com search and analysis.
+
+Every operation is available as a blocking call, a native async call and
+a stream of partial content and citations (``stream``), since answers
+often take tens of seconds to generate.
+
+Several posts can be read at once (``read_x_posts``): posts are grouped
+by handle into batches of nearby status IDs, each batch is read with one
+live-search request, and posts already read are served from a cache.
 """
 
 import os
 import re
+import time
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 from dotenv import load_dotenv
 
 try:
-    from xai_sdk import Client
+    from xai_sdk import AsyncClient, Client
     from xai_sdk.chat import user
     from xai_sdk.search import (
         SearchParameters,
@@ -25,8 +37,39 @@ try:
 except ImportError:
     raise ImportError("xai-sdk is required. Install with: pip install xai-sdk")
 
+from ..search_engines.base import AnswerChunk
+
 logger = logging.getLogger(__name__)
 
+# Snowflake status IDs carry the post time in milliseconds since this
+# epoch above bit 22; older IDs were sequential
+_SNOWFLAKE_EPOCH_MS = 1288834974657
+_FIRST_SNOWFLAKE_ID = 29700859247
+
+# Section heading that starts each post of a batched read
+_POST_HEADING = re.compile(r"^#{1,6}\s*POST\s+(\d+)\b.*$", re.MULTILINE)
+
+
+def status_time(status_id: Optional[str]) -> Optional[datetime]:
+    """
+    Creation time (naive UTC) of a post, decoded from its status ID.
+
+    Args:
+        status_id: X.com status ID
+
+    Returns:
+        Post creation time, or None for non-snowflake IDs
+    """
+    try:
+        value = int(status_id)
+    except (TypeError, ValueError):
+        return None
+    if value < _FIRST_SNOWFLAKE_ID:
+        return None
+    return datetime(1970, 1, 1) + timedelta(
+        milliseconds=(value >> 22) + _SNOWFLAKE_EPOCH_MS
+    )
+
 
 class XAILiveSearchClient:
     """
@@ -43,6 +86,9 @@ class XAILiveSearchClient:
         timeout: int = 1200,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_batch_size: int = 10,
+        post_cache_size: int = 256,
+        post_cache_ttl: float = 3600.0,
     ):
         """
         Initialize XAILiveSearchClient.
@@ -53,6 +99,9 @@ class XAILiveSearchClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            max_batch_size: Maximum posts read in one batched request
+            post_cache_size: Maximum posts kept in the read cache
+            post_cache_ttl: Seconds a read post stays cached
         """
         # Get API key from environment if not provided
         if not api_key:
@@ -69,9 +118,53 @@ class XAILiveSearchClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_batch_size = max_batch_size
+        self.post_cache_size = post_cache_size
+        self.post_cache_ttl = post_cache_ttl
+
+        # Posts already read by this client, keyed by status ID
+        self._posts: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._posts_lock = threading.Lock()
 
         # Initialize xAI SDK client
         self.client = Client(api_key=self.api_key)
+        # Async client, bound to the event loop it was created on
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def _get_async_client(self) -> AsyncClient:
+        """
+        Get the async xAI SDK client for the running event loop.
+
+        A client's gRPC channels are bound to the loop that created them,
+        so the previous loop's client is closed when the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            previous = self._async_client
+            self._async_client = AsyncClient(
+                api_key=self.api_key, timeout=self.timeout
+            )
+            self._async_client_loop = loop
+            if previous is not None:
+                await self._close_async_client(previous)
+        return self._async_client
+
+    @staticmethod
+    async def _close_async_client(client: AsyncClient):
+        """Close the gRPC channels of a replaced async client."""
+        for channel in (
+            getattr(client, "_api_channel", None),
+            getattr(client, "_management_channel", None),
+        ):
+            if channel is None:
+                continue
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.debug(f"Failed to close xAI channel: {str(e)}")
 
     @staticmethod
     def extract_username_from_url(url: str) -> Optional[str]:
@@ -193,38 +286,36 @@ class XAILiveSearchClient:
 
         return SearchParameters(**params)
 
-    def search_x_posts(
+    def _prepare(
         self,
-        query: str,
+        operation: str,
+        query_or_url: Optional[str],
         search_params: Optional[Dict[str, Any]] = None,
+        question: Optional[str] = None,
         max_results: int = 20,
-    ) -> Dict[str, Any]:
+    ) -> Tuple[SearchParameters, str, Dict[str, Any]]:
         """
-        Search X.com posts with advanced filtering.
+        Build the search parameters, prompt and result fields of a request.
 
         Args:
-            query: Search query
+            operation: 'search', 'read' or 'query'
+            query_or_url: Search query, post URL or search context
             search_params: Optional search filters
-            max_results: Maximum number of results
+            question: Question for 'query'
+            max_results: Maximum number of results for 'search'
 
         Returns:
-            Dict with search results and metadata
+            Tuple of (search parameters, prompt, identifying result fields)
         """
-        try:
+        if operation == "search":
             # Build search parameters
             search_parameters = self._build_search_parameters(
                 search_params, max_results
             )
 
-            # Create chat with search
-            chat = self.client.chat.create(
-                model=self.model,
-                search_parameters=search_parameters,
-            )
-
             # Construct search prompt
             prompt = (
-                f"Search X.com for: {query}\n\n"
+                f"Search X.com for: {query_or_url}\n\n"
                 "Please find and analyze the most relevant X posts. "
                 "For each post, include:\n"
                 "1. Author username and display name\n"
@@ -236,70 +327,21 @@ class XAILiveSearchClient:
                 "Format the results as a structured list with clear "
                 "sections for each post."
             )
+            fields = {"query": query_or_url, "search_params": search_params}
 
-            chat.append(user(prompt))
-            response = chat.sample()
-
-            # Extract structured results
-            results = {
-                "success": True,
-                "query": query,
-                "search_params": search_params,
-                "content": response.content,
-                "citations": list(response.citations) if response.citations else [],
-                "posts_found": len(response.citations) if response.citations else 0,
-                "usage": {
-                    "total_tokens": response.usage.total_tokens,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                }
-            }
-
-            logger.info(
-                f"X.com search completed: '{query}' - "
-                f"found {results['posts_found']} posts"
-            )
-
-            return results
-
-        except Exception as e:
-            error_msg = f"Error searching X.com posts: {str(e)}"
-            logger.error(error_msg)
-            return {
-                "success": False,
-                "error": error_msg,
-                "query": query,
-                "search_params": search_params,
-            }
-
-    def read_x_post(self, url: str) -> Dict[str, Any]:
-        """
-        Read and extract detailed content from a specific X.com post URL.
-
-        Args:
-            url: X.com post URL
-
-        Returns:
-            Dict with post content and metadata
-        """
-        try:
+        elif operation == "read":
             # Extract username for targeted search
+            url = query_or_url
             username = self.extract_username_from_url(url)
             status_id = self.extract_status_id_from_url(url)
 
             # Build search parameters targeting the specific post
-            search_params = {}
+            read_params = {}
             if username:
-                search_params["included_x_handles"] = [username]
+                read_params["included_x_handles"] = [username]
 
             search_parameters = self._build_search_parameters(
-                search_params, max_results=5
-            )
-
-            # Create chat with search
-            chat = self.client.chat.create(
-                model=self.model,
-                search_parameters=search_parameters,
+                read_params, max_results=5
             )
 
             # Construct read prompt
@@ -316,56 +358,10 @@ class XAILiveSearchClient:
                 "7. Top replies or notable interactions\n\n"
                 "Format the information in a clear, structured way."
             )
+            fields = {"url": url, "username": username, "status_id": status_id}
 
-            chat.append(user(prompt))
-            response = chat.sample()
-
-            # Extract structured results
-            results = {
-                "success": True,
-                "url": url,
-                "username": username,
-                "status_id": status_id,
-                "content": response.content,
-                "citations": list(response.citations) if response.citations else [],
-                "usage": {
-                    "total_tokens": response.usage.total_tokens,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                }
-            }
-
-            logger.info(f"Successfully read X.com post: {url}")
-
-            return results
-
-        except Exception as e:
-            error_msg = f"Error reading X.com post {url}: {str(e)}"
-            logger.error(error_msg)
-            return {
-                "success": False,
-                "error": error_msg,
-                "url": url,
-            }
-
-    def query_x_content(
-        self,
-        question: str,
-        search_context: Optional[str] = None,
-        search_params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """
-        Ask questions about X.com content with optional search context.
-
-        Args:
-            question: Question to ask
-            search_context: Optional search query for context
-            search_params: Optional search filters
-
-        Returns:
-            Dict with AI-powered answer and supporting data
-        """
-        try:
+        elif operation == "query":
+            search_context = query_or_url
             # Build search parameters if context provided
             if search_context:
                 search_parameters = self._build_search_parameters(
@@ -379,12 +375,6 @@ class XAILiveSearchClient:
                     return_citations=True,
                 )
 
-            # Create chat with search
-            chat = self.client.chat.create(
-                model=self.model,
-                search_parameters=search_parameters,
-            )
-
             # Construct query prompt
             if search_context:
                 prompt = (
@@ -402,39 +392,640 @@ class XAILiveSearchClient:
                     "X posts can help answer this question, search for "
                     "and include them with proper citations."
                 )
-
-            chat.append(user(prompt))
-            response = chat.sample()
-
-            # Extract structured results
-            results = {
-                "success": True,
+            fields = {
                 "question": question,
                 "search_context": search_context,
                 "search_params": search_params,
-                "answer": response.content,
-                "citations": list(response.citations) if response.citations else [],
-                "sources_used": len(response.citations) if response.citations else 0,
-                "usage": {
-                    "total_tokens": response.usage.total_tokens,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                }
             }
 
+        else:
+            raise ValueError(f"Unknown operation: '{operation}'")
+
+        return search_parameters, prompt, fields
+
+    def _finish(
+        self,
+        operation: str,
+        fields: Dict[str, Any],
+        response: Any,
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a completed request.
+
+        Args:
+            operation: 'search', 'read' or 'query'
+            fields: Identifying result fields from ``_prepare``
+            response: Sampled or fully streamed chat response
+
+        Returns:
+            Dict with content, citations, usage and the request fields
+        """
+        citations = list(response.citations) if response.citations else []
+        results = {"success": True, **fields}
+        if operation == "query":
+            results["answer"] = response.content
+            results["citations"] = citations
+            results["sources_used"] = len(citations)
+        else:
+            results["content"] = response.content
+            results["citations"] = citations
+            if operation == "search":
+                results["posts_found"] = len(citations)
+        results["usage"] = {
+            "total_tokens": response.usage.total_tokens,
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+        }
+
+        if operation == "search":
             logger.info(
-                f"X.com Q&A completed: '{question}' - "
+                f"X.com search completed: '{fields['query']}' - "
+                f"found {results['posts_found']} posts"
+            )
+        elif operation == "read":
+            logger.info(f"Successfully read X.com post: {fields['url']}")
+        else:
+            logger.info(
+                f"X.com Q&A completed: '{fields['question']}' - "
                 f"used {results['sources_used']} sources"
             )
+        return results
+
+    @staticmethod
+    def _failure(
+        operation: str,
+        query_or_url: Optional[str],
+        fields: Dict[str, Any],
+        error: Exception,
+    ) -> Dict[str, Any]:
+        """Build the result of a failed request."""
+        if operation == "search":
+            error_msg = f"Error searching X.com posts: {str(error)}"
+        elif operation == "read":
+            error_msg = f"Error reading X.com post {query_or_url}: {str(error)}"
+        else:
+            error_msg = f"Error querying X.com content: {str(error)}"
+        logger.error(error_msg)
+        return {"success": False, "error": error_msg, **fields}
+
+    @staticmethod
+    def _request_fields(
+        operation: str,
+        query_or_url: Optional[str],
+        search_params: Optional[Dict[str, Any]],
+        question: Optional[str],
+    ) -> Dict[str, Any]:
+        """Identifying fields reported when a request fails."""
+        if operation == "read":
+            return {"url": query_or_url}
+        if operation == "query":
+            return {"question": question, "search_context": query_or_url}
+        return {"query": query_or_url, "search_params": search_params}
+
+    def _sample(self, search_parameters: SearchParameters, prompt: str):
+        """Sample one live-search chat response."""
+        # Create chat with search
+        chat = self.client.chat.create(
+            model=self.model,
+            search_parameters=search_parameters,
+        )
+        chat.append(user(prompt))
+        return chat.sample()
+
+    async def _sample_async(
+        self, search_parameters: SearchParameters, prompt: str
+    ):
+        """Sample one live-search chat response on the async client."""
+        chat = (await self._get_async_client()).chat.create(
+            model=self.model,
+            search_parameters=search_parameters,
+        )
+        chat.append(user(prompt))
+        return await chat.sample()
+
+    def _run(self, operation: str, query_or_url: Optional[str], **kwargs):
+        """Run a request to completion."""
+        fields = self._request_fields(
+            operation, query_or_url, kwargs.get("search_params"),
+            kwargs.get("question")
+        )
+        try:
+            search_parameters, prompt, fields = self._prepare(
+                operation, query_or_url, **kwargs
+            )
+            response = self._sample(search_parameters, prompt)
 
-            return results
+            return self._finish(operation, fields, response)
 
         except Exception as e:
-            error_msg = f"Error querying X.com content: {str(e)}"
-            logger.error(error_msg)
-            return {
-                "success": False,
-                "error": error_msg,
-                "question": question,
-                "search_context": search_context,
+            return self._failure(operation, query_or_url, fields, e)
+
+    async def _run_async(
+        self, operation: str, query_or_url: Optional[str], **kwargs
+    ):
+        """Run a request to completion on the async client."""
+        fields = self._request_fields(
+            operation, query_or_url, kwargs.get("search_params"),
+            kwargs.get("question")
+        )
+        try:
+            search_parameters, prompt, fields = self._prepare(
+                operation, query_or_url, **kwargs
+            )
+            response = await self._sample_async(search_parameters, prompt)
+
+            return self._finish(operation, fields, response)
+
+        except Exception as e:
+            return self._failure(operation, query_or_url, fields, e)
+
+    async def stream(
+        self,
+        operation: str,
+        query_or_url: Optional[str],
+        search_params: Optional[Dict[str, Any]] = None,
+        question: Optional[str] = None,
+        max_results: int = 20,
+    ) -> AsyncIterator[AnswerChunk]:
+        """
+        Stream a request's answer as it is generated.
+
+        Args:
+            operation: 'search', 'read' or 'query'
+            query_or_url: Search query, post URL or search context
+            search_params: Optional search filters
+            question: Question for 'query'
+            max_results: Maximum number of results for 'search'
+
+        Yields:
+            AnswerChunk objects with partial content and newly seen
+            citations; the last one carries the same result dict as the
+            blocking call, including failures
+        """
+        if operation == "read":
+            cached = self._cached_post(
+                self.extract_status_id_from_url(query_or_url)
+            )
+            if cached is not None:
+                cached["url"] = query_or_url
+                yield AnswerChunk(
+                    content=cached.get("content") or "",
+                    citations=list(cached.get("citations") or []),
+                )
+                yield AnswerChunk(result=cached)
+                return
+
+        fields = self._request_fields(
+            operation, query_or_url, search_params, question
+        )
+        try:
+            search_parameters, prompt, fields = self._prepare(
+                operation, query_or_url,
+                search_params=search_params,
+                question=question,
+                max_results=max_results,
+            )
+
+            chat = (await self._get_async_client()).chat.create(
+                model=self.model,
+                search_parameters=search_parameters,
+            )
+            chat.append(user(prompt))
+
+            response = None
+            async for response, chunk in chat.stream():
+                if chunk.content or chunk.citations:
+                    yield AnswerChunk(
+                        content=chunk.content,
+                        citations=list(chunk.citations),
+                    )
+            if response is None:
+                raise ValueError("Empty response stream")
+            result = self._finish(operation, fields, response)
+            if operation == "read":
+                self._cache_post(result.get("status_id"), result)
+
+        except Exception as e:
+            result = self._failure(operation, query_or_url, fields, e)
+
+        yield AnswerChunk(result=result)
+
+    def search_x_posts(
+        self,
+        query: str,
+        search_params: Optional[Dict[str, Any]] = None,
+        max_results: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Search X.com posts with advanced filtering.
+
+        Args:
+            query: Search query
+            search_params: Optional search filters
+            max_results: Maximum number of results
+
+        Returns:
+            Dict with search results and metadata
+        """
+        return self._run(
+            "search", query,
+            search_params=search_params, max_results=max_results
+        )
+
+    async def search_x_posts_async(
+        self,
+        query: str,
+        search_params: Optional[Dict[str, Any]] = None,
+        max_results: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Async version of search_x_posts.
+
+        Args:
+            query: Search query
+            search_params: Optional search filters
+            max_results: Maximum number of results
+
+        Returns:
+            Dict with search results and metadata
+        """
+        return await self._run_async(
+            "search", query,
+            search_params=search_params, max_results=max_results
+        )
+
+    def read_x_post(self, url: str) -> Dict[str, Any]:
+        """
+        Read and extract detailed content from a specific X.com post URL.
+
+        Args:
+            url: X.com post URL
+
+        Returns:
+            Dict with post content and metadata
+        """
+        cached = self._cached_post(self.extract_status_id_from_url(url))
+        if cached is not None:
+            cached["url"] = url
+            return cached
+
+        result = self._run("read", url)
+        self._cache_post(result.get("status_id"), result)
+        return result
+
+    async def read_x_post_async(self, url: str) -> Dict[str, Any]:
+        """
+        Async version of read_x_post.
+
+        Args:
+            url: X.com post URL
+
+        Returns:
+            Dict with post content and metadata
+        """
+        cached = self._cached_post(self.extract_status_id_from_url(url))
+        if cached is not None:
+            cached["url"] = url
+            return cached
+
+        result = await self._run_async("read", url)
+        self._cache_post(result.get("status_id"), result)
+        return result
+
+    def read_x_posts(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read several X.com posts with as few live-search requests as possible.
+
+        Posts already read are served from the cache, the others are
+        grouped by handle into batches of nearby status IDs read with one
+        request each. Posts missing from a batch's answer, and URLs that
+        are not posts of a known handle, are read one by one.
+
+        Args:
+            urls: X.com post URLs
+
+        Returns:
+            Dict mapping each URL to its ``read_x_post``-style result
+        """
+        results, batches, singles = self._plan_reads(urls)
+
+        for handle, status_ids in batches:
+            try:
+                search_parameters, prompt = self._prepare_batch(
+                    handle, status_ids
+                )
+                response = self._sample(search_parameters, prompt)
+                found = self._split_batch(handle, status_ids, response)
+            except Exception as e:
+                logger.warning(
+                    f"Batched read of {len(status_ids)} posts by "
+                    f"@{handle} failed: {str(e)}"
+                )
+                found = {}
+            self._collect_batch(handle, status_ids, found, results, singles)
+
+        for key, url in singles.items():
+            results[key] = self.read_x_post(url)
+
+        return self._fan_out(urls, results)
+
+    async def read_x_posts_async(
+        self, urls: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Async version of read_x_posts, running requests concurrently.
+
+        Args:
+            urls: X.com post URLs
+
+        Returns:
+            Dict mapping each URL to its ``read_x_post``-style result
+        """
+        results, batches, singles = self._plan_reads(urls)
+
+        async def read_batch(handle: str, status_ids: List[str]):
+            try:
+                search_parameters, prompt = self._prepare_batch(
+                    handle, status_ids
+                )
+                response = await self._sample_async(search_parameters, prompt)
+                return self._split_batch(handle, status_ids, response)
+            except Exception as e:
+                logger.warning(
+                    f"Batched read of {len(status_ids)} posts by "
+                    f"@{handle} failed: {str(e)}"
+                )
+                return {}
+
+        found_batches = await asyncio.gather(
+            *(read_batch(handle, ids) for handle, ids in batches)
+        )
+        for (handle, status_ids), found in zip(batches, found_batches):
+            self._collect_batch(handle, status_ids, found, results, singles)
+
+        keys = list(singles)
+        reads = await asyncio.gather(
+            *(self.read_x_post_async(singles[key]) for key in keys)
+        )
+        results.update(zip(keys, reads))
+
+        return self._fan_out(urls, results)
+
+    def _cached_post(self, status_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Copy of a cached post result, if still fresh."""
+        if not status_id:
+            return None
+        with self._posts_lock:
+            entry = self._posts.get(status_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.post_cache_ttl:
+                del self._posts[status_id]
+                return None
+            self._posts.move_to_end(status_id)
+            return dict(entry[1])
+
+    def _cache_post(self, status_id: Optional[str], result: Dict[str, Any]):
+        """Remember a successfully read post."""
+        if not status_id or not result.get("success"):
+            return
+        with self._posts_lock:
+            self._posts[status_id] = (time.monotonic(), dict(result))
+            self._posts.move_to_end(status_id)
+            while len(self._posts) > self.post_cache_size:
+                self._posts.popitem(last=False)
+
+    def _plan_reads(
+        self, urls: List[str]
+    ) -> Tuple[
+        Dict[str, Dict[str, Any]], List[Tuple[str, List[str]]], Dict[str, str]
+    ]:
+        """
+        Split post URLs into cached results, batches and single reads.
+
+        Args:
+            urls: X.com post URLs
+
+        Returns:
+            Tuple of (cached results keyed by status ID, batches of
+            (handle, status IDs), single reads mapping key to URL); keys
+            are status IDs, or the URL for URLs without one
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        singles: Dict[str, str] = {}
+        handles: Dict[str, str] = {}
+        posts: Dict[str, Dict[str, str]] = {}
+
+        for url in urls:
+            status_id = self.extract_status_id_from_url(url)
+            username = self.extract_username_from_url(url)
+            key = status_id or url
+            if key in results or key in singles or any(
+                key in group for group in posts.values()
+            ):
+                continue
+            cached = self._cached_post(status_id)
+            if cached is not None:
+                results[key] = cached
+            elif status_id and username:
+                handle = handles.setdefault(username.lower(), username)
+                posts.setdefault(handle, {})[status_id] = url
+            else:
+                singles[key] = url
+
+        batches = []
+        for handle, group in posts.items():
+            # Nearby status IDs are posts from the same stretch of time
+            status_ids = sorted(group, key=int)
+            for start in range(0, len(status_ids), self.max_batch_size):
+                chunk = status_ids[start:start + self.max_batch_size]
+                if len(chunk) == 1:
+                    singles[chunk[0]] = group[chunk[0]]
+                else:
+                    batches.append((handle, chunk))
+
+        logger.info(
+            f"Reading {len(urls)} X.com URLs: {len(results)} cached, "
+            f"{sum(len(ids) for _, ids in batches)} in {len(batches)} "
+            f"batches, {len(singles)} single reads"
+        )
+        return results, batches, singles
+
+    def _prepare_batch(
+        self, handle: str, status_ids: List[str]
+    ) -> Tuple[SearchParameters, str]:
+        """
+        Build the search parameters and prompt of a batched read.
+
+        Args:
+            handle: Author handle of the posts
+            status_ids: Status IDs of the posts
+
+        Returns:
+            Tuple of (search parameters, prompt)
+        """
+        search_params: Dict[str, Any] = {"included_x_handles": [handle]}
+        # Restrict the search to the days the posts were created
+        times = [t for t in map(status_time, status_ids) if t is not None]
+        if len(times) == len(status_ids):
+            search_params["from_date"] = datetime.combine(
+                min(times).date(), datetime.min.time()
+            )
+            search_params["to_date"] = datetime.combine(
+                max(times).date() + timedelta(days=1), datetime.min.time()
+            )
+
+        search_parameters = self._build_search_parameters(
+            search_params, max_results=min(5 * len(status_ids), 50)
+        )
+
+        post_list = "\n".join(
+            f"- https://x.com/{handle}/status/{status_id}"
+            for status_id in status_ids
+        )
+        prompt = (
+            f"Please extract and analyze the content of each of these "
+            f"X.com posts by @{handle}:\n{post_list}\n\n"
+            "Start the section of each post with a heading line of the "
+            "form '### POST <status id>' and include:\n"
+            "1. Author details (username, display name, verification status)\n"
+            "2. Full post content (including any threads or replies)\n"
+            "3. Timestamp (exact date and time)\n"
+            "4. Engagement metrics (likes, retweets, quotes, views)\n"
+            "5. Media descriptions (if any images/videos)\n"
+            "6. Context (what the post is replying to, if applicable)\n"
+            "7. Top replies or notable interactions\n\n"
+            "Leave out any post you cannot find."
+        )
+        return search_parameters, prompt
+
+    def _split_batch(
+        self, handle: str, status_ids: List[str], response: Any
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Split a batched read's answer into per-post results.
+
+        Args:
+            handle: Author handle of the posts
+            status_ids: Status IDs of the posts
+            response: Sampled chat response
+
+        Returns:
+            Dict mapping the status IDs found in the answer to results
+        """
+        content = response.content or ""
+        sections: Dict[str, str] = {}
+        headings = list(_POST_HEADING.finditer(content))
+        for i, heading in enumerate(headings):
+            end = (
+                headings[i + 1].start() if i + 1 < len(headings)
+                else len(content)
+            )
+            text = content[heading.end():end].strip()
+            if text:
+                sections.setdefault(heading.group(1), text)
+
+        citations = list(response.citations) if response.citations else []
+        # Each post is charged an equal share of the request
+        share = {
+            "total_tokens": response.usage.total_tokens // len(status_ids),
+            "prompt_tokens": response.usage.prompt_tokens // len(status_ids),
+            "completion_tokens": (
+                response.usage.completion_tokens // len(status_ids)
+            ),
+        }
+
+        results = {}
+        for status_id in status_ids:
+            if status_id not in sections:
+                continue
+            results[status_id] = {
+                "success": True,
+                "url": f"https://x.com/{handle}/status/{status_id}",
+                "username": handle,
+                "status_id": status_id,
+                "content": sections[status_id],
+                "citations": [
+                    c for c in citations if status_id in c
+                ] or citations,
+                "usage": share,
+                "batch_size": len(status_ids),
             }
+        return results
+
+    def _collect_batch(
+        self,
+        handle: str,
+        status_ids: List[str],
+        found: Dict[str, Dict[str, Any]],
+        results: Dict[str, Dict[str, Any]],
+        singles: Dict[str, str],
+    ):
+        """Store a batch's posts, queueing missing ones for single reads."""
+        for status_id in status_ids:
+            if status_id in found:
+                results[status_id] = found[status_id]
+                self._cache_post(status_id, found[status_id])
+            else:
+                singles[status_id] = (
+                    f"https://x.com/{handle}/status/{status_id}"
+                )
+        if len(found) < len(status_ids):
+            logger.info(
+                f"Batched read of @{handle} missed "
+                f"{len(status_ids) - len(found)} of {len(status_ids)} posts"
+            )
+
+    def _fan_out(
+        self, urls: List[str], results: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map each requested URL to the result of its post."""
+        fanned = {}
+        for url in urls:
+            result = results[self.extract_status_id_from_url(url) or url]
+            fanned[url] = dict(result, url=url)
+        return fanned
+
+    def query_x_content(
+        self,
+        question: str,
+        search_context: Optional[str] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ask questions about X.com content with optional search context.
+
+        Args:
+            question: Question to ask
+            search_context: Optional search query for context
+            search_params: Optional search filters
+
+        Returns:
+            Dict with AI-powered answer and supporting data
+        """
+        return self._run(
+            "query", search_context,
+            search_params=search_params, question=question
+        )
+
+    async def query_x_content_async(
+        self,
+        question: str,
+        search_context: Optional[str] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async version of query_x_content.
+
+        Args:
+            question: Question to ask
+            search_context: Optional search query for context
+            search_params: Optional search filters
+
+        Returns:
+            Dict with AI-powered answer and supporting data
+        """
+        return await self._run_async(
+            "query", search_context,
+            search_params=search_params, question=question
+        )
@@ -7,24 +7,8 @@
 Agent Tools for DeepSearchAgents.
 """
 
-from .search import SearchLinksTool
-from .search_fast import SearchLinksFastTool, search_fast
-from .search_helpers import (
-    MultiQuerySearchTool,
-    DomainSearchTool,
-    search_code,
-    search_docs,
-    search_recent
-)
-from .readurl import ReadURLTool
-from .chunk import ChunkTextTool
-from .embed import EmbedTextsTool
-from .rerank import RerankTextsTool
-from .wolfram import EnhancedWolframAlphaTool
-from .xcom_qa import XcomDeepQATool
-from .github_qa import GitHubRepoQATool
-# from .academic_retrieval import AcademicRetrieval  # Temporarily disabled pending full implementation
-from .final_answer import EnhancedFinalAnswerTool as FinalAnswerTool
+import importlib
+
 from .toolbox import (
     ToolCollection,
     DeepSearchToolbox,
@@ -33,6 +17,40 @@ from .toolbox import (
 )
 from src.agents.ui_common.constants import TOOL_ICONS
 
+# Tool classes are imported on first attribute access, so importing the
+# package (or the toolbox) doesn't load every tool's dependencies
+_LAZY_EXPORTS = {
+    "SearchLinksTool": (".search", "SearchLinksTool"),
+    "SearchLinksFastTool": (".search_fast", "SearchLinksFastTool"),
+    # Shadowed by the submodule once it is imported elsewhere; prefer
+    # ``from src.tools.search_fast import search_fast``
+    "search_fast": (".search_fast", "search_fast"),
+    "MultiQuerySearchTool": (".search_helpers", "MultiQuerySearchTool"),
+    "DomainSearchTool": (".search_helpers", "DomainSearchTool"),
+    "search_code": (".search_helpers", "search_code"),
+    "search_docs": (".search_helpers", "search_docs"),
+    "search_recent": (".search_helpers", "search_recent"),
+    "ReadURLTool": (".readurl", "ReadURLTool"),
+    "ChunkTextTool": (".chunk", "ChunkTextTool"),
+    "EmbedTextsTool": (".embed", "EmbedTextsTool"),
+    "RerankTextsTool": (".rerank", "RerankTextsTool"),
+    "EnhancedWolframAlphaTool": (".wolfram", "EnhancedWolframAlphaTool"),
+    "XcomDeepQATool": (".xcom_qa", "XcomDeepQATool"),
+    "GitHubRepoQATool": (".github_qa", "GitHubRepoQATool"),
+    # "AcademicRetrieval": (".academic_retrieval", "AcademicRetrieval"),
+    "FinalAnswerTool": (".final_answer", "EnhancedFinalAnswerTool"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
 # Re-export
 __all__ = [
     "SearchLinksTool",
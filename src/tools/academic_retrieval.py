@@ -12,6 +12,7 @@ direct API implementation.
 
 import asyncio
 import logging
+import threading
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
 from smolagents import Tool
@@ -139,14 +140,26 @@ class AcademicRetrieval(Tool):
         self.cli_console = cli_console
         self.verbose = verbose
         self._retriever = None
-        self._loop = None
+        self._retriever_lock = threading.Lock()
+        # Parallel sub-agents share the tool, so each calling thread runs
+        # its requests on its own event loop
+        self._local = threading.local()
 
     @property
     def retriever(self) -> PaperRetriever:
         """Get or create the paper retriever."""
-        if self._retriever is None:
-            self._retriever = PaperRetriever()
-        return self._retriever
+        with self._retriever_lock:
+            if self._retriever is None:
+                self._retriever = PaperRetriever()
+            return self._retriever
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the calling thread's event loop, reused across calls."""
+        loop = getattr(self._local, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+        return loop
 
     def forward(
         self,
@@ -191,24 +204,19 @@ class AcademicRetrieval(Tool):
                 "source": source
             }
 
-            # Setup event loop if needed
-            try:
-                self._loop = asyncio.get_event_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
+            loop = self._get_loop()
 
             # Execute operation
             if operation == "search":
-                papers = self._loop.run_until_complete(
+                papers = loop.run_until_complete(
                     self._search_papers(**kwargs)
                 )
             elif operation == "get_paper":
-                papers = self._loop.run_until_complete(
+                papers = loop.run_until_complete(
                     self._get_paper(**kwargs)
                 )
             elif operation == "related":
-                papers = self._loop.run_until_complete(
+                papers = loop.run_until_complete(
                     self._find_related_papers(**kwargs)
                 )
             else:
@@ -12,7 +12,6 @@ import json
 import asyncio
 from typing import List, Optional, Dict
 from smolagents import Tool
-import torch
 from src.core.ranking.jina_embedder import JinaAIEmbedder
 
 
@@ -159,16 +158,13 @@ class EmbedTextsTool(Tool):
 
             async def run_embed():
                 async with embedder:
-                    # Note: JinaEmbedder returns torch.Tensor
-                    tensor_result: torch.Tensor = (
-                        await embedder.get_embeddings_async(
-                            input_list,
-                            task=task,
-                            normalized=effective_normalized
-                        )
+                    # JinaAIEmbedder returns a float32 numpy array
+                    embeddings = await embedder.get_embeddings_async(
+                        input_list,
+                        task=task,
+                        normalized=effective_normalized
                     )
-                    # convert Tensor to Python list
-                    return tensor_result.tolist()
+                    return embeddings.tolist()
 
             embeddings_list: List[List[float]] = loop.run_until_complete(
                 run_embed()
@@ -6,16 +6,452 @@
 """
 Enhanced FinalAnswerTool implementation to standardize output format across
 DeepSearchAgents, ReAct and CodeAct agents.
+
+The final answer is parsed once into a ``FinalAnswer``: a dict (so
+existing consumers keep working) that caches its JSON and Markdown forms.
+Source titles and provenance come from the tool calls made during the run,
+recorded by a ``SourceTracker``, instead of being scraped from the text.
 """
 
+import ast
 import json
 import logging
-from typing import Any, Dict, List
-
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from functools import lru_cache, wraps
+from typing import Any, Dict, Iterator, List, Optional
+
+from smolagents import Tool
 from smolagents.default_tools import FinalAnswerTool as BaseFinaAnswerTool
 
 logger = logging.getLogger(__name__)
 
+_URL_RE = re.compile(r'https?://[^\s)>]+')
+_ANSWER_PREFIXES = ("**Final answer:**", "Final answer:")
+# Keys that can hold the answer text in a structured answer
+_CONTENT_KEYS = ("content", "answer", "markdown", "text")
+# Keys of URL and title fields in structured tool outputs
+_URL_KEYS = ("url", "link", "source_url")
+_TITLE_KEYS = ("title", "name")
+
+
+@dataclass
+class SourceRef:
+    """A source URL and the tool call it came from."""
+    url: str
+    title: str = ""
+    tool: str = ""
+
+
+class SourceTracker:
+    """
+    Sources seen in tool calls during one agent run, in first-seen order.
+
+    Parallel sub-agents record into their manager's tracker from worker
+    threads, so access is guarded by a lock.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, SourceRef] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __iter__(self) -> Iterator[SourceRef]:
+        with self._lock:
+            return iter(list(self._sources.values()))
+
+    def get(self, url: str) -> Optional[SourceRef]:
+        """Get the recorded source for a URL."""
+        with self._lock:
+            return self._sources.get(url)
+
+    def record(self, url: str, title: str = "", tool: str = ""):
+        """Record a source URL, keeping the first title seen for it."""
+        url = url.strip()
+        if not url.startswith(("http://", "https://")):
+            return
+        with self._lock:
+            source = self._sources.get(url)
+            if source is None:
+                self._sources[url] = SourceRef(
+                    url=url, title=title, tool=tool
+                )
+            elif title and not source.title:
+                source.title = title
+
+    def record_tool_call(
+        self,
+        tool_name: str,
+        arguments: List[Any],
+        output: Any
+    ):
+        """
+        Record the sources of a tool call.
+
+        URL arguments (e.g. ``read_url``) are recorded with the page title
+        when the output starts with a Markdown heading; structured outputs
+        (search results) are walked for url/link and title fields.
+
+        Args:
+            tool_name: Name of the tool
+            arguments: Positional and keyword argument values
+            output: Tool output
+        """
+        if isinstance(output, str) and output[:1] in ("[", "{"):
+            try:
+                output = json.loads(output)
+            except ValueError:
+                pass
+
+        if isinstance(output, (dict, list)):
+            self._record_structured(output, tool_name)
+            title = ""
+        else:
+            title = _markdown_title(output) if isinstance(output, str) else ""
+
+        for value in arguments:
+            if isinstance(value, str) and value.startswith("http"):
+                self.record(value, title=title, tool=tool_name)
+
+    def cited_in(self, content: str) -> List[SourceRef]:
+        """Recorded sources whose URL appears in the content."""
+        return [source for source in self if source.url in content]
+
+    def _record_structured(self, data: Any, tool_name: str, depth: int = 0):
+        if depth > 4:
+            return
+        if isinstance(data, list):
+            for item in data:
+                self._record_structured(item, tool_name, depth + 1)
+        elif isinstance(data, dict):
+            url = next(
+                (data[k] for k in _URL_KEYS if isinstance(data.get(k), str)),
+                None
+            )
+            if url:
+                title = next(
+                    (data[k] for k in _TITLE_KEYS
+                     if isinstance(data.get(k), str)),
+                    ""
+                )
+                self.record(url, title=title, tool=tool_name)
+            for value in data.values():
+                if isinstance(value, (dict, list)):
+                    self._record_structured(value, tool_name, depth + 1)
+
+
+_current_tracker: ContextVar[Optional[SourceTracker]] = ContextVar(
+    "source_tracker", default=None
+)
+
+
+def get_source_tracker() -> Optional[SourceTracker]:
+    """Get the source tracker of the current run, if any."""
+    return _current_tracker.get()
+
+
+@contextmanager
+def track_sources(tracker: Optional[SourceTracker] = None):
+    """
+    Record tool call sources into a tracker for the enclosed run.
+
+    Args:
+        tracker: Tracker to use, a new one by default
+
+    Yields:
+        SourceTracker: The active tracker
+    """
+    tracker = tracker if tracker is not None else SourceTracker()
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+class SourceTrackingIterator:
+    """
+    Wrap a streaming run so each step runs with the run's tracker.
+
+    The tracker is set per ``next()`` call, since streaming consumers may
+    advance the generator from different threads or contexts.
+    """
+
+    def __init__(self, iterator: Iterator, tracker: SourceTracker):
+        self._iterator = iterator
+        self.tracker = tracker
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        token = _current_tracker.set(self.tracker)
+        try:
+            return next(self._iterator)
+        finally:
+            _current_tracker.reset(token)
+
+
+def track_tool_sources(tool: Tool) -> Tool:
+    """
+    Make a tool record the sources of its calls in the run's tracker.
+
+    Args:
+        tool: Tool instance; its ``forward`` is wrapped in place
+
+    Returns:
+        The same tool
+    """
+    if tool.name == "final_answer" or getattr(
+        tool.forward, "_tracks_sources", False
+    ):
+        return tool
+    forward = tool.forward
+
+    @wraps(forward)
+    def tracked_forward(*args, **kwargs):
+        output = forward(*args, **kwargs)
+        tracker = _current_tracker.get()
+        if tracker is not None:
+            try:
+                tracker.record_tool_call(
+                    tool.name, list(args) + list(kwargs.values()), output
+                )
+            except Exception as e:
+                logger.debug(f"Failed to record sources of {tool.name}: {e}")
+        return output
+
+    tracked_forward._tracks_sources = True
+    tool.forward = tracked_forward
+    return tool
+
+
+def _markdown_title(text: str) -> str:
+    for line in text[:500].splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return ""
+
+
+def _url_title(url: str, index: int) -> str:
+    """Fallback title from the last URL path segment."""
+    url_parts = url.rstrip("/").split("/")
+    if len(url_parts) > 3:
+        title = (url_parts[-1].split('.')[0]
+                 .replace('-', ' ')
+                 .replace('_', ' ')
+                 .capitalize())
+        if title:
+            return title
+    return f"Source {index}"
+
+
+@lru_cache(maxsize=16)
+def _parse_answer_text(text: str) -> Optional[Dict]:
+    """Parse a JSON (or Python dict literal) answer string, cached."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # Tools may have returned str(dict) instead of json.dumps(dict)
+        try:
+            data = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return None
+    return data if isinstance(data, dict) else None
+
+
+class FinalAnswer(dict):
+    """
+    Standardized final answer.
+
+    A dict with ``title``, ``content`` (Markdown, including the Sources
+    section), ``sources`` (URLs), ``type`` and ``format`` keys. ``str()``
+    gives the JSON form; JSON and Markdown renderings are cached.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Source titles and provenance, parallel to self["sources"]
+        self.source_refs: List[SourceRef] = []
+        self._json: Optional[str] = None
+
+    @classmethod
+    def build(
+        cls,
+        content: str,
+        title: str = "Final Answer",
+        sources: Optional[List[SourceRef]] = None,
+        append_sources: bool = True
+    ) -> "FinalAnswer":
+        """
+        Create a final answer.
+
+        Args:
+            content: Markdown answer
+            title: Answer title
+            sources: Answer sources
+            append_sources: Add a Sources section unless content has one
+
+        Returns:
+            FinalAnswer
+        """
+        sources = sources or []
+        if append_sources and sources and "## Sources" not in content:
+            content = content.rstrip("\n") + "\n\n## Sources\n\n" + "".join(
+                f"{i}. [{source.title or _url_title(source.url, i)}]"
+                f"({source.url})\n"
+                for i, source in enumerate(sources, 1)
+            )
+        answer = cls(
+            title=title,
+            content=content,
+            sources=[source.url for source in sources],
+            type="final_answer",
+            format="markdown",
+        )
+        answer.source_refs = sources
+        return answer
+
+    @classmethod
+    def from_output(cls, output: Any) -> Optional["FinalAnswer"]:
+        """
+        Get the structured final answer from an agent or step output.
+
+        Args:
+            output: FinalAnswer, dict, or (JSON) string or AgentText,
+                with or without a "Final answer:" prefix
+
+        Returns:
+            FinalAnswer, or None if the output isn't a structured answer
+        """
+        if isinstance(output, FinalAnswer):
+            return output
+        if isinstance(output, dict):
+            if not any(key in output for key in _CONTENT_KEYS):
+                return None
+            return cls.from_dict(output)
+        # AgentText is a str subclass
+        if not isinstance(output, str):
+            return None
+
+        text = output.strip()
+        for prefix in _ANSWER_PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix):].strip()
+                break
+        if not (text.startswith("{") and text.endswith("}")):
+            return None
+        data = _parse_answer_text(text)
+        if data is None or not any(key in data for key in _CONTENT_KEYS):
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict,
+        tracker: Optional[SourceTracker] = None
+    ) -> "FinalAnswer":
+        """Standardize a structured answer."""
+        content = next(
+            (data[key] for key in _CONTENT_KEYS if key in data), ""
+        )
+        if not isinstance(content, str):
+            content = str(content)
+
+        sources = []
+        raw_sources = data.get("sources")
+        for item in raw_sources if isinstance(raw_sources, list) else []:
+            if isinstance(item, dict):
+                url = next((item[k] for k in _URL_KEYS if k in item), "")
+                title = item.get("title", "")
+            else:
+                url, title = str(item), ""
+            tracked = tracker.get(url) if tracker else None
+            sources.append(SourceRef(
+                url=url,
+                title=title or (tracked.title if tracked else ""),
+                tool=tracked.tool if tracked else "",
+            ))
+        return cls.build(content, data.get("title", "Final Answer"), sources)
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        tracker: Optional[SourceTracker] = None
+    ) -> "FinalAnswer":
+        """
+        Wrap a plain-text answer.
+
+        Sources are the tool-call sources cited in the text; without a
+        tracker, URLs are taken from the text itself.
+        """
+        if tracker is not None and len(tracker):
+            sources = tracker.cited_in(text)
+        else:
+            sources = [
+                SourceRef(url=url)
+                for url in dict.fromkeys(_URL_RE.findall(text))
+            ]
+        return cls.build(text, sources=sources, append_sources=False)
+
+    @property
+    def title(self) -> str:
+        return self.get("title", "Final Answer")
+
+    @property
+    def content(self) -> str:
+        return self.get("content", "")
+
+    @property
+    def sources(self) -> List[str]:
+        return self.get("sources", [])
+
+    @property
+    def markdown(self) -> str:
+        """Markdown rendering (the content, with its Sources section)."""
+        return self.content
+
+    def to_json(self) -> str:
+        """JSON rendering, cached until the answer changes."""
+        if self._json is None:
+            self._json = json.dumps(self, ensure_ascii=False)
+        return self._json
+
+    def source_details(self) -> List[Dict[str, str]]:
+        """Sources with titles and the tools they came from."""
+        return [asdict(source) for source in self.source_refs]
+
+    def __str__(self) -> str:
+        return self.to_json()
+
+    # Mutations drop the cached JSON
+    def __setitem__(self, key, value):
+        self._json = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._json = None
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self._json = None
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._json = None
+        return super().pop(*args)
+
+    def setdefault(self, key, default=None):
+        self._json = None
+        return super().setdefault(key, default)
+
 
 class EnhancedFinalAnswerTool(BaseFinaAnswerTool):
     """
@@ -51,162 +487,23 @@ class EnhancedFinalAnswerTool(BaseFinaAnswerTool):
             object
 
         Returns:
-            A standardized JSON object with consistent formatting
+            FinalAnswer: A standardized answer object (a dict)
         """
+        tracker = get_source_tracker()
         try:
             # If answer is a string that contains valid JSON, parse it
             if (isinstance(answer, str) and answer.strip().startswith('{')
                     and answer.strip().endswith('}')):
-                try:
-                    answer = json.loads(answer)
-                except json.JSONDecodeError:
-                    # Not valid JSON, continue with string processing
-                    pass
+                answer = _parse_answer_text(answer.strip()) or answer
 
-            # Process based on input type
             if isinstance(answer, dict):
                 # Already structured, ensure it has all required fields
-                return self._standardize_json_object(answer)
-            elif isinstance(answer, str):
-                # Convert string to standardized object
-                return self._standardize_string_answer(answer)
-            else:
-                # Handle other types by converting to string
-                return self._standardize_string_answer(str(answer))
+                return FinalAnswer.from_dict(answer, tracker)
+            return FinalAnswer.from_text(
+                answer if isinstance(answer, str) else str(answer), tracker
+            )
 
         except Exception as e:
             logger.error(f"Error processing final answer: {e}")
             # In case of error, return a simple object with the raw answer
-            return {
-                "title": "Final Answer",
-                "content": str(answer),
-                "sources": [],
-                "type": "final_answer",
-                "format": "markdown"
-            }
-
-    def _standardize_json_object(self, answer_dict: Dict) -> Dict:
-        """
-        Ensure JSON object has standard format.
-        """
-        # Basic fields
-        standardized = {
-            "title": answer_dict.get("title", "Final Answer"),
-            "content": "",
-            "sources": [],
-            "type": "final_answer",
-            "format": "markdown"
-        }
-
-        # Process content field
-        if "content" in answer_dict:
-            standardized["content"] = answer_dict["content"]
-        elif "answer" in answer_dict:
-            standardized["content"] = answer_dict["answer"]
-        elif "markdown" in answer_dict:
-            standardized["content"] = answer_dict["markdown"]
-        elif "text" in answer_dict:
-            standardized["content"] = answer_dict["text"]
-
-        # Process sources field
-        if (
-            "sources" in answer_dict and
-            isinstance(answer_dict["sources"], list)
-        ):
-            standardized["sources"] = answer_dict["sources"]
-
-        # Ensure content contains sources
-        if (standardized["sources"] and
-                "## Sources" not in standardized["content"]):
-            sources_text = "\n\n## Sources\n\n"
-            for i, url in enumerate(standardized["sources"]):
-                sources_text += f"{i+1}. [{url}]({url})\n"
-            standardized["content"] += sources_text
-
-        return standardized
-
-    def _standardize_string_answer(self, answer_str: str) -> Dict:
-        """
-        Convert a string answer to the standardized JSON object format.
-
-        Args:
-            answer_str: String containing the answer
-
-        Returns:
-            Standardized dictionary with all required fields
-        """
-        # Extract potential URLs from the string
-        import re
-        urls = []
-
-        # Look for URL patterns in the text
-        url_pattern = r'https?://[^\s)>]+'
-        found_urls = re.findall(url_pattern, answer_str)
-
-        # Remove URLs from content but save them for sources
-        if found_urls:
-            urls = found_urls
-
-        return {
-            "title": "Final Answer",
-            "content": answer_str,
-            "sources": urls
-        }
-
-    def _append_sources_to_content(
-        self,
-        content: str,
-        sources: List[str]
-    ) -> str:
-        """
-        Append sources in Markdown format to the content
-        if they don't already exist.
-
-        Args:
-            content: The main content text
-            sources: List of source URLs
-
-        Returns:
-            Content with sources appended in Markdown format
-        """
-        if not sources:
-            return content
-
-        # Check if content already ends with sources section
-        has_sources_section = "## Sources" in content and any(
-            url in content for url in sources
-        )
-        if has_sources_section:
-            return content
-
-        # Add newlines to ensure proper spacing
-        if not content.endswith('\n\n'):
-            if content.endswith('\n'):
-                content += '\n'
-            else:
-                content += '\n\n'
-
-        # Format sources in Markdown
-        content += "## Sources\n\n"
-        for i, url in enumerate(sources):
-            # Extract a title from the URL or use a generic one
-            url_parts = url.split("/")
-            title = ""
-            # Try to get a meaningful title from the URL
-            if len(url_parts) > 2:
-                # Use last part of URL path, cleaned up
-                raw_title = url_parts[-1] if url_parts[-1] else url_parts[-2]
-                # Remove file extensions and clean up
-                title = (raw_title.split('.')[0]
-                         .replace('-', ' ')
-                         .replace('_', ' ')
-                         .capitalize())
-
-            # If we couldn't extract a meaningful title, use a generic one
-            if not title:
-                title = f"Source {i+1}"
-
-            # Add the numbered reference with consistent format
-            content += f"{i+1}. [{title}]({url})\n"
-
-        return content
+            return FinalAnswer.build(str(answer))
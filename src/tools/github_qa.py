@@ -28,15 +28,21 @@ class GitHubRepoQATool(Tool):
     Query GitHub repositories using DeepWiki's AI-powered documentation
     and search capabilities. This tool can:
     - Get repository documentation structure
-    - Read full repository documentation
+    - Read full repository documentation, or only the sections about a
+      topic
     - Ask specific questions about a repository
+
+    Wiki data is cached per repository, so repeated reads of popular
+    repositories are served locally, and questions that the cached wiki
+    sections already cover are answered without calling DeepWiki.
     """
 
     name = "github_repo_qa"
     description = (
         "Query GitHub repositories using DeepWiki's AI-powered documentation "
         "and search. Operations: 'structure' (get docs structure), 'contents' "
-        "(read full docs), 'query' (ask questions). Repository format: "
+        "(read docs; pass 'topic' to read only the matching sections), "
+        "'query' (ask questions). Repository format: "
         "'owner/repo' (e.g., 'google-gemini/gemini-cli')."
     )
     inputs = {
@@ -66,6 +72,15 @@ class GitHubRepoQATool(Tool):
             "default": "Help me analyze this Repo...",
             "nullable": True,
         },
+        "topic": {
+            "type": "string",
+            "description": (
+                "Topic to read about when operation='contents' (e.g., "
+                "'authentication'); only the matching documentation "
+                "sections are returned"
+            ),
+            "nullable": True,
+        },
     }
     output_type = "any"  # returns structured data or text
 
@@ -75,6 +90,9 @@ class GitHubRepoQATool(Tool):
         transport: str = "streamable-http",
         cli_console: Optional["Console"] = None,
         verbose: bool = False,
+        use_cache: bool = True,
+        answer_from_cache: bool = True,
+        max_sections: int = 5,
     ):
         """
         Initialize GitHubRepoQATool.
@@ -84,6 +102,10 @@ class GitHubRepoQATool(Tool):
             transport: Transport protocol ("sse" or "streamable-http")
             cli_console: Optional rich.console.Console for verbose CLI output
             verbose: Whether to enable verbose logging
+            use_cache: Whether to cache wiki data and answers per repository
+            answer_from_cache: Answer questions from cached wiki sections
+                when they cover the question
+            max_sections: Maximum documentation sections returned per topic
         """
         super().__init__()
 
@@ -95,9 +117,13 @@ class GitHubRepoQATool(Tool):
         self.transport = transport
         self.cli_console = cli_console
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.answer_from_cache = answer_from_cache
+        self.max_sections = max_sections
 
         # DeepWikiClient instance will be created when needed
         self.scraper: Optional[DeepWikiClient] = None
+        self._scraper_lock = threading.Lock()
 
         # Thread pool for handling async operations
         self._executor = ThreadPoolExecutor(max_workers=10)
@@ -121,14 +147,17 @@ class GitHubRepoQATool(Tool):
 
     def _ensure_scraper(self):
         """Ensure DeepWikiClient instance is created."""
-        if self.scraper is None:
-            self.scraper = DeepWikiClient(
-                server_url=self.server_url, transport=self.transport
-            )
-            if self.verbose and self.cli_console:
-                self.cli_console.print(
-                    "[green]Connected to DeepWiki MCP server[/green]"
+        with self._scraper_lock:
+            if self.scraper is None:
+                self.scraper = DeepWikiClient(
+                    server_url=self.server_url,
+                    transport=self.transport,
+                    use_cache=self.use_cache,
                 )
+                if self.verbose and self.cli_console:
+                    self.cli_console.print(
+                        "[green]Connected to DeepWiki MCP server[/green]"
+                    )
 
     def _run_in_thread(self, coro):
         """Run async coroutine in thread pool."""
@@ -146,11 +175,27 @@ class GitHubRepoQATool(Tool):
             # No event loop exists, create one
             return asyncio.run(coro)
 
+    def _answer_from_cache(
+        self,
+        repo: str,
+        question: str
+    ) -> Optional[Dict[str, Any]]:
+        """Answer from cached wiki data, or None to ask DeepWiki."""
+        if not self.answer_from_cache:
+            return None
+        result = self.scraper.answer_from_cache(repo, question)
+        if result is not None and self.verbose and self.cli_console:
+            self.cli_console.print(
+                f"[green]Answered from cached wiki of {repo}[/green]"
+            )
+        return result
+
     async def _async_forward(
         self,
         repo: str,
         operation: str = "structure",
         question: Optional[str] = None,
+        topic: Optional[str] = None,
     ) -> Union[str, Dict[str, Any]]:
         """Async implementation of the tool's forward method."""
         self._ensure_scraper()
@@ -180,7 +225,9 @@ class GitHubRepoQATool(Tool):
                 result = await self.scraper.read_wiki_structure_async(repo)
 
             elif operation == "contents":
-                result = await self.scraper.read_wiki_contents_async(repo)
+                result = await self.scraper.read_wiki_sections_async(
+                    repo, topic, max_sections=self.max_sections
+                )
 
             elif operation == "query":
                 if not question:
@@ -191,7 +238,11 @@ class GitHubRepoQATool(Tool):
                         )
                     return {"error": error_msg, "success": False}
 
-                result = await self.scraper.ask_question_async(repo, question)
+                result = self._answer_from_cache(repo, question)
+                if result is None:
+                    result = await self.scraper.ask_question_async(
+                        repo, question
+                    )
 
             else:
                 error_msg = (
@@ -241,6 +292,7 @@ class GitHubRepoQATool(Tool):
         repo: str,
         operation: str = "structure",
         question: Optional[str] = None,
+        topic: Optional[str] = None,
     ) -> Union[str, Dict[str, Any]]:
         """
         Query a GitHub repository using DeepWiki.
@@ -249,6 +301,8 @@ class GitHubRepoQATool(Tool):
             repo: GitHub repository in format 'owner/repo'
             operation: Operation to perform ('structure', 'contents', 'query')
             question: Question to ask (required when operation='query')
+            topic: Topic whose documentation sections to return when
+                operation='contents'
 
         Returns:
             Query results as string or structured data
@@ -281,7 +335,9 @@ class GitHubRepoQATool(Tool):
                 result = self.scraper.read_wiki_structure(repo)
 
             elif operation == "contents":
-                result = self.scraper.read_wiki_contents(repo)
+                result = self.scraper.read_wiki_sections(
+                    repo, topic, max_sections=self.max_sections
+                )
 
             elif operation == "query":
                 if not question:
@@ -292,7 +348,9 @@ class GitHubRepoQATool(Tool):
                         )
                     return {"error": error_msg, "success": False}
 
-                result = self.scraper.ask_question(repo, question)
+                result = self._answer_from_cache(repo, question)
+                if result is None:
+                    result = self.scraper.ask_question(repo, question)
 
             else:
                 error_msg = (
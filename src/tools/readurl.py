@@ -5,18 +5,29 @@
 
 """
 Read URL Agent Tool for DeepSearchAgents.
+
+Large pages are streamed and cut into markdown sections as they arrive:
+the tool returns the first sections within a token budget plus a handle
+for reading the rest with ``read_url(url, section=k)``, while the
+remainder of the page keeps streaming in the background. Pages already
+fetched (or being fetched) by the search result prefetcher are used
+instead of scraping them again.
 """
 
 import asyncio
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Set, TYPE_CHECKING
 import logging
 from smolagents import Tool
 
 if TYPE_CHECKING:
     from rich.console import Console
+from src.core.scraping.prefetch import active_prefetcher
 from src.core.scraping.scrape_url import ScrapeUrl
+from src.core.scraping.sections import (
+    MarkdownSectionizer, SectionedDocument, SectionStore
+)
 
 # setup logging
 logger = logging.getLogger(__name__)
@@ -33,7 +44,9 @@ class ReadURLTool(Tool):
         "Reads the content of any given URLs using web scraping services "
         "and returns the processed content, typically in Markdown format. "
         "This tool response need some time to complete, when you call this "
-        "tool, please wait for some time."
+        "tool, please wait for some time. Long pages are returned in "
+        "sections: the response ends with a note telling you how to read "
+        "the next section with the `section` argument."
     )
     inputs = {
         "url": {
@@ -45,6 +58,14 @@ class ReadURLTool(Tool):
             "description": "Desired output format (e.g., 'markdown', 'text').",
             "default": "markdown",
             "nullable": True,
+        },
+        "section": {
+            "type": "integer",
+            "description": (
+                "1-based section of a long page to read, as given in the "
+                "note at the end of a previous read_url response."
+            ),
+            "nullable": True,
         }
     }
     output_type = "string"  # returns the processed content
@@ -54,7 +75,12 @@ class ReadURLTool(Tool):
         cli_console: Optional["Console"] = None,
         verbose: bool = False,  # for logging (optional)
         default_provider: Optional[str] = None,
-        fallback_enabled: bool = True
+        fallback_enabled: bool = True,
+        stream_sections: bool = True,
+        max_tokens: int = 6000,
+        section_tokens: int = 1500,
+        max_documents: int = 32,
+        section_ttl: float = 600.0
     ):
         """
         Initialize ReadURLTool.
@@ -63,18 +89,31 @@ class ReadURLTool(Tool):
             cli_console: Optional rich.console.Console for verbose CLI output.
             verbose (bool): Whether to enable verbose logging.
             default_provider (str, optional): Default scraper provider to use.
-                Options: 'jina', 'firecrawl', 'xcom', 'auto' (default).
+                Options: 'local', 'jina', 'firecrawl', 'xcom',
+                'auto' (default).
             fallback_enabled (bool): Whether to fallback to other scrapers
                 on failure. Default is True.
+            stream_sections (bool): Stream pages and return long ones in
+                sections. Default is True.
+            max_tokens (int): Approximate tokens returned per call when
+                streaming sections.
+            section_tokens (int): Approximate maximum tokens per section.
+            max_documents (int): Sectioned pages kept for follow-up reads.
+            section_ttl (float): Seconds a sectioned page is reused before
+                it is read again.
         """
         super().__init__()
         self.cli_console = cli_console
         self.verbose = verbose
         self.default_provider = default_provider
         self.fallback_enabled = fallback_enabled
+        self.stream_sections = stream_sections
+        self.max_tokens = max_tokens
+        self.section_tokens = section_tokens
 
         # Unified scraper instance will be created when needed
         self.scraper: Optional[ScrapeUrl] = None
+        self._scraper_lock = threading.Lock()
 
         # Thread pool for handling async operations
         self._executor = ThreadPoolExecutor(max_workers=50)
@@ -82,27 +121,74 @@ class ReadURLTool(Tool):
         # Thread local storage for isolation
         self._local = threading.local()
 
+        # Sectioned pages, filled on a dedicated event loop thread so
+        # streams keep running between tool calls
+        self._sections = SectionStore(
+            max_documents=max_documents, ttl=section_ttl
+        )
+        self._streams: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
     def _ensure_scraper(self):
         """Ensure unified scraper instance is created and configured."""
-        if self.scraper is None:
-            from src.core.scraping.scrape_url import ScrapeUrl, ScraperConfig
-            from src.core.scraping.scrape_url import ScraperProvider
-
-            # Create configuration
-            config = ScraperConfig(
-                default_provider=(
-                    ScraperProvider(self.default_provider.lower())
-                    if self.default_provider
-                    else ScraperProvider.AUTO
-                ),
-                fallback_enabled=self.fallback_enabled
-            )
+        with self._scraper_lock:
+            if self.scraper is None:
+                from src.core.scraping.scrape_url import (
+                    ScrapeUrl, ScraperConfig, ScraperProvider
+                )
 
-            self.scraper = ScrapeUrl(
-                config=config,
-                timeout=120,
-                max_retries=3
-            )
+                # Create configuration
+                config = ScraperConfig.from_settings(
+                    default_provider=(
+                        ScraperProvider(self.default_provider.lower())
+                        if self.default_provider
+                        else ScraperProvider.AUTO
+                    ),
+                    fallback_enabled=self.fallback_enabled
+                )
+
+                self.scraper = ScrapeUrl(
+                    config=config,
+                    timeout=120,
+                    max_retries=3
+                )
+
+    async def _prefetched(
+        self,
+        url: str,
+        output_format: str
+    ) -> Optional[str]:
+        """
+        Content of the URL from a speculative prefetch, if there is one.
+
+        Args:
+            url (str): The URL to read content from.
+            output_format (str): The output format.
+
+        Returns:
+            Optional[str]: Prefetched content, waiting for a prefetch still
+                in flight, or None to scrape the URL normally.
+        """
+        prefetcher = active_prefetcher()
+        if prefetcher is None or output_format != "markdown":
+            return None
+        future = prefetcher.take(url)
+        if future is None:
+            return None
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            return None
+        except Exception as e:
+            logger.debug(f"Prefetch of URL {url} failed: {e}")
+            return None
+        if result and result.success and result.content:
+            logger.info(f"Using prefetched content for URL: {url}")
+            return result.content
+        return None
 
     async def _async_scrape(self, url: str, output_format: str) -> str:
         """
@@ -121,6 +207,10 @@ class ReadURLTool(Tool):
             return f"Error: Scraper not initialized for URL {url}"
 
         try:
+            content = await self._prefetched(url, output_format)
+            if content is not None:
+                return content
+
             logger.info(f"Starting to scrape URL: {url}")
             result = await asyncio.wait_for(
                 self.scraper.scrape_async(
@@ -184,10 +274,183 @@ class ReadURLTool(Tool):
             logger.error(f"Thread execution error for URL {url}: {str(e)}")
             return f"Error processing URL {url}: {str(e)}"
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop thread that runs streamed reads."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="read-url-stream",
+                    daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _start_stream(
+        self,
+        url: str,
+        output_format: str
+    ) -> SectionedDocument:
+        """Start streaming a page into a new sectioned document."""
+        document = SectionedDocument(url, output_format)
+        self._sections.put(document)
+        task = asyncio.get_running_loop().create_task(
+            self._fill_sections(document, output_format)
+        )
+        self._streams.add(task)
+        task.add_done_callback(self._streams.discard)
+        return document
+
+    def _complete_document(
+        self,
+        url: str,
+        output_format: str,
+        content: str
+    ) -> SectionedDocument:
+        """Section an already fetched page."""
+        document = SectionedDocument(url, output_format)
+        sectionizer = MarkdownSectionizer(self.section_tokens)
+        document.add(sectionizer.feed(content))
+        document.add(sectionizer.close())
+        document.finish()
+        self._sections.put(document)
+        return document
+
+    async def _fill_sections(
+        self,
+        document: SectionedDocument,
+        output_format: str
+    ):
+        """Cut the streamed page into sections as chunks arrive."""
+        sectionizer = MarkdownSectionizer(self.section_tokens)
+        try:
+            async with asyncio.timeout(1200):
+                async for chunk in self.scraper.stream_async(
+                    document.url,
+                    output_format=output_format
+                ):
+                    document.add(sectionizer.feed(chunk))
+            document.add(sectionizer.close())
+            document.finish()
+            logger.info(f"Finished streaming URL: {document.url} "
+                        f"({len(document.sections)} sections)")
+        except Exception as e:
+            logger.warning(f"Streaming URL {document.url} failed: {e}")
+            document.add(sectionizer.close())
+            document.finish(error=str(e))
+
+    async def _async_read_sections(
+        self,
+        url: str,
+        output_format: str,
+        section: Optional[int]
+    ) -> str:
+        """
+        Read a page section by section.
+
+        Args:
+            url (str): The URL to read content from.
+            output_format (str): The output format.
+            section (int, optional): 1-based section to start from.
+
+        Returns:
+            str: Sections within the token budget, followed by a note on
+                how to continue if the page is longer, or an error message.
+        """
+        self._ensure_scraper()
+
+        if not self.scraper:
+            return f"Error: Scraper not initialized for URL {url}"
+
+        document = self._sections.get(url, output_format)
+        if document is None:
+            content = await self._prefetched(url, output_format)
+            if content is not None:
+                document = self._complete_document(
+                    url, output_format, content
+                )
+            else:
+                logger.info(f"Starting to stream URL: {url}")
+                document = self._start_stream(url, output_format)
+
+        start = (section or 1) - 1
+        try:
+            end = await document.wait_for_tokens(
+                self.max_tokens, start=start, timeout=1200
+            )
+        except asyncio.TimeoutError:
+            error_msg = f"Timeout error scraping URL {url} after 1200 seconds"
+            logger.error(error_msg)
+            return error_msg
+
+        if not document.sections:
+            self._sections.discard(url, output_format)
+            error_msg = (
+                f"Error reading URL {url}: "
+                f"{document.error or 'No content'}"
+            )
+            logger.warning(error_msg)
+            return error_msg
+
+        if start >= end:
+            return (
+                f"Error reading URL {url}: section {start + 1} does not "
+                f"exist, the page has {document.total_label()} sections."
+            )
+
+        content = "\n\n".join(document.sections[start:end])
+        if document.complete and start == 0 and end == len(
+            document.sections
+        ):
+            return content
+
+        if document.error and end == len(document.sections):
+            note = (
+                f"[read_url: sections {start + 1}-{end} of {end}, "
+                f"page truncated: {document.error}]"
+            )
+        elif document.complete and end == len(document.sections):
+            note = (
+                f"[read_url: sections {start + 1}-{end} of {end}, "
+                f"end of {url}]"
+            )
+        else:
+            note = (
+                f"[read_url: sections {start + 1}-{end} of "
+                f"{document.total_label()} from {url}. Continue with "
+                f"read_url(url=\"{url}\", section={end + 1})]"
+            )
+        return f"{content}\n\n{note}"
+
+    def _run_sectioned(self, url, output_format, section):
+        """
+        Run a sectioned read on the streaming event loop.
+
+        Args:
+            url: target URL
+            output_format: output format
+            section: 1-based section to start from
+
+        Returns:
+            webpage sections or error message
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_read_sections(url, output_format, section),
+            self._get_loop()
+        )
+        try:
+            return future.result(timeout=1200)
+        except Exception as e:
+            future.cancel()
+            logger.error(f"Streaming read error for URL {url}: {str(e)}")
+            return f"Error processing URL {url}: {str(e)}"
+
     def forward(
         self,
         url: str,
-        output_format: Optional[str] = "markdown"
+        output_format: Optional[str] = "markdown",
+        section: Optional[int] = None
     ) -> str:
         """
         Reads the content of a given URL and returns the processed text.
@@ -199,6 +462,8 @@ class ReadURLTool(Tool):
             url (str): The URL to read content from.
             output_format (str, optional): The output format. Default is
                 'markdown'.
+            section (int, optional): 1-based section of a long page to
+                read. Only used when streaming sections.
 
         Returns:
             str: The processed content. If reading fails, return an error
@@ -216,7 +481,14 @@ class ReadURLTool(Tool):
         try:
             # always run in a new thread, avoiding any event loop pollution
             logger.info(f"Starting to read URL in thread: {url}")
-            result = self._run_in_new_thread(url, effective_output_format)
+            if self.stream_sections:
+                result = self._run_sectioned(
+                    url, effective_output_format, section
+                )
+            else:
+                result = self._run_in_new_thread(
+                    url, effective_output_format
+                )
 
             # log success result
             content_length = len(result) if result else 0
@@ -223,7 +223,8 @@ class SearchLinksTool(Tool):
         exa_api_key: Optional[str] = None,
         search_provider: Literal["auto", "serper", "xai", "hybrid"] = "auto",
         cli_console=True,
-        verbose: bool = False
+        verbose: bool = False,
+        prefetch_top_k: int = 0
     ):
         """
         Initialize SearchLinksTool.
@@ -241,10 +242,20 @@ class SearchLinksTool(Tool):
                 ('auto', 'serper', 'xai', or 'hybrid')
             cli_console: Optional rich.console.Console for verbose CLI output.
             verbose (bool): Whether to enable verbose logging.
+            prefetch_top_k (int): Top results to start scraping in the
+                background after each search, so a following read_url
+                finds them fetched. 0 (default) disables prefetching.
         """
         super().__init__()
         self.search_provider = search_provider
 
+        # Opt-in speculative prefetch of top results (shared with read_url)
+        self.prefetch_top_k = prefetch_top_k
+        self.prefetcher = None
+        if prefetch_top_k > 0:
+            from src.core.scraping.prefetch import get_prefetcher
+            self.prefetcher = get_prefetcher(top_k=prefetch_top_k)
+
         # Initialize Serper API for Google search
         self.serper_api_key = serper_api_key or os.getenv("SERPER_API_KEY")
         if not self.serper_api_key:
@@ -279,7 +290,9 @@ class SearchLinksTool(Tool):
 
             if api_keys:
                 self.hybrid_search_api = HybridSearchEngine(
-                    api_keys=api_keys
+                    api_keys=api_keys,
+                    prefetcher=self.prefetcher,
+                    prefetch_top_k=prefetch_top_k
                 )
 
         self.cli_console = cli_console
@@ -563,6 +576,13 @@ class SearchLinksTool(Tool):
         else:
             log_func(f"[bold red]Unsupported search source: {search_source}[/bold red]")
 
+        # Hybrid search prefetches its own results
+        if self.prefetcher and search_source != "hybrid" and results_list:
+            self.prefetcher.prefetch(
+                [r.get("link") or r.get("url") for r in results_list],
+                top_k=self.prefetch_top_k
+            )
+
         # Return results in requested format
         if return_dict:
             # Return structured dict
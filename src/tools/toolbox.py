@@ -9,31 +9,17 @@ This module provides a centralized way to manage and initialize
 all DeepSearchAgent tools using the ToolCollection interface.
 """
 
+import importlib
 import logging
 import os
-from typing import Dict, List, Optional, Type, Any
+import time
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Type, Any, Union
 from contextlib import contextmanager
 from ..core.config.settings import settings
+from ..core.mcp_toolkit import get_mcp_manager
 from smolagents import Tool, ToolCollection
-
-# Import all DeepSearchAgent system agent's tools classes
-from .search import SearchLinksTool  # Universal Hybrid Web Search
-from .search_fast import SearchLinksFastTool  # Fast Web Search
-from .readurl import ReadURLTool  # Read URL (Crawl & Scrape URL transform to LLM friendly format URL content)
-from .github_qa import GitHubRepoQATool  # GitHub repo deep analysis (repo analysis & code analysis)
-from .xcom_qa import XcomDeepQATool  # X.com (Twitter) deep Q&A (search posts & read posts)
-from .chunk import ChunkTextTool  # Chunk Text
-from .embed import EmbedTextsTool  # Embed Texts
-from .rerank import RerankTextsTool  # Rerank Texts
-from .wolfram import EnhancedWolframAlphaTool  # Wolfram|Alpha API symbolic mathematics and Science Query
-# Academic tools
-try:
-    from .academic_retrieval import AcademicRetrieval  # Academic paper search and research
-except ImportError:
-    AcademicRetrieval = None  # Tool temporarily unavailable
-# Note: academic_qa and academic_research have been archived
-# Functionality will be integrated into academic_retrieval in future iterations
-from .final_answer import EnhancedFinalAnswerTool  # Final Answer
+from .final_answer import track_tool_sources
 
 TOOL_ICONS = {
     "search_links": "🔍",
@@ -53,23 +39,107 @@ TOOL_ICONS = {
 logger = logging.getLogger(__name__)
 
 
-# Define tool registry
-BUILTIN_TOOLS = {
-    "search_links": SearchLinksTool,
-    "search_fast": SearchLinksFastTool,
-    "read_url": ReadURLTool,
-    "github_repo_qa": GitHubRepoQATool,
-    "xcom_deep_qa": XcomDeepQATool,
-    "chunk_text": ChunkTextTool,
-    "embed_texts": EmbedTextsTool,
-    "rerank_texts": RerankTextsTool,
-    "wolfram": EnhancedWolframAlphaTool,
-    "final_answer": EnhancedFinalAnswerTool,
-}
+class LazyToolRegistry(MutableMapping):
+    """
+    Tool registry that imports tool classes on first use.
+
+    Entries are tool classes or ``"module:ClassName"`` import paths
+    (relative to ``src.tools``). Tool modules pull in heavy dependencies
+    (PyMuPDF, the Mistral and xAI SDKs, langchain splitters), so they
+    are only imported when the tool is first looked up. Tools whose
+    import fails resolve to None and are skipped, as before.
+    """
 
-# Add Academic tools only if they were successfully imported
-if AcademicRetrieval is not None:
-    BUILTIN_TOOLS["academic_retrieval"] = AcademicRetrieval
+    def __init__(
+        self,
+        tools: Optional[Dict[str, Union[str, Type[Tool]]]] = None
+    ):
+        self._specs: Dict[str, Union[str, Type[Tool]]] = dict(tools or {})
+        self._resolved: Dict[str, Optional[Type[Tool]]] = {}
+
+    def __getitem__(self, name: str) -> Optional[Type[Tool]]:
+        if name in self._resolved:
+            return self._resolved[name]
+        spec = self._specs[name]
+        tool_cls = self._import(name, spec) if isinstance(spec, str) else spec
+        self._resolved[name] = tool_cls
+        return tool_cls
+
+    def __setitem__(self, name: str, tool: Union[str, Type[Tool]]):
+        self._specs[name] = tool
+        self._resolved.pop(name, None)
+
+    def __delitem__(self, name: str):
+        del self._specs[name]
+        self._resolved.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        # The Mapping default looks the tool up, which would import it
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a tool's class has been imported already."""
+        return name in self._resolved or not isinstance(
+            self._specs.get(name), str
+        )
+
+    def module_path(self, name: str) -> str:
+        """Get the module a tool is defined in."""
+        spec = self._specs[name]
+        if isinstance(spec, str):
+            module_name = spec.partition(":")[0]
+            if module_name.startswith("."):
+                module_name = __package__ + module_name
+            return module_name
+        return spec.__module__
+
+    def copy(self) -> "LazyToolRegistry":
+        """Copy the registry, keeping already imported classes."""
+        registry = LazyToolRegistry(self._specs)
+        registry._resolved = dict(self._resolved)
+        return registry
+
+    def _import(self, name: str, spec: str) -> Optional[Type[Tool]]:
+        module_name, _, class_name = spec.partition(":")
+        start_time = time.perf_counter()
+        try:
+            module = importlib.import_module(module_name, __package__)
+            tool_cls = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Tool {name} is unavailable: {e}")
+            return None
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Imported tool {name} in {elapsed_ms:.0f}ms")
+        return tool_cls
+
+
+# Define tool registry; tool modules are imported on first use
+BUILTIN_TOOLS = LazyToolRegistry({
+    # Universal Hybrid Web Search
+    "search_links": ".search:SearchLinksTool",
+    # Fast Web Search
+    "search_fast": ".search_fast:SearchLinksFastTool",
+    # Read URL (Crawl & Scrape URL transform to LLM friendly format)
+    "read_url": ".readurl:ReadURLTool",
+    # GitHub repo deep analysis (repo analysis & code analysis)
+    "github_repo_qa": ".github_qa:GitHubRepoQATool",
+    # X.com (Twitter) deep Q&A (search posts & read posts)
+    "xcom_deep_qa": ".xcom_qa:XcomDeepQATool",
+    "chunk_text": ".chunk:ChunkTextTool",
+    "embed_texts": ".embed:EmbedTextsTool",
+    "rerank_texts": ".rerank:RerankTextsTool",
+    # Wolfram|Alpha API symbolic mathematics and Science Query
+    "wolfram": ".wolfram:EnhancedWolframAlphaTool",
+    "final_answer": ".final_answer:EnhancedFinalAnswerTool",
+    # Academic paper search and research
+    "academic_retrieval": ".academic_retrieval:AcademicRetrieval",
+})
 
 
 def _create_tool_instance(
@@ -254,7 +324,7 @@ def from_toolbox(
         )
 
         if tool_instance:
-            tools.append(tool_instance)
+            tools.append(track_tool_sources(tool_instance))
             logger.debug(
                 f"Added tool {name} {TOOL_ICONS.get(name, '')} to toolbox"
             )
@@ -384,7 +454,7 @@ class DeepSearchToolbox:
                 # Configure server parameters based on type
                 if server_type == "stdio":
                     self._load_stdio_mcp_server(server_config, api_keys)
-                elif server_type == "sse":
+                elif server_type in ("sse", "streamable-http"):
                     self._load_sse_mcp_server(server_config, api_keys)
                 else:
                     logger.error(
@@ -445,13 +515,12 @@ class DeepSearchToolbox:
                 env=env
             )
 
-            # Load tools from MCP server
-            with self.load_from_mcp(
+            # Register tools of the shared, long-lived server process
+            self.register_mcp_server(
                 server_params,
-                trust_remote_code=settings.TOOLS_TRUST_REMOTE_CODE,
+                name=server_config.get("name"),
                 replace_existing=True
-            ):
-                pass  # Tools are loaded in the context manager
+            )
 
         except Exception as e:
             logger.error(f"Failed to load stdio MCP server: {e}")
@@ -460,7 +529,7 @@ class DeepSearchToolbox:
         self, server_config: Dict[str, Any], api_keys: Dict[str, str]
     ) -> None:
         """
-        Load an SSE MCP server from configuration
+        Load an HTTP (SSE or streamable HTTP) MCP server from configuration
 
         Args:
             server_config: Server configuration
@@ -475,27 +544,35 @@ class DeepSearchToolbox:
                 return
 
             url = server_config.get("url")
-            logger.info(f"Loading SSE MCP server from URL: {url}")
+            transport = server_config.get(
+                "transport", server_config.get("type", "sse")
+            )
+            logger.info(f"Loading {transport} MCP server from URL: {url}")
 
-            # For SSE servers, we pass the config as a dictionary directly
-            # to ToolCollection.from_mcp which handles it appropriately
-            with self.load_from_mcp(
-                {"url": url},
-                trust_remote_code=settings.TOOLS_TRUST_REMOTE_CODE,
+            server_params = {"url": url, "transport": transport}
+            if isinstance(server_config.get("headers"), dict):
+                server_params["headers"] = server_config["headers"]
+
+            # Register tools of the shared, long-lived connection
+            self.register_mcp_server(
+                server_params,
+                name=server_config.get("name"),
                 replace_existing=True
-            ):
-                pass  # Tools are loaded in the context manager
+            )
 
         except Exception as e:
             logger.error(f"Failed to load SSE MCP server: {e}")
 
-    def register_tool(self, name: str, tool_cls: Type[Tool]) -> None:
+    def register_tool(
+        self, name: str, tool_cls: Union[str, Type[Tool]]
+    ) -> None:
         """
         Register a new tool in the toolbox
 
         Args:
             name: Tool identifier
-            tool_cls: Tool class to register
+            tool_cls: Tool class to register, or a ``"module:ClassName"``
+                import path to import it on first use
         """
         self.tool_registry[name] = tool_cls
         logger.info(f"Registered tool {name} in toolbox")
@@ -542,7 +619,7 @@ class DeepSearchToolbox:
             )
 
             if tool_instance:
-                tools.append(tool_instance)
+                tools.append(track_tool_sources(tool_instance))
 
         logger.info(f"Created tool collection with {len(tools)} tools")
         return ToolCollection(tools)
@@ -648,6 +725,63 @@ class DeepSearchToolbox:
             logger.error(f"Failed to load tools from Hub: {e}")
             return []
 
+    def register_mcp_server(
+        self,
+        server_parameters,
+        name: Optional[str] = None,
+        replace_existing: bool = False,
+        trust_remote_code: Optional[bool] = None
+    ) -> List[str]:
+        """
+        Register the tools of an MCP server kept open by the process-wide
+        MCP connection manager.
+
+        The server is connected (or its stdio process spawned) once per
+        process; later toolboxes reuse the connection and its cached tool
+        schemas, and tool calls from all agents share the session.
+
+        Args:
+            server_parameters: ``StdioServerParameters`` or a dict with a
+                ``url`` and ``transport``
+            name: Display name of the server for logs
+            replace_existing: Whether to replace existing tools with same name
+            trust_remote_code: Whether the server is trusted to run code
+                locally (default: ``settings.TOOLS_TRUST_REMOTE_CODE``)
+
+        Returns:
+            List of tool names that were registered
+
+        Raises:
+            ValueError: If the server is not trusted
+        """
+        if trust_remote_code is None:
+            trust_remote_code = settings.TOOLS_TRUST_REMOTE_CODE
+        if not trust_remote_code:
+            raise ValueError(
+                "Loading tools from MCP requires you to acknowledge you "
+                "trust the MCP server, as it will execute code on your local "
+                "machine: pass `trust_remote_code=True`."
+            )
+
+        connection = get_mcp_manager().get_connection(
+            server_parameters, name=name
+        )
+        registered = []
+        for tool_name, tool_cls in connection.tool_classes().items():
+            if tool_name in self.tool_registry and not replace_existing:
+                logger.warning(
+                    f"Tool {tool_name} already exists in registry. Skipping."
+                )
+                continue
+            self.register_tool(tool_name, tool_cls)
+            registered.append(tool_name)
+
+        logger.info(
+            f"Registered {len(registered)} tools from MCP server "
+            f"{connection.name}: {', '.join(registered)}"
+        )
+        return registered
+
     @contextmanager
     def load_from_mcp(
         self,
@@ -730,6 +864,8 @@ toolbox = DeepSearchToolbox()
 
 __all__ = [
     "ToolCollection",
+    "LazyToolRegistry",
+    "BUILTIN_TOOLS",
     "DeepSearchToolbox",
     "toolbox",
     "from_toolbox",
@@ -9,13 +9,18 @@ Uses xAI's Live Search API to analyze X.com content.
 """
 
 import re
+import asyncio
 import logging
-from typing import Optional, Union, Dict, Any, TYPE_CHECKING
+import threading
+from typing import (
+    Optional, Union, Dict, Any, AsyncIterator, Callable, List, TYPE_CHECKING
+)
 from smolagents import Tool
 
 if TYPE_CHECKING:
     from rich.console import Console
 
+from src.core.search_engines.base import AnswerChunk
 from src.core.xcom_toolkit import XAILiveSearchClient
 
 logger = logging.getLogger(__name__)
@@ -33,7 +38,8 @@ class XcomDeepQATool(Tool):
     name = "xcom_deep_qa"
     description = (
         "Deep query and analyze X.com content using xAI's Live Search. "
-        "Operations: 'search' (find posts), 'read' (extract post content), "
+        "Operations: 'search' (find posts), 'read' (extract post content; "
+        "pass several post URLs at once to read them in one batch), "
         "'query' (ask questions). Supports filters like user handles, "
         "engagement metrics, and date ranges."
     )
@@ -42,7 +48,8 @@ class XcomDeepQATool(Tool):
             "type": "string",
             "description": (
                 "Search query for 'search'/'query' operations, or X.com URL "
-                "for 'read' operation"
+                "(or several URLs separated by spaces or commas) for 'read' "
+                "operation"
             ),
         },
         "operation": {
@@ -87,6 +94,8 @@ class XcomDeepQATool(Tool):
         xai_api_key: Optional[str] = None,
         cli_console: Optional["Console"] = None,
         verbose: bool = False,
+        stream: bool = True,
+        on_chunk: Optional[Callable[[AnswerChunk], None]] = None,
     ):
         """
         Initialize XcomDeepQATool.
@@ -95,24 +104,59 @@ class XcomDeepQATool(Tool):
             xai_api_key: xAI API key (defaults to XAI_API_KEY env var)
             cli_console: Optional rich.console.Console for verbose CLI output
             verbose: Whether to enable verbose logging
+            stream: Stream answers, printing partial content and citations
+                to the console (when verbose) and ``on_chunk`` as they
+                arrive
+            on_chunk: Optional callback for each partial AnswerChunk
         """
         super().__init__()
 
         self.xai_api_key = xai_api_key
         self.cli_console = cli_console
         self.verbose = verbose
+        self.stream = stream
+        self.on_chunk = on_chunk
 
         # XAILiveSearchClient instance will be created when needed
         self.client: Optional[XAILiveSearchClient] = None
+        self._client_lock = threading.Lock()
+        # Event loop thread running streamed answers, started on first use,
+        # so the client's async SDK channel is reused across calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
     def _ensure_client(self):
         """Ensure XAILiveSearchClient instance is created."""
-        if self.client is None:
-            self.client = XAILiveSearchClient(api_key=self.xai_api_key)
-            if self.verbose and self.cli_console:
-                self.cli_console.print(
-                    "[green]Connected to xAI Live Search API[/green]"
-                )
+        with self._client_lock:
+            if self.client is None:
+                self.client = XAILiveSearchClient(api_key=self.xai_api_key)
+                if self.verbose and self.cli_console:
+                    self.cli_console.print(
+                        "[green]Connected to xAI Live Search API[/green]"
+                    )
+
+    def _extract_x_urls(self, text: str) -> List[str]:
+        """Extract the X.com URLs of a space or comma separated list."""
+        return [
+            url for url in re.split(r"[\s,]+", text or "")
+            if self._is_x_url(url)
+        ]
+
+    def _format_posts(self, results: Dict[str, Dict[str, Any]]) -> str:
+        """Format the results of a batched read, one section per URL."""
+        sections = []
+        for url, result in results.items():
+            if result.get("success"):
+                section = f"## Post: {url}\n\n{result.get('content', '')}"
+                if result.get("citations"):
+                    section += "\n\n### Sources\n" + "".join(
+                        f"{i}. {citation}\n"
+                        for i, citation in enumerate(result["citations"], 1)
+                    )
+            else:
+                section = f"## Post: {url}\n\nError: {result.get('error')}"
+            sections.append(section)
+        return "\n\n".join(sections)
 
     def _is_x_url(self, text: str) -> bool:
         """Check if text is an X.com URL."""
@@ -176,6 +220,85 @@ class XcomDeepQATool(Tool):
 
         return cleaned if cleaned else None
 
+    async def astream(
+        self,
+        query_or_url: str,
+        operation: str = "search",
+        search_params: Optional[Dict[str, Any]] = None,
+        question: Optional[str] = None,
+        max_results: int = 20,
+    ) -> AsyncIterator[AnswerChunk]:
+        """
+        Stream an operation's answer as it is generated.
+
+        Args:
+            query_or_url: Search query or X.com URL
+            operation: Operation to perform ('search', 'read', 'query')
+            search_params: Optional search filters
+            question: Question for 'query' operation
+            max_results: Maximum results for search
+
+        Yields:
+            AnswerChunk objects with partial content and citations; the
+            last one carries the operation's result dict
+        """
+        self._ensure_client()
+        assert self.client is not None, "Client not initialized"
+
+        async for chunk in self.client.stream(
+            operation,
+            query_or_url,
+            search_params=self._validate_search_params(search_params),
+            question=question,
+            max_results=max_results,
+        ):
+            yield chunk
+
+    async def _consume_stream(self, **request) -> Dict[str, Any]:
+        """Show a streamed answer as it arrives and return its result."""
+        result: Dict[str, Any] = {}
+        show = self.verbose and self.cli_console
+        async for chunk in self.astream(**request):
+            if chunk.final:
+                result = chunk.result
+                continue
+            if self.on_chunk:
+                self.on_chunk(chunk)
+            if show:
+                if chunk.content:
+                    self.cli_console.print(
+                        chunk.content, end="", markup=False, highlight=False
+                    )
+                for citation in chunk.citations:
+                    self.cli_console.print(f"\n[dim]Source: {citation}[/dim]")
+        if show:
+            self.cli_console.print()
+        return result
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop thread that runs streamed answers."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="xcom-qa-stream",
+                    daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _run_stream(self, **request) -> Dict[str, Any]:
+        """Consume a streamed answer on the tool's event loop thread."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._consume_stream(**request), self._get_loop()
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
     def forward(
         self,
         query_or_url: str,
@@ -211,7 +334,54 @@ class XcomDeepQATool(Tool):
         try:
             assert self.client is not None, "Client not initialized"
 
-            if operation == "search":
+            # Validate the request
+            post_urls = (
+                self._extract_x_urls(query_or_url) if operation == "read"
+                else []
+            )
+            if operation == "read" and not post_urls:
+                error_msg = (
+                    f"Invalid X.com URL: '{query_or_url}'. "
+                    f"Expected URL starting with https://x.com/ or "
+                    f"https://twitter.com/"
+                )
+            elif operation == "query" and not question:
+                error_msg = "Question is required when operation='query'"
+            elif operation not in ("search", "read", "query"):
+                error_msg = (
+                    f"Unknown operation: '{operation}'. "
+                    f"Valid operations: 'search', 'read', 'query'"
+                )
+            else:
+                error_msg = None
+            if error_msg:
+                if self.verbose and self.cli_console:
+                    self.cli_console.print(f"[red]Error: {error_msg}[/red]")
+                return {"error": error_msg, "success": False}
+
+            if len(post_urls) == 1:
+                query_or_url = post_urls[0]
+            elif len(post_urls) > 1:
+                # Read several posts with batched, deduplicated requests
+                results = self.client.read_x_posts(post_urls)
+                if self.verbose and self.cli_console:
+                    self.cli_console.print(
+                        f"[green]X.com Deep QA read {len(results)} posts"
+                        f"[/green]"
+                    )
+                return self._format_posts(results)
+
+            if self.stream:
+                # Stream the answer, showing it as it is generated
+                result = self._run_stream(
+                    query_or_url=query_or_url,
+                    operation=operation,
+                    search_params=search_params,
+                    question=question,
+                    max_results=max_results,
+                )
+
+            elif operation == "search":
                 # Search X posts
                 result = self.client.search_x_posts(
                     query=query_or_url,
@@ -220,28 +390,10 @@ class XcomDeepQATool(Tool):
                 )
 
             elif operation == "read":
-                # Validate URL
-                if not self._is_x_url(query_or_url):
-                    error_msg = (
-                        f"Invalid X.com URL: '{query_or_url}'. "
-                        f"Expected URL starting with https://x.com/ or "
-                        f"https://twitter.com/"
-                    )
-                    if self.verbose and self.cli_console:
-                        self.cli_console.print(f"[red]Error: {error_msg}[/red]")
-                    return {"error": error_msg, "success": False}
-
                 # Read specific post
                 result = self.client.read_x_post(url=query_or_url)
 
-            elif operation == "query":
-                # Validate question
-                if not question:
-                    error_msg = "Question is required when operation='query'"
-                    if self.verbose and self.cli_console:
-                        self.cli_console.print(f"[red]Error: {error_msg}[/red]")
-                    return {"error": error_msg, "success": False}
-
+            else:
                 # Query about X content
                 result = self.client.query_x_content(
                     question=question,
@@ -249,15 +401,6 @@ class XcomDeepQATool(Tool):
                     search_params=search_params,
                 )
 
-            else:
-                error_msg = (
-                    f"Unknown operation: '{operation}'. "
-                    f"Valid operations: 'search', 'read', 'query'"
-                )
-                if self.verbose and self.cli_console:
-                    self.cli_console.print(f"[red]Error: {error_msg}[/red]")
-                return {"error": error_msg, "success": False}
-
             # Process result
             if result.get("success"):
                 if self.verbose and self.cli_console:
@@ -268,7 +411,9 @@ class XcomDeepQATool(Tool):
                 # For better integration, return content directly for read/query
                 if operation in ["read", "query"]:
                     # Include metadata in response
-                    response = result.get("content", "")
+                    response = result.get("content") or result.get(
+                        "answer", ""
+                    )
                     if result.get("citations"):
                         response += "\n\n## Sources\n"
                         for i, citation in enumerate(result["citations"], 1):
@@ -13,8 +13,9 @@ Use xcom_deep_qa tool for more advanced X.com search and analysis capabilities.
 """
 
 import re
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import Dict, Optional
 import logging
 from smolagents import Tool
 from src.core.scraping.scraper_xcom import XcomScraper
@@ -82,20 +83,29 @@ class XcomReadURLTool(Tool):
 
         # XcomScraper instance will be created when needed or setup()
         self.scraper: Optional[XcomScraper] = None
+        # One scraper per output format, so concurrent reads in different
+        # formats don't replace each other's scraper
+        self._scrapers: Dict[str, XcomScraper] = {}
         self.cli_console = cli_console
         self.verbose = verbose
 
         # Thread pool for handling async operations
         self._executor = ThreadPoolExecutor(max_workers=10)
-
-    def _ensure_scraper(self, output_format: str = "markdown"):
-        """Ensure XcomScraper instance is created and configured correctly."""
-        if self.scraper is None or self.scraper.output_format != output_format:
-            self.scraper = XcomScraper(
-                api_key=self.xai_api_key,
-                output_format=output_format,
-                timeout=120
-            )
+        self._scraper_lock = threading.Lock()
+
+    def _ensure_scraper(self, output_format: str = "markdown") -> XcomScraper:
+        """Get the XcomScraper for an output format, creating it if needed."""
+        with self._scraper_lock:
+            scraper = self._scrapers.get(output_format)
+            if scraper is None:
+                scraper = XcomScraper(
+                    api_key=self.xai_api_key,
+                    output_format=output_format,
+                    timeout=120
+                )
+                self._scrapers[output_format] = scraper
+            self.scraper = scraper
+            return scraper
 
     def _run_in_thread(self, url, output_format):
         """
@@ -109,8 +119,8 @@ class XcomReadURLTool(Tool):
             Content of the URL or error message
         """
         try:
-            self._ensure_scraper(output_format)
-            result = self.scraper.scrape(url)
+            scraper = self._ensure_scraper(output_format)
+            result = scraper.scrape(url)
 
             if result.success:
                 return result.content
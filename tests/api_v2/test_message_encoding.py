@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/api_v2/test_message_encoding.py
+# code style: PEP 8
+
+"""
+Unit tests for cached message serialization and WebSocket frame encoding.
+"""
+
+import json
+
+import pytest
+
+from src.api.v2.encoding import (
+    JSON_SUBPROTOCOL, MSGPACK_SUBPROTOCOL, MessageDecoder, MessageEncoder,
+    negotiate_subprotocol
+)
+from src.api.v2.models import DSAgentRunMessage, PongMessage
+from src.api.v2.session import MessageStore
+
+
+def _make_delta(seq: int, content: str) -> DSAgentRunMessage:
+    """Create a streaming delta message."""
+    message = DSAgentRunMessage(
+        role="assistant",
+        content=content,
+        metadata={
+            "component": "chat",
+            "message_type": "action_thought",
+            "streaming": True,
+            "is_delta": True,
+            "stream_id": "stream-1",
+        },
+        session_id="session-1",
+        step_number=2,
+    )
+    message.seq = seq
+    return message
+
+
+def test_json_cached_per_sequence_number():
+    """JSON is serialized once and shared with stored history entries."""
+    message = _make_delta(1, "Thinking")
+    first = message.to_json()
+    assert message.to_json() is first
+    assert json.loads(first) == message.model_dump(mode="json")
+
+    message.seq = 2
+    assert json.loads(message.to_json())["seq"] == 2
+
+    store = MessageStore()
+    entry = store.get(store.add(message, seq=message.seq))
+    assert entry.to_json() is message.to_json()
+
+
+def test_json_frames():
+    """Plain connections get the cached JSON text unchanged."""
+    encoder = MessageEncoder()
+    message = _make_delta(1, "Thinking")
+
+    assert encoder.encode_message(message) is message.to_json()
+    assert json.loads(encoder.encode_control(PongMessage())) == {
+        "type": "pong"
+    }
+    assert negotiate_subprotocol([]) is None
+    assert negotiate_subprotocol(["other", JSON_SUBPROTOCOL]) == (
+        JSON_SUBPROTOCOL
+    )
+
+
+def test_msgpack_frames_intern_metadata():
+    """Binary frames round-trip and repeat metadata as short references."""
+    pytest.importorskip("msgpack")
+    assert negotiate_subprotocol([MSGPACK_SUBPROTOCOL]) == (
+        MSGPACK_SUBPROTOCOL
+    )
+    encoder = MessageEncoder(MSGPACK_SUBPROTOCOL)
+    decoder = MessageDecoder()
+
+    messages = [_make_delta(seq, "x" * seq) for seq in (1, 2, 3)]
+    frames = [encoder.encode_message(message) for message in messages]
+    assert all(isinstance(frame, bytes) for frame in frames)
+    assert len(frames[1]) < len(frames[0])
+    assert len(frames[1]) < len(messages[1].to_json()) // 2
+
+    for message, frame in zip(messages, frames):
+        assert decoder.decode(frame) == message.model_dump(mode="json")
+    assert decoder.decode(encoder.encode_control(PongMessage())) == {
+        "type": "pong"
+    }
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/api_v2/test_message_store.py
+# code style: PEP 8
+
+"""
+Unit tests for the v2 session MessageStore and ReplayBuffer.
+"""
+
+import json
+
+import pytest
+
+from src.api.v2.session import (
+    AgentSession, MessageStore, ReplayBuffer, SessionState
+)
+from src.api.v2.models import DSAgentRunMessage
+
+
+def _make_message(index: int) -> DSAgentRunMessage:
+    """Create a test message for the given index."""
+    return DSAgentRunMessage(
+        role="assistant",
+        content=f"message {index}",
+        metadata={"component": "chat" if index % 2 else "webide"},
+        step_number=index // 3
+    )
+
+
+class TestMessageStore:
+    """Test ring buffer, cursor pagination and indexes."""
+
+    def test_sequence_numbers(self):
+        """Test sequence numbers are assigned monotonically."""
+        store = MessageStore()
+        seqs = [store.add(_make_message(i)) for i in range(3)]
+
+        assert seqs == [1, 2, 3]
+        assert store.first_seq == 1
+        assert store.last_seq == 3
+        assert store.get_count() == 3
+
+    def test_ring_buffer_eviction(self):
+        """Test oldest messages are evicted when full."""
+        store = MessageStore(max_messages=5)
+        for i in range(12):
+            store.add(_make_message(i))
+
+        assert store.get_count() == 5
+        assert store.first_seq == 8
+        assert store.get(7) is None
+        assert store.get(8).message.content == "message 7"
+        assert [m.content for m in store.messages] == [
+            f"message {i}" for i in range(7, 12)
+        ]
+
+    def test_get_recent(self):
+        """Test most recent messages are returned in order."""
+        store = MessageStore()
+        for i in range(10):
+            store.add(_make_message(i))
+
+        recent = store.get_recent(3)
+        assert [m.content for m in recent] == [
+            "message 7", "message 8", "message 9"
+        ]
+
+    def test_cursor_pagination(self):
+        """Test after_seq and before_seq cursors."""
+        store = MessageStore()
+        for i in range(10):
+            store.add(_make_message(i))
+
+        forward = store.get_page(after_seq=4, limit=3)
+        assert [e.seq for e in forward] == [5, 6, 7]
+
+        backward = store.get_page(before_seq=5, limit=3)
+        assert [e.seq for e in backward] == [2, 3, 4]
+
+        window = store.get_page(after_seq=2, before_seq=5)
+        assert [e.seq for e in window] == [3, 4]
+
+        assert store.get_page(after_seq=10) == []
+        assert store.get_page(limit=0) == []
+
+    def test_filter_by_step_and_component(self):
+        """Test step and component filters use the indexes."""
+        store = MessageStore()
+        for i in range(12):
+            store.add(_make_message(i))
+
+        by_step = store.get_page(step=2)
+        assert [e.message.content for e in by_step] == [
+            "message 6", "message 7", "message 8"
+        ]
+
+        by_both = store.get_page(step=2, component="chat")
+        assert [e.message.content for e in by_both] == ["message 7"]
+
+        by_component = store.get_page(component="webide", limit=2)
+        assert [e.message.content for e in by_component] == [
+            "message 8", "message 10"
+        ]
+
+    def test_filters_skip_evicted_messages(self):
+        """Test index lookups ignore messages evicted from the ring."""
+        store = MessageStore(max_messages=4)
+        for i in range(12):
+            store.add(_make_message(i))
+
+        page = store.get_page(component="chat")
+        assert [e.message.content for e in page] == [
+            "message 9", "message 11"
+        ]
+
+    def test_cached_json(self):
+        """Test serialized JSON is cached per stored message."""
+        store = MessageStore()
+        seq = store.add(_make_message(1))
+        entry = store.get(seq)
+
+        first = entry.to_json()
+        assert json.loads(first)["content"] == "message 1"
+        assert entry.to_json() is first
+
+    def test_clear(self):
+        """Test clearing keeps sequence numbers monotonic."""
+        store = MessageStore()
+        for i in range(3):
+            store.add(_make_message(i))
+        store.clear()
+
+        assert store.get_count() == 0
+        assert store.get_page() == []
+        assert store.add(_make_message(3)) == 4
+
+    def test_invalid_capacity(self):
+        """Test non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            MessageStore(max_messages=0)
+
+    def test_external_sequence_numbers(self):
+        """Test sparse, externally assigned sequence numbers."""
+        store = MessageStore(max_messages=3)
+        for seq in [2, 5, 7, 9, 12]:
+            store.add(_make_message(seq), seq=seq)
+
+        assert store.first_seq == 7
+        assert store.last_seq == 12
+        assert [e.seq for e in store.get_page(after_seq=7)] == [9, 12]
+        assert [e.seq for e in store.get_page(before_seq=9)] == [7]
+        assert store.get(8) is None
+
+        with pytest.raises(ValueError):
+            store.add(_make_message(0), seq=12)
+
+
+class TestReplayBuffer:
+    """Test the resumable stream replay buffer."""
+
+    @staticmethod
+    def _append(buffer: ReplayBuffer, seq: int, **metadata):
+        message = DSAgentRunMessage(
+            role="assistant",
+            content=f"message {seq}",
+            metadata=metadata,
+            seq=seq
+        )
+        buffer.append(message)
+        return message
+
+    def test_since_returns_gap(self):
+        """Test only messages after last_seq are replayed."""
+        buffer = ReplayBuffer()
+        for seq in range(1, 6):
+            self._append(buffer, seq)
+
+        gap, complete = buffer.since(3)
+        assert [m.seq for m in gap] == [4, 5]
+        assert complete
+
+    def test_deltas_are_coalesced(self):
+        """Test a newer delta supersedes older deltas of its stream."""
+        buffer = ReplayBuffer()
+        self._append(buffer, 1, stream_id="s", is_initial_stream=True)
+        for seq in range(2, 7):
+            self._append(buffer, seq, stream_id="s", is_delta=True)
+        self._append(buffer, 7)
+
+        gap, complete = buffer.since(0)
+        assert [m.seq for m in gap] == [1, 6, 7]
+        assert complete
+
+    def test_evicted_gap_is_incomplete(self):
+        """Test resuming past the buffer horizon is reported."""
+        buffer = ReplayBuffer(max_messages=3)
+        for seq in range(1, 8):
+            self._append(buffer, seq)
+
+        gap, complete = buffer.since(2)
+        assert [m.seq for m in gap] == [5, 6, 7]
+        assert not complete
+        assert buffer.since(4)[1]
+
+
+class FakeProcessor:
+    """Message processor streaming one answer per run."""
+
+    async def process_agent_stream(self, agent, query, **kwargs):
+        yield DSAgentRunMessage(role="assistant", content=f"answer: {query}")
+
+
+class TestAgentSession:
+    """Test background runs and resumable stream cursors."""
+
+    @staticmethod
+    def _session() -> AgentSession:
+        session = AgentSession("test-session")
+        session.agent = object()
+        session.processor = FakeProcessor()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_init_failure_is_reported(self):
+        """An agent that fails to initialize ends the run in ERROR."""
+        session = AgentSession("test-session")
+
+        async def fail():
+            raise RuntimeError("no model configured")
+
+        session.initialize_agent = fail
+        session.start_query("question")
+        subscription = session.subscribe(after_seq=0)
+        messages = [message async for message in subscription]
+
+        assert [m.role for m in messages] == ["user", "assistant"]
+        assert messages[-1].metadata["error"]
+        assert "no model configured" in messages[-1].content
+        assert session.state == SessionState.ERROR
+        assert session.get_messages()[-1] is messages[-1]
+
+    @pytest.mark.asyncio
+    async def test_cursor_from_other_epoch_replays_current_run(self):
+        """Cursors only resume within the epoch they were received in."""
+        session = self._session()
+        await session.start_query("first")
+        first_epoch = session.stream_epoch
+        session.state = SessionState.IDLE
+        await session.start_query("second")
+
+        assert session.stream_epoch != first_epoch
+        resumed = session.subscribe(after_seq=3, epoch=session.stream_epoch)
+        assert [m.seq for m in resumed.replayed] == [4]
+        assert resumed.complete
+
+        stale = session.subscribe(after_seq=3, epoch=first_epoch)
+        assert [m.content for m in stale.replayed] == [
+            "second", "answer: second"
+        ]
+        assert not stale.complete
+        assert stale.replayed[0].metadata["stream_epoch"] == (
+            session.stream_epoch
+        )
+
+        # A recreated session starts a new epoch of sequence numbers
+        recreated = self._session()
+        assert not recreated.subscribe(after_seq=1, epoch=first_epoch).complete
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/performance/test_benchmark_stats.py
+# code style: PEP 8
+
+"""
+Tests for the benchmark harness statistics and regression comparison.
+"""
+
+import pytest
+
+from benchmarks.stats import compare_results, percentile, summarize
+
+
+def _document(p95: float, throughput: float) -> dict:
+    return {
+        "scenarios": {
+            "hybrid_search": {
+                "throughput_per_s": throughput,
+                "latency_ms": {"p50": 100.0, "p95": p95, "p99": p95},
+            }
+        }
+    }
+
+
+class TestBenchmarkStats:
+    """Test latency summaries and result comparison."""
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate linearly between samples."""
+        samples = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(samples, 0) == 1.0
+        assert percentile(samples, 50) == pytest.approx(2.5)
+        assert percentile(samples, 100) == 4.0
+
+    def test_summarize(self):
+        """Summaries report milliseconds and throughput."""
+        summary = summarize([0.1, 0.2, 0.3], wall_seconds=0.6, errors=1)
+        assert summary["operations"] == 4
+        assert summary["errors"] == 1
+        assert summary["throughput_per_s"] == pytest.approx(5.0)
+        assert summary["latency_ms"]["p50"] == pytest.approx(200.0)
+
+    def test_compare_flags_regressions(self):
+        """Slower p95 or lower throughput beyond the threshold regresses."""
+        baseline = _document(p95=200.0, throughput=10.0)
+
+        rows = compare_results(baseline, _document(205.0, 9.8), 10.0)
+        assert not rows[0]["regression"]
+
+        rows = compare_results(baseline, _document(260.0, 10.0), 10.0)
+        assert rows[0]["regression"]
+        assert rows[0]["p95"]["change_pct"] == pytest.approx(30.0)
+
+        rows = compare_results(baseline, _document(200.0, 8.0), 10.0)
+        assert rows[0]["regression"]
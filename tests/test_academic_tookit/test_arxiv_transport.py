@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/test_academic_tookit/test_arxiv_transport.py
+
+"""
+Offline tests for the async arXiv transport and search cache.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+
+from src.core.academic_tookit.models import Paper, PaperSource, SearchParams
+from src.core.academic_tookit.paper_search.arxiv import (
+    ArxivClient,
+    ArxivRateLimiter,
+    ArxivSearchCache,
+    AsyncArxivTransport,
+)
+from src.core.academic_tookit.paper_search.arxiv.arxiv_sdk import Search
+from src.core.academic_tookit.paper_search.arxiv.async_transport import (
+    ArxivPage,
+    AtomEntryParser,
+    get_shared_rate_limiter,
+)
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <opensearch:totalResults>250</opensearch:totalResults>
+  <entry>
+    <id>http://arxiv.org/abs/2210.03629v3</id>
+    <updated>2023-03-10T01:00:40Z</updated>
+    <published>2022-10-06T01:00:32Z</published>
+    <title>ReAct: Synergizing Reasoning
+      and Acting in Language Models</title>
+    <summary>We explore the use of LLMs.</summary>
+    <author><name>Shunyu Yao</name></author>
+    <author><name>Jeffrey Zhao</name></author>
+    <arxiv:comment>ICLR 2023</arxiv:comment>
+    <link href="http://arxiv.org/abs/2210.03629v3" rel="alternate"
+          type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2210.03629v3"
+          rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.CL"/>
+    <category term="cs.CL"/>
+    <category term="cs.AI"/>
+  </entry>
+</feed>"""
+
+
+class _FakeTransport(AsyncArxivTransport):
+    """Transport serving synthetic pages instead of HTTP requests."""
+
+    def __init__(self, total: int, **kwargs):
+        super().__init__(rate_limiter=ArxivRateLimiter(0), **kwargs)
+        self.total = total
+        self.requests = []
+
+    async def _fetch_page(self, url, first_page):
+        query = dict(parse_qsl(urlparse(url).query))
+        start, size = int(query["start"]), int(query["max_results"])
+        self.requests.append((start, size))
+        await asyncio.sleep(0)
+        return ArxivPage(
+            total_results=self.total,
+            results=list(range(start, min(start + size, self.total)))
+        )
+
+
+def _make_paper(paper_id: str) -> Paper:
+    return Paper(
+        paper_id=paper_id,
+        title="Test paper",
+        authors=["A. Author"],
+        abstract="Abstract",
+        source=PaperSource.ARXIV,
+        published_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        url=f"https://arxiv.org/abs/{paper_id}"
+    )
+
+
+@pytest.mark.unit
+class TestAtomEntryParser:
+    """Test incremental Atom parsing."""
+
+    def test_parse_in_chunks(self):
+        """Entries parse correctly when the body arrives in pieces."""
+        parser = AtomEntryParser()
+        results = []
+        for i in range(0, len(SAMPLE_FEED), 64):
+            results.extend(parser.feed(SAMPLE_FEED[i:i + 64]))
+        results.extend(parser.close())
+
+        assert parser.total_results == 250
+        assert len(results) == 1
+        result = results[0]
+        assert result.get_short_id() == "2210.03629v3"
+        assert result.title == (
+            "ReAct: Synergizing Reasoning and Acting in Language Models"
+        )
+        assert [a.name for a in result.authors] == [
+            "Shunyu Yao", "Jeffrey Zhao"
+        ]
+        assert result.pdf_url == "http://arxiv.org/pdf/2210.03629v3"
+        assert result.categories == ["cs.CL", "cs.AI"]
+        assert result.primary_category == "cs.CL"
+        assert result.comment == "ICLR 2023"
+        assert result.published.year == 2022
+
+
+@pytest.mark.unit
+class TestAsyncArxivTransport:
+    """Test pagination and rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_pagination_respects_max_results(self):
+        transport = _FakeTransport(total=1000, page_size=100)
+        results = [
+            r async for r in transport.results(
+                Search(query="test", max_results=250)
+            )
+        ]
+
+        assert results == list(range(250))
+        assert transport.requests == [(0, 100), (100, 100), (200, 50)]
+
+    @pytest.mark.asyncio
+    async def test_pagination_stops_at_total(self):
+        transport = _FakeTransport(total=30, page_size=100)
+        results = [
+            r async for r in transport.results(
+                Search(query="test", max_results=100)
+            )
+        ]
+
+        assert results == list(range(30))
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_requests(self):
+        limiter = ArxivRateLimiter(delay_seconds=0.05)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        assert time.monotonic() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_caller_delay(self):
+        limiter = ArxivRateLimiter(delay_seconds=0.0)
+        start = time.monotonic()
+        await limiter.acquire(0.1)
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.1
+        assert limiter.delay_seconds == 0.0
+
+    def test_session_per_event_loop(self):
+        transport = AsyncArxivTransport()
+
+        async def use_session():
+            first = await transport._get_session()
+            second = await transport._get_session()
+            assert first is second
+            await transport.close()
+            assert first.closed
+            return first
+
+        assert asyncio.run(use_session()) is not asyncio.run(use_session())
+
+    def test_client_does_not_change_shared_limiter(self):
+        shared = get_shared_rate_limiter()
+        delay = shared.delay_seconds
+        client = ArxivClient(delay_seconds=delay + 5)
+
+        assert shared.delay_seconds == delay
+        assert client._transport.delay_seconds == delay + 5
+
+
+@pytest.mark.unit
+class TestArxivSearchCache:
+    """Test the persistent search cache."""
+
+    def test_roundtrip_through_disk(self, tmp_path):
+        key = SearchParams(query="react agents").get_cache_key()
+        ArxivSearchCache(cache_dir=tmp_path).set(key, [_make_paper("1")])
+
+        # A fresh instance reads the persisted entry
+        cache = ArxivSearchCache(cache_dir=tmp_path)
+        papers = cache.get(key)
+
+        assert [p.paper_id for p in papers] == ["1"]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_expired_entries_miss(self, tmp_path):
+        cache = ArxivSearchCache(cache_dir=tmp_path, ttl_seconds=0)
+        cache.set("key", [_make_paper("1")])
+        time.sleep(0.01)
+
+        assert cache.get("key") is None
+        assert not (tmp_path / "key.json").exists()
+
+    def test_memory_only_lru(self, tmp_path):
+        cache = ArxivSearchCache(
+            cache_dir=tmp_path, max_entries=2, persist=False
+        )
+        for key in ("a", "b", "c"):
+            cache.set(key, [_make_paper(key)])
+
+        assert cache.get("a") is None
+        assert cache.get("c")[0].paper_id == "c"
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/test_academic_tookit/test_deduplicator.py
+
+"""
+Unit tests for title-based grouping in PaperDeduplicator.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.academic_tookit.models import Paper, PaperSource
+from src.core.academic_tookit.ranking.deduplicator import PaperDeduplicator
+
+
+def _make_paper(paper_id: str, title: str, year: int = 2024) -> Paper:
+    return Paper(
+        paper_id=paper_id,
+        title=title,
+        authors=["A. Author"],
+        abstract="Abstract",
+        source=PaperSource.ARXIV,
+        published_date=datetime(year, 1, 1, tzinfo=timezone.utc),
+        url=f"https://arxiv.org/abs/{paper_id}"
+    )
+
+
+def _brute_force_groups(dedup, papers):
+    """Reference all-pairs grouping the blocked version must match."""
+    groups, used = [], set()
+    for i, p1 in enumerate(papers):
+        if i in used:
+            continue
+        group = [p1]
+        used.add(i)
+        for j in range(i + 1, len(papers)):
+            p2 = papers[j]
+            if j in used:
+                continue
+            similarity = dedup._calculate_title_similarity(p1.title, p2.title)
+            same_year = p1.published_date.year == p2.published_date.year
+            if same_year and (
+                similarity >= dedup.title_similarity_threshold
+            ):
+                group.append(p2)
+                used.add(j)
+        if len(group) > 1:
+            groups.append(group)
+    return groups
+
+
+@pytest.mark.unit
+class TestTitleGrouping:
+    """Test blocked near-duplicate title grouping."""
+
+    def test_near_duplicates_grouped(self):
+        dedup = PaperDeduplicator()
+        papers = [
+            _make_paper("1", "ReAct: Synergizing Reasoning and Acting"),
+            _make_paper("2", "REACT - synergizing reasoning and acting."),
+            _make_paper("3", "Attention Is All You Need"),
+        ]
+
+        groups = dedup._group_by_title(papers)
+
+        # Only groups with duplicates are returned
+        assert [[p.paper_id for p in g] for g in groups] == [["1", "2"]]
+
+    def test_different_years_not_grouped(self):
+        dedup = PaperDeduplicator()
+        papers = [
+            _make_paper("1", "Scaling Laws for Neural Language Models", 2020),
+            _make_paper("2", "Scaling Laws for Neural Language Models", 2022),
+        ]
+
+        assert dedup._group_by_title(papers) == []
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        words = [
+            "neural", "graph", "language", "model", "retrieval", "agents",
+            "reasoning", "efficient", "transformer", "learning", "search",
+            "survey", "benchmark", "scaling", "diffusion", "robust"
+        ]
+        papers = []
+        for i in range(150):
+            title = " ".join(rng.sample(words, 6))
+            papers.append(_make_paper(f"{i}", title, rng.choice([2023, 2024])))
+            if i % 3 == 0:
+                # Typo-level variant of the same title
+                variant = title.replace("e", "a", 1) + "s"
+                papers.append(_make_paper(
+                    f"{i}v", variant, papers[-1].published_date.year
+                ))
+        rng.shuffle(papers)
+
+        dedup = PaperDeduplicator()
+        blocked = dedup._group_by_title(papers)
+        expected = _brute_force_groups(dedup, papers)
+
+        assert expected
+
+        assert [[p.paper_id for p in g] for g in blocked] == [
+            [p.paper_id for p in g] for g in expected
+        ]
+
+    def test_recall_on_near_duplicate_titles(self):
+        """Variants just above the threshold are grouped as by all-pairs."""
+        rng = random.Random(11)
+        words = [
+            "neural", "graph", "language", "model", "retrieval", "agents",
+            "reasoning", "efficient", "transformer", "learning", "search",
+            "survey", "benchmark", "scaling", "diffusion", "robust",
+            "vision", "policy", "optimization", "sparse", "attention",
+            "federated", "causal", "contrastive", "memory", "planning"
+        ]
+        letters = "abcdefghijklmnopqrstuvwxyz "
+        dedup = PaperDeduplicator()
+
+        def edit(title):
+            chars = list(title)
+            i = rng.randrange(len(chars))
+            op = rng.random()
+            if op < 0.4:
+                chars[i] = rng.choice(letters)
+            elif op < 0.7:
+                chars.insert(i, rng.choice(letters))
+            else:
+                del chars[i]
+            return "".join(chars)
+
+        papers = []
+        for i in range(300):
+            title = " ".join(rng.sample(words, rng.randint(2, 7)))
+            papers.append(_make_paper(f"{i}", title))
+            # Keep editing while the variant stays a duplicate
+            variant = title
+            for _ in range(12):
+                edited = edit(variant)
+                similarity = dedup._calculate_title_similarity(title, edited)
+                if similarity < dedup.title_similarity_threshold:
+                    break
+                variant = edited
+            papers.append(_make_paper(f"{i}v", variant))
+        rng.shuffle(papers)
+
+        blocked = dedup._group_by_title(papers)
+        expected = _brute_force_groups(dedup, papers)
+
+        assert len(expected) > 250
+        assert [[p.paper_id for p in g] for g in blocked] == [
+            [p.paper_id for p in g] for g in expected
+        ]
+
+    def test_lsh_parameters_follow_threshold(self):
+        """Stricter thresholds allow more selective LSH bands."""
+        loose = PaperDeduplicator(title_similarity_threshold=0.85)
+        strict = PaperDeduplicator(title_similarity_threshold=0.95)
+
+        assert loose.lsh_rows < strict.lsh_rows
+        assert (
+            PaperDeduplicator(
+                title_similarity_threshold=0.5
+            ).lsh_bands is None
+        )
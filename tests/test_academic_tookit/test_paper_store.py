@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/test_academic_tookit/test_paper_store.py
+
+"""
+Unit tests for the parsed-paper store and its use by PaperReader.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.academic_tookit.paper_reader import (
+    HTMLParserConfig, PaperKey, PaperReader, PaperReaderConfig,
+    ParsedPaperStore, split_paper_version
+)
+
+
+def make_result(paper_id="2301.12345v2", content_format="html"):
+    """Build a standardized reader result."""
+    sections = [{"title": "Introduction", "level": 1}]
+    return {
+        "paper_id": paper_id,
+        "content_format": content_format,
+        "full_text": "# Paper\n\n" + "Body text. " * 200,
+        "sections": sections,
+        "figures": [],
+        "tables": [],
+        "references": [{"title": "Attention Is All You Need"}],
+        "equations": [],
+        "metadata": {"title": "Paper", "sections": sections},
+        "metadata_sources": {"title": "extracted"},
+        "processing_info": {"parser": "jina_reader"},
+    }
+
+
+class CountingReader(PaperReader):
+    """PaperReader whose HTML parse is local and counted."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.parses = 0
+
+    async def _read_html(self, html_url, paper_id=None, paper=None):
+        self.parses += 1
+        await asyncio.sleep(0.01)
+        return make_result(paper_id)
+
+
+@pytest.mark.unit
+class TestParsedPaperStore:
+    """Test storing and loading column-split results."""
+
+    def test_split_paper_version(self):
+        """Versions are split off arXiv-style IDs."""
+        assert split_paper_version("2301.12345v2") == ("2301.12345", "v2")
+        assert split_paper_version("2301.12345") == ("2301.12345", "latest")
+
+    def test_round_trip_and_partial_load(self, tmp_path):
+        """Single columns load without the others."""
+        store = ParsedPaperStore(tmp_path)
+        key = PaperKey.for_paper("2301.12345v2", "jina_reader", "abc")
+        result = make_result()
+        store.put(key, result)
+
+        assert store.get(key) == result
+        refs = store.get(key, fields=["references"])
+        assert refs["references"] == result["references"]
+        assert refs["paper_id"] == "2301.12345v2"
+        assert "full_text" not in refs
+        assert store.versions("2301.12345") == ["v2"]
+
+        other = PaperKey.for_paper("2301.12345v2", "jina_reader", "def")
+        assert store.get(other) is None
+        with pytest.raises(ValueError):
+            store.get(key, fields=["body"])
+
+    def test_unversioned_entries_expire(self, tmp_path):
+        """Entries for unversioned IDs honour the TTL."""
+        key = PaperKey.for_paper("2301.12345", "mistral_ocr", "abc")
+        ParsedPaperStore(tmp_path).put(key, make_result("2301.12345"))
+
+        assert ParsedPaperStore(tmp_path).contains(key)
+        assert not ParsedPaperStore(tmp_path, latest_ttl=-1).contains(key)
+
+
+@pytest.mark.unit
+class TestPaperReaderStore:
+    """Test that PaperReader reuses stored parses."""
+
+    @pytest.mark.asyncio
+    async def test_parse_once_across_readers(self, tmp_path):
+        """Concurrent and later reads share the first parse."""
+        config = PaperReaderConfig(
+            cache_dir=tmp_path,
+            html_config=HTMLParserConfig(api_key="test-key")
+        )
+        reader = CountingReader(config)
+        url = "https://arxiv.org/html/2301.12345v2"
+
+        results = await asyncio.gather(*[
+            reader.read_paper(paper_id="2301.12345v2", html_url=url)
+            for _ in range(3)
+        ])
+        assert reader.parses == 1
+        assert results[1]["sections"] == results[0]["sections"]
+
+        # A new session with the same store directory reuses the parse
+        session = CountingReader(config)
+        sections = await session.read_paper(
+            paper_id="2301.12345v2", html_url=url, fields=["sections"]
+        )
+        assert session.parses == 0
+        assert set(sections) == {
+            "paper_id", "content_format", "processing_info", "sections"
+        }
+
+        await session.read_paper(
+            paper_id="2301.12345v2", html_url=url, refresh=True
+        )
+        assert session.parses == 1
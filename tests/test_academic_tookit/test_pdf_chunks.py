@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/test_academic_tookit/test_pdf_chunks.py
+
+"""
+Unit tests for concurrent OCR of large PDFs split into chunks.
+"""
+
+import asyncio
+
+import fitz
+import pytest
+
+from src.core.academic_tookit.paper_reader import paper_parser_pdf
+from src.core.academic_tookit.paper_reader.paper_parser_pdf import (
+    PDFParserConfig, _process_large_pdf_chunks
+)
+
+
+def make_doc(pages: int) -> fitz.Document:
+    """Build an in-memory PDF with the given number of pages."""
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1}")
+    return doc
+
+
+class FakeOCR:
+    """parse_pdf_with_ocr stand-in tracking concurrency and memory."""
+
+    def __init__(self, page_count: int):
+        self.page_count = page_count
+        self.running = 0
+        self.peak = 0
+        self.encoded = 0
+        self.peak_encoded = 0
+
+    def encode(self, pdf_doc, start_page, end_page):
+        self.encoded += 1
+        self.peak_encoded = max(self.peak_encoded, self.encoded)
+        return f"{start_page}-{end_page}"
+
+    async def parse(self, pdf_base64, filename_for_logging, **kwargs):
+        start_page = int(pdf_base64.split("-")[0])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Later chunks finish first
+        await asyncio.sleep(0.01 * (self.page_count - start_page))
+        self.running -= 1
+        self.encoded -= 1
+        return {}, f"pages from {start_page + 1}", [], [], {}
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    """Replace chunk encoding and OCR requests with a FakeOCR."""
+    ocr = FakeOCR(page_count=40)
+    monkeypatch.setattr(paper_parser_pdf, "_encode_pdf_chunk", ocr.encode)
+    monkeypatch.setattr(paper_parser_pdf, "parse_pdf_with_ocr", ocr.parse)
+    return ocr
+
+
+@pytest.mark.unit
+class TestLargePDFChunks:
+    """Test chunked OCR of large PDFs."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_merge_in_page_order(self, fake_ocr):
+        doc = make_doc(fake_ocr.page_count)
+        config = PDFParserConfig(max_concurrent_chunks=5)
+        try:
+            raw, markdown, _, _, _ = await _process_large_pdf_chunks(
+                doc, fake_ocr.page_count, None, config, "paper.pdf"
+            )
+        finally:
+            doc.close()
+
+        assert len(raw["chunks"]) == 5
+        assert markdown.split("\n\n") == [
+            f"pages from {start}" for start in (1, 9, 17, 25, 33)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_bounds_encoded_chunks(self, fake_ocr):
+        doc = make_doc(fake_ocr.page_count)
+        config = PDFParserConfig(max_concurrent_chunks=2)
+        try:
+            await _process_large_pdf_chunks(
+                doc, fake_ocr.page_count, None, config, "paper.pdf"
+            )
+        finally:
+            doc.close()
+
+        assert fake_ocr.peak == 2
+        assert fake_ocr.peak_encoded == 2
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/test_academic_tookit/test_pdf_download.py
+
+"""
+Unit tests for streaming PDF downloads against a local HTTP server.
+"""
+
+import asyncio
+import base64
+
+import fitz
+import pytest
+from aiohttp import web
+
+from src.core.academic_tookit.paper_reader import (
+    DownloadedPDF, PDFDownloader, PDFDownloadError, PDFTooLargeError
+)
+
+
+def make_pdf(pages: int = 3) -> bytes:
+    """Build a small PDF with the given number of pages."""
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+async def pdf_server():
+    """Serve a PDF, an HTML page and an oversized body locally."""
+    pdf_bytes = make_pdf()
+
+    async def pdf(request):
+        return web.Response(body=pdf_bytes,
+                            content_type="application/pdf")
+
+    async def html(request):
+        return web.Response(text="<html>" + " " * 2048 + "</html>",
+                            content_type="text/html")
+
+    async def chunked(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(pdf_bytes)
+        await response.write(b"\0" * 4096)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/paper.pdf", pdf)
+    app.router.add_get("/paper.html", html)
+    app.router.add_get("/big.pdf", chunked)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", pdf_bytes
+
+    await runner.cleanup()
+
+
+@pytest.mark.unit
+class TestPDFDownloader:
+    """Test streaming downloads and incremental encoding."""
+
+    @pytest.mark.asyncio
+    async def test_download_maps_file(self, pdf_server, tmp_path):
+        """The spooled file matches the body and is encoded in pieces."""
+        base_url, pdf_bytes = pdf_server
+        downloader = PDFDownloader()
+        try:
+            with await downloader.download(f"{base_url}/paper.pdf") as pdf:
+                assert pdf.size == len(pdf_bytes)
+                assert pdf.page_count == 3
+                expected = base64.b64encode(pdf_bytes).decode()
+                assert pdf.to_base64() == expected
+                assert b"".join(pdf.iter_base64(7)).decode() == expected
+                temp_path = pdf.path
+            assert not temp_path.exists()
+
+            dest = tmp_path / "cache" / "paper.pdf"
+            (await downloader.download(f"{base_url}/paper.pdf",
+                                       dest=dest)).close()
+            assert dest.read_bytes() == pdf_bytes
+            assert [p.name for p in dest.parent.iterdir()] == ["paper.pdf"]
+        finally:
+            await downloader.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_and_non_pdf(self, pdf_server,
+                                                 tmp_path):
+        """Limits and content checks abort without leaving files."""
+        base_url, pdf_bytes = pdf_server
+        downloader = PDFDownloader(max_bytes=len(pdf_bytes) + 1024)
+        dest = tmp_path / "paper.pdf"
+        try:
+            with pytest.raises(PDFTooLargeError):
+                await downloader.download(f"{base_url}/big.pdf", dest=dest)
+            with pytest.raises(PDFTooLargeError):
+                await downloader.download(f"{base_url}/paper.pdf",
+                                          max_bytes=100)
+            with pytest.raises(PDFDownloadError):
+                await downloader.download(f"{base_url}/paper.html",
+                                          dest=dest)
+        finally:
+            await downloader.close()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_kept_per_event_loop(self, pdf_server):
+        """A download on another loop leaves this loop's session open."""
+        base_url, _ = pdf_server
+        downloader = PDFDownloader()
+
+        async def download():
+            (await downloader.download(f"{base_url}/paper.pdf")).close()
+            session = await downloader._get_session()
+            await downloader.close()
+            return session
+
+        try:
+            (await downloader.download(f"{base_url}/paper.pdf")).close()
+            session = await downloader._get_session()
+            other = await asyncio.to_thread(asyncio.run, download())
+
+            assert other is not session
+            assert other.closed
+            assert not session.closed
+            assert await downloader._get_session() is session
+        finally:
+            await downloader.close()
+        assert session.closed
+
+
+def test_local_file_is_not_deleted(tmp_path):
+    """Mapping an existing file leaves it in place."""
+    path = tmp_path / "local.pdf"
+    path.write_bytes(make_pdf(1))
+    with DownloadedPDF(path, delete=False) as pdf:
+        assert pdf.page_count == 1
+    assert path.exists()
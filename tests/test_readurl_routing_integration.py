@@ -86,8 +86,9 @@ class TestReadURLRoutingIntegration:
             print(f"{provider}: {details}")
 
     def test_xcom_routing_with_only_xai(self, env_only_xai):
-        """Test that non-X.com URLs fail when only XAI is available."""
+        """Test that non-X.com URLs never use Xcom when only XAI is set."""
         from src.core.scraping.scrape_url import ScrapeUrl
+        from src.core.scraping.scraper_local import LocalScraper
 
         scraper = ScrapeUrl()
 
@@ -98,7 +99,7 @@ class TestReadURLRoutingIntegration:
         if selected:
             assert selected.__class__.__name__ == "XcomScraper"
 
-        # Test that non-X.com URLs get no scraper
+        # Test that non-X.com URLs only get the keyless local scraper
         non_x_urls = [
             "https://example.com",
             "https://github.com/repo",
@@ -107,8 +108,8 @@ class TestReadURLRoutingIntegration:
 
         for url in non_x_urls:
             selected = scraper._select_scraper(url)
-            assert selected is None, (
-                f"Expected no scraper for {url}, "
+            assert selected is None or isinstance(selected, LocalScraper), (
+                f"Expected local or no scraper for {url}, "
                 f"but got {selected.__class__.__name__}"
             )
 
@@ -121,17 +122,18 @@ class TestReadURLRoutingIntegration:
         config = ScraperConfig()
         scraper = ScrapeUrl(config=config)
 
-        # Verify default priority excludes XCOM
+        # Verify default priority excludes XCOM and tries local first
         assert ScraperProvider.XCOM not in config.provider_priority
+        assert config.provider_priority[0] == ScraperProvider.LOCAL
         assert ScraperProvider.JINA in config.provider_priority
         assert ScraperProvider.FIRECRAWL in config.provider_priority
 
         # Test selection for general URL
         selected = scraper._select_scraper("https://example.com")
         if selected:
-            # Should be Jina or Firecrawl, not Xcom
+            # Should be local, Jina or Firecrawl, not Xcom
             assert selected.__class__.__name__ in [
-                "JinaReaderScraper", "FirecrawlScraper"
+                "LocalScraper", "JinaReaderScraper", "FirecrawlScraper"
             ]
             assert selected.__class__.__name__ != "XcomScraper"
 
@@ -228,9 +230,14 @@ class TestErrorHandling:
                 del os.environ[key]
 
         try:
-            from src.core.scraping.scrape_url import ScrapeUrl
+            from src.core.scraping.scrape_url import (
+                ScrapeUrl, ScraperConfig, ScraperProvider
+            )
 
-            scraper = ScrapeUrl()
+            # Only API-key providers: the local scraper needs no key
+            scraper = ScrapeUrl(config=ScraperConfig(provider_priority=[
+                ScraperProvider.JINA, ScraperProvider.FIRECRAWL
+            ]))
             result = scraper.scrape("https://example.com")
 
             assert not result.success
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_answer_cache.py
+# code style: PEP 8
+
+"""
+Unit tests for the semantic answer cache.
+"""
+
+import time
+
+import pytest
+
+from src.agents.answer_cache import (
+    SemanticAnswerCache, extract_sources, normalize_query
+)
+
+ANSWER = (
+    "Python 3.13 adds a free-threaded build.\n\n"
+    "## Sources\n"
+    "1. [Release notes](https://docs.python.org/3.13/whatsnew.html)\n"
+    "2. [PEP 703](https://peps.python.org/pep-0703/)\n"
+)
+
+# Fixed 3-d embeddings; cosine similarity is set by the angle between them
+VECTORS = {
+    "what is new in python 3.13": [1.0, 0.0, 0.0],
+    "whats new in python 3.13": [0.99, 0.1, 0.0],
+    "python 3.13 free threading status": [0.9, 0.44, 0.0],
+    "best pizza in naples": [0.0, 0.0, 1.0],
+}
+
+
+class FakeEmbedder:
+    """Embed queries from a lookup table and count calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, texts):
+        self.calls += 1
+        return [VECTORS[normalize_query(text)] for text in texts]
+
+
+@pytest.fixture
+def embedder():
+    return FakeEmbedder()
+
+
+@pytest.fixture
+def cache(embedder):
+    return SemanticAnswerCache(
+        embed_fn=embedder, similarity_threshold=0.95, seed_threshold=0.85
+    )
+
+
+class TestSemanticAnswerCache:
+    """Test exact, semantic and seeding lookups."""
+
+    @pytest.mark.asyncio
+    async def test_exact_match_skips_embedding(self, cache, embedder):
+        """Normalized repeats hit without another embedding call."""
+        await cache.store("What is new in Python 3.13?", "codact", ANSWER)
+        calls = embedder.calls
+
+        match = await cache.lookup("  what is NEW in python 3.13 ", "codact")
+        assert match is not None and match.reusable
+        assert match.similarity == 1.0
+        assert embedder.calls == calls
+        assert match.entry.hits == 1
+
+        assert await cache.lookup("what is new in python 3.13", "react") \
+            is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_and_seed(self, cache):
+        """Close queries reuse the answer, related ones only seed a run."""
+        await cache.store("What is new in Python 3.13?", "codact", ANSWER)
+
+        match = await cache.lookup("Whats new in Python 3.13", "codact")
+        assert match is not None and match.reusable
+
+        seed = await cache.lookup("Python 3.13 free threading status",
+                                  "codact")
+        assert seed is not None and not seed.reusable
+        task = cache.seeded_task("Python 3.13 free threading status", seed)
+        assert "<prior_answer>" in task
+        assert "https://peps.python.org/pep-0703/" in task
+
+        assert await cache.lookup("Best pizza in Naples", "codact") is None
+        assert cache.stats() == {
+            "hits": 1, "seeds": 1, "misses": 1, "stores": 1, "entries": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_lru_eviction(self, embedder):
+        """Expired entries are dropped; the least recent entry is evicted."""
+        cache = SemanticAnswerCache(
+            embed_fn=embedder, ttl_seconds=60, max_entries=1
+        )
+        entry = await cache.store("What is new in Python 3.13", "codact",
+                                  ANSWER)
+        entry.created_at = time.time() - 120
+        assert await cache.lookup("Whats new in Python 3.13", "codact") \
+            is None
+
+        await cache.store("What is new in Python 3.13", "codact", ANSWER)
+        await cache.store("Best pizza in Naples", "codact", "Da Michele")
+        assert await cache.lookup("What is new in Python 3.13", "codact") \
+            is None
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_keeps_exact_matches(self):
+        """Embedding errors degrade to exact matching."""
+        async def failing(texts):
+            raise RuntimeError("embedding API down")
+
+        cache = SemanticAnswerCache(embed_fn=failing)
+        await cache.store("What is new in Python 3.13", "codact", ANSWER)
+        assert (await cache.lookup("what is new in python 3.13?",
+                                   "codact")).reusable
+        assert await cache.lookup("Whats new in Python 3.13", "codact") \
+            is None
+
+
+def test_extract_sources():
+    """Source links come from the Sources section, deduplicated."""
+    assert extract_sources(ANSWER + ANSWER.split("## Sources")[1]) == [
+        "https://docs.python.org/3.13/whatsnew.html",
+        "https://peps.python.org/pep-0703/",
+    ]
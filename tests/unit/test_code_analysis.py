@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_code_analysis.py
+# code style: PEP 8
+
+"""
+Unit tests for the shared action-code analysis.
+"""
+
+from types import SimpleNamespace
+
+from smolagents.memory import ActionStep, CallbackRegistry, ToolCall
+from smolagents.monitoring import Timing
+
+from src.agents.code_analysis import (
+    analyze_code, extract_code, known_tool_names
+)
+from src.agents.ui_common.agent_step_callback import AgentStepCallback
+
+TOOLS = ["search_links", "read_url", "academic_retrieval", "final_answer"]
+
+CODE = '''import json
+from collections import Counter
+# read_url("https://ignored.example")
+results = [search_links(query="café (menu)", num_results=3)]
+papers = academic_retrieval("rag")
+page = tools.read_url(url=results[0]["link"])
+final_answer(json.dumps({"title": "t"}))
+'''
+
+
+def test_tool_calls_imports_and_spans():
+    """Calls are found once per call site with their argument text."""
+    analysis = analyze_code(CODE, TOOLS)
+
+    assert analysis.parsed
+    assert analysis.tool_names == [
+        "search_links", "academic_retrieval", "read_url", "final_answer"
+    ]
+    assert analysis.imports == ("json", "collections")
+    first = analysis.tool_calls[0]
+    assert first.arguments(CODE) == 'query="café (menu)", num_results=3'
+    assert CODE[first.start:first.end].startswith("search_links(")
+    assert analysis.safe
+    assert analyze_code(CODE, TOOLS) is analysis
+
+
+def test_partial_code_and_safety():
+    """Unparsable code falls back to the compiled call pattern."""
+    partial = 'data = read_url(url="https://a.b/(x)")\nsearch_links(query="'
+    analysis = analyze_code(partial, TOOLS)
+
+    assert not analysis.parsed
+    assert analysis.tool_names == ["read_url", "search_links"]
+    assert analysis.tool_calls[0].arguments(partial) == (
+        'url="https://a.b/(x)"'
+    )
+    assert analysis.tool_calls[1].end is None
+
+    unsafe = analyze_code("import os; os.system('cat /etc/passwd')", TOOLS)
+    assert not unsafe.safe
+    assert unsafe.imports == ("os",)
+    assert len(unsafe.dangerous_patterns) == 2
+    assert not analyze_code("x = eval('1')", TOOLS).safe
+
+
+def test_extract_code_blocks():
+    """Markdown and XML code blocks are both recognised."""
+    assert extract_code("Thought\n```python\nx = 1\n```") == "x = 1"
+    assert extract_code("Thought\n<code>\ny = 2\n</code>") == "y = 2"
+    assert extract_code("no code") is None
+
+
+def test_known_tool_names_include_agent_tools():
+    """Agent tools, managed agents and the interpreter are detected."""
+    agent = SimpleNamespace(
+        tools={"pubmed_search": object()},
+        managed_agents={"web_search_agent": object()},
+    )
+    wrapper = SimpleNamespace(agent=None, tools=[
+        SimpleNamespace(name="pubmed_search")
+    ])
+
+    names = known_tool_names(agent)
+    assert {"pubmed_search", "web_search_agent"} <= names
+    assert {"python_interpreter", "final_answer", "read_url"} <= names
+    assert "pubmed_search" in known_tool_names(wrapper)
+    assert "pubmed_search" not in known_tool_names()
+
+
+def test_step_callback_uses_running_agent_tools():
+    """smolagents passes the agent, whose tools show up in code steps."""
+    callback = AgentStepCallback()
+    registry = CallbackRegistry()
+    registry.register(ActionStep, callback)
+    step = ActionStep(
+        step_number=1,
+        timing=Timing(start_time=0.0),
+        model_output=(
+            "```python\nhits = pubmed_search(query='rag')\n"
+            "web_search_agent(task='check hits')\n```"
+        ),
+        tool_calls=[ToolCall(
+            name="python_interpreter", arguments="", id="call_1"
+        )],
+    )
+    agent = SimpleNamespace(
+        tools={"pubmed_search": object()},
+        managed_agents={"web_search_agent": object()},
+    )
+
+    registry.callback(step, agent=agent)
+
+    assert {"pubmed_search", "web_search_agent"} <= callback.tools_used
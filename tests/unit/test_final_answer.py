@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_final_answer.py
+# code style: PEP 8
+
+"""
+Unit tests for the final answer pipeline and source provenance.
+"""
+
+import json
+
+from smolagents import Tool
+
+from src.tools.final_answer import (
+    EnhancedFinalAnswerTool,
+    FinalAnswer,
+    SourceTracker,
+    SourceTrackingIterator,
+    get_source_tracker,
+    track_sources,
+    track_tool_sources,
+)
+
+SEARCH_OUTPUT = json.dumps([
+    {"title": "PEP 703", "link": "https://peps.python.org/pep-0703/"},
+    {"title": "What's New", "link": "https://docs.python.org/3.13/whatsnew"},
+])
+
+
+class FakeReadURLTool(Tool):
+    name = "read_url"
+    description = "Read a URL"
+    inputs = {"url": {"type": "string", "description": "URL"}}
+    output_type = "string"
+
+    def forward(self, url: str) -> str:
+        return f"# Page at {url}\n\nBody text"
+
+
+class TestSourceTracker:
+    """Test recording sources from tool calls."""
+
+    def test_records_search_results_and_url_arguments(self):
+        """Search results keep titles; read URLs get the page heading."""
+        tracker = SourceTracker()
+        tracker.record_tool_call("search_links", ["python 3.13"],
+                                 SEARCH_OUTPUT)
+        tool = track_tool_sources(FakeReadURLTool())
+        with track_sources(tracker):
+            tool(url="https://example.com/free-threading")
+        tool(url="https://example.com/untracked")
+
+        pep = tracker.get("https://peps.python.org/pep-0703/")
+        assert (pep.title, pep.tool) == ("PEP 703", "search_links")
+        page = tracker.get("https://example.com/free-threading")
+        assert page.title == "Page at https://example.com/free-threading"
+        assert tracker.get("https://example.com/untracked") is None
+        assert len(tracker) == 3
+
+    def test_streaming_iterator_scopes_tracker(self):
+        """Each step of a streamed run sees the run's tracker."""
+        tracker = SourceTracker()
+        seen = []
+
+        def steps():
+            for _ in range(2):
+                seen.append(get_source_tracker())
+                yield len(seen)
+
+        assert list(SourceTrackingIterator(steps(), tracker)) == [1, 2]
+        assert seen == [tracker, tracker]
+        assert get_source_tracker() is None
+
+
+class TestFinalAnswerTool:
+    """Test answer standardization."""
+
+    def test_structured_answer_uses_tracked_titles(self):
+        """Listed sources get titles and provenance from tool calls."""
+        tracker = SourceTracker()
+        tracker.record_tool_call("search_links", ["q"], SEARCH_OUTPUT)
+        with track_sources(tracker):
+            answer = EnhancedFinalAnswerTool().forward(json.dumps({
+                "title": "Python 3.13",
+                "content": "Free threading is experimental.",
+                "sources": ["https://peps.python.org/pep-0703/"],
+            }))
+
+        assert isinstance(answer, FinalAnswer)
+        assert answer["type"] == "final_answer"
+        assert answer.sources == ["https://peps.python.org/pep-0703/"]
+        assert "1. [PEP 703](https://peps.python.org/pep-0703/)" in \
+            answer.content
+        assert answer.source_details()[0]["tool"] == "search_links"
+
+    def test_text_answer_cites_tracked_sources(self):
+        """Plain answers list the tracked sources they cite."""
+        tracker = SourceTracker()
+        tracker.record_tool_call("search_links", ["q"], SEARCH_OUTPUT)
+        text = "See https://docs.python.org/3.13/whatsnew for details."
+        with track_sources(tracker):
+            answer = EnhancedFinalAnswerTool().forward(text)
+
+        assert answer.content == text
+        assert answer.sources == ["https://docs.python.org/3.13/whatsnew"]
+        assert answer.source_refs[0].title == "What's New"
+
+        untracked = EnhancedFinalAnswerTool().forward(text)
+        assert untracked.sources == ["https://docs.python.org/3.13/whatsnew"]
+
+
+class TestFinalAnswer:
+    """Test parsing and cached renderings."""
+
+    def test_from_output(self):
+        """Answers are recognized in all the forms agents produce."""
+        answer = FinalAnswer.build("Body", title="T")
+        assert FinalAnswer.from_output(answer) is answer
+
+        for output in (
+            str(answer),
+            f"**Final answer:** {answer.to_json()}",
+            repr(dict(answer)),
+            {"answer": "Body", "title": "T"},
+        ):
+            parsed = FinalAnswer.from_output(output)
+            assert (parsed.title, parsed.markdown) == ("T", "Body")
+
+        assert FinalAnswer.from_output("Just text") is None
+        assert FinalAnswer.from_output({"status": "ok"}) is None
+
+    def test_json_cache_invalidated_on_change(self):
+        """The cached JSON follows mutations."""
+        answer = FinalAnswer.build("Body")
+        assert json.loads(str(answer))["content"] == "Body"
+        assert answer.to_json() is answer.to_json()
+
+        answer["title"] = "Changed"
+        assert json.loads(answer.to_json())["title"] == "Changed"
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_incremental_markdown.py
+# code style: PEP 8
+
+"""
+Unit tests for incremental markdown rendering of CLI streams.
+"""
+
+import io
+
+from rich.console import Console
+
+from src.agents.stream_aggregator import StreamBuffer
+from src.agents.ui_common.incremental_markdown import (
+    IncrementalMarkdownRenderer,
+    MarkdownBlockSplitter,
+)
+
+REPORT = (
+    "# Report\n"
+    "\n"
+    "First paragraph\ncontinues here.\n"
+    "\n"
+    "```python\n"
+    "x = 1\n"
+    "\n"
+    "print(x)\n"
+    "```\n"
+    "| a | b |\n"
+    "|---|---|\n"
+    "| 1 | 2 |\n"
+    "\n"
+    "Closing line"
+)
+
+
+def _split(text: str, step: int):
+    splitter = MarkdownBlockSplitter()
+    blocks = []
+    for start in range(0, len(text), step):
+        blocks.extend(splitter.feed(text[start:start + step]))
+    final = splitter.flush()
+    if final is not None:
+        blocks.append(final)
+    return blocks
+
+
+class TestMarkdownBlockSplitter:
+    """Test block splitting of streamed markdown."""
+
+    def test_blocks(self):
+        """Blank lines and fences delimit blocks; code keeps blank lines."""
+        assert _split(REPORT, len(REPORT)) == [
+            "# Report",
+            "First paragraph\ncontinues here.",
+            "```python\nx = 1\n\nprint(x)\n```",
+            "| a | b |\n|---|---|\n| 1 | 2 |",
+            "Closing line",
+        ]
+
+    def test_chunking_does_not_change_blocks(self):
+        """Blocks are the same however the text is chunked."""
+        expected = _split(REPORT, len(REPORT))
+        for step in (1, 2, 3, 7):
+            assert _split(REPORT, step) == expected
+
+    def test_tail_tracks_open_block(self):
+        """The tail holds the unfinished block, including partial lines."""
+        splitter = MarkdownBlockSplitter()
+        assert splitter.feed("Done.\n\n```py\nx = 1\npri") == ["Done."]
+        assert splitter.in_code_block
+        assert splitter.tail == "```py\nx = 1\npri"
+        assert splitter.tail_line_count == 3
+
+
+class TestIncrementalMarkdownRenderer:
+    """Test the renderer on a non-interactive console."""
+
+    def test_renders_every_block_once(self):
+        """All streamed content ends up printed once."""
+        output = io.StringIO()
+        console = Console(file=output, width=80, force_terminal=False)
+        buffer = StreamBuffer()
+        renderer = IncrementalMarkdownRenderer(console, buffer, max_fps=0)
+
+        renderer.start()
+        for start in range(0, len(REPORT), 5):
+            buffer.append(REPORT[start:start + 5])
+            renderer.refresh()
+        renderer.finish()
+
+        text = output.getvalue()
+        assert renderer.completed_blocks == 5
+        assert text.count("First paragraph") == 1
+        assert "print(x)" in text
+        assert "Closing line" in text
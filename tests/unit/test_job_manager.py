@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_job_manager.py
+# code style: PEP 8
+
+"""
+Unit tests for the v1 background job queue and worker pool.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.v1.jobs import (
+    FairShareQueue, Job, JobManager, JobStatus, QueueFullError,
+    run_agent_job
+)
+
+
+def _job(job_id: str, client_id: str, priority: str = "normal") -> Job:
+    return Job(
+        job_id=job_id, user_input="q", agent_type="codact",
+        priority=priority, client_id=client_id
+    )
+
+
+class TestFairShareQueue:
+    """Test priority and per-client round-robin ordering."""
+
+    def test_priority_then_round_robin(self):
+        """Higher priority first, then clients take turns."""
+        queue = FairShareQueue()
+        jobs = [
+            _job("a1", "a"), _job("a2", "a"), _job("a3", "a"),
+            _job("b1", "b"), _job("h1", "c", priority="high"),
+            _job("l1", "b", priority="low"),
+        ]
+        for job in jobs:
+            queue.push(job)
+
+        assert queue.depth() == {"high": 1, "normal": 4, "low": 1}
+        assert queue.position(jobs[2]) == 4
+        order = [queue.pop().job_id for _ in range(len(jobs))]
+        assert order == ["h1", "a1", "b1", "a2", "a3", "l1"]
+        assert queue.pop() is None
+
+    def test_remove(self):
+        """Removed jobs are never served."""
+        queue = FairShareQueue()
+        first, second = _job("1", "a"), _job("2", "a")
+        queue.push(first)
+        queue.push(second)
+        assert queue.remove(first)
+        assert not queue.remove(first)
+        assert len(queue) == 1
+        assert queue.pop() is second
+
+
+class TestJobManager:
+    """Test job execution with a fake runner."""
+
+    @pytest.mark.asyncio
+    async def test_runs_jobs_with_bounded_workers(self):
+        """Jobs complete, at most max_workers run at once."""
+        active = 0
+        peak = 0
+
+        async def runner(job, worker_state):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if job.user_input == "boom":
+                raise RuntimeError("agent failed")
+            return f"answer to {job.user_input}"
+
+        manager = JobManager(max_workers=2, runner=runner)
+        try:
+            jobs = [
+                await manager.submit(f"q{i}", client_id=f"c{i % 3}")
+                for i in range(6)
+            ]
+            failing = await manager.submit("boom")
+
+            states = [
+                job async for job in manager.watch(jobs[-1].job_id)
+            ]
+            assert states[-1].status == JobStatus.SUCCEEDED
+            await asyncio.sleep(0.05)
+
+            assert all(job.status == JobStatus.SUCCEEDED for job in jobs)
+            assert jobs[0].result == "answer to q0"
+            assert failing.status == JobStatus.FAILED
+            assert failing.error == "agent failed"
+            assert peak == 2
+
+            metrics = manager.metrics()
+            assert metrics["queue_depth"] == 0
+            assert metrics["jobs"]["succeeded"] == 6
+            assert metrics["jobs"]["failed"] == 1
+            assert metrics["wait_seconds"]["count"] == 7
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_limit_and_cancel(self):
+        """Full queues reject submissions; queued jobs can be cancelled."""
+        release = asyncio.Event()
+
+        async def runner(job, worker_state):
+            await release.wait()
+            return "done"
+
+        manager = JobManager(max_workers=1, max_queue_size=1, runner=runner)
+        try:
+            running = await manager.submit("first")
+            await asyncio.sleep(0)
+            queued = await manager.submit("second")
+            with pytest.raises(QueueFullError):
+                await manager.submit("third")
+
+            manager.cancel(queued.job_id)
+            assert queued.status == JobStatus.CANCELLED
+            assert manager.metrics()["jobs"]["rejected"] == 1
+
+            release.set()
+            async for _ in manager.watch(running.job_id):
+                pass
+            assert running.status == JobStatus.SUCCEEDED
+        finally:
+            await manager.shutdown()
+
+
+class InterruptibleAgent:
+    """Agent whose runs block until interrupted."""
+
+    def __init__(self):
+        self.agent = SimpleNamespace(interrupt=self._interrupt)
+        self._stop = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self.runs = 0
+
+    def _interrupt(self):
+        self._stop.set()
+
+    def run(self, task, stream=False, reset=True):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.runs += 1
+        try:
+            self._stop.wait(5)
+            self._stop.clear()
+            # The step in progress finishes after the interrupt
+            time.sleep(0.05)
+            raise RuntimeError("Agent interrupted")
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_is_interrupted_before_worker_moves_on(
+    monkeypatch
+):
+    """Cancelling interrupts the agent; its worker waits for the thread."""
+    agent = InterruptibleAgent()
+    runtime = SimpleNamespace(
+        answer_cache=None, create_codact_agent=lambda **kwargs: agent
+    )
+    monkeypatch.setitem(
+        sys.modules, "src.agents.runtime",
+        SimpleNamespace(agent_runtime=runtime)
+    )
+
+    manager = JobManager(max_workers=1, runner=run_agent_job)
+    try:
+        with pytest.raises(ValueError, match="Unsupported agent type"):
+            await manager.submit("q", agent_type="manager")
+
+        first = await manager.submit("first")
+        while agent.runs < 1:
+            await asyncio.sleep(0.01)
+        second = await manager.submit("second")
+
+        manager.cancel(first.job_id)
+        assert first.status == JobStatus.CANCELLED
+        while agent.runs < 2:
+            await asyncio.sleep(0.01)
+        assert agent.peak == 1
+
+        manager.cancel(second.job_id)
+        while agent.active:
+            await asyncio.sleep(0.01)
+    finally:
+        await manager.shutdown()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_lazy_toolbox.py
+# code style: PEP 8
+
+"""
+Unit tests for the lazy tool registry and startup import profiling.
+"""
+
+import sys
+
+from src.agents.ui_common.startup_profile import (
+    ImportProfile, parse_importtime
+)
+from src.tools.toolbox import BUILTIN_TOOLS, LazyToolRegistry
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       300 |        420 |   json.decoder
+import time:       200 |        620 | json
+some log line from the profiled process
+import time:      1000 |       1500 | src.tools.embed
+"""
+
+
+class TestLazyToolRegistry:
+    """Test deferred tool imports."""
+
+    def test_builtin_tools_are_not_imported_eagerly(self):
+        """Listing tools doesn't import heavy tool modules."""
+        registry = BUILTIN_TOOLS.copy()
+        assert "embed_texts" in registry
+        assert registry.module_path("embed_texts") == "src.tools.embed"
+        if "src.tools.embed" not in sys.modules:
+            assert not registry.is_loaded("embed_texts")
+
+    def test_resolves_on_first_lookup(self):
+        """Import paths resolve once; classes pass through."""
+        registry = LazyToolRegistry({
+            "decoder": "json.decoder:JSONDecoder",
+            "direct": dict,
+            "missing": "src.tools.no_such_tool:NoSuchTool",
+        })
+        assert not registry.is_loaded("decoder")
+        assert registry.is_loaded("direct")
+
+        from json.decoder import JSONDecoder
+        assert registry["decoder"] is JSONDecoder
+        assert registry.is_loaded("decoder")
+        assert registry["direct"] is dict
+        assert registry["missing"] is None
+
+        copied = registry.copy()
+        copied["decoder"] = list
+        assert copied["decoder"] is list
+        assert registry["decoder"] is JSONDecoder
+        assert list(registry) == ["decoder", "direct", "missing"]
+
+
+def test_parse_importtime():
+    """Import timings are parsed with their nesting level."""
+    profile = ImportProfile(records=parse_importtime(IMPORTTIME_OUTPUT))
+
+    assert [(r.module, r.depth) for r in profile.records] == [
+        ("_json", 2), ("json.decoder", 1), ("json", 0),
+        ("src.tools.embed", 0),
+    ]
+    assert profile.total_us == 1620
+    assert profile.slowest(1)[0].module == "src.tools.embed"
+    assert profile.by_package() == [
+        ("src", 1000, 1), ("json", 500, 2), ("_json", 120, 1)
+    ]
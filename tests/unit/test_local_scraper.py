@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_local_scraper.py
+# code style: PEP 8
+
+"""
+Unit tests for the local scraper and escalation in ScrapeUrl.
+"""
+
+import pytest
+from aiohttp import web
+
+from src.core.config.settings import settings
+from src.core.scraping.base import BaseScraper
+from src.core.scraping.scrape_url import (
+    ScrapeUrl, ScraperConfig, ScraperProvider
+)
+from src.core.scraping import scraper_local
+from src.core.scraping.scraper_local import (
+    LocalScraper, LocalScraperException, PublicAddressResolver,
+    html_to_markdown
+)
+
+ARTICLE = """
+<html><head><title>Free threading</title>
+<script>var tracking = 1;</script></head>
+<body>
+<nav><a href="/">Home</a></nav>
+<article>
+<h1>Free threading in Python</h1>
+<p>{body}</p>
+<p>See <a href="/docs/threads">the docs</a>.</p>
+</article>
+<footer>Copyright</footer>
+</body></html>
+""".format(body="The GIL can be disabled in free-threaded builds. " * 20)
+
+SPA = """
+<html><head><title>App</title></head>
+<body><noscript>You need to enable JavaScript to run this app.</noscript>
+<div id="root"></div><script src="/bundle.js"></script></body></html>
+"""
+
+
+class RemoteScraper(BaseScraper):
+    """Stand-in for a paid remote scraper."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def scrape(self, url, **kwargs):
+        self.urls.append(url)
+        return self.standardize_result(url=url, content="remote")
+
+    async def scrape_async(self, url, **kwargs):
+        return self.scrape(url, **kwargs)
+
+
+@pytest.fixture
+async def site():
+    """Serve a static article and a client-rendered app locally."""
+    app = web.Application()
+    app.router.add_get(
+        "/article", lambda r: web.Response(text=ARTICLE,
+                                           content_type="text/html"))
+    app.router.add_get(
+        "/app", lambda r: web.Response(text=SPA, content_type="text/html"))
+    app.router.add_get("/missing", lambda r: web.Response(status=404))
+    app.router.add_get(
+        "/metadata", lambda r: web.HTTPFound("http://169.254.169.254/latest/")
+    )
+    runner = web.AppRunner(app)
+    await runner.setup()
+    server = web.TCPSite(runner, "127.0.0.1", 0)
+    await server.start()
+    port = server._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def make_scrape_url(monkeypatch):
+    """ScrapeUrl with the local scraper and one remote scraper."""
+    for key in ("JINA_API_KEY", "FIRECRAWL_API_KEY", "XAI_API_KEY"):
+        monkeypatch.setenv(key, "")
+    # The test site is served on loopback
+    scraper = ScrapeUrl(config=ScraperConfig(
+        provider_config={"local": {"allow_private_networks": True}}
+    ))
+    remote = RemoteScraper()
+    scraper._scrapers[ScraperProvider.JINA] = remote
+    return scraper, remote
+
+
+def test_html_to_markdown_extracts_article():
+    """Boilerplate is dropped and links are made absolute."""
+    converted = html_to_markdown(ARTICLE, "https://example.com/post")
+    content = converted["content"]
+
+    assert content.startswith("# Free threading in Python")
+    assert "[the docs](https://example.com/docs/threads)" in content
+    assert "tracking" not in content and "Copyright" not in content
+    assert not converted["js_required"]
+    assert html_to_markdown(SPA)["js_required"]
+
+
+class TestPublicAddressGuard:
+    """Test that the local scraper only fetches public addresses."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", [
+        "http://127.0.0.1/article",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://[::1]/",
+        "http://10.0.0.1/",
+        "file:///etc/passwd",
+    ])
+    async def test_non_public_targets_are_refused(self, url):
+        scraper = LocalScraper()
+        with pytest.raises(LocalScraperException, match="Refusing"):
+            await scraper.scrape_async(url)
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_loopback_site_is_not_fetched(self, site):
+        scraper = LocalScraper()
+        with pytest.raises(LocalScraperException, match="non-public"):
+            await scraper.scrape_async(f"{site}/article")
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_redirect_to_private_address_is_refused(
+        self, site, monkeypatch
+    ):
+        """Each redirect hop is checked, not just the first URL."""
+        is_public = scraper_local.is_public_address
+        monkeypatch.setattr(
+            scraper_local, "is_public_address",
+            lambda host: host == "127.0.0.1" or is_public(host)
+        )
+        scraper = LocalScraper()
+        assert (await scraper.scrape_async(f"{site}/article")).success
+        with pytest.raises(LocalScraperException, match="169.254.169.254"):
+            await scraper.scrape_async(f"{site}/metadata")
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_resolver_refuses_private_host_names(self):
+        resolver = PublicAddressResolver()
+        with pytest.raises(OSError, match="non-public"):
+            await resolver.resolve("localhost", 80)
+        await resolver.close()
+
+
+class TestEscalation:
+    """Test local-first scraping with remote escalation."""
+
+    @pytest.mark.asyncio
+    async def test_static_page_stays_local(self, site, monkeypatch):
+        """Readable pages never reach the remote scraper."""
+        scraper, remote = make_scrape_url(monkeypatch)
+
+        result = await scraper.scrape_async(f"{site}/article")
+
+        assert result.success
+        assert result.metadata["provider"] == "local"
+        assert "Free threading in Python" in result.content
+        assert remote.urls == []
+        await scraper._scrapers[ScraperProvider.LOCAL].close()
+
+    @pytest.mark.asyncio
+    async def test_js_page_escalates_and_domain_is_learned(
+        self, site, monkeypatch
+    ):
+        """Pages needing JavaScript go remote, then skip local fetch."""
+        scraper, remote = make_scrape_url(monkeypatch)
+
+        result = await scraper.scrape_async(f"{site}/app")
+        assert result.content == "remote"
+        assert remote.urls == [f"{site}/app"]
+
+        selected = scraper._select_scraper(f"{site}/article")
+        assert selected is remote
+
+        # Explicit local requests are never escalated
+        local = await scraper.scrape_async(f"{site}/app", provider="local")
+        assert local.metadata["needs_escalation"]
+        assert len(remote.urls) == 1
+        await scraper._scrapers[ScraperProvider.LOCAL].close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_do_not_escalate_domain(
+        self, site, monkeypatch
+    ):
+        """A dead link falls back remotely for that URL only."""
+        scraper, remote = make_scrape_url(monkeypatch)
+
+        result = await scraper.scrape_async(f"{site}/missing")
+        assert result.content == "remote"
+
+        local = scraper._scrapers[ScraperProvider.LOCAL]
+        assert scraper._select_scraper(f"{site}/article") is local
+        await local.close()
+
+    def test_config_from_settings(self, monkeypatch):
+        """The [scrapers] priority and local options are applied."""
+        monkeypatch.setattr(
+            settings, "SCRAPER_PROVIDER_PRIORITY", ["jina", "local", "bogus"]
+        )
+        monkeypatch.setattr(
+            settings, "SCRAPER_LOCAL_CONFIG", {"min_content_length": 42}
+        )
+        config = ScraperConfig.from_settings(fallback_enabled=False)
+
+        assert config.provider_priority == [
+            ScraperProvider.JINA, ScraperProvider.LOCAL
+        ]
+        assert not config.fallback_enabled
+        scraper = ScrapeUrl(config=config)
+        assert scraper._scrapers[ScraperProvider.LOCAL].min_content_length == 42
+
+    def test_selection_rules(self, monkeypatch):
+        """Remote-only options, documents and X.com skip local fetch."""
+        scraper, remote = make_scrape_url(monkeypatch)
+        local = scraper._scrapers[ScraperProvider.LOCAL]
+
+        assert isinstance(local, LocalScraper)
+        assert scraper._select_scraper("https://docs.python.org/3/") is local
+        assert scraper._select_scraper(
+            "https://docs.python.org/3/", screenshot=True) is remote
+        assert scraper._select_scraper(
+            "https://example.com/paper.pdf") is remote
+        assert scraper._select_scraper("https://x.com/user") is remote
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_mcp_connection_manager.py
+# code style: PEP 8
+
+"""
+Unit tests for the process-wide MCP connection manager.
+"""
+
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.mcp_toolkit import (
+    ManagedMCPTool, MCPConnectionManager, server_key
+)
+from src.tools.toolbox import DeepSearchToolbox
+
+# src.tools re-exports the toolbox instance under the module's name
+toolbox_module = importlib.import_module("src.tools.toolbox")
+
+SERVER = {"url": "http://127.0.0.1:9/mcp", "transport": "streamable-http"}
+
+
+class FakeRawTool:
+    """MCP tool as exposed by a connected client."""
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.description = f"{name} tool"
+        self.inputs = {"text": {"type": "string", "description": "Text"}}
+        self.output_type = "string"
+
+    def forward(self, text):
+        if self.client.broken:
+            raise ConnectionError("session closed")
+        with self.client.lock:
+            self.client.in_flight += 1
+            self.client.peak = max(self.client.peak, self.client.in_flight)
+        time.sleep(0.05)
+        with self.client.lock:
+            self.client.in_flight -= 1
+        return f"{self.name}:{text}"
+
+
+class FakeServer:
+    """Client factory counting connections."""
+
+    def __init__(self, tool_names=("echo",)):
+        self.tool_names = list(tool_names)
+        self.clients = []
+        self.fail = False
+
+    def __call__(self, server_parameters):
+        if self.fail:
+            raise OSError("connection refused")
+        server = self
+
+        class Client:
+            broken = False
+            in_flight = 0
+            peak = 0
+            lock = threading.Lock()
+
+            def get_tools(self):
+                return [FakeRawTool(self, n) for n in server.tool_names]
+
+            def disconnect(self):
+                self.broken = True
+
+        client = Client()
+        self.clients.append(client)
+        return client
+
+
+def test_connection_is_shared_and_multiplexed():
+    """Toolboxes share one session; concurrent calls run over it."""
+    server = FakeServer()
+    manager = MCPConnectionManager(client_factory=server)
+
+    first = manager.get_connection(dict(SERVER)).get_tools()
+    second = manager.get_connection(dict(SERVER)).get_tools()
+    assert len(server.clients) == 1
+    assert isinstance(first[0], ManagedMCPTool)
+    assert first[0].name == "echo"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(
+            lambda i: second[0](text=str(i)), range(8)
+        ))
+    assert results == [f"echo:{i}" for i in range(8)]
+    assert server.clients[0].peak > 1
+    assert server_key(SERVER) == server_key(
+        {"transport": "streamable-http", "url": SERVER["url"]}
+    )
+    with_auth = dict(SERVER, headers={"Authorization": "Bearer a"})
+    assert server_key(with_auth) != server_key(SERVER)
+    assert server_key(with_auth) != server_key(
+        dict(SERVER, headers={"Authorization": "Bearer b"})
+    )
+    assert "Bearer" not in server_key(with_auth)
+    manager.close_all()
+
+
+def test_reconnects_and_reloads_schemas():
+    """Broken sessions reconnect; invalidation reloads tool schemas."""
+    server = FakeServer()
+    manager = MCPConnectionManager(
+        client_factory=server, initial_backoff=0.0
+    )
+    connection = manager.get_connection(SERVER)
+    tool = connection.get_tools()[0]
+
+    server.clients[0].broken = True
+    assert tool(text="hi") == "echo:hi"
+    assert len(server.clients) == 2
+
+    server.tool_names.append("shout")
+    assert set(connection.tool_classes()) == {"echo"}
+    manager.invalidate(SERVER)
+    assert set(connection.tool_classes()) == {"echo", "shout"}
+    assert server.clients[1].broken
+    manager.close_all()
+
+
+def test_failed_connections_back_off():
+    """Failed connects are retried, then paused before the next try."""
+    server = FakeServer()
+    server.fail = True
+    manager = MCPConnectionManager(
+        client_factory=server, max_retries=2, initial_backoff=0.0
+    )
+    connection = manager.get_connection(SERVER)
+    connection.initial_backoff = 5.0
+
+    with pytest.raises(ConnectionError, match="Failed to connect"):
+        connection.get_tools()
+    server.fail = False
+    with pytest.raises(ConnectionError, match="unavailable"):
+        connection.get_tools()
+    assert server.clients == []
+
+
+def test_untrusted_servers_are_not_registered(monkeypatch):
+    """MCP servers are only connected when remote code is trusted."""
+    server = FakeServer()
+    manager = MCPConnectionManager(client_factory=server)
+    monkeypatch.setattr(toolbox_module, "get_mcp_manager", lambda: manager)
+    monkeypatch.setattr(
+        toolbox_module.settings, "TOOLS_TRUST_REMOTE_CODE", False
+    )
+    toolbox = DeepSearchToolbox()
+
+    with pytest.raises(ValueError, match="trust the MCP server"):
+        toolbox.register_mcp_server(dict(SERVER))
+    assert server.clients == []
+
+    assert toolbox.register_mcp_server(
+        dict(SERVER), trust_remote_code=True
+    ) == ["echo"]
+    manager.close_all()
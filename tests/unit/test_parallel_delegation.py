@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_parallel_delegation.py
+# code style: PEP 8
+
+"""
+Unit tests for parallel delegation to managed agents.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from smolagents import LiteLLMModel
+from smolagents.memory import ActionStep, FinalAnswerStep
+from smolagents.monitoring import Timing, TokenUsage
+
+from src.agents.delegation import ParallelDelegationTool, ParallelDelegator
+from src.agents.manager_agent import ManagerAgent
+from src.agents.runtime import AgentRuntime
+from src.tools.academic_retrieval import AcademicRetrieval
+from src.tools.final_answer import (
+    SourceTracker, get_source_tracker, track_sources
+)
+
+
+class FakeRunner:
+    """smolagents agent streaming canned steps."""
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def run(self, task, stream=False, reset=True):
+        owner = self.owner
+        with owner.lock:
+            owner.running += 1
+            owner.peak = max(owner.peak, owner.running)
+        try:
+            if owner.barrier:
+                owner.barrier.wait()
+            for number in range(1, owner.steps + 1):
+                time.sleep(owner.delay)
+                tracker = get_source_tracker()
+                if tracker is not None:
+                    for page in range(50):
+                        tracker.record(
+                            f"https://example.com/{task}/{page}",
+                            title=owner.name
+                        )
+                yield ActionStep(
+                    step_number=number,
+                    timing=Timing(start_time=0.0),
+                    observations=f"{owner.name} observed step {number}",
+                    token_usage=TokenUsage(input_tokens=80, output_tokens=20),
+                )
+            yield FinalAnswerStep(output=f"{owner.name} answered: {task}")
+        finally:
+            with owner.lock:
+                owner.running -= 1
+
+
+class ToolRunner:
+    """smolagents agent answering with a single call to a shared tool."""
+
+    def __init__(self, tool):
+        self.tool = tool
+
+    def run(self, task, stream=False, reset=True):
+        papers = self.tool(query=task)
+        yield ActionStep(
+            step_number=1,
+            timing=Timing(start_time=0.0),
+            observations=str(papers),
+        )
+        yield FinalAnswerStep(output=str(papers))
+
+
+class FakeAgent:
+    """Managed agent whose instances share run counters."""
+
+    def __init__(self, name, steps=1, delay=0.0, barrier=None, shared=None):
+        self.name = name
+        self.description = f"{name} description"
+        self.steps = steps
+        self.delay = delay
+        self.barrier = barrier
+        shared = shared or self
+        self.lock = getattr(shared, "lock", None) or threading.Lock()
+        self.agent = FakeRunner(shared)
+        if shared is self:
+            self.running = 0
+            self.peak = 0
+            self.clones = 0
+
+    def clone(self):
+        self.clones += 1
+        return FakeAgent(self.name, shared=self)
+
+
+def test_tasks_run_concurrently_and_merge_in_completion_order():
+    """Different agents run at once; answers arrive as they finish."""
+    barrier = threading.Barrier(2, timeout=5)
+    slow = FakeAgent("web_search_agent", steps=2, delay=0.2, barrier=barrier)
+    fast = FakeAgent("analysis_agent", steps=1, barrier=barrier)
+    steps = []
+    tool = ParallelDelegationTool(
+        [slow, fast], on_step=lambda name, step: steps.append(name)
+    )
+
+    output = tool.forward([
+        {"agent": "web_search_agent", "task": "find A"},
+        {"agent": "analysis_agent", "task": "compute B"},
+    ])
+
+    assert output.startswith("# Parallel delegation: 2 of 2 tasks completed")
+    assert output.index("analysis_agent answered: compute B") < (
+        output.index("web_search_agent answered: find A")
+    )
+    assert "## 1. analysis_agent (task 2," in output
+    assert sorted(steps) == ["analysis_agent"] + ["web_search_agent"] * 2
+
+
+def test_same_agent_tasks_use_clones_or_queue():
+    """Clones take extra tasks for one agent; without a factory they queue."""
+    tasks = [{"agent": "web_search_agent", "task": f"q{i}"} for i in range(4)]
+
+    agent = FakeAgent("web_search_agent", delay=0.1)
+    delegator = ParallelDelegator(
+        [agent],
+        agent_factories={"web_search_agent": agent.clone},
+        max_concurrency=2
+    )
+    results = list(delegator.run(tasks))
+    assert all(result.success for result in results)
+    assert agent.clones == 1 and agent.peak == 2
+
+    agent = FakeAgent("web_search_agent", delay=0.05)
+    results = list(ParallelDelegator([agent], max_concurrency=2).run(tasks))
+    assert all(result.success for result in results)
+    assert agent.peak == 1
+
+
+def test_shared_token_budget_stops_and_skips_tasks():
+    """Sub-agents stop once the shared budget is spent; later tasks skip."""
+    agent = FakeAgent("web_search_agent", steps=3)
+    delegator = ParallelDelegator(
+        [agent], max_concurrency=1, token_budget=150
+    )
+    first, second, third = delegator.run([
+        {"agent": "web_search_agent", "task": "q1"},
+        {"agent": "web_search_agent", "task": "q2"},
+        {"agent": "missing_agent", "task": "q3"},
+    ])
+
+    assert first.steps == 2 and first.tokens == 200
+    assert "token budget exhausted" in first.error
+    assert first.answer == "web_search_agent observed step 2"
+    assert second.error.startswith("Skipped")
+    assert third.error == "Unknown managed agent 'missing_agent'"
+
+
+def test_sub_agent_sources_reach_manager_tracker():
+    """Parallel sub-agents record their sources into one tracker."""
+    agent = FakeAgent("web_search_agent", steps=2)
+    delegator = ParallelDelegator(
+        [agent],
+        agent_factories={"web_search_agent": agent.clone},
+        max_concurrency=4
+    )
+    tracker = SourceTracker()
+    with track_sources(tracker):
+        results = list(delegator.run([
+            {"agent": "web_search_agent", "task": f"q{i}"} for i in range(4)
+        ]))
+
+    assert all(result.success for result in results)
+    assert len(tracker) == 200
+    assert tracker.get("https://example.com/q3/49").title == (
+        "web_search_agent"
+    )
+
+
+def test_sub_agents_share_stateful_tool_safely(monkeypatch):
+    """Concurrent sub-agents can call one tool instance that runs a loop."""
+    # Hold sub-agents once they install a loop so their calls interleave
+    barrier = threading.Barrier(4, timeout=5)
+    set_event_loop = asyncio.set_event_loop
+
+    def synchronised_set_event_loop(loop):
+        set_event_loop(loop)
+        barrier.wait()
+
+    async def search_papers(**kwargs):
+        await asyncio.sleep(0.02)
+        return []
+
+    monkeypatch.setattr(
+        asyncio, "set_event_loop", synchronised_set_event_loop
+    )
+    tool = AcademicRetrieval()
+    tool._search_papers = search_papers
+    agents = [
+        SimpleNamespace(
+            name=f"agent_{i}", description="", agent=ToolRunner(tool)
+        )
+        for i in range(4)
+    ]
+    results = list(ParallelDelegator(agents, max_concurrency=4).run([
+        {"agent": f"agent_{i}", "task": "papers"} for i in range(4)
+    ]))
+
+    assert all(result.success for result in results)
+    assert all(result.answer == "[]" for result in results)
+
+
+def test_runtime_passes_sub_agent_steps_to_step_callbacks():
+    """The manager's step callbacks see every parallel sub-agent step."""
+    seen = []
+    hook = AgentRuntime._create_delegation_step_hook([seen.append])
+    tool = ParallelDelegationTool(
+        [FakeAgent("web_search_agent", steps=2),
+         FakeAgent("analysis_agent", steps=3)],
+        on_step=hook
+    )
+    tool.forward([
+        {"agent": "web_search_agent", "task": "find A"},
+        {"agent": "analysis_agent", "task": "compute B"},
+    ])
+
+    assert len(seen) == 5
+    assert all(isinstance(step, ActionStep) for step in seen)
+
+
+def test_shared_model_created_once_across_threads():
+    """Concurrent clones of team members build one shared model."""
+    runtime = AgentRuntime()
+    created = []
+
+    def create_llm_model(model_id):
+        time.sleep(0.05)
+        created.append(model_id)
+        return MagicMock(spec=LiteLLMModel)
+
+    models = []
+    with patch.object(runtime, "_create_llm_model", create_llm_model):
+        threads = [
+            threading.Thread(
+                target=lambda: models.append(
+                    runtime._get_shared_model("search-model")
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert created == ["search-model"]
+    assert all(model is models[0] for model in models)
+
+
+def test_manager_offers_parallel_delegation_tool():
+    """The manager registers the tool and its prompt instructions."""
+    model = MagicMock(spec=LiteLLMModel)
+    model.model_id = "test-model"
+    agents = [FakeAgent("web_search_agent"), FakeAgent("analysis_agent")]
+    with patch("src.agents.codact_agent.CodeAgent") as code_agent:
+        manager = ManagerAgent(
+            orchestrator_model=model,
+            search_model=model,
+            tools=[],
+            initial_state={},
+            managed_agents=agents,
+            max_parallel_agents=2,
+            delegation_token_budget=1000,
+            verbosity_level=0,
+        ).initialize()
+        manager.initialize()
+
+    kwargs = code_agent.call_args.kwargs
+    (tool,) = kwargs["tools"]
+    assert tool.name == "delegate_parallel"
+    assert tool.delegator.max_concurrency == 2
+    assert tool.delegator.token_budget == 1000
+    assert "delegate_parallel(tasks=[" in (
+        kwargs["prompt_templates"]["system_prompt"]
+    )
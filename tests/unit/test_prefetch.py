@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_prefetch.py
+# code style: PEP 8
+
+"""
+Unit tests for speculative prefetch of search results.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core.scraping import prefetch as prefetch_module
+from src.core.scraping.prefetch import ScrapePrefetcher
+from src.core.scraping.result import ExtractionResult
+from src.tools.readurl import ReadURLTool
+
+URLS = [
+    "https://docs.example.com/a",
+    "https://docs.example.com/b",
+    "https://x.com/someone/status/1",
+    "https://blog.example.org/post",
+    "https://news.example.net/story",
+    "https://wiki.example.io/page",
+]
+
+
+class FakeScraper:
+    """Scraper returning canned pages, optionally held until released."""
+
+    def __init__(self, hold: bool = False):
+        self.hold = threading.Event()
+        if not hold:
+            self.hold.set()
+        self.calls = []
+
+    async def scrape_async(self, url, **kwargs):
+        self.calls.append(url)
+        while not self.hold.is_set():
+            await asyncio.sleep(0.01)
+        return ExtractionResult(
+            name="fake", success=True, content=f"# Page\n\nBody of {url}"
+        )
+
+
+def wait_until(predicate, timeout=5.0):
+    """Poll until ``predicate`` is true."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_top_k_is_domain_aware_and_counted():
+    """One URL per domain, skipped domains ignored, hits and waste kept."""
+    scraper = FakeScraper()
+    prefetcher = ScrapePrefetcher(lambda: scraper, top_k=3)
+
+    scheduled = prefetcher.prefetch(URLS)
+    assert scheduled == [URLS[0], URLS[3], URLS[4]]
+    wait_until(lambda: prefetcher.stats()["ready"] == 3)
+
+    future = prefetcher.take(URLS[0] + "#intro")
+    assert "Body of" in future.result().content
+    assert prefetcher.take(URLS[5]) is None
+
+    prefetcher.cancel()
+    stats = prefetcher.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["completed"] == 3 and stats["wasted"] == 2
+    assert stats["hit_rate"] == 0.5
+
+
+def test_in_flight_prefetch_is_joined_or_cancelled():
+    """Reads join running prefetches; stale queued ones are cancelled."""
+    scraper = FakeScraper(hold=True)
+    prefetcher = ScrapePrefetcher(
+        lambda: scraper, top_k=3, max_concurrency=1
+    )
+    prefetcher.prefetch(URLS[3:6])
+    wait_until(lambda: len(scraper.calls) == 1)
+
+    # A new search cancels the queued prefetches of the previous one
+    prefetcher.prefetch(["https://other.example.com/x"], top_k=1)
+    wait_until(lambda: prefetcher.stats()["cancelled"] == 2)
+
+    future = prefetcher.take(URLS[3])
+    assert not future.done()
+    scraper.hold.set()
+    assert future.result(timeout=5).success
+    assert prefetcher.stats()["joined"] == 1
+
+
+class FailingScraper:
+    """Scraper that must not be reached."""
+
+    async def scrape_async(self, url, **kwargs):
+        raise AssertionError(f"unexpected scrape of {url}")
+
+    async def stream_async(self, url, **kwargs):
+        raise AssertionError(f"unexpected stream of {url}")
+        yield
+
+
+@pytest.mark.parametrize("stream_sections", [True, False])
+def test_read_url_uses_prefetched_page(monkeypatch, stream_sections):
+    """ReadURLTool serves a prefetched page without scraping it again."""
+    prefetcher = ScrapePrefetcher(lambda: FakeScraper(), top_k=1)
+    monkeypatch.setattr(prefetch_module, "_shared_prefetcher", prefetcher)
+    prefetcher.prefetch(URLS[:1])
+    wait_until(lambda: prefetcher.stats()["ready"] == 1)
+
+    tool = ReadURLTool(stream_sections=stream_sections)
+    tool.scraper = FailingScraper()
+    assert f"Body of {URLS[0]}" in tool.forward(URLS[0])
+    assert prefetcher.stats()["hits"] == 1
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_ranking_backends.py
+# code style: PEP 8
+
+"""
+Unit tests for the NumPy ranking backend and embedding decoding.
+"""
+
+import base64
+
+import numpy as np
+import pytest
+
+from src.core.ranking.backends import NumpyBackend, get_backend
+from src.core.ranking.base_ranker import BaseRanker
+from src.core.ranking.jina_embedder import _decode_embeddings
+
+EMBEDDINGS = {
+    "cats": [1.0, 0.0],
+    "dogs": [0.0, 1.0],
+    "a cat sat": [0.9, 0.1],
+    "dog park": [0.2, 0.8],
+    "kittens": [0.7, 0.3],
+}
+
+
+class FakeRanker(BaseRanker):
+    """Ranker with a fixed embedding table."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        return [EMBEDDINGS[text] for text in texts]
+
+
+class TestNumpyBackend:
+    """Test scoring primitives."""
+
+    def test_topk_matches_full_sort(self):
+        """argpartition top-k equals a full descending sort."""
+        rng = np.random.default_rng(0)
+        scores = rng.random((4, 50), dtype=np.float32)
+        values, indices = NumpyBackend().topk(scores, 7)
+
+        expected = np.argsort(-scores, axis=-1)[:, :7]
+        assert values.shape == indices.shape == (4, 7)
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_allclose(
+            values, np.take_along_axis(scores, expected, axis=-1)
+        )
+
+    def test_topk_k_larger_than_row(self):
+        """k is capped at the number of documents."""
+        values, indices = NumpyBackend().topk(np.array([0.1, 0.9, 0.5]), 10)
+        assert indices.tolist() == [[1, 2, 0]]
+        assert values.shape == (1, 3)
+
+    def test_softmax_rows_sum_to_one(self):
+        """Softmax is stable for large scores."""
+        scores = np.array([[1000.0, 1001.0], [0.0, 0.0]], dtype=np.float32)
+        probs = NumpyBackend().softmax(scores)
+        np.testing.assert_allclose(probs.sum(axis=-1), [1.0, 1.0])
+        np.testing.assert_allclose(probs[1], [0.5, 0.5])
+
+    def test_get_backend(self):
+        """Backends are shared; unknown names are rejected."""
+        assert get_backend("numpy") is get_backend()
+        with pytest.raises(ValueError):
+            get_backend("jax")
+
+
+class TestBaseRanker:
+    """Test ranking through the default backend."""
+
+    def test_rerank_single_and_batched_queries(self):
+        """One embedding call scores all queries against all documents."""
+        ranker = FakeRanker()
+        documents = ["a cat sat", "dog park", "kittens"]
+
+        results = ranker.rerank(["cats", "dogs"], documents, top_k=2,
+                                normalize="none")
+        assert ranker.calls == [["cats", "dogs"] + documents]
+        assert [r["document"] for r in results[0]] == ["a cat sat",
+                                                       "kittens"]
+        assert [r["document"] for r in results[1]] == ["dog park",
+                                                       "kittens"]
+        assert results[0][0]["score"] == pytest.approx(0.9)
+        assert isinstance(results[0][0]["score"], float)
+
+        single = ranker.rerank("cats", documents, top_k=1)
+        assert single[0]["document"] == "a cat sat"
+
+    def test_unknown_normalization(self):
+        """Invalid normalization fails before embedding."""
+        ranker = FakeRanker()
+        with pytest.raises(ValueError):
+            ranker.calculate_scores(["cats"], ["dogs"], normalize="l2")
+        assert ranker.calls == []
+
+
+def test_decode_base64_embeddings():
+    """Base64 float32 buffers decode to the same matrix as float lists."""
+    rows = [[0.5, -1.25, 3.0], [1.0, 2.0, -0.125]]
+    encoded = [
+        base64.b64encode(np.asarray(row, dtype="<f4").tobytes()).decode()
+        for row in rows
+    ]
+    decoded = _decode_embeddings(encoded)
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, np.asarray(rows, np.float32))
+    np.testing.assert_array_equal(_decode_embeddings(rows), decoded)
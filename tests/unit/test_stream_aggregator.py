@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_stream_aggregator.py
+# code style: PEP 8
+
+"""
+Unit tests for StreamBuffer and StreamAggregator.
+"""
+
+from smolagents.models import ChatMessageStreamDelta
+
+from src.agents.stream_aggregator import StreamAggregator, StreamBuffer
+
+
+class TestStreamBuffer:
+    """Test the shared append-only stream buffer."""
+
+    def test_text_is_joined_lazily(self):
+        """Full text reflects every append, including after reads."""
+        buffer = StreamBuffer()
+        buffer.append("Hello")
+        buffer.append("")
+        buffer.append(" world")
+        assert buffer.text == "Hello world"
+
+        buffer.append("!")
+        assert buffer.text == "Hello world!"
+        assert len(buffer) == 12
+        assert buffer.chunk_count == 3
+
+    def test_text_is_cached_between_appends(self):
+        """Reads without new chunks reuse the joined text."""
+        buffer = StreamBuffer()
+        buffer.append("Hello")
+        text = buffer.text
+        assert buffer.text is text
+
+        buffer.append(" world")
+        assert buffer.text == "Hello world"
+        assert buffer.text is buffer.text
+
+        buffer.clear()
+        assert buffer.text == ""
+
+    def test_token_count_spans_chunk_boundaries(self):
+        """Words split across chunks are counted once."""
+        chunks = ["Stream", "ing resp", "onse ", " with  ", "split", " words"]
+        buffer = StreamBuffer()
+        for chunk in chunks:
+            buffer.append(chunk)
+        assert buffer.token_count == len("".join(chunks).split())
+
+    def test_cursors_read_only_new_content(self):
+        """Each subscriber reads its own unread tail."""
+        buffer = StreamBuffer()
+        buffer.append("a")
+        early = buffer.cursor()
+        late = buffer.cursor(from_start=False)
+
+        buffer.append("b")
+        buffer.append("c")
+        assert early.read() == "abc"
+        assert late.read() == "bc"
+        assert early.read() == ""
+        assert not early.has_unread
+
+        buffer.clear()
+        buffer.append("d")
+        assert early.has_unread
+        assert early.read() == "d"
+
+
+class TestStreamAggregator:
+    """Test StreamAggregator on top of StreamBuffer."""
+
+    def test_aggregate_stream_shares_buffer(self):
+        """Aggregated content is visible through a shared buffer."""
+        buffer = StreamBuffer()
+        reader = buffer.cursor()
+        aggregator = StreamAggregator(buffer)
+
+        deltas = [
+            ChatMessageStreamDelta(content="First"),
+            ChatMessageStreamDelta(content=None),
+            ChatMessageStreamDelta(content=" chunk"),
+        ]
+        assert list(aggregator.aggregate_stream(iter(deltas))) == deltas
+
+        assert aggregator.get_aggregated_content() == "First chunk"
+        assert aggregator.get_token_count() == 2
+        assert reader.read() == "First chunk"
+
+        aggregator.reset()
+        assert aggregator.current_content == ""
+        assert aggregator.token_count == 0
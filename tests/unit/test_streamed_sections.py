@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_streamed_sections.py
+# code style: PEP 8
+
+"""
+Unit tests for streamed, sectioned page reads.
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.core.scraping.base import BaseScraper
+from src.core.scraping.scrape_url import (
+    ScrapeUrl, ScraperConfig, ScraperProvider
+)
+from src.core.scraping.scraper_jinareader import JinaReaderScraper
+from src.core.scraping.sections import MarkdownSectionizer, estimate_tokens
+from src.tools.readurl import ReadURLTool
+
+PAGE = "\n\n".join(
+    f"## Part {i}\n\n" + f"Paragraph {i} of the page. " * 40
+    for i in range(1, 9)
+)
+
+
+def sectionize(text: str, chunk_size: int, max_tokens: int = 1500):
+    """Feed ``text`` in fixed-size chunks and collect the sections."""
+    sectionizer = MarkdownSectionizer(max_tokens)
+    sections = []
+    for i in range(0, len(text), chunk_size):
+        sections.extend(sectionizer.feed(text[i:i + chunk_size]))
+    return sections + sectionizer.close()
+
+
+class StreamingScraper(BaseScraper):
+    """Streams a page, optionally pausing near the end until released."""
+
+    def __init__(self, text: str, pause: bool = True):
+        super().__init__()
+        self.text = text
+        self.pause = pause
+        self.release = None
+        self.calls = 0
+
+    def scrape(self, url, **kwargs):
+        raise NotImplementedError
+
+    async def scrape_async(self, url, **kwargs):
+        raise NotImplementedError
+
+    async def stream_async(self, url, **kwargs):
+        self.calls += 1
+        self.release = asyncio.Event()
+        split = len(self.text) * 3 // 4
+        for i in range(0, split, 100):
+            yield self.text[i:min(i + 100, split)]
+        if self.pause:
+            await self.release.wait()
+        yield self.text[split:]
+
+
+class FormatScraper(StreamingScraper):
+    """Streams a short page naming the requested output format."""
+
+    async def stream_async(self, url, output_format="markdown", **kwargs):
+        self.calls += 1
+        yield f"# {output_format} page"
+
+
+class TestMarkdownSectionizer:
+    """Test incremental markdown sectioning."""
+
+    def test_sections_are_independent_of_chunking(self):
+        """Headings start sections wherever chunk boundaries fall."""
+        whole = sectionize(PAGE, len(PAGE))
+
+        assert len(whole) == 8
+        assert whole[0].startswith("## Part 1")
+        assert sectionize(PAGE, 7) == whole
+
+    def test_long_sections_and_code_fences(self):
+        """Long sections split at paragraphs; fenced headings stay."""
+        text = (
+            "# Title\n\n```\n# not a heading\n```\n\n"
+            + "\n\n".join("word " * 100 for _ in range(10))
+        )
+        sections = sectionize(text, 64, max_tokens=200)
+
+        assert "# not a heading" in sections[0]
+        assert len(sections) > 1
+        assert all(estimate_tokens(s) <= 200 for s in sections)
+        assert sum(s.count("word") for s in sections) == 1000
+
+
+class TestReadURLSections:
+    """Test the section handle returned by read_url."""
+
+    def make_tool(self, text: str, pause: bool = True):
+        tool = ReadURLTool(max_tokens=1000, section_tokens=400)
+        tool.scraper = StreamingScraper(text, pause=pause)
+        return tool
+
+    def test_head_is_returned_before_stream_ends(self):
+        """The first sections come back while the page still streams."""
+        tool = self.make_tool(PAGE)
+        url = "https://example.com/long"
+
+        head = tool.forward(url)
+        assert head.startswith("## Part 1")
+        assert "## Part 8" not in head
+        assert f'read_url(url="{url}", section=' in head
+
+        next_section = int(head.rsplit("section=", 1)[1].rstrip(")]"))
+        tool._loop.call_soon_threadsafe(tool.scraper.release.set)
+        rest = []
+        while next_section:
+            part = tool.forward(url, section=next_section)
+            rest.append(part.rsplit("\n\n[read_url:", 1)[0])
+            next_section = (
+                int(part.rsplit("section=", 1)[1].rstrip(")]"))
+                if "section=" in part else None
+            )
+
+        assert "## Part 8" in rest[-1]
+        assert "end of" in part
+        assert tool.scraper.calls == 1
+        assert "does not exist" in tool.forward(url, section=99)
+
+    def test_formats_are_read_separately(self):
+        """A page read as text is not served from its markdown read."""
+        tool = ReadURLTool()
+        tool.scraper = FormatScraper("")
+        url = "https://example.com/formats"
+
+        assert tool.forward(url) == "# markdown page"
+        assert tool.forward(url, output_format="text") == "# text page"
+        assert tool.forward(url) == "# markdown page"
+        assert tool.scraper.calls == 2
+
+    def test_expired_pages_are_read_again(self):
+        """Pages older than the TTL are fetched again."""
+        tool = ReadURLTool(section_ttl=0)
+        tool.scraper = FormatScraper("")
+        url = "https://example.com/stale"
+
+        tool.forward(url)
+        tool.forward(url)
+        assert tool.scraper.calls == 2
+
+    def test_short_page_is_returned_whole(self):
+        """Pages within the budget have no section note."""
+        tool = self.make_tool("# Short\n\nA short page.", pause=False)
+        assert tool.forward("https://example.com/short") == (
+            "# Short\n\nA short page."
+        )
+
+
+@pytest.mark.asyncio
+async def test_jina_stream_reads_plain_text(monkeypatch):
+    """Jina responses are requested as text and streamed in chunks."""
+    seen = {}
+
+    async def reader(request):
+        seen["accept"] = request.headers["Accept"]
+        seen["path"] = request.path
+        response = web.StreamResponse()
+        response.content_type = "text/plain"
+        await response.prepare(request)
+        # The second write ends in the middle of a UTF-8 character
+        for part in (b"# Title\n\n", b"Caf\xc3", b"\xa9 body"):
+            await response.write(part)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", reader)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    for key in ("JINA_API_KEY", "FIRECRAWL_API_KEY", "XAI_API_KEY"):
+        monkeypatch.setenv(key, "")
+    scraper = ScrapeUrl(config=ScraperConfig())
+    jina = JinaReaderScraper(
+        api_key="test-key", api_base_url=f"http://127.0.0.1:{port}"
+    )
+    scraper._scrapers[ScraperProvider.JINA] = jina
+    try:
+        chunks = [
+            chunk async for chunk in scraper.stream_async(
+                "https://example.com/page", provider="jina"
+            )
+        ]
+    finally:
+        await jina._close_session()
+        await runner.cleanup()
+
+    assert "".join(chunks) == "# Title\n\nCafé body"
+    assert seen["accept"] == "text/plain"
+    assert seen["path"] == "/https://example.com/page"
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_streaming_answers.py
+# code style: PEP 8
+
+"""
+Unit tests for async-native and streaming xAI / Exa answers.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.search_engines import search_exa, search_xcom_sdk
+from src.core.search_engines.search_hybrid import HybridSearchEngine
+from src.core.xcom_toolkit import xai_live_search
+from src.core.xcom_toolkit.xai_live_search import XAILiveSearchClient
+from src.tools.xcom_qa import XcomDeepQATool
+
+PARTS = [
+    ("Grok 4 ", []),
+    ("was released.", []),
+    ("", ["https://x.com/xai/status/1"]),
+]
+
+
+class FakeChat:
+    """Async xAI chat replaying canned chunks."""
+
+    def __init__(self):
+        self.messages = []
+
+    def append(self, message):
+        self.messages.append(message)
+
+    def _response(self, parts):
+        return SimpleNamespace(
+            content="".join(content for content, _ in parts),
+            citations=[c for _, cites in parts for c in cites],
+            usage=SimpleNamespace(
+                total_tokens=30, prompt_tokens=20, completion_tokens=10
+            ),
+        )
+
+    async def sample(self):
+        return self._response(PARTS)
+
+    async def stream(self):
+        for i, (content, citations) in enumerate(PARTS):
+            chunk = SimpleNamespace(content=content, citations=citations)
+            yield self._response(PARTS[:i + 1]), chunk
+
+
+class FakeChannel:
+    """gRPC channel of an async xAI SDK client."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncClient:
+    """Async xAI SDK client."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(create=lambda **kw: FakeChat())
+        self._api_channel = FakeChannel()
+        self._management_channel = None
+        self.instances.append(self)
+
+
+class FakeAnswerStream:
+    """Exa streaming answer response."""
+
+    def __init__(self):
+        self._raw_response = SimpleNamespace(aclose=self._aclose)
+        self.closed = False
+
+    async def _aclose(self):
+        self.closed = True
+
+    def __aiter__(self):
+        async def generator():
+            citation = SimpleNamespace(
+                url="https://example.com/a", title="A",
+                published_date=None, author=None, text=None
+            )
+            yield SimpleNamespace(content="Answer ", citations=None)
+            yield SimpleNamespace(content=None, citations=[citation])
+            yield SimpleNamespace(content="text.", citations=[citation])
+        return generator()
+
+
+class FakeAsyncExa:
+    """Async Exa client."""
+
+    streams = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def search(self, query, **kwargs):
+        result = SimpleNamespace(
+            title="A", url="https://example.com/a", id="1", score=0.9
+        )
+        return SimpleNamespace(results=[result])
+
+    async def stream_answer(self, query, **kwargs):
+        stream = FakeAnswerStream()
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def fake_sdks(monkeypatch):
+    """Replace the async SDK clients with fakes."""
+    monkeypatch.setattr(xai_live_search, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(search_xcom_sdk, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(search_exa, "AsyncExa", FakeAsyncExa)
+
+
+async def test_xai_live_search_streams_partials(fake_sdks):
+    """Partial content and citations arrive before the final result."""
+    client = XAILiveSearchClient(api_key="test")
+    chunks = [
+        chunk async for chunk in client.stream(
+            "query", "Grok", question="What was released?"
+        )
+    ]
+
+    assert [c.content for c in chunks[:-1]] == ["Grok 4 ", "was released.", ""]
+    assert chunks[2].citations == ["https://x.com/xai/status/1"]
+    result = chunks[-1].result
+    assert result["answer"] == "Grok 4 was released."
+    assert result["sources_used"] == 1
+    assert result == await client.query_x_content_async(
+        "What was released?", search_context="Grok"
+    )
+
+
+def test_xcom_tool_reports_chunks(fake_sdks):
+    """The tool hands partial answers to its callback while streaming."""
+    seen = []
+    tool = XcomDeepQATool(xai_api_key="test", on_chunk=seen.append)
+    answer = tool.forward(
+        "Grok", operation="query", question="What was released?"
+    )
+
+    assert "".join(chunk.content for chunk in seen) == "Grok 4 was released."
+    assert answer.startswith("Grok 4 was released.")
+    assert "1. https://x.com/xai/status/1" in answer
+
+
+def test_xcom_tool_reuses_async_client(fake_sdks):
+    """Streamed answers share one loop thread and one async SDK client."""
+    FakeAsyncClient.instances.clear()
+    tool = XcomDeepQATool(xai_api_key="test")
+    for _ in range(3):
+        tool.forward("Grok", operation="query", question="What was released?")
+
+    assert len(FakeAsyncClient.instances) == 1
+
+
+def test_async_client_closed_when_loop_changes(fake_sdks):
+    """A client made on a new loop closes the previous loop's channels."""
+    FakeAsyncClient.instances.clear()
+    client = XAILiveSearchClient(api_key="test")
+    first = asyncio.run(client._get_async_client())
+    second = asyncio.run(client._get_async_client())
+
+    assert first is not second
+    assert first._api_channel.closed
+    assert not second._api_channel.closed
+
+
+async def test_exa_async_and_hybrid_stream(fake_sdks):
+    """Exa runs natively async and answers stream through the engine."""
+    engine = HybridSearchEngine(api_keys={"exa": "test"}, providers=["exa"])
+    results = await engine.clients["exa"].search_async("neural search")
+    assert results["results"][0].url == "https://example.com/a"
+
+    chunks = [c async for c in engine.stream_answer("what is exa?")]
+    assert [c.citations for c in chunks[:-1]] == [
+        [], ["https://example.com/a"], []
+    ]
+    result = chunks[-1].result
+    assert result["answer"] == "Answer text."
+    assert result["provider"] == "exa"
+    assert FakeAsyncExa.streams[-1].closed
+
+    with pytest.raises(ValueError):
+        async for _ in engine.stream_answer("what is exa?", provider="xai"):
+            pass
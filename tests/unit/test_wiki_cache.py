@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_wiki_cache.py
+# code style: PEP 8
+
+"""
+Unit tests for the DeepWiki repository cache and section index.
+"""
+
+import pytest
+
+from src.core.github_toolkit import DeepWikiClient, RepoWikiCache, WikiIndex
+
+WIKI = """# Page: Overview
+
+# Overview
+
+Zurich is a tiny HTTP framework. Café-friendly docs.
+
+## Installation
+
+Install with pip install zurich.
+
+```
+# not a heading
+```
+
+# Page: Authentication
+
+# Authentication
+
+Tokens are verified by the AuthMiddleware before routing.
+
+## OAuth providers
+
+OAuth login supports GitHub and Google providers.
+
+# Page: Routing
+
+# Routing
+
+Routes map paths to handlers with decorators.
+"""
+
+
+class FakeMCPTool:
+    """Stand-in for a DeepWiki MCP tool that counts calls."""
+
+    def __init__(self, name, response):
+        self.name = name
+        self.response = response
+        self.calls = 0
+
+    def forward(self, **kwargs):
+        self.calls += 1
+        return self.response
+
+    async def aforward(self, **kwargs):
+        return self.forward(**kwargs)
+
+
+def make_client():
+    """DeepWikiClient wired to fake tools and a private cache."""
+    client = DeepWikiClient(cache=RepoWikiCache(ttl=60))
+    client._connection = object()
+    client._tools_by_name = {
+        "read_wiki_structure": FakeMCPTool("read_wiki_structure", "topics"),
+        "read_wiki_contents": FakeMCPTool("read_wiki_contents", WIKI),
+        "ask_question": FakeMCPTool("ask_question", "remote answer"),
+    }
+    return client, client._tools_by_name
+
+
+def test_index_sections_and_search():
+    """Sections follow headings outside fences and rank by keywords."""
+    index = WikiIndex(WIKI)
+
+    assert index.titles() == [
+        "Overview",
+        "Overview > Installation",
+        "Authentication",
+        "Authentication > OAuth providers",
+        "Routing",
+    ]
+    assert "# not a heading" in index.text(1)
+    assert "Café" in index.text(0)
+
+    best, _ = index.search("oauth providers")[0]
+    assert index.sections[best].path == "Authentication > OAuth providers"
+    assert index.coverage("how are oauth tokens verified", [2, 3]) == 1.0
+
+
+class TestDeepWikiClientCache:
+    """Test cached reads through DeepWikiClient."""
+
+    def test_contents_fetched_once_and_sliced(self):
+        """Topic reads return matching sections from one fetch."""
+        client, tools = make_client()
+
+        full = client.read_wiki_sections("Acme/Zurich")
+        assert full["data"] == WIKI
+
+        result = client.read_wiki_sections("acme/zurich", "routing handlers")
+        assert result["sections"] == ["Routing"]
+        assert "Routes map paths" in result["data"]
+        assert "OAuth" not in result["data"]
+        assert tools["read_wiki_contents"].calls == 1
+
+        client.read_wiki_structure("acme/zurich")
+        assert client.read_wiki_structure("acme/zurich")["cached"]
+        assert tools["read_wiki_structure"].calls == 1
+
+    @pytest.mark.asyncio
+    async def test_questions_reuse_cached_context(self):
+        """Covered questions skip ask_question; answers are cached."""
+        client, tools = make_client()
+        question = "Which OAuth providers are supported?"
+
+        assert client.answer_from_cache("acme/zurich", question) is None
+        await client.read_wiki_contents_async("acme/zurich")
+
+        cached = client.answer_from_cache("acme/zurich", question)
+        assert "GitHub and Google" in cached["data"]
+
+        other = "What is the release cadence?"
+        assert client.answer_from_cache("acme/zurich", other) is None
+        await client.ask_question_async("acme/zurich", other)
+        assert client.answer_from_cache("acme/zurich", other)["data"] == (
+            "remote answer"
+        )
+        assert tools["ask_question"].calls == 1
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# tests/unit/test_xcom_batch_reads.py
+# code style: PEP 8
+
+"""
+Unit tests for batched and deduplicated X.com post reads.
+"""
+
+import re
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.core.xcom_toolkit.xai_live_search import (
+    XAILiveSearchClient, status_time
+)
+from src.tools.xcom_qa import XcomDeepQATool
+
+POST_A1 = "https://x.com/alice/status/1943190393602068801"
+POST_A2 = "https://x.com/alice/status/1943190393602068900"
+POST_A3 = "https://twitter.com/Alice/status/1943190393602069000"
+POST_B1 = "https://x.com/bob/status/1943190393602068999"
+
+
+class FakeChat:
+    """Live-search chat answering the posts named in its prompt."""
+
+    def __init__(self, calls, search_parameters, skip):
+        self.calls = calls
+        self.search_parameters = search_parameters
+        self.skip = skip
+        self.prompt = ""
+
+    def append(self, message):
+        self.prompt = str(message)
+
+    def sample(self):
+        self.calls.append((self.search_parameters, self.prompt))
+        status_ids = list(dict.fromkeys(
+            re.findall(r"status/(\d+)", self.prompt)
+        ))
+        if "### POST" not in self.prompt:
+            content = f"Post {status_ids[0]} text"
+        else:
+            # Batched answers leave out the skipped posts
+            status_ids = [i for i in status_ids if i not in self.skip]
+            content = "\n\n".join(
+                f"### POST {status_id}\nPost {status_id} text"
+                for status_id in status_ids
+            )
+        return SimpleNamespace(
+            content=content,
+            citations=[f"https://x.com/i/status/{i}" for i in status_ids],
+            usage=SimpleNamespace(
+                total_tokens=90, prompt_tokens=60, completion_tokens=30
+            ),
+        )
+
+
+def make_client(skip=()):
+    """Client whose live-search chats are recorded in ``client.calls``."""
+    client = XAILiveSearchClient(api_key="test", max_batch_size=2)
+    client.calls = []
+    client.client = SimpleNamespace(chat=SimpleNamespace(
+        create=lambda **kw: FakeChat(
+            client.calls, kw["search_parameters"], set(skip)
+        )
+    ))
+    return client
+
+
+def test_status_time_decodes_snowflake_ids():
+    """Status IDs give the post's creation time."""
+    assert status_time("1943190393602068801").date() == (
+        datetime(2025, 7, 10).date()
+    )
+    assert status_time("20") is None
+    assert status_time(None) is None
+
+
+def test_posts_are_batched_per_handle_and_cached():
+    """Posts are grouped by handle, deduplicated and served from cache."""
+    client = make_client()
+    client.read_x_post(POST_B1)
+    assert len(client.calls) == 1
+
+    urls = [POST_A1, POST_A3, POST_A2, POST_A1 + "?s=20", POST_B1]
+    results = client.read_x_posts(urls)
+
+    # alice's three posts: one batch of two and one single read; bob cached
+    assert len(client.calls) == 3
+    search_parameters, prompt = client.calls[1]
+    assert "### POST <status id>" in prompt
+    assert search_parameters.from_date == datetime(2025, 7, 10)
+    assert search_parameters.to_date == datetime(2025, 7, 11)
+
+    assert list(results) == urls
+    assert results[POST_A1]["content"] == "Post 1943190393602068801 text"
+    assert results[POST_A1]["batch_size"] == 2
+    assert results[POST_A1]["usage"]["total_tokens"] == 45
+    assert results[POST_A1 + "?s=20"]["url"] == POST_A1 + "?s=20"
+    assert results[POST_A3]["content"] == "Post 1943190393602069000 text"
+    assert results[POST_B1]["success"]
+
+    client.read_x_posts(urls)
+    assert len(client.calls) == 3
+
+
+def test_posts_missing_from_a_batch_are_read_alone():
+    """A post the batched answer left out falls back to a single read."""
+    client = make_client(skip={"1943190393602068900"})
+    results = client.read_x_posts([POST_A1, POST_A2])
+
+    assert len(client.calls) == 2
+    assert results[POST_A1]["batch_size"] == 2
+    assert results[POST_A2]["success"]
+    assert "batch_size" not in results[POST_A2]
+
+
+def test_tool_reads_several_urls_in_one_call():
+    """The tool formats a batched read as one section per URL."""
+    tool = XcomDeepQATool(xai_api_key="test")
+    tool.client = make_client()
+    output = tool.forward(f"{POST_A1}, {POST_A2}", operation="read")
+
+    assert len(tool.client.calls) == 1
+    assert f"## Post: {POST_A1}" in output
+    assert "Post 1943190393602068900 text" in output